@@ -41,6 +41,7 @@ from io_scs_tools.imp import pix as _pix_import
 from io_scs_tools.internals.callbacks import open_gl as _open_gl_callback
 from io_scs_tools.internals.callbacks import persistent as _persistent_callback
 from io_scs_tools.internals import icons as _icons
+from io_scs_tools.internals.shaders import shader as _shader
 from io_scs_tools.operators.bases.export import SCSExportHelper as _SCSExportHelper
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.utils.view3d import has_view3d_space as _has_view3d_space
@@ -203,6 +204,9 @@ class SCS_TOOLS_OT_Import(bpy.types.Operator, ImportHelper):
             col.prop(scs_globals, "import_pia_file", toggle=True, icon=get_on_off_icon(scs_globals.import_pia_file))
             if scs_globals.import_pia_file:
                 col.prop(scs_globals, "import_include_subdirs_for_pia")
+        col.prop(scs_globals, "import_use_parse_cache")
+        if scs_globals.import_use_parse_cache:
+            col.prop(scs_globals, "import_parse_cache_dir", text="")
 
         # Common global settings
         box3 = layout.box()
@@ -439,6 +443,9 @@ def unregister():
     # REMOVE PERSISTENT HANDLERS
     _persistent_callback.disable()
 
+    # CLEAR SHADER NODE TREE TEMPLATES
+    _shader.clear_node_tree_templates()
+
     # REMOVE MENU ENTRIES
     bpy.types.TOPBAR_MT_editor_menus.remove(menu_scs_tools)
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_export)
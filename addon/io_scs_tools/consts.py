@@ -292,6 +292,8 @@ class PrefabLocators:
     """Number of segments that curves are using during export calculations"""
     CURVE_CLOSEST_POINT_ITER = 30
     """Number of iterations for closest point calculations."""
+    CURVE_INTERSECTION_MAX_HEIGHT = 4.0
+    """Maximal height difference between segments of two curves to be still considered as intersecting."""
     CURVE_SPLIT_CROSS_DOT = cos(60.0 * pi / 180.0)
     """Dot product constante which marsk split croos intersection as sharp."""
     SAFE_DISTANCE = 4.0
@@ -580,3 +582,23 @@ class Cache:
     """Name of the directory inside tmp directory, that will be used for cache storage."""
     max_size = 40 * 1024 * 1024  # 40MB
     """Maximum size of tmp directory cache."""
+    pix_dir_name = "pix"
+    """Name of the directory inside cache directory, that will be used for parsed PIX files."""
+    pix_max_size = 512 * 1024 * 1024  # 512MB
+    """Maximum size of parsed PIX files cache, least recently used files are removed once it's exceeded."""
+
+
+class Profiler:
+    dump_level = 4
+    """Minimal dump level at which import and export operations are profiled and their stages breakdown is printed."""
+    trace_dump_level = 5
+    """Minimal dump level at which trace file of profiled operation is written as well."""
+    trace_dir_name = "profiles"
+    """Name of the directory inside cache directory, that will be used for profile trace files."""
+
+
+class ExportManifest:
+    file_ext = ".scs_manifest"
+    """Extension of export manifest file, written beside exported files of each SCS Game Object."""
+    version = 1
+    """Version of manifest data, it has to be increased whenever fingerprinted data changes, so old manifests are not used anymore."""
@@ -25,9 +25,12 @@ from io_scs_tools.exp import pic
 from io_scs_tools.exp import pip
 from io_scs_tools.exp import pis
 from io_scs_tools.exp import pix
+from io_scs_tools.exp.manifest import ExportManifest as _ExportManifest
+from io_scs_tools.internals.containers import pix as _pix_container
 from io_scs_tools.utils import name as _name_utils
 from io_scs_tools.utils import object as _object_utils
 from io_scs_tools.utils import path as _path_utils
+from io_scs_tools.utils import profiler as _profiler
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.utils.printout import lprint
 
@@ -52,74 +55,106 @@ def batch_export(operator_instance, init_obj_list, name_suffix="", menu_filepath
     # exclude game objects that were manually omitted from export by property
     game_objects_dict = _object_utils.exclude_switched_off(game_objects_dict)
 
+    _ExportManifest.reset_stats()
+
     if game_objects_dict:
-        scs_game_objects_exported = []
+        scs_game_objects_exported = {}
         scs_game_objects_rejected = []
+        scs_game_objects_filepaths = {}
 
         global_filepath = _path_utils.get_global_export_path()
 
-        for root_object in game_objects_dict:
-
-            if not _name_utils.is_valid_scs_root_object_name(root_object.name):
-                lprint("E Rejecting Game Object with invalid SCS Root Object name: %r.\n\t   "
-                       "Only a-z, A-Z, 0-9 and \"._-\" characters can be used." % root_object.name)
-                scs_game_objects_rejected.append("> \"" + root_object.name + "\"")
-                continue
-
-            game_object_list = game_objects_dict[root_object]
-            if len(game_object_list) == 0:
-                lprint("E Rejecting empty Game Object with SCS Root Object name: %r\n\t   " +
-                       "Game Object has to have at least one mesh object or model locator!",
-                       (root_object.name,))
-                scs_game_objects_rejected.append("> \"" + root_object.name + "\"")
-                continue
-
-            # GET CUSTOM FILE PATH
-            custom_filepath = _path_utils.get_custom_scs_root_export_path(root_object)
-
-            # MAKE FINAL FILEPATH
-            if menu_filepath:
-                filepath = _path_utils.readable_norm(menu_filepath)
-                filepath_message = "Export path selected in file browser:\n\t   \"" + filepath + "\""
-            elif custom_filepath:
-                filepath = _path_utils.readable_norm(custom_filepath)
-                filepath_message = "Custom export path used for \"" + root_object.name + "\" is:\n\t   \"" + filepath + "\""
-            else:
-                filepath = _path_utils.readable_norm(global_filepath)
-                filepath_message = "Default export path used for \"" + root_object.name + "\":\n\t   \"" + filepath + "\""
-
-            scs_project_path = _path_utils.readable_norm(_get_scs_globals().scs_project_path)
-            if os.path.isdir(filepath) and _path_utils.startswith(filepath, scs_project_path) and scs_project_path != "":
-
-                # EXPORT ENTRY POINT
-                export_success = pix.export(filepath, name_suffix, root_object, game_object_list)
-
-                if export_success:
-                    scs_game_objects_exported.append("> \"" + root_object.name + "\" exported to: '" + filepath + "'")
-                else:
+        _profiler.start("Export")
+
+        # files are written in worker threads while data for the next ones are gathered
+        _pix_container.start_deferred_writing()
+        try:
+
+            for root_object in game_objects_dict:
+
+                if not _name_utils.is_valid_scs_root_object_name(root_object.name):
+                    lprint("E Rejecting Game Object with invalid SCS Root Object name: %r.\n\t   "
+                           "Only a-z, A-Z, 0-9 and \"._-\" characters can be used." % root_object.name)
                     scs_game_objects_rejected.append("> \"" + root_object.name + "\"")
+                    continue
 
-            else:
-                if filepath:
-                    message = (
-                        "No valid export path found!\n\t   " +
-                        "Export path does not exists or it's not inside SCS Project Base Path.\n\t   " +
-                        "SCS Project Base Path:\n\t   \"" + scs_project_path + "\"\n\t   " +
-                        filepath_message
-                    )
+                game_object_list = game_objects_dict[root_object]
+                if len(game_object_list) == 0:
+                    lprint("E Rejecting empty Game Object with SCS Root Object name: %r\n\t   " +
+                           "Game Object has to have at least one mesh object or model locator!",
+                           (root_object.name,))
+                    scs_game_objects_rejected.append("> \"" + root_object.name + "\"")
+                    continue
+
+                # GET CUSTOM FILE PATH
+                custom_filepath = _path_utils.get_custom_scs_root_export_path(root_object)
+
+                # MAKE FINAL FILEPATH
+                if menu_filepath:
+                    filepath = _path_utils.readable_norm(menu_filepath)
+                    filepath_message = "Export path selected in file browser:\n\t   \"" + filepath + "\""
+                elif custom_filepath:
+                    filepath = _path_utils.readable_norm(custom_filepath)
+                    filepath_message = "Custom export path used for \"" + root_object.name + "\" is:\n\t   \"" + filepath + "\""
                 else:
-                    message = "No valid export path found! Please check 'SCS Project Base Path' first."
-                lprint('E ' + message)
-                operator_instance.report({'ERROR'}, message.replace("\t", "").replace("   ", ""))
-                return {'CANCELLED'}
+                    filepath = _path_utils.readable_norm(global_filepath)
+                    filepath_message = "Default export path used for \"" + root_object.name + "\":\n\t   \"" + filepath + "\""
+
+                scs_project_path = _path_utils.readable_norm(_get_scs_globals().scs_project_path)
+                if os.path.isdir(filepath) and _path_utils.startswith(filepath, scs_project_path) and scs_project_path != "":
+
+                    submitted_count = len(_pix_container.get_deferred_writing_filepaths())
+
+                    # EXPORT ENTRY POINT
+                    with _profiler.stage("game objects"):
+                        export_success = pix.export(filepath, name_suffix, root_object, game_object_list)
+
+                    if export_success:
+                        scs_game_objects_exported[root_object.name] = "> \"" + root_object.name + "\" exported to: '" + filepath + "'"
+                        scs_game_objects_filepaths[root_object.name] = _pix_container.get_deferred_writing_filepaths()[submitted_count:]
+                    else:
+                        scs_game_objects_rejected.append("> \"" + root_object.name + "\"")
+
+                else:
+                    if filepath:
+                        message = (
+                            "No valid export path found!\n\t   " +
+                            "Export path does not exists or it's not inside SCS Project Base Path.\n\t   " +
+                            "SCS Project Base Path:\n\t   \"" + scs_project_path + "\"\n\t   " +
+                            filepath_message
+                        )
+                    else:
+                        message = "No valid export path found! Please check 'SCS Project Base Path' first."
+                    lprint('E ' + message)
+                    operator_instance.report({'ERROR'}, message.replace("\t", "").replace("   ", ""))
+                    return {'CANCELLED'}
+
+        finally:
+            with _profiler.stage("waiting for writing"):
+                failed_filepaths = _pix_container.finish_deferred_writing()
+            _ExportManifest.save_queued(failed_filepaths)
+            _profiler.finish()
+
+        # files are written only after game objects were reported as exported,
+        # so game object is rejected after all if any of its files couldn't be written
+        for root_object_name, filepaths in scs_game_objects_filepaths.items():
+            object_failed_filepaths = [filepath for filepath in filepaths if filepath in failed_filepaths]
+            if object_failed_filepaths:
+                del scs_game_objects_exported[root_object_name]
+                scs_game_objects_rejected.append("> \"" + root_object_name + "\" couldn't write: '" +
+                                                 "', '".join(object_failed_filepaths) + "'")
 
         if not lprint("\nI Export procces completed, summaries are printed below!", report_errors=True, report_warnings=True):
             operator_instance.report({'INFO'}, "Export successfully completed, exported %s game object(s)!" % len(scs_game_objects_exported))
             bpy.ops.wm.scs_tools_show_3dview_report('INVOKE_DEFAULT', abort=True)  # abort 3d view reporting operator
 
+        if _get_scs_globals().export_incremental:
+            written_count, skipped_count = _ExportManifest.get_stats()
+            lprint("I Incremental export: %i file(s) written, %i unchanged file(s) skipped.", (written_count, skipped_count))
+
         if len(scs_game_objects_exported) > 0:
             message = "EXPORTED GAME OBJECTS (" + str(len(scs_game_objects_exported)) + "):\n\t   " + "=" * 26 + "\n\t   "
-            for scs_game_object_export_message in scs_game_objects_exported:
+            for scs_game_object_export_message in scs_game_objects_exported.values():
                 message += scs_game_object_export_message + "\n\t   "
             message += "=" * 26
             lprint("I " + message)
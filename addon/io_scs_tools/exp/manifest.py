@@ -0,0 +1,536 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Copyright (C) 2022: SCS Software
+
+import bpy
+import json
+import os
+import numpy
+from hashlib import sha1
+from io_scs_tools.consts import ExportManifest as _MANIFEST_consts
+from io_scs_tools.utils import path as _path_utils
+from io_scs_tools.utils import get_scs_globals as _get_scs_globals
+from io_scs_tools.utils.info import get_tools_version
+from io_scs_tools.utils.printout import lprint
+from io_scs_tools.utils.property import get_id_prop_as_py_object
+
+_MAX_RNA_DEPTH = 3
+"""Maximal depth of nested RNA structures taken into fingerprint."""
+
+_ATTRIBUTES_DATA = {
+    'FLOAT': ("value", 1, numpy.float32),
+    'INT': ("value", 1, numpy.int32),
+    'INT8': ("value", 1, numpy.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, numpy.float32),
+    'FLOAT_VECTOR': ("vector", 3, numpy.float32),
+    'FLOAT_COLOR': ("color", 4, numpy.float32),
+    'BYTE_COLOR': ("color", 4, numpy.float32),
+}
+"""Mesh attribute data types with their data property name, number of components and array type used for reading."""
+
+_NON_OUTPUT_SETTINGS = ("export_scope", "export_incremental")
+"""Export settings which don't affect content of exported files."""
+
+
+def _to_hashable(value):
+    """Converts given RNA property value into python native value, so it's representation doesn't depend on Blender types.
+
+    :param value: RNA property value
+    :type value: any
+    :return: native python value, arrays, sets and dictionaries are converted into tuples
+    :rtype: any
+    """
+    if isinstance(value, str) or not hasattr(value, "__len__"):
+        return value
+    elif isinstance(value, dict):
+        return tuple(sorted((key, _to_hashable(item)) for key, item in value.items()))
+    elif isinstance(value, (set, frozenset)):
+        return tuple(sorted(value))
+
+    return tuple(_to_hashable(item) for item in value)
+
+
+class Fingerprint:
+    """Class for computing fingerprint of the data that are used for export.
+
+    Fingerprint is SHA1 hash over all the given values, so any change in them results in different fingerprint.
+    """
+
+    def __init__(self):
+        """Creates fingerprint with empty hash."""
+        self.__hash = sha1()
+
+    def add_value(self, value):
+        """Adds python value to fingerprint by it's representation.
+
+        :param value: value to add
+        :type value: any
+        """
+        self.__hash.update(repr(_to_hashable(value)).encode("utf-8"))
+        self.__hash.update(b"|")
+
+    def add_array(self, collection, attribute, components, dtype):
+        """Adds attribute of all items in given Blender collection to fingerprint.
+
+        :param collection: Blender collection supporting foreach_get
+        :type collection: bpy.types.bpy_prop_collection
+        :param attribute: name of the attribute to read
+        :type attribute: str
+        :param components: number of components of given attribute
+        :type components: int
+        :param dtype: numpy type used for reading attribute values
+        :type dtype: type
+        """
+        array = numpy.empty(len(collection) * components, dtype=dtype)
+        collection.foreach_get(attribute, array)
+
+        self.add_value(len(array))
+        self.__hash.update(array.tobytes())
+
+    def add_rna(self, data, depth=0):
+        """Adds all RNA properties of given Blender structure to fingerprint.
+        Nested structures and collections are added recursively, ID data-blocks only by their name.
+
+        :param data: Blender structure which properties should be added
+        :type data: bpy.types.bpy_struct | None
+        :param depth: current recursion depth
+        :type depth: int
+        """
+
+        if data is None:
+            self.add_value(None)
+            return
+
+        for prop in data.bl_rna.properties:
+
+            if prop.identifier == "rna_type":
+                continue
+
+            value = getattr(data, prop.identifier, None)
+
+            if prop.type == 'POINTER':
+                if value is None or isinstance(value, bpy.types.ID):
+                    self.add_value(getattr(value, "name", None))
+                elif depth < _MAX_RNA_DEPTH:
+                    self.add_rna(value, depth + 1)
+            elif prop.type == 'COLLECTION':
+                if depth < _MAX_RNA_DEPTH:
+                    self.add_value(len(value))
+                    for item in value:
+                        self.add_rna(item, depth + 1)
+            else:
+                self.add_value(value)
+
+    def add_id_props(self, id_data):
+        """Adds custom ID properties of given data-block to fingerprint.
+
+        :param id_data: Blender data-block
+        :type id_data: bpy.types.ID
+        """
+        for key in sorted(id_data.keys()):
+            self.add_value((key, get_id_prop_as_py_object(id_data[key])))
+
+    def add_mesh(self, mesh):
+        """Adds geometry and custom data of given mesh to fingerprint.
+
+        :param mesh: Blender mesh
+        :type mesh: bpy.types.Mesh
+        """
+
+        self.add_array(mesh.vertices, "co", 3, numpy.float32)
+        self.add_array(mesh.edges, "vertices", 2, numpy.int32)
+        self.add_array(mesh.edges, "use_edge_sharp", 1, bool)
+        self.add_array(mesh.loops, "vertex_index", 1, numpy.int32)
+        self.add_array(mesh.polygons, "loop_start", 1, numpy.int32)
+        self.add_array(mesh.polygons, "material_index", 1, numpy.int32)
+        self.add_array(mesh.polygons, "use_smooth", 1, bool)
+
+        for uv_layer in mesh.uv_layers:
+            self.add_value((uv_layer.name, uv_layer.active))
+            self.add_array(uv_layer.data, "uv", 2, numpy.float32)
+
+        for attribute in mesh.attributes:
+
+            # internal attributes (like selection) don't affect export
+            if attribute.name.startswith("."):
+                continue
+
+            self.add_value((attribute.name, attribute.domain, attribute.data_type))
+            if attribute.data_type in _ATTRIBUTES_DATA:
+                self.add_array(attribute.data, *_ATTRIBUTES_DATA[attribute.data_type])
+
+        self.add_value((mesh.use_auto_smooth, mesh.auto_smooth_angle, mesh.has_custom_normals))
+        if mesh.has_custom_normals:
+            mesh.calc_normals_split()
+            self.add_array(mesh.loops, "normal", 3, numpy.float32)
+
+        if mesh.shape_keys:
+            for key_block in mesh.shape_keys.key_blocks:
+                self.add_value((key_block.name, key_block.value, key_block.mute, key_block.relative_key.name))
+                self.add_array(key_block.data, "co", 3, numpy.float32)
+
+        self.add_rna(mesh.scs_props)
+
+    def add_object(self, obj):
+        """Adds transformation, properties, modifiers, materials and data of given object to fingerprint.
+
+        :param obj: Blender object
+        :type obj: bpy.types.Object
+        """
+
+        self.add_value((obj.name, obj.type, getattr(obj.parent, "name", None), obj.parent_type, obj.parent_bone))
+        self.add_value(obj.matrix_world)
+        self.add_rna(obj.scs_props)
+
+        for modifier in obj.modifiers:
+            self.add_rna(modifier)
+            modifier_obj = getattr(modifier, "object", None)
+            if modifier_obj:
+                self.add_value(modifier_obj.matrix_world)
+
+        for material_slot in obj.material_slots:
+            self.add_value((material_slot.link, getattr(material_slot.material, "name", None)))
+            if material_slot.material:
+                self.add_rna(material_slot.material.scs_props)
+
+        if obj.type == 'MESH':
+
+            self.add_mesh(obj.data)
+
+            # vertex weights are not accessible in bulk, so they have to be collected per vertex
+            self.add_value([vertex_group.name for vertex_group in obj.vertex_groups])
+            if len(obj.vertex_groups) > 0:
+                self.add_value([(group.group, group.weight) for vertex in obj.data.vertices for group in vertex.groups])
+
+        elif obj.type == 'ARMATURE':
+
+            self.add_armature(obj)
+
+    def add_armature(self, armature):
+        """Adds bones hierarchy and rest pose of given armature object to fingerprint.
+
+        :param armature: Blender armature object
+        :type armature: bpy.types.Object
+        """
+
+        self.add_value((armature.name, armature.matrix_world))
+
+        for bone in armature.data.bones:
+            self.add_value((bone.name, getattr(bone.parent, "name", None), bone.use_deform, bone.matrix_local))
+
+    def add_action(self, action):
+        """Adds all fcurves of given action together with it's SCS properties to fingerprint.
+
+        :param action: Blender action
+        :type action: bpy.types.Action
+        """
+
+        self.add_value(action.name)
+        self.add_rna(action.scs_props)
+
+        for fcurve in action.fcurves:
+            self.add_value((fcurve.data_path, fcurve.array_index, fcurve.extrapolation, fcurve.mute))
+            self.add_array(fcurve.keyframe_points, "co", 2, numpy.float32)
+            self.add_array(fcurve.keyframe_points, "handle_left", 2, numpy.float32)
+            self.add_array(fcurve.keyframe_points, "handle_right", 2, numpy.float32)
+            self.add_value([(keyframe.interpolation, keyframe.easing) for keyframe in fcurve.keyframe_points])
+            self.add_value([(modifier.type, modifier.mute) for modifier in fcurve.modifiers])
+
+    def add_export_settings(self):
+        """Adds tools version, project paths settings and all export settings from SCS globals to fingerprint."""
+
+        self.add_value(get_tools_version())
+
+        scs_globals = _get_scs_globals()
+
+        # texture and skeleton paths written into files are resolved against project base path and alternative bases
+        self.add_value((scs_globals.scs_project_path, scs_globals.use_alternative_bases))
+
+        for prop in scs_globals.bl_rna.properties:
+            if prop.identifier.startswith("export_") and prop.identifier not in _NON_OUTPUT_SETTINGS:
+                self.add_value((prop.identifier, getattr(scs_globals, prop.identifier)))
+
+    def get_hexdigest(self):
+        """Gets current fingerprint.
+
+        :return: fingerprint as hex string
+        :rtype: str
+        """
+        return self.__hash.hexdigest()
+
+
+def get_model_fingerprint(dirpath, name_suffix, skeleton_filepath, root_object, game_object_list):
+    """Gets fingerprint of all the data used for export of model files (PIM, PIT, PIC, PIP and PIS) of SCS Game Object.
+
+    :param dirpath: directory path where game object is exported
+    :type dirpath: str
+    :param name_suffix: files name suffix
+    :type name_suffix: str
+    :param skeleton_filepath: relative path of skeleton file
+    :type skeleton_filepath: str
+    :param root_object: SCS Root Object of game object
+    :type root_object: bpy.types.Object
+    :param game_object_list: all objects belonging to game object
+    :type game_object_list: list[bpy.types.Object]
+    :return: fingerprint as hex string
+    :rtype: str
+    """
+
+    fingerprint = Fingerprint()
+    fingerprint.add_export_settings()
+    fingerprint.add_value((dirpath, name_suffix, skeleton_filepath))
+
+    # root object carries parts, variants and looks
+    fingerprint.add_object(root_object)
+    fingerprint.add_id_props(root_object)
+    for inventory in (root_object.scs_object_part_inventory, root_object.scs_object_variant_inventory, root_object.scs_object_look_inventory):
+        fingerprint.add_value(len(inventory))
+        for item in inventory:
+            fingerprint.add_rna(item)
+
+    for obj in game_object_list:
+        fingerprint.add_object(obj)
+
+    return fingerprint.get_hexdigest()
+
+
+def get_animation_fingerprint(anim_dirpath, name_suffix, skeleton_filepath, root_object, armature_object, scs_animation):
+    """Gets fingerprint of all the data used for export of given SCS animation into PIA file.
+
+    :param anim_dirpath: directory path where animation is exported
+    :type anim_dirpath: str
+    :param name_suffix: files name suffix
+    :type name_suffix: str
+    :param skeleton_filepath: path of skeleton file relative to animation directory
+    :type skeleton_filepath: str
+    :param root_object: SCS Root Object of game object
+    :type root_object: bpy.types.Object
+    :param armature_object: armature object animation is used on
+    :type armature_object: bpy.types.Object
+    :param scs_animation: SCS animation
+    :type scs_animation: io_scs_tools.properties.object.ObjectAnimationInventoryItem
+    :return: fingerprint as hex string
+    :rtype: str
+    """
+
+    fingerprint = Fingerprint()
+    fingerprint.add_export_settings()
+    fingerprint.add_value((anim_dirpath, name_suffix, skeleton_filepath, root_object.name, root_object.matrix_world))
+    fingerprint.add_armature(armature_object)
+    fingerprint.add_rna(scs_animation)
+
+    if scs_animation.action in bpy.data.actions:
+        fingerprint.add_action(bpy.data.actions[scs_animation.action])
+
+    return fingerprint.get_hexdigest()
+
+
+class ExportManifest:
+    """Class for reading and writing export manifest of one SCS Game Object.
+
+    Manifest is stored beside exported files and holds entries (one for model files and one per each animation),
+    where each entry has fingerprint of the data used for export and states of the files written by it.
+    Entry is up to date only if it's fingerprint didn't change and all it's files still exist unchanged.
+    """
+
+    __written = 0
+    __skipped = 0
+    __queued = []
+
+    def __init__(self, dirpath, root_object_name):
+        """Creates manifest for given SCS Game Object and loads existing one if present.
+
+        :param dirpath: directory path where game object is exported
+        :type dirpath: str
+        :param root_object_name: name of the SCS Root Object
+        :type root_object_name: str
+        """
+
+        self.dirpath = dirpath
+        self.filepath = os.path.join(dirpath, root_object_name + _MANIFEST_consts.file_ext)
+        self.entries = {}
+        self.__pending_files = {}
+
+        if not os.path.isfile(self.filepath):
+            return
+
+        try:
+            with open(self.filepath, mode="r", encoding="utf8") as file:
+                data = json.load(file)
+
+            if data.get("version") == _MANIFEST_consts.version:
+                self.entries = data["entries"]
+
+        except (OSError, ValueError, KeyError) as e:
+            lprint("D Ignoring invalid export manifest %r: %s", (self.filepath, e))
+
+    @staticmethod
+    def get_file_states(filepaths):
+        """Gets states of given files used to detect their change.
+
+        :param filepaths: absolute paths of the files
+        :type filepaths: collections.Iterable[str]
+        :return: dictionary of states (key: file path, value: [size, modification time in nanoseconds]), non existing files are ignored
+        :rtype: dict[str, list[int]]
+        """
+
+        states = {}
+        for filepath in filepaths:
+            if os.path.isfile(filepath):
+                stat = os.stat(filepath)
+                states[filepath] = [stat.st_size, stat.st_mtime_ns]
+
+        return states
+
+    def is_up_to_date(self, key, fingerprint):
+        """Checks if entry is up to date, meaning fingerprint is the same and all files written by entry still exist unchanged.
+
+        :param key: entry key
+        :type key: str
+        :param fingerprint: current fingerprint of entry data
+        :type fingerprint: str
+        :return: True if export of this entry can be skipped; False otherwise
+        :rtype: bool
+        """
+
+        entry = self.entries.get(key)
+        if entry is None or entry["fingerprint"] != fingerprint or len(entry["files"]) == 0:
+            return False
+
+        files = {os.path.join(self.dirpath, rel_path): state for rel_path, state in entry["files"].items()}
+        if self.get_file_states(files) != files:
+            return False
+
+        ExportManifest.__skipped += len(files)
+        return True
+
+    def get_data(self, key, name, default=None):
+        """Gets additional data stored within entry.
+
+        :param key: entry key
+        :type key: str
+        :param name: name of the data
+        :type name: str
+        :param default: value returned if entry or data doesn't exist
+        :type default: any
+        :return: stored data
+        :rtype: any
+        """
+        return self.entries.get(key, {}).get("data", {}).get(name, default)
+
+    def update(self, key, fingerprint, old_states, filepaths, **data):
+        """Updates entry with new fingerprint. States of written files are taken on save,
+        as files can still be written in worker threads. Files are treated as written if their state differs from the state before export.
+
+        :param key: entry key
+        :type key: str
+        :param fingerprint: fingerprint of exported data
+        :type fingerprint: str
+        :param old_states: states of files before the export, as returned by get_file_states
+        :type old_states: dict[str, list[int]]
+        :param filepaths: absolute paths of all the files this entry could write
+        :type filepaths: collections.Iterable[str]
+        :param data: additional data to be stored within entry
+        :type data: dict
+        """
+
+        self.entries[key] = {
+            "fingerprint": fingerprint,
+            "files": {},
+            "data": data
+        }
+        self.__pending_files[key] = (old_states, list(filepaths))
+
+    def remove(self, key):
+        """Removes entry, so it gets exported next time.
+
+        :param key: entry key
+        :type key: str
+        """
+        if key in self.entries:
+            del self.entries[key]
+
+        if key in self.__pending_files:
+            del self.__pending_files[key]
+
+    def save(self, failed_filepaths=()):
+        """Takes states of written files and writes manifest beside exported files.
+
+        :param failed_filepaths: paths of the files which writing failed, entries writing them are removed
+        :type failed_filepaths: collections.abc.Container[str]
+        :return: True if manifest was written; False otherwise
+        :rtype: bool
+        """
+
+        for key, (old_states, filepaths) in self.__pending_files.items():
+
+            if any(_path_utils.readable_norm(filepath) in failed_filepaths for filepath in filepaths):
+                del self.entries[key]
+                continue
+
+            files = self.entries[key]["files"]
+            for filepath, state in self.get_file_states(filepaths).items():
+                if old_states.get(filepath) != state:
+                    files[os.path.relpath(filepath, self.dirpath).replace("\\", "/")] = state
+
+            ExportManifest.__written += len(files)
+
+        self.__pending_files.clear()
+
+        try:
+            with open(self.filepath, mode="w", encoding="utf8", newline="\n") as file:
+                json.dump({"version": _MANIFEST_consts.version, "entries": self.entries}, file, indent=1, sort_keys=True)
+        except OSError as e:
+            lprint("W Export manifest %r couldn't be written, next export won't be incremental: %s", (self.filepath, e))
+            return False
+
+        return True
+
+    def queue_save(self):
+        """Queues manifest to be saved once all exported files are written."""
+        ExportManifest.__queued.append(self)
+
+    @staticmethod
+    def save_queued(failed_filepaths=()):
+        """Saves all queued manifests.
+
+        :param failed_filepaths: paths of the files which writing failed, entries writing them are removed
+        :type failed_filepaths: collections.abc.Container[str]
+        """
+
+        for manifest in ExportManifest.__queued:
+            manifest.save(failed_filepaths)
+
+        ExportManifest.__queued.clear()
+
+    @staticmethod
+    def get_stats():
+        """Gets number of written and skipped files since last reset.
+
+        :return: tuple of (written, skipped)
+        :rtype: tuple[int, int]
+        """
+        return ExportManifest.__written, ExportManifest.__skipped
+
+    @staticmethod
+    def reset_stats():
+        """Resets number of written and skipped files."""
+        ExportManifest.__written = 0
+        ExportManifest.__skipped = 0
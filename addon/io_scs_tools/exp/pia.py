@@ -21,10 +21,13 @@
 import os
 
 import bpy
+import numpy
 from collections import OrderedDict
-from mathutils import Vector, Matrix, Euler, Quaternion
+from itertools import chain
+from mathutils import Vector, Matrix
 from io_scs_tools.utils import convert as _convert_utils
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
+from io_scs_tools.utils import profiler as _profiler
 from io_scs_tools.utils.info import get_combined_ver_str
 from io_scs_tools.utils.printout import lprint
 from io_scs_tools.internals.structure import SectionData as _SectionData
@@ -85,56 +88,279 @@ def _get_custom_channels(scs_animation, action):
     return custom_channels
 
 
+def _get_curves_per_bone(armature, action):
+    """Indexes recognized bone fcurves of given action by bone names.
+
+    :param armature: armature object of current animation
+    :type armature: bpy.types.Object
+    :param action: action from which fcurves should be taken
+    :type action: bpy.types.Action
+    :return: per bone names, in order of armature bones, dictionary of curve types with fcurves per array index
+    :rtype: collections.OrderedDict[str, dict[str, dict[int, bpy.types.FCurve]]]
+    """
+
+    curves_per_path_key = {}  # store all the curves we are interested in per bone data path key: '["bone_name"]'
+
+    for fcurve in action.fcurves:
+
+        data_path = fcurve.data_path
+
+        if data_path.endswith("location"):
+            curve_type = "location"
+        elif data_path.endswith("rotation_euler"):
+            curve_type = "euler_rotation"
+        elif data_path.endswith("rotation_quaternion"):
+            curve_type = "quat_rotation"
+        elif data_path.endswith("scale"):
+            curve_type = "scale"
+        else:
+            continue
+
+        # bone name is enclosed in first square brackets of data path
+        key_start = data_path.find('["')
+        key_end = data_path.find('"]', key_start + 2)
+        if key_start == -1 or key_end == -1:
+            continue
+
+        path_key = data_path[key_start:key_end + 2]
+        if path_key not in curves_per_path_key:
+            curves_per_path_key[path_key] = {
+                "location": {},
+                "euler_rotation": {},
+                "quat_rotation": {},
+                "scale": {}
+            }
+
+        curves_per_path_key[path_key][curve_type][fcurve.array_index] = fcurve
+
+    curves_per_bone = OrderedDict()
+    for bone in armature.data.bones:
+
+        path_key = '["' + bone.name + '"]'
+        if path_key in curves_per_path_key:
+            curves_per_bone[bone.name] = curves_per_path_key[path_key]
+
+    return curves_per_bone
+
+
+def _sample_curves(curves, frames, default_values):
+    """Samples given curves on all given frames.
+
+    :param curves: fcurves per array index
+    :type curves: dict[int, bpy.types.FCurve]
+    :param frames: frames on which curves should be sampled
+    :type frames: list[float]
+    :param default_values: values used for array indices without curve, length defines number of components
+    :type default_values: tuple[float]
+    :return: sampled values in array of shape (frames count, components count)
+    :rtype: numpy.ndarray
+    """
+
+    values = numpy.empty((len(frames), len(default_values)))
+    for index, default_value in enumerate(default_values):
+        if index in curves:
+            evaluate = curves[index].evaluate
+            values[:, index] = [evaluate(frame) for frame in frames]
+        else:
+            values[:, index] = default_value
+
+    return values
+
+
+def _get_euler_rotation_matrices(rotations, rotation_mode):
+    """Computes rotation matrices from euler rotations in the same way as mathutils.Euler.to_matrix does.
+
+    :param rotations: euler rotations in array of shape (count, 3)
+    :type rotations: numpy.ndarray
+    :param rotation_mode: euler rotation order, eg. 'XYZ'
+    :type rotation_mode: str
+    :return: rotation matrices in array of shape (count, 3, 3)
+    :rtype: numpy.ndarray
+    """
+
+    matrices = numpy.tile(numpy.identity(3), (len(rotations), 1, 1))
+
+    # rotations are applied in given order, so first axis rotation is the most right one
+    for axis in rotation_mode:
+
+        index = "XYZ".index(axis)
+        i1, i2 = (index + 1) % 3, (index + 2) % 3
+
+        cos = numpy.cos(rotations[:, index])
+        sin = numpy.sin(rotations[:, index])
+
+        axis_matrices = numpy.zeros_like(matrices)
+        axis_matrices[:, index, index] = 1.0
+        axis_matrices[:, i1, i1] = cos
+        axis_matrices[:, i1, i2] = -sin
+        axis_matrices[:, i2, i1] = sin
+        axis_matrices[:, i2, i2] = cos
+
+        matrices = axis_matrices @ matrices
+
+    return matrices
+
+
+def _get_quaternion_rotation_matrices(rotations):
+    """Computes rotation matrices from quaternions in the same way as mathutils.Quaternion.to_matrix does,
+    meaning quaternions are not normalized.
+
+    :param rotations: quaternions (w, x, y, z) in array of shape (count, 4)
+    :type rotations: numpy.ndarray
+    :return: rotation matrices in array of shape (count, 3, 3)
+    :rtype: numpy.ndarray
+    """
+
+    w, x, y, z = rotations.T
+
+    matrices = numpy.empty((len(rotations), 3, 3))
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y - w * z)
+    matrices[:, 0, 2] = 2.0 * (x * z + w * y)
+    matrices[:, 1, 0] = 2.0 * (x * y + w * z)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z - w * x)
+    matrices[:, 2, 0] = 2.0 * (x * z - w * y)
+    matrices[:, 2, 1] = 2.0 * (y * z + w * x)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+
+    return matrices
+
+
+def _get_reduced_keyframes(matrices, tolerance):
+    """Gets keyframes which have to be kept, so that all dropped keyframes can be reconstructed within given tolerance
+    by interpolation of kept neighbouring keyframes. First and last keyframes are always kept.
+
+    Interpolation is assumed to be linear for location and scale and spherical for rotation.
+    Reconstruction error is measured as maximal absolute difference of matrix elements.
+
+    :param matrices: frame matrices in array of shape (frames count, 4, 4)
+    :type matrices: numpy.ndarray
+    :param tolerance: maximal allowed difference of reconstructed matrix elements
+    :type tolerance: float
+    :return: indices of keyframes to be kept
+    :rtype: list[int]
+    """
+
+    frames_count = len(matrices)
+    if frames_count <= 2:
+        return list(range(frames_count))
+
+    # decompose matrices to location, rotation and scale
+    locations = matrices[:, :3, 3]
+    scales = numpy.linalg.norm(matrices[:, :3, :3], axis=1)
+    rot_mats = matrices[:, :3, :3] / numpy.where(scales == 0, 1.0, scales)[:, numpy.newaxis, :]
+
+    quats = numpy.empty((frames_count, 4))
+    quats[:, 0] = numpy.sqrt(numpy.maximum(0.0, 1.0 + rot_mats[:, 0, 0] + rot_mats[:, 1, 1] + rot_mats[:, 2, 2])) / 2
+    quats[:, 1] = numpy.sqrt(numpy.maximum(0.0, 1.0 + rot_mats[:, 0, 0] - rot_mats[:, 1, 1] - rot_mats[:, 2, 2])) / 2
+    quats[:, 2] = numpy.sqrt(numpy.maximum(0.0, 1.0 - rot_mats[:, 0, 0] + rot_mats[:, 1, 1] - rot_mats[:, 2, 2])) / 2
+    quats[:, 3] = numpy.sqrt(numpy.maximum(0.0, 1.0 - rot_mats[:, 0, 0] - rot_mats[:, 1, 1] + rot_mats[:, 2, 2])) / 2
+    quats[:, 1] = numpy.copysign(quats[:, 1], rot_mats[:, 2, 1] - rot_mats[:, 1, 2])
+    quats[:, 2] = numpy.copysign(quats[:, 2], rot_mats[:, 0, 2] - rot_mats[:, 2, 0])
+    quats[:, 3] = numpy.copysign(quats[:, 3], rot_mats[:, 1, 0] - rot_mats[:, 0, 1])
+
+    def is_reconstructable(start_i, end_i):
+        """Checks if all keyframes between start and end keyframe can be reconstructed within tolerance."""
+
+        factors = (numpy.arange(start_i + 1, end_i) - start_i) / (end_i - start_i)
+        factors_col = factors[:, numpy.newaxis]
+
+        quat0 = quats[start_i]
+        quat1 = quats[end_i]
+
+        # interpolate along shorter path
+        quats_dot = numpy.dot(quat0, quat1)
+        if quats_dot < 0:
+            quat1 = -quat1
+            quats_dot = -quats_dot
+
+        angle = numpy.arccos(min(quats_dot, 1.0))
+        if angle < 1e-6:
+            weights0 = 1.0 - factors_col
+            weights1 = factors_col
+        else:
+            weights0 = numpy.sin((1.0 - factors_col) * angle) / numpy.sin(angle)
+            weights1 = numpy.sin(factors_col * angle) / numpy.sin(angle)
+
+        rec_quats = weights0 * quat0 + weights1 * quat1
+        rec_quats /= numpy.linalg.norm(rec_quats, axis=1)[:, numpy.newaxis]
+
+        rec_matrices = _get_quaternion_rotation_matrices(rec_quats)
+        rec_matrices *= (scales[start_i] + factors_col * (scales[end_i] - scales[start_i]))[:, numpy.newaxis, :]
+        rec_locations = locations[start_i] + factors_col * (locations[end_i] - locations[start_i])
+
+        if numpy.abs(rec_matrices - matrices[start_i + 1:end_i, :3, :3]).max() > tolerance:
+            return False
+
+        return numpy.abs(rec_locations - locations[start_i + 1:end_i]).max() <= tolerance
+
+    # from each kept keyframe find the furthest one to which segment can be extended, by doubling segment length
+    # until it can't be reconstructed and then bisecting the last doubling, so each segment is checked only few times
+    keyframes = [0]
+    last_i = frames_count - 1
+    while keyframes[-1] < last_i:
+
+        start_i = keyframes[-1]
+        valid_i = start_i + 1  # neighbouring keyframe has nothing in between, so it's always valid
+        invalid_i = None
+
+        length = 2
+        while invalid_i is None and valid_i < last_i:
+            end_i = min(start_i + length, last_i)
+            if is_reconstructable(start_i, end_i):
+                valid_i = end_i
+                length *= 2
+            else:
+                invalid_i = end_i
+
+        while invalid_i is not None and invalid_i - valid_i > 1:
+            middle_i = (valid_i + invalid_i) // 2
+            if is_reconstructable(start_i, middle_i):
+                valid_i = middle_i
+            else:
+                invalid_i = middle_i
+
+        keyframes.append(valid_i)
+
+    return keyframes
+
+
 def _get_bone_channels(scs_root_obj, armature, scs_animation, action, export_scale):
     """Takes armature and action and returns bone channels.
     bone_channels structure example:
-    [("Bone", [("_TIME", [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1]), ("_MATRIX", [])])]"""
+    [("Bone", [("_TIME", [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1]), ("_MATRIX", [])])]
+
+    All frames of bone curves are sampled at once and frame matrices are composed in batch.
+    If keyframe reduction tolerance is set on action, keyframes which can be reconstructed
+    from neighbouring ones are dropped and their time is added to next kept keyframe."""
     bone_channels = []
     frame_start = scs_animation.anim_start
     frame_end = scs_animation.anim_end
     anim_export_step = action.scs_props.anim_export_step
+    anim_export_tolerance = action.scs_props.anim_export_tolerance
     total_frames = (frame_end - frame_start) / anim_export_step
+    frame_time = scs_animation.length / total_frames
+
+    frames = []
+    actual_frame = frame_start
+    while actual_frame <= frame_end:
+        frames.append(actual_frame)
+        actual_frame += anim_export_step
 
     # armature matrix stores transformation of armature object against scs root
     # and has to be added to all bones as they only armature space transformations
     armature_mat = scs_root_obj.matrix_world.inverted() @ armature.matrix_world
 
+    # constant part of all frame matrices, from scale matrix to scs space conversion
+    scale_matrix = Matrix.Scale(export_scale, 4)
+    scs_to_blend_mat_inv = _convert_utils.scs_to_blend_matrix().inverted()
+    scale_to_scs_mat = scs_to_blend_mat_inv @ scale_matrix.inverted()
+
     invalid_data = False  # flag to indicate invalid data state
-    curves_per_bone = OrderedDict()  # store all the curves we are interested in per bone names
+    keyframes_count = dropped_keyframes_count = 0
 
-    for bone in armature.data.bones:
-        for fcurve in action.fcurves:
-
-            # check if curve belongs to bone
-            if '["' + bone.name + '"]' in fcurve.data_path:
-
-                data_path = fcurve.data_path
-                array_index = fcurve.array_index
-
-                if data_path.endswith("location"):
-                    curve_type = "location"
-                elif data_path.endswith("rotation_euler"):
-                    curve_type = "euler_rotation"
-                elif data_path.endswith("rotation_quaternion"):
-                    curve_type = "quat_rotation"
-                elif data_path.endswith("scale"):
-                    curve_type = "scale"
-                else:
-                    curve_type = None
-
-                # write only recognized curves
-                if curve_type is not None:
-                    if bone.name not in curves_per_bone:
-                        curves_per_bone[bone.name] = {
-                            "location": {},
-                            "euler_rotation": {},
-                            "quat_rotation": {},
-                            "scale": {}
-                        }
-
-                    curves_per_bone[bone.name][curve_type][array_index] = fcurve
-
-    for bone_name, bone_curves in curves_per_bone.items():
+    for bone_name, bone_curves in _get_curves_per_bone(armature, action).items():
 
         bone = armature.data.bones[bone_name]
         pose_bone = armature.pose.bones[bone_name]
@@ -145,103 +371,73 @@ def _get_bone_channels(scs_root_obj, armature, scs_animation, action, export_sca
 
         bone_rest_mat = armature_mat @ bone.matrix_local
         if bone.parent:
-            parent_bone_rest_mat = (Matrix.Scale(export_scale, 4) @
-                                    _convert_utils.scs_to_blend_matrix().inverted() @
+            parent_bone_rest_mat = (scale_matrix @
+                                    scs_to_blend_mat_inv @
                                     armature_mat @
                                     bone.parent.matrix_local)
         else:
             parent_bone_rest_mat = Matrix()
 
-        # GO THOUGH FRAMES
-        actual_frame = frame_start
-        timings_stream = []
-        matrices_stream = []
-        while actual_frame <= frame_end:
-            mat_loc = Matrix()
-            mat_rot = Matrix()
-            mat_sca = Matrix()
+        # SCALE REMOVAL MATRIX, as inverted one is used, we can directly create scale matrix
+        rest_location, rest_rotation, rest_scale = bone_rest_mat.decompose()
+        rest_scale = rest_scale * export_scale
+        scale_removal_mat_inv = numpy.diag((rest_scale[0], rest_scale[1], rest_scale[2], 1.0))
 
-            # LOCATION MATRIX
-            if len(loc_curves) > 0:
-                location = Vector()
-                for index in range(3):
-                    if index in loc_curves:
-                        location[index] = loc_curves[index].evaluate(actual_frame)
-                mat_loc = Matrix.Translation(location)
+        bone_mat = numpy.array(parent_bone_rest_mat.inverted() @ scale_to_scs_mat @ bone_rest_mat)
 
-            # ROTATION MATRIX
-            if len(euler_rot_curves) > 0 and pose_bone.rotation_mode != 'QUATERNION':
-                rotation = Euler()
-                for index in range(3):
-                    if index in euler_rot_curves:
-                        rotation[index] = euler_rot_curves[index].evaluate(actual_frame)
-                mat_rot = Euler(rotation, pose_bone.rotation_mode).to_matrix().to_4x4()  # calc rotation by pose rotation mode
-
-            elif len(quat_rot_curves) > 0 and pose_bone.rotation_mode == 'QUATERNION':
-                rotation = Quaternion()
-                for index in range(4):
-                    if index in quat_rot_curves:
-                        rotation[index] = quat_rot_curves[index].evaluate(actual_frame)
-                mat_rot = rotation.to_matrix().to_4x4()
-            else:
-                if len(euler_rot_curves) > 0 and pose_bone.rotation_mode == 'QUATERNION':
-                    lprint("W Rotation mode of bone %r from scs animation %r is desycned with it's stored keyframes mode\n\t   "
-                           "(keyframes are stored in Eulers but bone pose rotation mode is set to Quaternions), "
-                           "no rotation will be stored for this bone!",
-                           (bone_name, scs_animation.name))
-                elif len(quat_rot_curves) > 0 and pose_bone.rotation_mode != 'QUATERNION':
-                    lprint("W Rotation mode of bone %r from scs animation %r is desycned with it's stored keyframes mode\n\t   "
-                           "(keyframes are stored in Eulers but bone pose rotation mode is set to Quaternions), "
-                           "no rotation will be stored for this bone!",
-                           (bone_name, scs_animation.name))
-
-            # SCALE MATRIX
-            if len(sca_curves) > 0:
-                scale = Vector((1.0, 1.0, 1.0))
-                for index in range(3):
-                    if index in sca_curves:
-                        scale[index] = sca_curves[index].evaluate(actual_frame)
-
-                        if scale[index] < 0:
-                            lprint(str("E Negative scale detected on bone %r:\n\t   "
-                                       "(Action: %r, keyframe no.: %s, SCS Animation: %r)."),
-                                   (bone_name, action.name, actual_frame, scs_animation.name))
-                            invalid_data = True
-
-                mat_sca = Matrix()
-                mat_sca[0] = (scale[0], 0, 0, 0)
-                mat_sca[1] = (0, scale[1], 0, 0)
-                mat_sca[2] = (0, 0, scale[2], 0)
-                mat_sca[3] = (0, 0, 0, 1)
-
-            # BLENDER FRAME MATRIX
-            mat = mat_loc @ mat_rot @ mat_sca
-
-            # SCALE REMOVAL MATRIX
-            rest_location, rest_rotation, rest_scale = bone_rest_mat.decompose()
-            # print(' BONES rest_scale: %s' % str(rest_scale))
-            rest_scale = rest_scale * export_scale
-            scale_removal_matrix = Matrix()
-            scale_removal_matrix[0] = (1.0 / rest_scale[0], 0, 0, 0)
-            scale_removal_matrix[1] = (0, 1.0 / rest_scale[1], 0, 0)
-            scale_removal_matrix[2] = (0, 0, 1.0 / rest_scale[2], 0)
-            scale_removal_matrix[3] = (0, 0, 0, 1)
-
-            # SCALE MATRIX
-            scale_matrix = Matrix.Scale(export_scale, 4)
-
-            # COMPUTE SCS FRAME MATRIX
-            frame_matrix = (parent_bone_rest_mat.inverted() @
-                            _convert_utils.scs_to_blend_matrix().inverted() @
-                            scale_matrix.inverted() @
-                            bone_rest_mat @
-                            mat @
-                            scale_removal_matrix.inverted())
-
-            # print('          actual_frame: %s - value: %s' % (actual_frame, frame_matrix))
-            timings_stream.append(("__time__", scs_animation.length / total_frames), )
-            matrices_stream.append(("__matrix__", frame_matrix.transposed()), )
-            actual_frame += anim_export_step
+        # BLENDER FRAME MATRICES
+        matrices = numpy.tile(numpy.identity(4), (len(frames), 1, 1))
+
+        # LOCATION
+        if len(loc_curves) > 0:
+            matrices[:, :3, 3] = _sample_curves(loc_curves, frames, (0.0, 0.0, 0.0))
+
+        # ROTATION
+        if len(euler_rot_curves) > 0 and pose_bone.rotation_mode != 'QUATERNION':
+            rotations = _sample_curves(euler_rot_curves, frames, (0.0, 0.0, 0.0))
+            matrices[:, :3, :3] = _get_euler_rotation_matrices(rotations, pose_bone.rotation_mode)  # calc rotation by pose rotation mode
+
+        elif len(quat_rot_curves) > 0 and pose_bone.rotation_mode == 'QUATERNION':
+            rotations = _sample_curves(quat_rot_curves, frames, (1.0, 0.0, 0.0, 0.0))
+            matrices[:, :3, :3] = _get_quaternion_rotation_matrices(rotations)
+
+        elif len(euler_rot_curves) > 0 or len(quat_rot_curves) > 0:
+            lprint("W Rotation mode of bone %r from scs animation %r is desycned with it's stored keyframes mode\n\t   "
+                   "(keyframes are stored in Eulers but bone pose rotation mode is set to Quaternions), "
+                   "no rotation will be stored for this bone!",
+                   (bone_name, scs_animation.name))
+
+        # SCALE
+        if len(sca_curves) > 0:
+            scales = _sample_curves(sca_curves, frames, (1.0, 1.0, 1.0))
+
+            for frame_i, index in zip(*numpy.nonzero(scales < 0)):
+                lprint(str("E Negative scale detected on bone %r:\n\t   "
+                           "(Action: %r, keyframe no.: %s, SCS Animation: %r)."),
+                       (bone_name, action.name, frames[frame_i], scs_animation.name))
+                invalid_data = True
+
+            matrices[:, :3, :3] *= scales[:, numpy.newaxis, :]
+
+        # COMPUTE SCS FRAME MATRICES
+        matrices = bone_mat @ matrices @ scale_removal_mat_inv
+
+        if anim_export_tolerance > 0:
+            keyframes = _get_reduced_keyframes(matrices, anim_export_tolerance)
+        else:
+            keyframes = list(range(len(frames)))
+
+        keyframes_count += len(frames)
+        dropped_keyframes_count += len(frames) - len(keyframes)
+
+        # time of each keyframe includes also time of dropped keyframes before it
+        timings_stream = []
+        prev_keyframe = -1
+        for keyframe in keyframes:
+            timings_stream.append(("__time__", frame_time * (keyframe - prev_keyframe)), )
+            prev_keyframe = keyframe
+
+        matrices_stream = [("__matrix__", matrix) for matrix in matrices[keyframes].transpose(0, 2, 1).tolist()]
 
         anim_timing = ("_TIME", timings_stream)
         anim_matrices = ("_MATRIX", matrices_stream)
@@ -249,6 +445,12 @@ def _get_bone_channels(scs_root_obj, armature, scs_animation, action, export_sca
         bone_data = (bone_name, bone_anim)
         bone_channels.append(bone_data)
 
+    _profiler.add_items(keyframes_count)
+
+    if dropped_keyframes_count > 0:
+        lprint("I Keyframe reduction dropped %i of %i bone keyframes in SCS Animation %r.",
+               (dropped_keyframes_count, keyframes_count, scs_animation.name))
+
     # return empty bone channels if data are invalid
     if invalid_data:
         return []
@@ -283,8 +485,9 @@ def _fill_global_section(skeleton_file, total_time, bone_channel_cnt, custom_cha
 
 
 def _fill_channel_sections(data_list, channel_type="BoneChannel"):
-    """Fills up Channel sections."""
-    sections = []
+    """Fills up Channel sections.
+    Sections are yielded one by one, so they can be written to file as soon as they are created,
+    unless deferred writing is used, which creates all of them on submission."""
     for item_i, item in enumerate(data_list):
         section = _SectionData(channel_type)
         section.props.append(("Name", item[0]))
@@ -293,8 +496,7 @@ def _fill_channel_sections(data_list, channel_type="BoneChannel"):
         for stream in item[1]:
             # print(' stream[0]: %s\n stream[1]: %s' % (str(stream[0]), str(stream[1])))
             section.sections.append(_pix_container.make_stream_section(stream[1], stream[0], ()))
-        sections.append(section)
-    return sections
+        yield section
 
 
 def export(scs_root_obj, armature, scs_animation, dirpath, name_suffix, skeleton_filepath):
@@ -330,8 +532,10 @@ def export(scs_root_obj, armature, scs_animation, dirpath, name_suffix, skeleton
     # DATA GATHERING
     total_time = scs_animation.length
     action = bpy.data.actions[scs_animation.action]
-    bone_channels = _get_bone_channels(scs_root_obj, armature, scs_animation, action, scs_globals.export_scale)
-    custom_channels = _get_custom_channels(scs_animation, action)
+    with _profiler.stage("bone channels"):
+        bone_channels = _get_bone_channels(scs_root_obj, armature, scs_animation, action, scs_globals.export_scale)
+    with _profiler.stage("custom channels"):
+        custom_channels = _get_custom_channels(scs_animation, action)
 
     # DATA CREATION
     header_section = _fill_header_section(scs_animation.name, scs_globals.export_write_signature)
@@ -347,11 +551,7 @@ def export(scs_root_obj, armature, scs_animation, dirpath, name_suffix, skeleton
         return False
 
     # DATA ASSEMBLING
-    pia_container = [header_section, global_section]
-    for section in custom_channel_sections:
-        pia_container.append(section)
-    for section in bone_channel_sections:
-        pia_container.append(section)
+    pia_container = chain((header_section, global_section), custom_channel_sections, bone_channel_sections)
 
     # FILE EXPORT
     ind = "    "
@@ -20,8 +20,9 @@
 
 import os
 import collections
+import numpy
 from re import match
-from mathutils import Matrix, Vector, Color
+from mathutils import Matrix, Vector
 from io_scs_tools.consts import Mesh as _MESH_consts
 from io_scs_tools.consts import Operators as _OP_consts
 from io_scs_tools.consts import PrefabLocators as _PL_consts
@@ -32,6 +33,7 @@ from io_scs_tools.exp.pim.piece import Piece
 from io_scs_tools.exp.pim.part import Part
 from io_scs_tools.exp.pim.locator import Locator
 from io_scs_tools.exp.pim.bones import Bones
+from io_scs_tools.exp.pim.mesh_data import MeshData
 from io_scs_tools.exp.pim.piece_skin import PieceSkin
 from io_scs_tools.exp.pim.piece_skin import PieceSkinStream
 from io_scs_tools.internals.containers import pix as _pix_container
@@ -39,14 +41,86 @@ from io_scs_tools.utils import mesh as _mesh_utils
 from io_scs_tools.utils import name as _name_utils
 from io_scs_tools.utils import object as _object_utils
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
-from io_scs_tools.utils.convert import change_to_scs_uv_coordinates as _change_to_scs_uv_coordinates
+from io_scs_tools.utils import profiler as _profiler
 from io_scs_tools.utils.convert import get_scs_transformation_components as _get_scs_transformation_components
 from io_scs_tools.utils.convert import scs_to_blend_matrix as _scs_to_blend_matrix
 from io_scs_tools.utils.convert import hookup_name_to_hookup_id as _hookup_name_to_hookup_id
 from io_scs_tools.utils.printout import lprint
 
-_ZERO_NORMAL = Vector.Fill(3)
-""":type: Vector"""
+_PIECE_MAX_VERTEX_COUNT = 65536 - 3
+"""Max number of vertices in piece before adding next polygon, otherwise piece is split."""
+
+
+def _get_polygons_corners(loop_starts, loop_totals, polys):
+    """Gets corners of given polygons in the order of polygons.
+
+    :param loop_starts: loop start index per mesh polygon
+    :type loop_starts: numpy.ndarray
+    :param loop_totals: number of loops per mesh polygon
+    :type loop_totals: numpy.ndarray
+    :param polys: indices of polygons
+    :type polys: numpy.ndarray
+    :return: corner offsets per polygon (with total corners count at the end) and loop index per corner
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    totals = loop_totals[polys]
+
+    corner_offsets = numpy.zeros(len(polys) + 1, dtype=numpy.int64)
+    numpy.cumsum(totals, out=corner_offsets[1:])
+
+    corner_loops = numpy.repeat(loop_starts[polys] - corner_offsets[:-1], totals) + numpy.arange(corner_offsets[-1])
+
+    return corner_offsets, corner_loops
+
+
+def _weld_piece_polygons(corner_offsets, corners, vertex_count):
+    """Welds corners of polygons into piece vertices and divides polygons into segments,
+    one segment per piece, so none of the pieces gets over max number of vertices.
+
+    First segment belongs to piece with given starting vertex count, each next one to new split piece.
+    First segment can be empty, if piece with given vertex count is already full.
+
+    :param corner_offsets: corner offsets per polygon with total corners count at the end
+    :type corner_offsets: numpy.ndarray
+    :param corners: per corner data: (vertex indices, normals, list of uvs, rgbas, tangents or None)
+    :type corners: tuple
+    :param vertex_count: number of vertices in piece before first polygon
+    :type vertex_count: int
+    :return: list of segments: (start polygon, end polygon, corners of welded vertices, welded vertex index per segment corner)
+    :rtype: list[tuple[int, int, numpy.ndarray, numpy.ndarray]]
+    """
+    vert_indices, normals, uvs, rgbas, tangents = corners
+
+    segments = []
+    poly_start = 0
+    polys_count = len(corner_offsets) - 1
+    while poly_start < polys_count:
+
+        corner_start = corner_offsets[poly_start]
+
+        welded_corners, corner_vert_indices = Piece.weld_vertices(vert_indices[corner_start:],
+                                                                  normals[corner_start:],
+                                                                  [uv_layer_uvs[corner_start:] for uv_layer_uvs in uvs],
+                                                                  rgbas[corner_start:],
+                                                                  tangents[corner_start:] if tangents is not None else None)
+
+        # number of piece vertices before each polygon
+        is_new_vertex = numpy.zeros(len(corner_vert_indices), dtype=numpy.int64)
+        is_new_vertex[welded_corners] = 1
+        new_vertex_counts = numpy.concatenate(([0], numpy.cumsum(is_new_vertex)))
+        vertex_counts = vertex_count + new_vertex_counts[corner_offsets[poly_start:-1] - corner_start]
+
+        exceeding_polys = numpy.flatnonzero(vertex_counts > _PIECE_MAX_VERTEX_COUNT)
+        poly_end = poly_start + int(exceeding_polys[0]) if len(exceeding_polys) > 0 else polys_count
+
+        # vertices of the segment are the ones which first appeared in it, as welding is done in order of corners
+        corner_end = corner_offsets[poly_end] - corner_start
+        segments.append((poly_start, poly_end, welded_corners[welded_corners < corner_end] + corner_start, corner_vert_indices[:corner_end]))
+
+        vertex_count = 0
+        poly_start = poly_end
+
+    return segments
 
 
 def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepath, mesh_objects, model_locators,
@@ -187,31 +261,90 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
         """:type: mathutils.Matrix"""
 
         # get initial mesh & extra copy of the mesh for normals
+        _profiler.begin("mesh preparation")
         mesh = _object_utils.get_mesh(mesh_obj)
         mesh_for_normals = _mesh_utils.get_mesh_for_normals(mesh)
 
         # prepare meshes
         faces_mapping = _mesh_utils.bm_prepare_mesh_for_export(mesh, mesh_transf_mat, triangulate=True)
-
-        # cache terrain points status, to avoid vertex group checking on each vertex if not present
-        terrain_point_vert_groups_names = set()
+        _profiler.end()
+
+        # cache terrain points vertex groups, to avoid vertex group checking on each vertex.
+        # Each vertex group is mapped to it's node index and variants with info if current part is included in them,
+        # or None if no variants are defined.
+        #
+        # NOTE: variant index is donated by direct order of variants in inventory
+        # so export in PIT has to use the same order otherwise variant
+        # indices will be misplaced
+        terrain_point_vert_groups = {}
         for vert_group in vert_groups:
+
             # if vertex group name doesn't match prescribed one ignore this vertex group
-            if match(_OP_consts.TerrainPoints.vg_name_regex, vert_group.name):
-                terrain_point_vert_groups_names.add(vert_group.name)
-        has_terrain_points = len(terrain_point_vert_groups_names) > 0
+            if not match(_OP_consts.TerrainPoints.vg_name_regex, vert_group.name):
+                continue
+
+            # if node index is not in bounds ignore this vertex group
+            node_index = int(vert_group.name[-1])
+            if node_index >= _PL_consts.PREFAB_NODE_COUNT_MAX:
+                continue
+
+            # if no variants defined terrain points will be added globally (without variant block)
+            if len(root_object.scs_object_variant_inventory) == 0:
+                terrain_point_vert_groups[vert_group.index] = (node_index, None)
+                continue
+
+            tp_variants = []
+            for variant_i, variant in enumerate(root_object.scs_object_variant_inventory):
+
+                is_part_included = False
+                for variant_part in variant.parts:
+                    if variant_part.name == mesh_obj.scs_props.scs_part and variant_part.include:
+                        is_part_included = True
+                        break
+
+                tp_variants.append((variant_i, is_part_included))
+
+            terrain_point_vert_groups[vert_group.index] = (node_index, tp_variants)
+
+        has_terrain_points = len(terrain_point_vert_groups) > 0
+        terrain_point_verts = set()  # vertices already saved to terrain points storage
 
         missing_uv_layers = {}  # stores missing uvs specified by materials of this object
-        missing_vcolor = False  # indicates if object is missing vertex color layer
-        missing_vcolor_a = False  # indicates if object is missing vertex color alpha layer
         missing_skinned_verts = set()  # indicates if object is having only partial skin, which is not allowed in our models
         has_unnormalized_skin = False  # indicates if object has vertices which bones weight sum is smaller then one
         last_tangents_uv_layer = None  # stores uv layer for which tangents were calculated, so tangents won't be calculated all over again
-        max_vcolor = 0  # indicates maximum vertex color inside this model and is used to report unnormalized vertex color over 1.0
+        tangents_uv_layer = None  # stores uv layer for which tangents were successfully calculated, None if none were calculated yet
+
+        # extract all mesh data at once
+        _profiler.begin("mesh data")
+        mesh_data = MeshData(mesh, mesh_for_normals, faces_mapping, pos_transf_mat, nor_transf_mat, tangent_transf_mat)
+        loop_vert_indices = mesh_data.vertex_indices
+        loop_normals = mesh_data.normals
+        loop_tangents = None
+
+        # positions as tuples are needed only for skin and terrain points entries
+        if is_skin_used or has_terrain_points:
+            vert_positions = list(map(tuple, mesh_data.positions.tolist()))
+        else:
+            vert_positions = None
+
+        # 4. vcol -> vcol_lay = mesh.color_attributes[0].data; vcol_lay[loop_i].color
+        if mesh_data.polygons_count > 0:
+            loop_vcols, missing_vcolor, missing_vcolor_a, max_vcolor = mesh_data.get_vertex_colors()
+        else:
+            loop_vcols, missing_vcolor, missing_vcolor_a, max_vcolor = None, False, False, 0
 
-        for poly in mesh.polygons:
+        _profiler.add_items(len(mesh_data.positions))
+        _profiler.end()
 
-            mat_index = poly.material_index
+        # polygons of each piece key in order of their appearance; each entry holds:
+        # material name, per loop uv layers, uv aliases, list of polygon indices and list of per loop tangents per polygon
+        pieces_polygons = collections.OrderedDict()
+
+        _profiler.begin("polygons", items=mesh_data.polygons_count)
+        for poly_i in range(mesh_data.polygons_count):
+
+            mat_index = mesh_data.material_indices[poly_i]
 
             # check material existence and decide what material name and effect has to be used
             if mat_index >= len(mesh_obj.material_slots) or mesh_obj.material_slots[mat_index].material is None:  # no material or invalid index
@@ -239,7 +372,9 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
 
                 if nmap_uv_layer in mesh.uv_layers:
                     try:
-                        mesh.calc_tangents(uvmap=nmap_uv_layer)
+                        with _profiler.stage("tangents"):
+                            loop_tangents = mesh_data.get_tangents(nmap_uv_layer)
+                        tangents_uv_layer = nmap_uv_layer
                     except RuntimeError:
                         invalid_objects_for_tangents.add(mesh_obj.name)
                 else:
@@ -253,83 +388,15 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
             else:  # if rigid just expot each mesh as own piece (conversion tools should take care about merging)
                 piece_key = pim_mat_name + "|" + part_name + "|" + str(mesh_i)
 
-            # create mesh piece object if max number of vertices is reached or no p piece for current piece dictonary key exists
-            if piece_key in mesh_pieces and mesh_pieces[piece_key].get_vertex_count() > 65536 - 3:
-
-                piece = mesh_pieces[piece_key]
-
-                # put current piece of current mesh to global list
-                pim_pieces.append(piece)
-
-                # add pieces of current mesh to part
-                pim_part = pim_parts[part_name]
-                pim_part.add_piece(piece)
-
-                del mesh_pieces[piece_key]
-                mesh_pieces[piece_key] = Piece(len(pim_pieces) + len(mesh_pieces), pim_materials[pim_mat_name])
-
-            elif piece_key not in mesh_pieces:
-
-                mesh_pieces[piece_key] = Piece(len(pim_pieces) + len(mesh_pieces), pim_materials[pim_mat_name])
-
-            mesh_piece = mesh_pieces[piece_key]
-            """:type: Piece"""
+            # 3. uvs -> per loop uvs of each uv layer used by material, None for missing uv layer
+            # NOTE: uvs depend only on material, which is the same for all polygons of the piece, so collect them only once
+            if piece_key not in pieces_polygons:
 
-            # create/get skin data section for current piece
-            if is_skin_used:
-                mesh_piece_idx = mesh_piece.get_index()
-
-                if mesh_piece_idx not in pim_piece_skins:
-                    new_skin_stream = PieceSkinStream(PieceSkinStream.Types.POSITION)
-                    pim_piece_skins[mesh_piece_idx] = PieceSkin(mesh_piece_idx, new_skin_stream)
-
-                skin_stream = pim_piece_skins[mesh_piece_idx].get_skin_stream_by_type(PieceSkinStream.Types.POSITION)
-            else:
-                skin_stream = None
-
-            # get polygon loop indices for normals depending on mapped triangulated face
-            if poly.index in faces_mapping:
-                normals_poly_loop_indices = list(mesh_for_normals.polygons[faces_mapping[poly.index]].loop_indices)
-                normals_poly_i = faces_mapping[poly.index]
-            else:
-                normals_poly_loop_indices = list(mesh_for_normals.polygons[poly.index].loop_indices)
-                normals_poly_i = poly.index
-
-            # vertex data
-            triangle_pvert_indices = []  # storing vertex indices for this polygon triangle
-            for loop_i in poly.loop_indices:
-
-                loop = mesh.loops[loop_i]
-                """:type: bpy.types.MeshLoop"""
-                vert_i = loop.vertex_index
-
-                # get data of current vertex
-                # 1. position -> mesh.vertices[loop.vertex_index].co
-                position = tuple(pos_transf_mat @ mesh.vertices[vert_i].co)
-
-                # 2. normal -> mesh_for_normals.loops[loop_i].normal -> calc_normals_split() has to be called before
-                if mesh_for_normals.has_custom_normals or poly.use_smooth:
-                    for i, normals_poly_loop_i in enumerate(normals_poly_loop_indices):
-                        normal_loop = mesh_for_normals.loops[normals_poly_loop_i]
-
-                        # match by vertex index as triangle will for sure have three unique vertices
-                        if vert_i == normal_loop.vertex_index:
-                            vert_normal = normal_loop.normal
-                            del normals_poly_loop_indices[i]
-                            break
-                    else:
-                        vert_normal = _ZERO_NORMAL
-                        lprint("E Normals data gathering went wrong, expect corrupted mesh! Shouldn't happen...")
-                else:
-                    vert_normal = mesh_for_normals.polygons[normals_poly_i].normal
-                normal = tuple((nor_transf_mat @ vert_normal).normalized())
-
-                # 3. uvs -> uv_lay = mesh.uv_layers[0].data; uv_lay[loop_i].uv
-                uvs = []
+                uv_layers = []
                 uvs_aliases = []
                 tex_coord_alias_map = pim_materials[pim_mat_name].get_tex_coord_map()
                 if len(tex_coord_alias_map) < 1:  # no textures or none uses uv mapping in current material effect
-                    uvs.append((0.0, 0.0))
+                    uv_layers.append(None)
                     uvs_aliases.append(["_TEXCOORD0"])
 
                     # report missing mappings only on actual materials with textures using uv mappings
@@ -344,7 +411,7 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
                     for uv_lay_name in tex_coord_alias_map:
 
                         if uv_lay_name not in mesh.uv_layers:
-                            uvs.append((0.0, 0.0))
+                            uv_layers.append(None)
 
                             # properly report missing uv layers where name of uv layout is key and materials that misses it are values
                             if uv_lay_name not in missing_uv_layers:
@@ -353,8 +420,7 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
                             if pim_mat_name not in missing_uv_layers[uv_lay_name]:  # add material if not already there
                                 missing_uv_layers[uv_lay_name].append(pim_mat_name)
                         else:
-                            uv_lay = mesh.uv_layers[uv_lay_name]
-                            uvs.append(_change_to_scs_uv_coordinates(uv_lay.data[loop_i].uv))
+                            uv_layers.append(mesh_data.get_uvs(uv_lay_name))
 
                         aliases = []
                         for alias_index in tex_coord_alias_map[uv_lay_name]:
@@ -362,154 +428,203 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
 
                         uvs_aliases.append(aliases)
 
-                # 4. vcol -> vcol_lay = mesh.color_attributes[0].data; vcol_lay[loop_i].color
-                if _MESH_consts.default_vcol not in mesh.color_attributes:  # get RGB component of RGBA
-                    vcol = (1.0,) * 3
-                    missing_vcolor = True
-                else:
-                    vcolors = mesh.color_attributes[_MESH_consts.default_vcol]
+                pieces_polygons[piece_key] = (pim_mat_name, uv_layers, uvs_aliases, [], [])
 
-                    if vcolors.domain == 'POINT':
-                        color = Color(vcolors.data[vert_i].color[:3])
-                    elif vcolors.domain == 'CORNER':
-                        color = Color(vcolors.data[loop_i].color[:3])
-                    else:
-                        raise TypeError("Invalid vertex color domain type!")
-
-                    color = color.from_scene_linear_to_srgb()
-
-                    if vcolors.data_type == 'BYTE_COLOR':
-                        for i in range(0, 3):
-                            # for byte color 8-bits 0.5 can not be set, thus clamp 128/255 to 0.5 or report to big vcolor otherwise
-                            if 0.5 < color[i] <= 0.50198:
-                                color[i] = 0.5
-                            elif color[i] > 0.50198 and color[i] > max_vcolor:
-                                max_vcolor = color[i]
-                    elif vcolors.data_type == 'FLOAT_COLOR':
-                        for i in range(0, 3):
-                            if color[i] > 0.5 and color[i] > max_vcolor:
-                                max_vcolor = color[i]
-                    else:
-                        raise TypeError("Invalid vertex color type!")
+            # 5. tangents -> calculated only if needed, on the last uv layer tangents calculation succeeded on
+            if nmap_uv_layer and loop_tangents is None:
+                with _profiler.stage("tangents"):
+                    loop_tangents = mesh_data.get_tangents(tangents_uv_layer)
 
-                    vcol = (color[0] * 2, color[1] * 2, color[2] * 2)
+            pieces_polygons[piece_key][3].append(poly_i)
+            pieces_polygons[piece_key][4].append(loop_tangents if nmap_uv_layer else None)
 
-                if _MESH_consts.default_vcol + _MESH_consts.vcol_a_suffix not in mesh.color_attributes:  # get A component of RGBA
-                    vcol += (1.0,)
-                    missing_vcolor_a = True
-                else:
-                    vcolors = mesh.color_attributes[_MESH_consts.default_vcol + _MESH_consts.vcol_a_suffix]
-
-                    if vcolors.domain == 'POINT':
-                        alpha = Color(vcolors.data[vert_i].color[:3])
-                    elif vcolors.domain == 'CORNER':
-                        alpha = Color(vcolors.data[loop_i].color[:3])
-                    else:
-                        raise TypeError("Invalid vertex color domain type!")
-
-                    alpha = alpha.from_scene_linear_to_srgb()
-                    alpha = (alpha[0] + alpha[1] + alpha[2]) / 3.0  # take avg of colors for alpha
-
-                    # since blender is saving vcolor in 8-bits 0.5 can not be set, thus clamp 128/255 to 0.5 or report to big vcolor otherwise
-                    if vcolors.data_type == 'BYTE_COLOR':
-                        # for byte color 8-bits 0.5 can not be set, thus clamp 128/255 to 0.5 or report to big vcolor otherwise
-                        if 0.5 < alpha <= 0.50198:
-                            alpha = 0.5
-                        elif alpha > 0.50198 and alpha > max_vcolor:
-                            max_vcolor = alpha
-                    elif vcolors.data_type == 'FLOAT_COLOR':
-                        if alpha > 0.5 and alpha > max_vcolor:
-                            max_vcolor = alpha
-                    else:
-                        raise TypeError("Invalid vertex color type!")
-
-                    vcol += (alpha * 2,)
-
-                # 5. tangent -> loop.tangent; loop.bitangent_sign -> calc_tangents() has to be called before
-                if pim_materials[pim_mat_name].get_nmap_uv_name():  # calculate tangents only if needed
-                    tangent = (tangent_transf_mat @ loop.tangent).normalized()
-                    tangent = (tangent[0], tangent[1], tangent[2], loop.bitangent_sign)
-                else:
-                    tangent = None
-
-                # 6. There we go, vertex data collected! Now create internal vertex index, for triangle and skin stream construction
-                # Construct unique vertex index - donated by mesh and vertex index, as we may export more mesh objects into same piece,
-                # thus only vertex index wouldn't be unique representation.
-                unique_vert_i = "%i|%i" % (mesh_i, vert_i)
-                piece_vert_index = mesh_piece.add_vertex(unique_vert_i, position, normal, uvs, uvs_aliases, vcol, tangent)
+            # 9. Terrain Points: save vertex to terrain points storage, if present in correct vertex group.
+            # NOTE: each vertex is saved only on it's first loop, as terrain points on the same position are saved only once
+            if has_terrain_points:
+                loop_start = mesh_data.loop_starts[poly_i]
+                for loop_i in range(loop_start, loop_start + mesh_data.loop_totals[poly_i]):
 
-                # 7. Add vertex to triangle creation list
-                triangle_pvert_indices.append(piece_vert_index)
+                    vert_i = loop_vert_indices[loop_i]
+                    if vert_i in terrain_point_verts:
+                        continue
 
-                # 8. Get skinning data for vertex and save it to skin stream
-                if is_skin_used:
-                    bone_weights = {}
-                    bone_weights_sum = 0
-                    for v_group_entry in mesh.vertices[vert_i].groups:
-                        bone_indx = bones.get_bone_index(vert_groups[v_group_entry.group].name)
-                        bone_weight = v_group_entry.weight
-
-                        # proceed only if bone exists in our armature
-                        if bone_indx != -1:
-                            bone_weights[bone_indx] = bone_weight
-                            bone_weights_sum += bone_weight
-
-                    if bone_weights_sum > 0:
-                        skin_entry = PieceSkinStream.Entry(piece_vert_index, position, bone_weights, bone_weights_sum)
-                        skin_stream.add_entry(skin_entry)
-                    else:
-                        # report un-skinned vertices (no bones or zero sum weight) or badly skinned model
-                        missing_skinned_verts.add(vert_i)
-                        if bone_weights_sum < 1:
-                            has_unnormalized_skin = True
+                    terrain_point_verts.add(vert_i)
+                    position = vert_positions[vert_i]
+                    normal = tuple(loop_normals[loop_i].tolist())
 
-                # 9. Terrain Points: save vertex to terrain points storage, if present in correct vertex group
-                if has_terrain_points:
                     for group in mesh.vertices[vert_i].groups:
 
-                        # if current object doesn't have vertex group found in mesh data, then ignore that group
-                        # This can happen if multiple objects are using same mesh and
+                        # ignore vertex groups which are not terrain points ones. This also ignores groups not found
+                        # in current object, which can happen if multiple objects are using same mesh and
                         # some of them have vertex groups, but others not.
-                        if group.group >= len(mesh_obj.vertex_groups):
-                            continue
-
-                        curr_vg_name = mesh_obj.vertex_groups[group.group].name
-
-                        # if vertex group name doesn't match prescribed one ignore this vertex group
-                        if curr_vg_name not in terrain_point_vert_groups_names:
+                        if group.group not in terrain_point_vert_groups:
                             continue
 
-                        # if node index is not in bounds ignore this vertex group
-                        node_index = int(curr_vg_name[-1])
-                        if node_index >= _PL_consts.PREFAB_NODE_COUNT_MAX:
-                            continue
+                        node_index, tp_variants = terrain_point_vert_groups[group.group]
 
-                        # if no variants defined add globally (without variant block)
-                        if len(root_object.scs_object_variant_inventory) == 0:
+                        if tp_variants is None:
                             used_terrain_points.add(-1, node_index, position, normal)
                             continue
 
-                        # finally iterate variant parts entries to find where this part is included
-                        # and add terrain points to transitional structure
-                        #
-                        # NOTE: variant index is donated by direct order of variants in inventory
-                        # so export in PIT has to use the same order otherwise variant
-                        # indices will be misplaced
-                        for variant_i, variant in enumerate(root_object.scs_object_variant_inventory):
+                        # add terrain points to transitional structure for variants where this part is included
+                        for variant_i, is_part_included in tp_variants:
 
                             used_terrain_points.ensure_entry(variant_i, node_index)
 
-                            for variant_part in variant.parts:
-                                if variant_part.name == mesh_obj.scs_props.scs_part and variant_part.include:
+                            if is_part_included:
+                                used_terrain_points.add(variant_i, node_index, position, normal)
+
+        _profiler.end()
+
+        # 6. weld corners of each piece into piece vertices and find out where pieces have to be split,
+        # so that none of them gets over max number of vertices
+        _profiler.begin("welding")
+        loop_starts = numpy.array(mesh_data.loop_starts, dtype=numpy.int64)
+        loop_totals = numpy.array(mesh_data.loop_totals, dtype=numpy.int64)
 
-                                    used_terrain_points.add(variant_i, node_index, position, normal)
-                                    break
+        pieces_segments = []  # list of (piece key, corner offsets, corner loops, corners data, segments)
+        pieces_events = []  # list of (polygon index, piece key, is split) marking creation of new piece before polygon
+        for piece_key, (__, uv_layers, __, polys, polys_tangents) in pieces_polygons.items():
 
-            # triangles
-            if face_flip:
-                mesh_piece.add_triangle(tuple(triangle_pvert_indices))
+            polys = numpy.array(polys, dtype=numpy.int64)
+            corner_offsets, corner_loops = _get_polygons_corners(loop_starts, loop_totals, polys)
+            corners_count = len(corner_loops)
+            _profiler.add_items(corners_count)
+
+            corner_uvs = []
+            for uv_layer in uv_layers:
+                if uv_layer is None:
+                    corner_uvs.append(numpy.zeros((corners_count, 2), dtype=numpy.float64))
+                else:
+                    corner_uvs.append(uv_layer[corner_loops])
+
+            if polys_tangents[0] is None:
+                corner_tangents = None
+            elif all(poly_tangents is polys_tangents[0] for poly_tangents in polys_tangents):
+                corner_tangents = polys_tangents[0][corner_loops]
+            else:  # tangents were recalculated on another uv layer in between polygons of this piece
+                corner_tangents = numpy.empty((corners_count, 4), dtype=numpy.float64)
+                for i, poly_tangents in enumerate(polys_tangents):
+                    poly_corners = slice(corner_offsets[i], corner_offsets[i + 1])
+                    corner_tangents[poly_corners] = poly_tangents[corner_loops[poly_corners]]
+
+            corners = (loop_vert_indices[corner_loops], loop_normals[corner_loops], corner_uvs, loop_vcols[corner_loops], corner_tangents)
+
+            start_vertex_count = mesh_pieces[piece_key].get_vertex_count() if piece_key in mesh_pieces else 0
+            segments = _weld_piece_polygons(corner_offsets, corners, start_vertex_count)
+
+            if piece_key not in mesh_pieces:
+                pieces_events.append((int(polys[0]), piece_key, False))
+            for poly_start, __, __, __ in segments[1:]:
+                pieces_events.append((int(polys[poly_start]), piece_key, True))
+
+            pieces_segments.append((piece_key, corner_offsets, corner_loops, corners, segments))
+
+        _profiler.end()
+
+        # 7. create and split pieces in the same order as polygons are requiring them,
+        # so piece indices are given by the order of polygons
+        _profiler.begin("pieces")
+        segment_pieces = {}  # list of pieces per piece key, one for each segment
+        for piece_key in pieces_polygons:
+            if piece_key in mesh_pieces:
+                segment_pieces[piece_key] = [mesh_pieces[piece_key]]
             else:
-                mesh_piece.add_triangle(tuple(triangle_pvert_indices[::-1]))  # yep it's weird but it simply works vice versa
+                segment_pieces[piece_key] = []
+
+        for __, piece_key, is_split in sorted(pieces_events, key=lambda event: event[0]):
+
+            pim_material = pim_materials[pieces_polygons[piece_key][0]]
+
+            if is_split:
+
+                piece = mesh_pieces[piece_key]
+
+                # put current piece of current mesh to global list
+                pim_pieces.append(piece)
+
+                # add pieces of current mesh to part
+                pim_part = pim_parts[part_name]
+                pim_part.add_piece(piece)
+
+                del mesh_pieces[piece_key]
+
+            mesh_pieces[piece_key] = Piece(len(pim_pieces) + len(mesh_pieces), pim_material)
+            segment_pieces[piece_key].append(mesh_pieces[piece_key])
+
+            # create skin data section for new piece
+            if is_skin_used:
+                mesh_piece_idx = mesh_pieces[piece_key].get_index()
+
+                if mesh_piece_idx not in pim_piece_skins:
+                    new_skin_stream = PieceSkinStream(PieceSkinStream.Types.POSITION)
+                    pim_piece_skins[mesh_piece_idx] = PieceSkin(mesh_piece_idx, new_skin_stream)
+
+        # 8. fill pieces with welded vertices, triangles and skin entries
+        vert_bone_weights = {}  # cached bone weights and their sum per vertex index
+        for piece_key, corner_offsets, corner_loops, corners, segments in pieces_segments:
+
+            uvs_aliases = pieces_polygons[piece_key][2]
+            vert_indices, normals, uvs, rgbas, tangents = corners
+
+            for (poly_start, poly_end, welded_corners, corner_vert_indices), mesh_piece in zip(segments, segment_pieces[piece_key]):
+
+                if poly_start == poly_end:
+                    continue
+
+                first_vert_index = mesh_piece.add_vertices(mesh_data.positions[vert_indices[welded_corners]].tolist(),
+                                                           normals[welded_corners].tolist(),
+                                                           [uv_layer_uvs[welded_corners].tolist() for uv_layer_uvs in uvs],
+                                                           uvs_aliases,
+                                                           rgbas[welded_corners].tolist(),
+                                                           tangents[welded_corners].tolist() if tangents is not None else None)
+
+                # triangles
+                segment_corners_start = corner_offsets[poly_start]
+                piece_vert_indices = (corner_vert_indices + first_vert_index).tolist()
+                for poly_offset in range(poly_start, poly_end):
+
+                    triangle_pvert_indices = piece_vert_indices[corner_offsets[poly_offset] - segment_corners_start:
+                                                                corner_offsets[poly_offset + 1] - segment_corners_start]
+
+                    if face_flip:
+                        mesh_piece.add_triangle(tuple(triangle_pvert_indices))
+                    else:
+                        mesh_piece.add_triangle(tuple(triangle_pvert_indices[::-1]))  # yep it's weird but it simply works vice versa
+
+                # Get skinning data for vertices and save it to skin stream
+                if is_skin_used:
+
+                    skin_stream = pim_piece_skins[mesh_piece.get_index()].get_skin_stream_by_type(PieceSkinStream.Types.POSITION)
+
+                    segment_vert_indices = vert_indices[segment_corners_start:corner_offsets[poly_end]].tolist()
+                    for vert_i, piece_vert_index in zip(segment_vert_indices, piece_vert_indices):
+
+                        if vert_i not in vert_bone_weights:
+                            bone_weights = {}
+                            bone_weights_sum = 0
+                            for v_group_entry in mesh.vertices[vert_i].groups:
+                                bone_indx = bones.get_bone_index(vert_groups[v_group_entry.group].name)
+                                bone_weight = v_group_entry.weight
+
+                                # proceed only if bone exists in our armature
+                                if bone_indx != -1:
+                                    bone_weights[bone_indx] = bone_weight
+                                    bone_weights_sum += bone_weight
+
+                            vert_bone_weights[vert_i] = (bone_weights, bone_weights_sum)
+
+                        bone_weights, bone_weights_sum = vert_bone_weights[vert_i]
+                        if bone_weights_sum > 0:
+                            skin_entry = PieceSkinStream.Entry(piece_vert_index, vert_positions[vert_i], bone_weights, bone_weights_sum)
+                            skin_stream.add_entry(skin_entry)
+                        else:
+                            # report un-skinned vertices (no bones or zero sum weight) or badly skinned model
+                            missing_skinned_verts.add(vert_i)
+                            if bone_weights_sum < 1:
+                                has_unnormalized_skin = True
+
+        _profiler.end()
 
         # free normals calculations & remove temporary mesh
         _mesh_utils.cleanup_mesh(mesh_for_normals)
@@ -611,33 +726,39 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
         pim_locators.append(locator)
 
     # create container
-    pim_container = [pim_header.get_as_section(), pim_global.get_as_section()]
+    def pim_container():
+        """Yields sections of PIM file, so piece and skin sections are created only while they are being written.
+        NOTE: with deferred writing sections are all created on submission, before writing in worker thread starts.
+        """
 
-    for mat_name in pim_materials:
-        pim_container.append(pim_materials[mat_name].get_as_section())
+        yield pim_header.get_as_section()
+        yield pim_global.get_as_section()
 
-    for pim_piece in pim_pieces:
-        pim_container.append(pim_piece.get_as_section())
+        for mat_name in pim_materials:
+            yield pim_materials[mat_name].get_as_section()
 
-    for part_name in used_parts.get_as_list():
+        for pim_piece in pim_pieces:
+            yield pim_piece.get_as_section()
 
-        # export all parts even empty ones used only in PIC and/or PIP
-        if part_name in pim_parts:
-            pim_container.append(pim_parts[part_name].get_as_section())
-        else:
-            pim_container.append(Part(part_name).get_as_section())
+        for part_name in used_parts.get_as_list():
 
-    for locator in pim_locators:
-        pim_container.append(locator.get_as_section())
+            # export all parts even empty ones used only in PIC and/or PIP
+            if part_name in pim_parts:
+                yield pim_parts[part_name].get_as_section()
+            else:
+                yield Part(part_name).get_as_section()
 
-    if is_skin_used:
-        pim_container.append(bones.get_as_section())
+        for locator in pim_locators:
+            yield locator.get_as_section()
+
+        if is_skin_used:
+            yield bones.get_as_section()
 
-        for piece_key in pim_piece_skins:
-            pim_container.append(pim_piece_skins[piece_key].get_as_section())
+            for piece_key in pim_piece_skins:
+                yield pim_piece_skins[piece_key].get_as_section()
 
     # write to file
     ind = "    "
     pim_filepath = os.path.join(dirpath, root_object.name + ".pim" + name_suffix)
     lprint("I Writting PIM file to %r ...", (pim_filepath,), immediate_timeout=0)
-    return _pix_container.write_data_to_file(pim_container, pim_filepath, ind, print_progress=True)
+    return _pix_container.write_data_to_file(pim_container(), pim_filepath, ind, print_progress=True)
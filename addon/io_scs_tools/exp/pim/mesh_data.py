@@ -0,0 +1,348 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Copyright (C) 2022: SCS Software
+
+import numpy
+from mathutils import Color
+from io_scs_tools.consts import Mesh as _MESH_consts
+from io_scs_tools.utils import math as _math_utils
+from io_scs_tools.utils.printout import lprint
+
+
+def _get_loops_polygons(polygons, loops_count):
+    """Gets polygon index for each of the loops.
+
+    :param polygons: mesh polygons
+    :type polygons: bpy.types.MeshPolygons
+    :param loops_count: number of mesh loops
+    :type loops_count: int
+    :return: polygon index per loop
+    :rtype: numpy.ndarray
+    """
+    loop_starts = numpy.empty(len(polygons), dtype=numpy.int32)
+    loop_totals = numpy.empty(len(polygons), dtype=numpy.int32)
+    polygons.foreach_get("loop_start", loop_starts)
+    polygons.foreach_get("loop_total", loop_totals)
+
+    polygon_loop_offsets = numpy.arange(numpy.sum(loop_totals)) - numpy.repeat(numpy.cumsum(loop_totals) - loop_totals, loop_totals)
+
+    loops_polygons = numpy.zeros(loops_count, dtype=numpy.int64)
+    loops_polygons[numpy.repeat(loop_starts, loop_totals) + polygon_loop_offsets] = numpy.repeat(numpy.arange(len(polygons)), loop_totals)
+
+    return loops_polygons
+
+
+class MeshData:
+    """Bulk extracted data of triangulated mesh prepared for PIM export.
+
+    All the data are read with "foreach_get" at once per mesh and transformed to SCS values with array operations.
+    Per corner data are indexed by loop index of exported mesh.
+    """
+
+    def __init__(self, mesh, mesh_for_normals, faces_mapping, pos_transf_mat, nor_transf_mat, tangent_transf_mat):
+        """Extracts polygons, positions and normals data of given mesh.
+
+        :param mesh: triangulated mesh prepared for export
+        :type mesh: bpy.types.Mesh
+        :param mesh_for_normals: original mesh with calculated split normals
+        :type mesh_for_normals: bpy.types.Mesh
+        :param faces_mapping: mapping of triangulated polygons indices to original ones
+        :type faces_mapping: dict[int, int]
+        :param pos_transf_mat: vertex position transformation matrix
+        :type pos_transf_mat: mathutils.Matrix
+        :param nor_transf_mat: vertex normals transformation matrix
+        :type nor_transf_mat: mathutils.Matrix
+        :param tangent_transf_mat: tangents transformation matrix
+        :type tangent_transf_mat: mathutils.Matrix
+        """
+        self.__mesh = mesh
+        self.__tangent_transf_mat = tangent_transf_mat
+        self.__uvs = {}
+        self.__tangents = {}
+
+        polygons_count = len(mesh.polygons)
+        loops_count = len(mesh.loops)
+
+        self.polygons_count = polygons_count
+        """Number of polygons in mesh."""
+
+        loop_starts = numpy.empty(polygons_count, dtype=numpy.int32)
+        loop_totals = numpy.empty(polygons_count, dtype=numpy.int32)
+        material_indices = numpy.empty(polygons_count, dtype=numpy.int32)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        mesh.polygons.foreach_get("material_index", material_indices)
+
+        self.loop_starts = loop_starts.tolist()
+        """Index of the first loop per polygon."""
+        self.loop_totals = loop_totals.tolist()
+        """Number of loops per polygon."""
+        self.material_indices = material_indices.tolist()
+        """Material index per polygon."""
+
+        loops_vertices = numpy.empty(loops_count, dtype=numpy.int32)
+        mesh.loops.foreach_get("vertex_index", loops_vertices)
+
+        self.vertex_indices = loops_vertices
+        """Vertex index per loop."""
+
+        positions = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+        mesh.vertices.foreach_get("co", positions)
+
+        self.positions = _math_utils.transform_vectors(pos_transf_mat, positions)
+        """Vertex position in SCS coordinates per vertex, as (N, 3) array."""
+
+        self.normals = self.__get_loops_normals(mesh, mesh_for_normals, faces_mapping, loops_vertices, nor_transf_mat)
+        """Normal in SCS coordinates per loop, as (N, 3) array."""
+
+    @staticmethod
+    def __get_loops_normals(mesh, mesh_for_normals, faces_mapping, loops_vertices, nor_transf_mat):
+        """Gets normals for all loops of triangulated mesh. Smooth and custom normals are taken from the loop of original polygon
+        using the same vertex, flat normals are taken from original polygon.
+
+        :return: normalized normals in SCS coordinates per loop
+        :rtype: numpy.ndarray
+        """
+        polygons_count = len(mesh.polygons)
+        loops_count = len(mesh.loops)
+
+        loops_polygons = _get_loops_polygons(mesh.polygons, loops_count)
+
+        # map triangulated polygons to original ones
+        polygons_mapping = numpy.arange(polygons_count, dtype=numpy.int64)
+        if faces_mapping:
+            polygons_mapping[numpy.fromiter(faces_mapping.keys(), dtype=numpy.int64)] = numpy.fromiter(faces_mapping.values(), dtype=numpy.int64)
+        loops_normals_polygons = polygons_mapping[loops_polygons]
+
+        polygon_normals = numpy.empty(len(mesh_for_normals.polygons) * 3, dtype=numpy.float32)
+        mesh_for_normals.polygons.foreach_get("normal", polygon_normals)
+        normals = polygon_normals.reshape(-1, 3)[loops_normals_polygons]
+
+        if mesh_for_normals.has_custom_normals:
+            smooth_loops = numpy.arange(loops_count)
+        else:
+            use_smooth = numpy.empty(polygons_count, dtype=bool)
+            mesh.polygons.foreach_get("use_smooth", use_smooth)
+            smooth_loops = numpy.flatnonzero(use_smooth[loops_polygons])
+
+        if len(smooth_loops) > 0:
+
+            normals_loops_count = len(mesh_for_normals.loops)
+            normals_loops_vertices = numpy.empty(normals_loops_count, dtype=numpy.int32)
+            loop_normals = numpy.empty(normals_loops_count * 3, dtype=numpy.float32)
+            mesh_for_normals.loops.foreach_get("vertex_index", normals_loops_vertices)
+            mesh_for_normals.loops.foreach_get("normal", loop_normals)
+            loop_normals = loop_normals.reshape(-1, 3)
+
+            # match loops by (original polygon, vertex) key, as triangle will for sure have three unique vertices
+            key_stride = max(len(mesh.vertices), len(mesh_for_normals.vertices)) + 1
+            normals_loops_keys = _get_loops_polygons(mesh_for_normals.polygons, normals_loops_count) * key_stride + normals_loops_vertices
+            sorted_loops = numpy.argsort(normals_loops_keys, kind="stable")
+            sorted_keys = normals_loops_keys[sorted_loops]
+
+            smooth_keys = loops_normals_polygons[smooth_loops] * key_stride + loops_vertices[smooth_loops]
+            found_positions = numpy.minimum(numpy.searchsorted(sorted_keys, smooth_keys), max(normals_loops_count - 1, 0))
+            is_found = sorted_keys[found_positions] == smooth_keys if normals_loops_count > 0 else numpy.zeros(len(smooth_keys), dtype=bool)
+
+            normals[smooth_loops[is_found]] = loop_normals[sorted_loops[found_positions[is_found]]]
+            normals[smooth_loops[~is_found]] = 0.0
+
+            for __ in range(numpy.count_nonzero(~is_found)):
+                lprint("E Normals data gathering went wrong, expect corrupted mesh! Shouldn't happen...")
+
+            # polygons using the same vertex more times have to be matched one by one, each loop can be used only once per triangle
+            duplicated_keys = sorted_keys[1:][sorted_keys[1:] == sorted_keys[:-1]]
+            if len(duplicated_keys) > 0:
+                duplicated_polygons = set((duplicated_keys // key_stride).tolist())
+                normals_loops_vertices_list = normals_loops_vertices.tolist()
+
+                for polygon_i in sorted(set(loops_polygons[smooth_loops].tolist())):
+                    normals_polygon_i = int(polygons_mapping[polygon_i])
+                    if normals_polygon_i not in duplicated_polygons:
+                        continue
+
+                    normals_polygon_loops = list(mesh_for_normals.polygons[normals_polygon_i].loop_indices)
+                    for loop_i in mesh.polygons[polygon_i].loop_indices:
+                        for i, normals_loop_i in enumerate(normals_polygon_loops):
+                            if loops_vertices[loop_i] == normals_loops_vertices_list[normals_loop_i]:
+                                normals[loop_i] = loop_normals[normals_loop_i]
+                                del normals_polygon_loops[i]
+                                break
+                        else:
+                            if normals[loop_i].any():
+                                normals[loop_i] = 0.0
+                                lprint("E Normals data gathering went wrong, expect corrupted mesh! Shouldn't happen...")
+
+        return _math_utils.normalize_vectors(_math_utils.transform_vectors(nor_transf_mat, normals))
+
+    def get_uvs(self, uv_layer_name):
+        """Gets uvs of given uv layer in SCS coordinates per loop. Result is cached per uv layer.
+
+        :param uv_layer_name: name of the uv layer, it has to exist in mesh
+        :type uv_layer_name: str
+        :return: uv in SCS coordinates per loop, as (N, 2) array
+        :rtype: numpy.ndarray
+        """
+        if uv_layer_name not in self.__uvs:
+            uvs = numpy.empty(len(self.__mesh.loops) * 2, dtype=numpy.float32)
+            self.__mesh.uv_layers[uv_layer_name].data.foreach_get("uv", uvs)
+
+            uvs = uvs.reshape(-1, 2).astype(numpy.float64)
+            uvs[:, 1] = 1 - uvs[:, 1]
+
+            self.__uvs[uv_layer_name] = uvs
+
+        return self.__uvs[uv_layer_name]
+
+    def get_tangents(self, uv_layer_name):
+        """Gets tangents with bitangent sign per loop. Result is cached per uv layer.
+
+        :param uv_layer_name: name of the uv layer tangents should be calculated on; if None tangents are read as they are in mesh
+        :type uv_layer_name: str | None
+        :return: normalized tangent in SCS coordinates and bitangent sign per loop, as (N, 4) array
+        :rtype: numpy.ndarray
+        :raises RuntimeError: if tangents calculation fails
+        """
+        if uv_layer_name not in self.__tangents:
+
+            if uv_layer_name is not None:
+                self.__mesh.calc_tangents(uvmap=uv_layer_name)
+
+            loops_count = len(self.__mesh.loops)
+            tangents = numpy.empty(loops_count * 3, dtype=numpy.float32)
+            bitangent_signs = numpy.empty(loops_count, dtype=numpy.float32)
+            self.__mesh.loops.foreach_get("tangent", tangents)
+            self.__mesh.loops.foreach_get("bitangent_sign", bitangent_signs)
+
+            tangents = _math_utils.normalize_vectors(_math_utils.transform_vectors(self.__tangent_transf_mat, tangents))
+
+            self.__tangents[uv_layer_name] = numpy.column_stack((tangents.astype(numpy.float64), bitangent_signs))
+
+        return self.__tangents[uv_layer_name]
+
+    def __get_color_layer(self, layer_name, vertex_indices):
+        """Gets RGB components of color attribute per loop.
+
+        :param layer_name: name of the color attribute
+        :type layer_name: str
+        :param vertex_indices: vertex index per loop
+        :type vertex_indices: numpy.ndarray
+        :return: color components per loop and color attribute data type; None if attribute doesn't exist
+        :rtype: tuple[numpy.ndarray, str] | None
+        """
+        if layer_name not in self.__mesh.color_attributes:
+            return None
+
+        vcolors = self.__mesh.color_attributes[layer_name]
+
+        colors = numpy.empty(len(vcolors.data) * 4, dtype=numpy.float32)
+        vcolors.data.foreach_get("color", colors)
+        colors = colors.reshape(-1, 4)[:, :3]
+
+        if vcolors.domain == 'POINT':
+            colors = colors[vertex_indices]
+        elif vcolors.domain != 'CORNER':
+            raise TypeError("Invalid vertex color domain type!")
+
+        if vcolors.data_type not in ('BYTE_COLOR', 'FLOAT_COLOR'):
+            raise TypeError("Invalid vertex color type!")
+
+        return colors, vcolors.data_type
+
+    @staticmethod
+    def __get_unique_srgb(colors, data_type, get_srgb_value):
+        """Converts colors into SCS sRGB values. Conversion is done only once for each unique color.
+
+        :param colors: RGB components per loop
+        :type colors: numpy.ndarray
+        :param data_type: color attribute data type
+        :type data_type: str
+        :param get_srgb_value: function converting sRGB color into tuple of SCS values and maximum unnormalized component
+        :type get_srgb_value: collections.abc.Callable
+        :return: SCS values per loop, as (N, M) array and maximum unnormalized component
+        :rtype: tuple[numpy.ndarray, float]
+        """
+        # compare colors by bits, so even signed zeros stay the same as with per loop conversion
+        unique_colors, inverse = numpy.unique(numpy.ascontiguousarray(colors).view(numpy.uint32), axis=0, return_inverse=True)
+
+        max_vcolor = 0
+        unique_values = []
+        for unique_color in unique_colors.view(numpy.float32).tolist():
+            value, unique_max_vcolor = get_srgb_value(Color(unique_color).from_scene_linear_to_srgb(), data_type == 'BYTE_COLOR')
+            unique_values.append(value)
+            max_vcolor = max(max_vcolor, unique_max_vcolor)
+
+        return numpy.array(unique_values, dtype=numpy.float64).reshape(len(unique_values), -1)[inverse.reshape(-1)], max_vcolor
+
+    @staticmethod
+    def __get_srgb_rgb(color, is_byte_color):
+        max_vcolor = 0
+        for i in range(0, 3):
+            if is_byte_color:
+                # for byte color 8-bits 0.5 can not be set, thus clamp 128/255 to 0.5 or report to big vcolor otherwise
+                if 0.5 < color[i] <= 0.50198:
+                    color[i] = 0.5
+                elif color[i] > 0.50198 and color[i] > max_vcolor:
+                    max_vcolor = color[i]
+            elif color[i] > 0.5 and color[i] > max_vcolor:
+                max_vcolor = color[i]
+
+        return (color[0] * 2, color[1] * 2, color[2] * 2), max_vcolor
+
+    @staticmethod
+    def __get_srgb_alpha(color, is_byte_color):
+        max_vcolor = 0
+        alpha = (color[0] + color[1] + color[2]) / 3.0  # take avg of colors for alpha
+
+        if is_byte_color:
+            # for byte color 8-bits 0.5 can not be set, thus clamp 128/255 to 0.5 or report to big vcolor otherwise
+            if 0.5 < alpha <= 0.50198:
+                alpha = 0.5
+            elif alpha > 0.50198:
+                max_vcolor = alpha
+        elif alpha > 0.5:
+            max_vcolor = alpha
+
+        return (alpha * 2,), max_vcolor
+
+    def get_vertex_colors(self):
+        """Gets SCS vertex colors per loop, combined from vertex color layer and vertex color alpha layer.
+
+        :return: RGBA per loop as (N, 4) array, missing vertex color flag, missing vertex color alpha flag and maximum unnormalized vertex color
+        :rtype: tuple[numpy.ndarray, bool, bool, float]
+        """
+        loops_count = len(self.__mesh.loops)
+        vertex_indices = self.vertex_indices
+        max_vcolor = 0
+
+        color_layer = self.__get_color_layer(_MESH_consts.default_vcol, vertex_indices)
+        if color_layer is None:
+            rgbs = numpy.ones((loops_count, 3), dtype=numpy.float64)
+        else:
+            rgbs, rgb_max_vcolor = self.__get_unique_srgb(*color_layer, self.__get_srgb_rgb)
+            max_vcolor = max(max_vcolor, rgb_max_vcolor)
+
+        alpha_layer = self.__get_color_layer(_MESH_consts.default_vcol + _MESH_consts.vcol_a_suffix, vertex_indices)
+        if alpha_layer is None:
+            alphas = numpy.ones((loops_count, 1), dtype=numpy.float64)
+        else:
+            alphas, alpha_max_vcolor = self.__get_unique_srgb(*alpha_layer, self.__get_srgb_alpha)
+            max_vcolor = max(max_vcolor, alpha_max_vcolor)
+
+        return numpy.column_stack((rgbs, alphas)), color_layer is None, alpha_layer is None, max_vcolor
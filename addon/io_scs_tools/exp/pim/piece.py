@@ -18,6 +18,7 @@
 
 # Copyright (C) 2013-2022: SCS Software
 
+import numpy
 from collections import OrderedDict
 from io_scs_tools.exp.pim.piece_stream import Stream
 from io_scs_tools.internals.structure import SectionData as _SectionData
@@ -34,8 +35,6 @@ class Piece:
     __streams = OrderedDict()  # dict of Stream class
     __triangles = []  # list of Triangle class
 
-    __vertices_hash = {}
-
     __global_piece_count = 0
     __global_vertex_count = 0
     __global_triangle_count = 0
@@ -59,51 +58,48 @@ class Piece:
         return Piece.__global_triangle_count
 
     @staticmethod
-    def __calc_vertex_hash(index, normal, uvs, rgba, tangent):
-        """Calculates vertex hash from original vertex index, uvs components and vertex color.
-        :param index: original index from Blender mesh
-        :type index: str
-        :param normal: normalized vector representation of the normal
-        :type normal: tuple | mathutils.Vector
-        :param uvs: list of uvs used on vertex (each uv must be in SCS coordinates)
-        :type uvs: list of (tuple | mathutils.Vector)
-        :param rgba: rgba representation of vertex color in SCS values
-        :type rgba: tuple | mathutils.Color
-        :param tangent: vertex tangent in SCS coordinates or none, if piece doesn't have tangents
-        :type tangent: tuple | None
-        :return: calculated vertex hash
-        :rtype: str
+    def weld_vertices(vert_indices, normals, uvs, rgbas, tangents):
+        """Welds corners into piece vertices. Corners are welded when they have the same original vertex index
+        and the same quantized normal, uvs, vertex color and tangent.
+        All corners are quantized into one integer matrix and deduplicated at once.
+
+        :param vert_indices: original vertex index from Blender mesh per corner
+        :type vert_indices: numpy.ndarray
+        :param normals: normal per corner in SCS coordinates, as (N, 3) array
+        :type normal: numpy.ndarray
+        :param uvs: uvs per corner for each uv layer used on piece (each uv must be in SCS coordinates), as (N, 2) arrays
+        :type uvs: list[numpy.ndarray]
+        :param rgbas: rgba representation of vertex color in SCS values per corner, as (N, 4) array
+        :type rgbas: numpy.ndarray
+        :param tangents: vertex tangent in SCS coordinates per corner as (N, 4) array or None, if piece doesn't have tangents
+        :type tangents: numpy.ndarray | None
+        :return: corner index for each welded vertex in order of first appearance and welded vertex index per corner
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
         """
         fprec = 10 ** 4
 
-        if tangent:
-            vertex_hash = (index,
-                           int(normal[0] * fprec),
-                           int(normal[1] * fprec),
-                           int(normal[2] * fprec),
-                           int(rgba[0] * fprec),
-                           int(rgba[1] * fprec),
-                           int(rgba[2] * fprec),
-                           int(rgba[3] * fprec),
-                           int(tangent[0] * fprec),
-                           int(tangent[1] * fprec),
-                           int(tangent[2] * fprec),
-                           int(tangent[3] * fprec))
-        else:
-            vertex_hash = (index,
-                           int(normal[0] * fprec),
-                           int(normal[1] * fprec),
-                           int(normal[2] * fprec),
-                           int(rgba[0] * fprec),
-                           int(rgba[1] * fprec),
-                           int(rgba[2] * fprec),
-                           int(rgba[3] * fprec))
+        quantized_attributes = [normals, rgbas]
+        if tangents is not None:
+            quantized_attributes.append(tangents)
+        quantized_attributes.extend(uvs)
+
+        corners_count = len(vert_indices)
+        quantized = numpy.empty((corners_count, 1 + sum(attr.shape[1] for attr in quantized_attributes)), dtype=numpy.int64)
+        quantized[:, 0] = vert_indices
+
+        column = 1
+        for attr in quantized_attributes:
+            quantized[:, column:column + attr.shape[1]] = numpy.trunc(numpy.asarray(attr, dtype=numpy.float64) * fprec)
+            column += attr.shape[1]
 
-        for uv in uvs:
-            vertex_hash += (int(uv[0] * fprec),
-                            int(uv[1] * fprec))
+        __, first_corners, inverse = numpy.unique(quantized, axis=0, return_index=True, return_inverse=True)
 
-        return vertex_hash
+        # order welded vertices by first appearance, same as they would be added one by one
+        order = numpy.argsort(first_corners, kind="stable")
+        ranks = numpy.empty(len(order), dtype=numpy.int64)
+        ranks[order] = numpy.arange(len(order))
+
+        return first_corners[order], ranks[inverse.reshape(-1)]
 
     def __init__(self, index, material):
         """Constructs empty piece.
@@ -118,7 +114,6 @@ class Piece:
         self.__stream_count = 0
         self.__streams = OrderedDict()
         self.__triangles = []
-        self.__vertices_hash = {}
 
         self.__index = index
         self.__material = material
@@ -155,71 +150,65 @@ class Piece:
 
         return True
 
-    def add_vertex(self, vert_index, position, normal, uvs, uvs_aliases, rgba, tangent):
-        """Adds new vertex to position and normal streams
-        :param vert_index: original vertex index from Blender mesh
-        :type vert_index: str
-        :param position: vector or tuple of vertex position in SCS coordinates
-        :type position: tuple | mathutils.Vector
-        :param normal: vector or tuple of vertex normal in SCS coordinates
-        :type normal: tuple | mathutils.Vector
-        :param uvs: list of uvs used on vertex (each uv must be in SCS coordinates)
-        :type uvs: list of (tuple | mathutils.Vector)
+    def add_vertices(self, positions, normals, uvs, uvs_aliases, rgbas, tangents):
+        """Adds new welded vertices to piece streams.
+        :param positions: vertex positions in SCS coordinates
+        :type positions: list[list[float]]
+        :param normals: vertex normals in SCS coordinates
+        :type normals: list[list[float]]
+        :param uvs: vertex uvs for each uv layer used on vertices (each uv must be in SCS coordinates)
+        :type uvs: list[list[list[float]]]
         :param uvs_aliases: list of uv aliases names per uv layer
         :type uvs_aliases: list[list[str]]
-        :param rgba: rgba representation of vertex color in SCS values
-        :type rgba: tuple | mathutils.Color
-        :param tangent: tuple representation of vertex tangent in SCS values or None if piece doesn't have tangents
-        :type tangent: tuple | None
-        :return: vertex index inside piece streams ( use it for adding triangles )
+        :param rgbas: rgba representation of vertex colors in SCS values
+        :type rgbas: list[list[float]]
+        :param tangents: vertex tangents in SCS values or None if piece doesn't have tangents
+        :type tangents: list[list[float]] | None
+        :return: piece vertex index of the first added vertex ( offset welded vertex indices with it for adding triangles )
         :rtype: int
         """
 
-        vertex_hash = self.__calc_vertex_hash(vert_index, normal, uvs, rgba, tangent)
-
-        # save vertex if the vertex with the same properties doesn't exists yet in streams
-        if vertex_hash not in self.__vertices_hash:
-
-            stream = self.__streams[Stream.Types.POSITION]
-            stream.add_entry(position)
+        first_vert_index = self.__streams[Stream.Types.POSITION].get_size()
+        if len(positions) == 0:
+            return first_vert_index
 
-            stream = self.__streams[Stream.Types.NORMAL]
-            stream.add_entry(normal)
+        stream = self.__streams[Stream.Types.POSITION]
+        stream.add_entries(positions)
 
-            for i, uv in enumerate(uvs):
-                uv_type = "%s%i" % (Stream.Types.UV, i)
-                # create more uv streams on demand
-                if uv_type not in self.__streams:
-                    self.__streams[uv_type] = Stream(Stream.Types.UV, i)
+        stream = self.__streams[Stream.Types.NORMAL]
+        stream.add_entries(normals)
 
-                stream = self.__streams[uv_type]
-                """:type: Stream"""
-                stream.add_entry(uv)
+        for i, uv_layer_uvs in enumerate(uvs):
+            uv_type = "%s%i" % (Stream.Types.UV, i)
+            # create more uv streams on demand
+            if uv_type not in self.__streams:
+                self.__streams[uv_type] = Stream(Stream.Types.UV, i)
 
-                for alias in uvs_aliases[i]:
-                    stream.add_alias(alias)
+            stream = self.__streams[uv_type]
+            """:type: Stream"""
+            stream.add_entries(uv_layer_uvs)
 
-            if tangent:
-                # create tangent stream on demand
-                if Stream.Types.TANGENT not in self.__streams:
-                    self.__streams[Stream.Types.TANGENT] = Stream(Stream.Types.TANGENT, -1)
+            for alias in uvs_aliases[i]:
+                stream.add_alias(alias)
 
-                stream = self.__streams[Stream.Types.TANGENT]
-                stream.add_entry(tangent)
+        if tangents is not None:
+            # create tangent stream on demand
+            if Stream.Types.TANGENT not in self.__streams:
+                self.__streams[Stream.Types.TANGENT] = Stream(Stream.Types.TANGENT, -1)
 
-            if Stream.Types.RGBA not in self.__streams:
-                self.__streams[Stream.Types.RGBA] = Stream(Stream.Types.RGBA, -1)
+            stream = self.__streams[Stream.Types.TANGENT]
+            stream.add_entries(tangents)
 
-            stream = self.__streams[Stream.Types.RGBA]
-            stream.add_entry(rgba)
+        if Stream.Types.RGBA not in self.__streams:
+            self.__streams[Stream.Types.RGBA] = Stream(Stream.Types.RGBA, -1)
 
-            vert_index_internal = stream.get_size() - 1  # streams has to be alligned so I can take last one for the index
-            self.__vertices_hash[vertex_hash] = vert_index_internal
+        stream = self.__streams[Stream.Types.RGBA]
+        stream.add_entries(rgbas)
 
-            self.__vertex_count = vert_index_internal + 1
-            Piece.__global_vertex_count += 1
+        self.__vertex_count = stream.get_size()  # streams has to be alligned so I can take last one for the count
+        Piece.__global_vertex_count += len(positions)
 
-        return self.__vertices_hash[vertex_hash]
+        return first_vert_index
 
     def get_index(self):
         return self.__index
@@ -99,6 +99,14 @@ class Stream:
         self.__data.append(tuple(value))
         return True
 
+    def add_entries(self, values):
+        """Adds new entries to data of stream.
+
+        :param values: tuple or list values
+        :type values: collections.abc.Iterable[tuple | list]
+        """
+        self.__data.extend(map(tuple, values))
+
     def add_alias(self, alias):
         """Adds alias to stream.
         NOTE: only unique aliases will be kept
@@ -18,6 +18,7 @@
 
 # Copyright (C) 2015-2019: SCS Software
 
+import numpy
 from mathutils import Vector, Quaternion
 from io_scs_tools.consts import PrefabLocators as _PL_consts
 from io_scs_tools.exp.pip.curve_bezier import Bezier
@@ -50,18 +51,36 @@ class Curve:
         :type curves_l: collections.Iterable[Curve]
         """
 
+        curves_l = list(curves_l)
+
+        # first calculate lengths of all curves at once
+        points0 = []
+        dirs0 = []
+        points1 = []
+        dirs1 = []
         for curve in curves_l:
 
-            # first calculate length
             pos0, dir0 = curve.get_start(cartes_tang=False)
             pos1, dir1 = curve.get_end(cartes_tang=False)
 
-            for i in range(4):  # converge to actual length with four iterations
-                curr_dir0 = Vector(dir0 @ Vector((0, 0, -1)) * Curve.__NODE_DIR_LEN_COEF * curve.get_length())
-                curr_dir1 = Vector(dir1 @ Vector((0, 0, -1)) * Curve.__NODE_DIR_LEN_COEF * curve.get_length())
+            points0.append(pos0)
+            dirs0.append(dir0 @ Vector((0, 0, -1)))
+            points1.append(pos1)
+            dirs1.append(dir1 @ Vector((0, 0, -1)))
+
+        # tangents are scaled in single precision, the same way as multiplication of "mathutils.Vector" does it
+        dirs0 = numpy.array(dirs0, dtype=numpy.float32).reshape(-1, 3) * numpy.float32(Curve.__NODE_DIR_LEN_COEF)
+        dirs1 = numpy.array(dirs1, dtype=numpy.float32).reshape(-1, 3) * numpy.float32(Curve.__NODE_DIR_LEN_COEF)
+        lengths = numpy.array([curve.get_length() for curve in curves_l], dtype=numpy.float64).reshape(-1, 1)
+
+        for i in range(4):  # converge to actual length with four iterations
+            scales = lengths.astype(numpy.float32)
+            control_points = _curve_utils.get_control_points(points0, dirs0 * scales, points1, dirs1 * scales)
+            lengths = _curve_utils.compute_lengths(control_points, _PL_consts.CURVE_MEASURE_STEPS).reshape(-1, 1)
 
-                new_length = _curve_utils.compute_smooth_curve_length(pos0, curr_dir0, pos1, curr_dir1, _PL_consts.CURVE_MEASURE_STEPS)
-                curve.set_length(new_length)
+        for curve, length in zip(curves_l, lengths.ravel().tolist()):
+
+            curve.set_length(length)
 
             # second calculate leads to nodes
             if curve.is_inbound():
@@ -365,6 +384,20 @@ class Curve:
 
         return position, rotation
 
+    def get_control_points(self):
+        """Get bezier control points of the curve.
+
+        NOTE: length of the curve must be already calculated
+
+        :return: control points of the curve in array of shape (4, 3)
+        :rtype: numpy.ndarray
+        """
+
+        curve_p1, curve_t1 = self.get_start()
+        curve_p2, curve_t2 = self.get_end()
+
+        return _curve_utils.get_control_points(curve_p1, curve_t1, curve_p2, curve_t2)[0]
+
     def get_length(self):
         """Get length of the curve.
 
@@ -36,6 +36,7 @@ from io_scs_tools.internals.containers import pix as _pix_container
 from io_scs_tools.internals.connections.wrappers import collection as _connections_wrapper
 from io_scs_tools.utils.convert import get_scs_transformation_components as _get_scs_transformation_components
 from io_scs_tools.utils.name import tokenize_name as _tokenize_name
+from io_scs_tools.utils import profiler as _profiler
 from io_scs_tools.utils.printout import lprint
 
 
@@ -223,6 +224,7 @@ def execute(dirpath, filename, name_suffix, prefab_locator_list, offset_matrix,
                    "Check Control Nodes in SCS Game Object with Root: %r", (filename,))
 
     # curves creation
+    _profiler.begin("curves")
     curves_dict = _connections_wrapper.get_curves(nav_point_locs.values())
     for key, curve_entry in curves_dict.items():
 
@@ -290,6 +292,8 @@ def execute(dirpath, filename, name_suffix, prefab_locator_list, offset_matrix,
                        (boundary_node_i, loc1.name,))
 
     Curve.prepare_curves(pip_curves.values())
+    _profiler.add_items(len(pip_curves))
+    _profiler.end()
 
     # signs creation
     for locator in sign_locs.values():
@@ -408,90 +412,101 @@ def execute(dirpath, filename, name_suffix, prefab_locator_list, offset_matrix,
 
     TriggerPoint.prepare_trigger_points(pip_trigger_points.values())
 
-    # intersections creation
-    for c0_i, c0 in enumerate(sorted(pip_curves.values())):
-        for c1_i, c1 in enumerate(sorted(pip_curves.values())):
-
-            if c1_i <= c0_i:  # only search each pair of curves once
-                continue
-
-            # get the intersection point and curves coefficient positions
-            intersect_p, c0_pos, c1_pos = Intersection.get_intersection(c0, c1)
-
-            if intersect_p:
-
-                intersect_p_str = str(intersect_p)  # Format: '<Vector (0.0000, 0.0000, 0.0000)>'
-
-                is_start = c0_pos == 0 and c0_pos == c1_pos
-                is_end = c1_pos == 1 and c0_pos == c1_pos
-                is_split_sharp = False
-
-                if is_start:
-                    inter_type = 0  # fork
-                elif is_end:
-                    inter_type = 1  # joint
-                else:
-                    inter_type = 2  # cross
-
-                    # if there is indication of cross intersection filter out intersections with common fork and joint
-                    # NOTE: this condition might not be sufficient, so if anyone will have problems,
-                    # this is the point that has to be improved
-                    if Intersection.have_common_fork(c0, c1) or Intersection.have_common_joint(c0, c1):
-                        continue
-
-                # calculate radius for the same directions on curves
-                forward_radius = Intersection.get_intersection_radius(c0, c1, c0_pos, c1_pos, 1, 1)
-                backward_radius = Intersection.get_intersection_radius(c0, c1, c0_pos, c1_pos, -1, -1)
-                final_radius = max(forward_radius, backward_radius)
-
-                # special calculations only for cross intersections
-                if inter_type == 2:
-
-                    # calculate radius also for opposite directions
-                    final_radius = max(final_radius, Intersection.get_intersection_radius(c0, c1, c0_pos, c1_pos, 1, -1))
-                    final_radius = max(final_radius, Intersection.get_intersection_radius(c0, c1, c0_pos, c1_pos, -1, 1))
-
-                    # calculate position of intersection point on curves with better precision
-                    c0_pos = c0.get_closest_point(intersect_p)
-                    c1_pos = c1.get_closest_point(intersect_p)
-
-                    # calculate if split cross intersection is too sharp for allowing of smother traffic flow
-                    c0_dir = c0.get_curve_tangent_at_position(c0_pos)
-                    c1_dir = c1.get_curve_tangent_at_position(c1_pos)
-                    is_split_sharp = c0_dir.dot(c1_dir) >= _PL_consts.CURVE_SPLIT_CROSS_DOT
-
-                    lprint("D Found cross intersection point: %r", (intersect_p,))
-
-                # creating intersection class instances
-                intersection = Intersection(c0.get_index(), c0.get_ui_name(), c0_pos * c0.get_length())
-                intersection1 = Intersection(c1.get_index(), c1.get_ui_name(), c1_pos * c1.get_length())
-
-                # init list of intersections for current intersecting point
-                if intersect_p_str not in pip_intersections[inter_type]:
-                    pip_intersections[inter_type][intersect_p_str] = []
-
-                # append intersections to list and calculate new siblings
-                new_siblings = 2
-                if intersection not in pip_intersections[inter_type][intersect_p_str]:
-                    pip_intersections[inter_type][intersect_p_str].append(intersection)
-                else:
-                    del intersection
-                    new_siblings -= 1
-
-                if intersection1 not in pip_intersections[inter_type][intersect_p_str]:
-                    pip_intersections[inter_type][intersect_p_str].append(intersection1)
-                else:
-                    del intersection1
-                    new_siblings -= 1
-
-                # always set flags on first entry in current intersection point list
-                # this way siblings count is getting updated properly
-                pip_intersections[inter_type][intersect_p_str][0].set_flags(is_start, is_end, is_split_sharp, new_siblings)
-
-                # update radius on all of intersection in the same intersecting point
-                for inter in pip_intersections[inter_type][intersect_p_str]:
-                    inter.set_radius(pip_intersections[inter_type][intersect_p_str][0].get_radius())
-                    inter.set_radius(final_radius)
+    # intersections creation: search each pair of curves only once and
+    # only if bounding boxes of the curves are overlapping, as otherwise they can't intersect
+    _profiler.begin("intersections", items=len(pip_curves))
+    sorted_curves = sorted(pip_curves.values())
+    curves_samples = Intersection.get_curves_samples(sorted_curves)
+    candidate_pairs = Intersection.get_candidate_pairs(curves_samples)
+
+    curves_count = len(sorted_curves)
+    lprint("I Curves intersections search: %i pairs tested, %i pairs culled by bounding boxes.",
+           (len(candidate_pairs), curves_count * (curves_count - 1) // 2 - len(candidate_pairs)))
+
+    for c0_i, c1_i in candidate_pairs:
+
+        c0 = sorted_curves[c0_i]
+        c1 = sorted_curves[c1_i]
+
+        # get the intersection point and curves coefficient positions
+        intersect_p, c0_pos, c1_pos = Intersection.get_intersection(c0, c1, curves_samples[c0_i], curves_samples[c1_i])
+
+        if intersect_p:
+
+            intersect_p_str = str(intersect_p)  # Format: '<Vector (0.0000, 0.0000, 0.0000)>'
+
+            is_start = c0_pos == 0 and c0_pos == c1_pos
+            is_end = c1_pos == 1 and c0_pos == c1_pos
+            is_split_sharp = False
+
+            if is_start:
+                inter_type = 0  # fork
+            elif is_end:
+                inter_type = 1  # joint
+            else:
+                inter_type = 2  # cross
+
+                # if there is indication of cross intersection filter out intersections with common fork and joint
+                # NOTE: this condition might not be sufficient, so if anyone will have problems,
+                # this is the point that has to be improved
+                if Intersection.have_common_fork(c0, c1) or Intersection.have_common_joint(c0, c1):
+                    continue
+
+            # calculate radius for the same directions on curves
+            forward_radius = Intersection.get_intersection_radius(c0, c1, c0_pos, c1_pos, 1, 1)
+            backward_radius = Intersection.get_intersection_radius(c0, c1, c0_pos, c1_pos, -1, -1)
+            final_radius = max(forward_radius, backward_radius)
+
+            # special calculations only for cross intersections
+            if inter_type == 2:
+
+                # calculate radius also for opposite directions
+                final_radius = max(final_radius, Intersection.get_intersection_radius(c0, c1, c0_pos, c1_pos, 1, -1))
+                final_radius = max(final_radius, Intersection.get_intersection_radius(c0, c1, c0_pos, c1_pos, -1, 1))
+
+                # calculate position of intersection point on curves with better precision
+                c0_pos = c0.get_closest_point(intersect_p)
+                c1_pos = c1.get_closest_point(intersect_p)
+
+                # calculate if split cross intersection is too sharp for allowing of smother traffic flow
+                c0_dir = c0.get_curve_tangent_at_position(c0_pos)
+                c1_dir = c1.get_curve_tangent_at_position(c1_pos)
+                is_split_sharp = c0_dir.dot(c1_dir) >= _PL_consts.CURVE_SPLIT_CROSS_DOT
+
+                lprint("D Found cross intersection point: %r", (intersect_p,))
+
+            # creating intersection class instances
+            intersection = Intersection(c0.get_index(), c0.get_ui_name(), c0_pos * c0.get_length())
+            intersection1 = Intersection(c1.get_index(), c1.get_ui_name(), c1_pos * c1.get_length())
+
+            # init list of intersections for current intersecting point
+            if intersect_p_str not in pip_intersections[inter_type]:
+                pip_intersections[inter_type][intersect_p_str] = []
+
+            # append intersections to list and calculate new siblings
+            new_siblings = 2
+            if intersection not in pip_intersections[inter_type][intersect_p_str]:
+                pip_intersections[inter_type][intersect_p_str].append(intersection)
+            else:
+                del intersection
+                new_siblings -= 1
+
+            if intersection1 not in pip_intersections[inter_type][intersect_p_str]:
+                pip_intersections[inter_type][intersect_p_str].append(intersection1)
+            else:
+                del intersection1
+                new_siblings -= 1
+
+            # always set flags on first entry in current intersection point list
+            # this way siblings count is getting updated properly
+            pip_intersections[inter_type][intersect_p_str][0].set_flags(is_start, is_end, is_split_sharp, new_siblings)
+
+            # update radius on all of intersection in the same intersecting point
+            for inter in pip_intersections[inter_type][intersect_p_str]:
+                inter.set_radius(pip_intersections[inter_type][intersect_p_str][0].get_radius())
+                inter.set_radius(final_radius)
+
+    _profiler.end()
 
     # create container
     pip_container = [pip_header.get_as_section(), pip_global.get_as_section()]
@@ -18,15 +18,17 @@
 
 # Copyright (C) 2015-2017: SCS Software
 
-from mathutils import Vector
+import numpy
 from io_scs_tools.consts import PrefabLocators as _PL_consts
 from io_scs_tools.internals.structure import SectionData as _SectionData
 from io_scs_tools.utils import curve as _curve_utils
-from io_scs_tools.utils import math as _math_utils
 
 
 class Intersection:
     __global_intersection_counter = 0
+    __RADIUS_CHUNK_SIZES = (8, 16, 32, 64)
+    """Growing numbers of stepping iterations on curves, which positions are evaluated at once when searching for intersection radius.
+    Last one is used for all further chunks."""
 
     @staticmethod
     def reset_counter():
@@ -85,7 +87,83 @@ class Intersection:
         return False
 
     @staticmethod
-    def get_intersection(curve1, curve2):
+    def get_curves_samples(curves):
+        """Gets polyline samples of all given curves at once, as used in intersection search.
+
+        :param curves: curves to be sampled
+        :type curves: list[io_scs_tools.exp.pip.curve.Curve]
+        :return: samples for each curve as tuple of position coefs and points; None for curves without length
+        :rtype: list[(list[float], list[list[float]]) | None]
+        """
+
+        sampled_curves = [curve for curve in curves if curve.get_length() != 0]
+        if len(sampled_curves) <= 0:
+            return [None] * len(curves)
+
+        control_points = numpy.array([curve.get_control_points() for curve in sampled_curves])
+        lengths = [curve.get_length() for curve in sampled_curves]
+        samples = iter(_curve_utils.get_intersection_samples(control_points, lengths, _PL_consts.CURVE_STEPS_COUNT))
+
+        return [next(samples) if curve.get_length() != 0 else None for curve in curves]
+
+    @staticmethod
+    def get_bounding_box(curve_samples):
+        """Gets axis aligned bounding box of the curve polyline from its intersection samples.
+        Box is enlarged in Y axis by half of maximal height difference of intersecting curves,
+        so that curves which might intersect have overlapping boxes.
+
+        :param curve_samples: intersection samples of the curve as returned from get_curves_samples
+        :type curve_samples: (list[float], list[list[float]])
+        :return: minimal and maximal corner of the bounding box
+        :rtype: (list[float], list[float])
+        """
+
+        points = numpy.array(curve_samples[1])
+
+        # small margin covers rounding errors
+        margins = numpy.array((0.001, _PL_consts.CURVE_INTERSECTION_MAX_HEIGHT / 2 + 0.001, 0.001))
+        bbox_min = points.min(axis=0) - margins
+        bbox_max = points.max(axis=0) + margins
+
+        return bbox_min.tolist(), bbox_max.tolist()
+
+    @staticmethod
+    def get_candidate_pairs(curves_samples):
+        """Gets pairs of curves which might intersect, by sweep and prune of their bounding boxes along X axis.
+        Curves without length are left out, as they can't intersect.
+
+        :param curves_samples: intersection samples of the curves as returned from get_curves_samples
+        :type curves_samples: list[(list[float], list[list[float]]) | None]
+        :return: sorted pairs of indices of curves in given list with overlapping bounding boxes
+        :rtype: list[(int, int)]
+        """
+
+        bboxes = [Intersection.get_bounding_box(curve_samples) if curve_samples else None for curve_samples in curves_samples]
+        sorted_indices = sorted((i for i in range(len(curves_samples)) if bboxes[i]), key=lambda i: bboxes[i][0][0])
+
+        candidate_pairs = []
+        active_indices = []
+        for c1_i in sorted_indices:
+
+            bbox1_min, bbox1_max = bboxes[c1_i]
+
+            # boxes ending before current one starts can't overlap with any of the next ones
+            active_indices = [c0_i for c0_i in active_indices if bboxes[c0_i][1][0] >= bbox1_min[0]]
+
+            for c0_i in active_indices:
+
+                bbox0_min, bbox0_max = bboxes[c0_i]
+
+                # X axis overlapping is ensured by sweep, so check only Y and Z axes
+                if all(bbox0_min[axis] <= bbox1_max[axis] and bbox1_min[axis] <= bbox0_max[axis] for axis in (1, 2)):
+                    candidate_pairs.append((min(c0_i, c1_i), max(c0_i, c1_i)))
+
+            active_indices.append(c1_i)
+
+        return sorted(candidate_pairs)
+
+    @staticmethod
+    def get_intersection(curve1, curve2, curve1_samples=None, curve2_samples=None):
         """Checks if given curves intersects and returns point of intersection
         and positions on the curve, where they intersects.
 
@@ -93,6 +171,10 @@ class Intersection:
         :type curve1: io_scs_tools.exp.pip.curve.Curve
         :param curve2: second curve
         :type curve2: io_scs_tools.exp.pip.curve.Curve
+        :param curve1_samples: intersection samples of first curve from get_curves_samples, computed if not given
+        :type curve1_samples: (list[float], list[list[float]]) | None
+        :param curve2_samples: intersection samples of second curve from get_curves_samples, computed if not given
+        :type curve2_samples: (list[float], list[list[float]]) | None
         :return: intersection point and position coefs where on curves that happend or None if not found
         :rtype: (mathutils.Vector, float, float) | (None, float, float)
         """
@@ -112,13 +194,17 @@ class Intersection:
 
         return _curve_utils.curves_intersect(curve1_p1, curve1_t1, curve1_p2, curve1_t2, length1,
                                              curve2_p1, curve2_t1, curve2_p2, curve2_t2, length2,
-                                             part_count=_PL_consts.CURVE_STEPS_COUNT)
+                                             part_count=_PL_consts.CURVE_STEPS_COUNT,
+                                             samples1=curve1_samples, samples2=curve2_samples)
 
     @staticmethod
     def get_intersection_radius(curve1, curve2, curve1_pos_coef, curve2_pos_coef, curve1_direction=1, curve2_direction=1):
         """Get needed radius for reaching safe point when moving on curves in desired direction.
         In forst case full radius is returned which is the point where curve has no ancestors/children anymore.
 
+        Stepping on curves is done for chunk of iterations first and then positions of whole chunk
+        are evaluated at once, until safe distance is reached.
+
         :param curve1: first curve
         :type curve1: io_scs_tools.exp.pip.curve.Curve
         :param curve2: second curve
@@ -140,67 +226,98 @@ class Intersection:
         curr_c = [curve1, curve2]  # current curves
         curr_pos = [curr_c[0].get_length() * curve1_pos_coef, curr_c[1].get_length() * curve2_pos_coef]  # current curves positions
 
-        # first point and tangent vectors for both curves
-        curve_p1 = [Vector(), Vector()]
-        curve_t1 = [Vector(), Vector()]
-
-        # second point and tangent vectors for both curves
-        curve_p2 = [Vector(), Vector()]
-        curve_t2 = [Vector(), Vector()]
-
         curve_directions = (curve1_direction, curve2_direction)  # stepping directions for both curves
 
-        # current radius and distance between curves
+        control_points = {}  # cached control points of visited curves
+
+        # current radius
         radius = 0
-        distance = 0
 
         # advance until distance is meet
-        while distance <= _PL_consts.SAFE_DISTANCE:
+        chunk_i = 0
+        while True:
 
-            # get data for both curves
-            for i in range(2):
+            chunk_size = Intersection.__RADIUS_CHUNK_SIZES[min(chunk_i, len(Intersection.__RADIUS_CHUNK_SIZES) - 1)]
+            chunk_i += 1
 
-                # go to next position on curve
-                old_curr_pos = curr_pos[i]
-                if curve_directions[i] == 1:
-                    curr_pos[i] = min(curr_pos[i] + steps[i], curr_c[i].get_length())
-                else:
-                    curr_pos[i] = max(0, curr_pos[i] - steps[i])
+            # control points and position coefs for both curves in each iteration of the chunk
+            chunk_control_points = ([], [])
+            chunk_coefs = ([], [])
 
-                # if we reached end of the curve, try to get on next/previous one or exit
-                if old_curr_pos == curr_pos[i]:
+            # stepping has to stop before the end of the chunk because of the end of curves or common fork/joint
+            is_end_reached = is_common_fork = False
 
-                    # step out if no next/previous possible curve
-                    if len(curr_c[i].get_next_prev_curves(curve_directions[i] == 1)) < 1:
-                        return radius
+            for __ in range(chunk_size):
 
-                    curr_c[i] = curr_c[i].get_next_prev_curves(curve_directions[i] == 1)[0]
+                # get data for both curves
+                for i in range(2):
 
+                    # go to next position on curve
+                    old_curr_pos = curr_pos[i]
                     if curve_directions[i] == 1:
-                        curr_pos[i] = min(steps[i], curr_c[i].get_length())
+                        curr_pos[i] = min(curr_pos[i] + steps[i], curr_c[i].get_length())
                     else:
-                        curr_pos[i] = max(0, curr_c[i].get_length() - steps[i])
+                        curr_pos[i] = max(0, curr_pos[i] - steps[i])
+
+                    # if we reached end of the curve, try to get on next/previous one or exit
+                    if old_curr_pos == curr_pos[i]:
+
+                        # step out if no next/previous possible curve
+                        if len(curr_c[i].get_next_prev_curves(curve_directions[i] == 1)) < 1:
+                            is_end_reached = True
+                            break
+
+                        curr_c[i] = curr_c[i].get_next_prev_curves(curve_directions[i] == 1)[0]
 
-                curve_p1[i], curve_t1[i] = curr_c[i].get_start()
-                curve_p2[i], curve_t2[i] = curr_c[i].get_end()
+                        if curve_directions[i] == 1:
+                            curr_pos[i] = min(steps[i], curr_c[i].get_length())
+                        else:
+                            curr_pos[i] = max(0, curr_c[i].get_length() - steps[i])
 
-            # extra check if curves have same fork/joint;
-            # then calculated radius has to be ignored therefore return zero radius
-            next_prev_c1 = curr_c[0].get_next_prev_curves(curve_directions[i] == 1)
-            next_prev_c2 = curr_c[1].get_next_prev_curves(curve_directions[i] == 1)
+                if is_end_reached:
+                    break
 
-            if len(next_prev_c1) == 1 and len(next_prev_c2) == 1:
-                if next_prev_c1[0] == next_prev_c2[0]:
-                    return 0
+                # extra check if curves have same fork/joint;
+                # then calculated radius has to be ignored therefore return zero radius
+                next_prev_c1 = curr_c[0].get_next_prev_curves(curve_directions[1] == 1)
+                next_prev_c2 = curr_c[1].get_next_prev_curves(curve_directions[1] == 1)
 
-            # if everything is okay finally calculate curve points, distance and radius
-            curr_p1 = _curve_utils.smooth_curve_position(curve_p1[0], curve_t1[0], curve_p2[0], curve_t2[0], curr_pos[0] / curr_c[0].get_length())
-            curr_p2 = _curve_utils.smooth_curve_position(curve_p1[1], curve_t1[1], curve_p2[1], curve_t2[1], curr_pos[1] / curr_c[1].get_length())
+                if len(next_prev_c1) == 1 and len(next_prev_c2) == 1:
+                    if next_prev_c1[0] == next_prev_c2[0]:
+                        is_common_fork = True
+                        break
+
+                for i in range(2):
+
+                    curve_index = curr_c[i].get_index()
+                    if curve_index not in control_points:
+                        control_points[curve_index] = curr_c[i].get_control_points()
+
+                    chunk_control_points[i].append(control_points[curve_index])
+                    chunk_coefs[i].append((curr_pos[i] / curr_c[i].get_length(),))
+
+            # if everything is okay finally calculate curve points, distances and radius for whole chunk
+            if len(chunk_coefs[0]) > 0:
+
+                curr_p1 = _curve_utils.evaluate_positions(numpy.array(chunk_control_points[0]), chunk_coefs[0])[:, 0]
+                curr_p2 = _curve_utils.evaluate_positions(numpy.array(chunk_control_points[1]), chunk_coefs[1])[:, 0]
+
+                # distances are computed in double precision as "math_utils.get_distance" does it
+                diffs = curr_p1.astype(numpy.float64) - curr_p2
+                distances = numpy.sqrt(diffs[:, 0] ** 2 + diffs[:, 1] ** 2 + diffs[:, 2] ** 2)
+
+                for distance in distances.tolist():
+
+                    radius += steps[0]
+
+                    if distance > _PL_consts.SAFE_DISTANCE:
+                        return radius
 
-            distance = _math_utils.get_distance(curr_p1, curr_p2)
-            radius += steps[0]
+            if is_common_fork:
+                return 0
 
-        return radius
+            if is_end_reached:
+                return radius
 
     def __eq__(self, other):
         return (self.__inter_curve_id == other.__inter_curve_id and
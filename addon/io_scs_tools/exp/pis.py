@@ -61,7 +61,8 @@ def _fill_bones_sections(scs_root_obj, armature_obj, used_bones, export_scale):
         armature_mat = scs_root_obj.matrix_world.inverted() @ armature_obj.matrix_world
 
         bone_mat = (Matrix.Scale(export_scale, 4) @ _convert_utils.scs_to_blend_matrix().inverted() @ armature_mat @ bone.matrix_local)
-        section.data.append(("__bone__", bone.name, bone.parent, bone_mat.transposed()))
+        bone_parent_name = bone.parent.name if bone.parent else ""
+        section.data.append(("__bone__", bone.name, bone_parent_name, bone_mat.transposed()))
     return section
 
 
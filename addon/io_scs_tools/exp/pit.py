@@ -124,7 +124,7 @@ def default_material(alias):
     return material_export_data
 
 
-def get_texture_path_from_material(material, texture_type, export_path):
+def get_texture_path_from_material(material, texture_type, export_path, written_filepaths=None):
     """Get's relative path for Texture section of tobj from given texture_type.
     If tobj is not yet created it also creates tobj for it.
 
@@ -134,6 +134,8 @@ def get_texture_path_from_material(material, texture_type, export_path):
     :type texture_type: str
     :param export_path: path where PIT of this material and texture is gonna be exported
     :type export_path: str
+    :param written_filepaths: list to which absolute paths of written TOBJ and copied texture files are appended
+    :type written_filepaths: list[str] | None
     :return: relative path for Texture section data of PIT material
     :rtype: str
     """
@@ -199,6 +201,8 @@ def get_texture_path_from_material(material, texture_type, export_path):
                 # copy texture beside exported files
                 try:
                     shutil.copy2(texture_raw_path_with_ext, texture_copied_path_with_ext)
+                    if written_filepaths is not None:
+                        written_filepaths.append(texture_copied_path_with_ext)
                 except OSError as e:
                     # ignore copying the same file
                     # NOTE: happens if absolute texture paths are used
@@ -210,6 +214,8 @@ def get_texture_path_from_material(material, texture_type, export_path):
                 texture_raw_tobj_path = str(tex_dir) + os.sep + tobj_filename
                 if os.path.isfile(texture_raw_tobj_path):
                     shutil.copy2(texture_raw_tobj_path, os.path.join(export_path, tobj_filename))
+                    if written_filepaths is not None:
+                        written_filepaths.append(os.path.join(export_path, tobj_filename))
 
                 # get copied TOBJ relative path to current scs project path
                 tobj_rel_filepath = ""
@@ -246,7 +252,8 @@ def get_texture_path_from_material(material, texture_type, export_path):
         # export tobj only if file of texture exists
         if os.path.isfile(texture_abs_filepath):
             texture_name = os.path.basename(_path_utils.strip_sep(texture_abs_filepath))
-            _tobj.export(tobj_abs_filepath, texture_name, set())
+            if _tobj.export(tobj_abs_filepath, texture_name, set()) and written_filepaths is not None:
+                written_filepaths.append(tobj_abs_filepath)
         else:
             lprint("E Texture file %r from material %r doesn't exists, TOBJ can not be exported!",
                    (texture_raw_path, material.name))
@@ -341,7 +348,7 @@ def fill_part_list(parts, used_parts_names, all_parts=False):
     return part_list
 
 
-def export(root_object, filepath, name_suffix, used_parts, used_materials):
+def export(root_object, filepath, name_suffix, used_parts, used_materials, written_filepaths=None):
     """Export PIT.
 
     :param root_object: SCS root object
@@ -354,6 +361,8 @@ def export(root_object, filepath, name_suffix, used_parts, used_materials):
     :type used_parts: io_scs_tools.exp.transition_structs.parts.PartsTrans
     :param used_materials: materials transitional structure for accessing stored materials from PIM
     :type used_materials: io_scs_tools.exp.transition_structs.materials.MaterialsTrans
+    :param written_filepaths: list to which absolute paths of written TOBJ and copied texture files are appended
+    :type written_filepaths: list[str] | None
     :return: True if successful; False otherwise;
     :rtype: bool
     """
@@ -513,7 +522,7 @@ def export(root_object, filepath, name_suffix, used_parts, used_materials):
 
                                     # create and get path to tobj
                                     tobj_rel_path = get_texture_path_from_material(material, tag_prop,
-                                                                                   os.path.dirname(filepath))
+                                                                                   os.path.dirname(filepath), written_filepaths)
 
                                     texture_data.props.append((rec[0], tobj_rel_path))
 
@@ -592,7 +601,8 @@ def export(root_object, filepath, name_suffix, used_parts, used_materials):
 
                             elif tex_prop == "Value":
                                 if tag_id_string[8:] in material.scs_props.get_texture_types():
-                                    tobj_rel_path = get_texture_path_from_material(material, tag_id_string, os.path.dirname(filepath))
+                                    tobj_rel_path = get_texture_path_from_material(material, tag_id_string, os.path.dirname(filepath),
+                                                                                   written_filepaths)
                                     texture_section.props.append((tex_prop, tobj_rel_path))
                                 else:
                                     texture_section.props.append((tex_prop, texture_dict[tex_prop]))
@@ -63,7 +63,7 @@ def _get_flavor_types(preset, flavors_str):
     return tuple(enabled_flavors)
 
 
-def export(root_object, filepath, name_suffix, used_parts, used_materials):
+def export(root_object, filepath, name_suffix, used_parts, used_materials, written_filepaths=None):
     """Export PIT EF.
 
     :param root_object: SCS root object
@@ -76,6 +76,8 @@ def export(root_object, filepath, name_suffix, used_parts, used_materials):
     :type used_parts: io_scs_tools.exp.transition_structs.parts.PartsTrans
     :param used_materials: materials transitional structure for accessing stored materials from PIM
     :type used_materials: io_scs_tools.exp.transition_structs.materials.MaterialsTrans
+    :param written_filepaths: list to which absolute paths of written TOBJ and copied texture files are appended
+    :type written_filepaths: list[str] | None
     :return: True if successful; False otherwise;
     :rtype: bool
     """
@@ -238,7 +240,7 @@ def export(root_object, filepath, name_suffix, used_parts, used_materials):
 
                                     # create and get path to tobj
                                     tobj_rel_path = get_texture_path_from_material(material, tag_prop,
-                                                                                   os.path.dirname(filepath))
+                                                                                   os.path.dirname(filepath), written_filepaths)
 
                                     texture_data.props.append((rec[0], tobj_rel_path))
 
@@ -321,7 +323,8 @@ def export(root_object, filepath, name_suffix, used_parts, used_materials):
 
                             elif tex_prop == "Value":
                                 if tag_id_string[8:] in material.scs_props.get_texture_types():
-                                    tobj_rel_path = get_texture_path_from_material(material, tag_id_string, os.path.dirname(filepath))
+                                    tobj_rel_path = get_texture_path_from_material(material, tag_id_string, os.path.dirname(filepath),
+                                                                                   written_filepaths)
                                     texture_section.props.append((tex_prop, tobj_rel_path))
                                 else:
                                     texture_section.props.append((tex_prop, texture_dict[tex_prop]))
@@ -23,12 +23,15 @@ import os
 from io_scs_tools.utils import path as _path_utils
 from io_scs_tools.utils import object as _object_utils
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
+from io_scs_tools.utils import profiler as _profiler
 from io_scs_tools.utils.printout import lprint
 from io_scs_tools.exp import pia as _pia
 from io_scs_tools.exp import pic as _pic
 from io_scs_tools.exp import pis as _pis
 from io_scs_tools.exp import pit as _pit
 from io_scs_tools.exp import pit_ef as _pit_ef
+from io_scs_tools.exp import manifest as _manifest
+from io_scs_tools.exp.manifest import ExportManifest as _ExportManifest
 from io_scs_tools.exp.pim import exporter as _pim_exporter
 from io_scs_tools.exp.pim_ef import exporter as _pim_ef_exporter
 from io_scs_tools.exp.pip import exporter as _pip_exporter
@@ -37,6 +40,11 @@ from io_scs_tools.exp.transition_structs.materials import MaterialsTrans
 from io_scs_tools.exp.transition_structs.parts import PartsTrans
 from io_scs_tools.exp.transition_structs.terrain_points import TerrainPntsTrans
 
+_MODEL_MANIFEST_KEY = "model"
+"""Export manifest entry key for model files."""
+_ANIM_MANIFEST_KEY_PREFIX = "animation:"
+"""Export manifest entry key prefix for animation files."""
+
 
 def _get_objects_by_type(blender_objects, parts):
     """Gets lists for different types of objects used by SCS.
@@ -98,6 +106,97 @@ def _get_objects_by_type(blender_objects, parts):
     return mesh_object_list, prefab_locator_list, model_locator_list, collision_locator_list, armature_object
 
 
+def _export_model(dirpath, name_suffix, root_object, skeleton_filepath,
+                  mesh_objects, prefab_locators, model_locators, collision_locators, armature_object,
+                  parts, materials, bones, terrain_points, written_filepaths=None):
+    """Exports model files of SCS Game Object: PIM, PIC, PIP, PIT and PIS, depending on export settings.
+
+    :param dirpath: The main Filepath where most of the Files will be exported
+    :type dirpath: str
+    :param name_suffix: files name suffix (exchange format is using .ef)
+    :type name_suffix: str
+    :param root_object: SCS Root Object of game object
+    :type root_object: bpy.types.Object
+    :param skeleton_filepath: relative path of skeleton file
+    :type skeleton_filepath: str
+    :param mesh_objects: mesh objects of game object
+    :type mesh_objects: list[bpy.types.Object]
+    :param prefab_locators: prefab locators of game object
+    :type prefab_locators: list[bpy.types.Object]
+    :param model_locators: model locators of game object
+    :type model_locators: list[bpy.types.Object]
+    :param collision_locators: collision locators of game object
+    :type collision_locators: list[bpy.types.Object]
+    :param armature_object: armature object of game object
+    :type armature_object: bpy.types.Object | None
+    :param parts: transitional parts structure
+    :type parts: io_scs_tools.exp.transition_structs.parts.PartsTrans
+    :param materials: transitional materials structure
+    :type materials: io_scs_tools.exp.transition_structs.materials.MaterialsTrans
+    :param bones: transitional bones structure
+    :type bones: io_scs_tools.exp.transition_structs.bones.BonesTrans
+    :param terrain_points: transitional terrain points structure
+    :type terrain_points: io_scs_tools.exp.transition_structs.terrain_points.TerrainPntsTrans
+    :param written_filepaths: list to which absolute paths of written TOBJ and copied texture files are appended
+    :type written_filepaths: list[str] | None
+    :return: True if export was successful; False otherwise
+    :rtype: bool
+    """
+
+    scs_globals = _get_scs_globals()
+    export_success = True
+
+    # EXPORT PIM
+    if scs_globals.export_pim_file:
+        in_args = (dirpath, name_suffix, root_object, armature_object, skeleton_filepath, mesh_objects, model_locators)
+        trans_structs_args = (parts, materials, bones, terrain_points)
+
+        with _profiler.stage("PIM"):
+            if scs_globals.export_output_type == "5":
+                export_success = _pim_exporter.execute(*(in_args + trans_structs_args))
+            elif scs_globals.export_output_type == "EF":
+                export_success = _pim_ef_exporter.execute(*(in_args + trans_structs_args))
+            else:
+                export_success = False
+
+        # EXPORT PIC
+        if scs_globals.export_pic_file and export_success:
+            if collision_locators:
+                in_args = (collision_locators, dirpath + os.sep + root_object.name, name_suffix, root_object.name)
+                trans_structs_args = (parts,)
+                with _profiler.stage("PIC"):
+                    export_success = _pic.export(*(in_args + trans_structs_args))
+            else:
+                lprint("I No collider locator objects to export.")
+
+    # EXPORT PIP
+    if scs_globals.export_pip_file and prefab_locators and export_success:
+        in_args = (dirpath, root_object.name, name_suffix, prefab_locators, root_object.matrix_world)
+        trans_structs_args = (parts, terrain_points)
+        with _profiler.stage("PIP"):
+            export_success = _pip_exporter.execute(*(in_args + trans_structs_args))
+
+    # EXPORT PIT
+    if scs_globals.export_pit_file and export_success:
+        in_args = (root_object, dirpath + os.sep + root_object.name, name_suffix)
+        trans_structs_args = (parts, materials)
+
+        with _profiler.stage("PIT"):
+            if scs_globals.export_output_type == "5":
+                export_success = _pit.export(*(in_args + trans_structs_args), written_filepaths=written_filepaths)
+            elif scs_globals.export_output_type == "EF":
+                export_success = _pit_ef.export(*(in_args + trans_structs_args), written_filepaths=written_filepaths)
+            else:
+                export_success = False
+
+    # EXPORT PIS
+    if root_object.scs_props.scs_root_animated == 'anim' and scs_globals.export_pis_file and bones.are_present() and export_success:
+        with _profiler.stage("PIS"):
+            export_success = _pis.export(os.path.join(dirpath, skeleton_filepath), root_object, armature_object, bones.get_as_list())
+
+    return export_success
+
+
 def export(dirpath, name_suffix, root_object, game_object_list):
     """The main export function.
 
@@ -160,53 +259,46 @@ def export(dirpath, name_suffix, root_object, game_object_list):
     scs_globals = _get_scs_globals()
     export_success = True
 
-    # EXPORT PIM
-    if scs_globals.export_pim_file:
-        in_args = (dirpath, name_suffix, root_object, armature_object, skeleton_filepath, mesh_objects, model_locators)
-        trans_structs_args = (parts, materials, bones, terrain_points)
+    # INCREMENTAL EXPORT CHECK
+    manifest = None
+    if scs_globals.export_incremental:
+        manifest = _ExportManifest(dirpath, root_object.name)
 
-        if scs_globals.export_output_type == "5":
-            export_success = _pim_exporter.execute(*(in_args + trans_structs_args))
-        elif scs_globals.export_output_type == "EF":
-            export_success = _pim_ef_exporter.execute(*(in_args + trans_structs_args))
-        else:
-            export_success = False
+    model_filepaths = [os.path.join(dirpath, root_object.name + ext + name_suffix) for ext in (".pim", ".pic", ".pip", ".pit")]
+    model_filepaths.append(os.path.join(dirpath, skeleton_filepath))
 
-        # EXPORT PIC
-        if scs_globals.export_pic_file and export_success:
-            if collision_locators:
-                in_args = (collision_locators, dirpath + os.sep + root_object.name, name_suffix, root_object.name)
-                trans_structs_args = (parts,)
-                export_success = _pic.export(*(in_args + trans_structs_args))
-            else:
-                lprint("I No collider locator objects to export.")
+    model_fingerprint = None
+    if manifest:
+        with _profiler.stage("fingerprints"):
+            model_fingerprint = _manifest.get_model_fingerprint(dirpath, name_suffix, skeleton_filepath, root_object, game_object_list)
 
-    # EXPORT PIP
-    if scs_globals.export_pip_file and prefab_locators and export_success:
-        in_args = (dirpath, root_object.name, name_suffix, prefab_locators, root_object.matrix_world)
-        trans_structs_args = (parts, terrain_points)
-        export_success = _pip_exporter.execute(*(in_args + trans_structs_args))
+    if manifest and manifest.is_up_to_date(_MODEL_MANIFEST_KEY, model_fingerprint):
 
-    # EXPORT PIT
-    if scs_globals.export_pit_file and export_success:
-        in_args = (root_object, dirpath + os.sep + root_object.name, name_suffix)
-        trans_structs_args = (parts, materials)
+        lprint("I Model files of %r didn't change since last export, skipping them!", (root_object.name,))
+        bones_present = manifest.get_data(_MODEL_MANIFEST_KEY, "bones_present", False)
 
-        if scs_globals.export_output_type == "5":
-            export_success = _pit.export(*(in_args + trans_structs_args))
-        elif scs_globals.export_output_type == "EF":
-            export_success = _pit_ef.export(*(in_args + trans_structs_args))
-        else:
-            export_success = False
+    else:
+
+        old_states = _ExportManifest.get_file_states(model_filepaths) if manifest else {}
+
+        in_args = (dirpath, name_suffix, root_object, skeleton_filepath)
+        objects_args = (mesh_objects, prefab_locators, model_locators, collision_locators, armature_object)
+        trans_structs_args = (parts, materials, bones, terrain_points)
+        texture_filepaths = []  # TOBJ and texture files written by PIT export have to be checked for changes too
+        export_success = _export_model(*(in_args + objects_args + trans_structs_args), written_filepaths=texture_filepaths)
+        bones_present = bones.are_present()
+
+        if manifest and export_success:
+            manifest.update(_MODEL_MANIFEST_KEY, model_fingerprint, old_states, model_filepaths + texture_filepaths,
+                            bones_present=bones_present)
+        elif manifest:
+            manifest.remove(_MODEL_MANIFEST_KEY)
 
-    # PIS, PIA
+    # PIA
     if root_object.scs_props.scs_root_animated == 'anim':
-        # EXPORT PIS
-        if scs_globals.export_pis_file and bones.are_present() and export_success:
-            export_success = _pis.export(os.path.join(dirpath, skeleton_filepath), root_object, armature_object, bones.get_as_list())
 
         # EXPORT PIA
-        if scs_globals.export_pia_file and bones.are_present() and export_success:
+        if scs_globals.export_pia_file and bones_present and export_success:
 
             anim_dirpath = _path_utils.get_animations_relative_filepath(root_object, dirpath)
 
@@ -222,8 +314,33 @@ def export(dirpath, name_suffix, root_object, game_object_list):
 
                     if scs_anim.export:  # check if export is disabled on animation itself
 
-                        # TODO: use bones transitional variable for safety checks
-                        export_success = _pia.export(root_object, armature_object, scs_anim, anim_dirpath, name_suffix, skeleton_filepath)
+                        anim_manifest_key = _ANIM_MANIFEST_KEY_PREFIX + scs_anim.name
+                        anim_filepaths = (os.path.join(anim_dirpath, scs_anim.name + ".pia" + name_suffix),)
+
+                        anim_fingerprint = None
+                        if manifest:
+                            with _profiler.stage("fingerprints"):
+                                anim_fingerprint = _manifest.get_animation_fingerprint(anim_dirpath, name_suffix, skeleton_filepath,
+                                                                                       root_object, armature_object, scs_anim)
+
+                        if manifest and manifest.is_up_to_date(anim_manifest_key, anim_fingerprint):
+
+                            lprint("I Animation %r didn't change since last export, skipping it!", (scs_anim.name,))
+                            export_success = True
+
+                        else:
+
+                            old_states = _ExportManifest.get_file_states(anim_filepaths) if manifest else {}
+
+                            # TODO: use bones transitional variable for safety checks
+                            with _profiler.stage("PIA"):
+                                export_success = _pia.export(root_object, armature_object, scs_anim, anim_dirpath, name_suffix,
+                                                             skeleton_filepath)
+
+                            if manifest and export_success:
+                                manifest.update(anim_manifest_key, anim_fingerprint, old_states, anim_filepaths)
+                            elif manifest:
+                                manifest.remove(anim_manifest_key)
 
                         if export_success:
 
@@ -248,6 +365,10 @@ def export(dirpath, name_suffix, root_object, game_object_list):
         lprint("W Armature and SCS Animations detected but not exported! If you are exporting animated model,\n\t   " +
                "make sure to switch SCS Root Object %r to 'Animated Model'!", (root_object.name,))
 
+    # manifest can be saved only once all the files are written
+    if manifest:
+        manifest.queue_save()
+
     # FINAL FEEDBACK
     context.window.cursor_modal_restore()
     if export_success:
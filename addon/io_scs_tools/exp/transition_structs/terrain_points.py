@@ -25,6 +25,9 @@ from io_scs_tools.consts import PrefabLocators as _PL_consts
 class TerrainPntsTrans:
     """Transitional terrain points class for storing terrain points position and normal per variant index and node index.
     This storage shall be use to collect&store terrain points in PIM exporter and then use it in PIP exporter.
+
+    Besides list of terrain points, each variant and node also has spatial hash of it's terrain points,
+    with grid cells of the size of minimal distance between terrain points, to quickly find close terrain points.
     """
 
     class Entry:
@@ -38,6 +41,19 @@ class TerrainPntsTrans:
                                  pow(self.position[2] - other.position[2], 2))
             return distance < _PL_consts.TERRAIN_POINTS_MIN_DISTANCE
 
+    @staticmethod
+    def __get_cell__(position):
+        """Gets spatial hash grid cell of given position.
+
+        :param position: position of terrain point
+        :type position: Vector | tuple
+        :return: grid cell indices
+        :rtype: tuple[int, int, int]
+        """
+        return (math.floor(position[0] / _PL_consts.TERRAIN_POINTS_MIN_DISTANCE),
+                math.floor(position[1] / _PL_consts.TERRAIN_POINTS_MIN_DISTANCE),
+                math.floor(position[2] / _PL_consts.TERRAIN_POINTS_MIN_DISTANCE))
+
     def __init__(self):
         """Creates class instance of terrain points transitional structure.
         """
@@ -45,6 +61,9 @@ class TerrainPntsTrans:
         self.__storage = {}
         """:type: dict[str, list[TerrainPntsTrans.Entry]]"""
 
+        self.__grids = {}
+        """:type: dict[str, dict[tuple[int, int, int], list[TerrainPntsTrans.Entry]]]"""
+
     def add(self, variant_index, node_index, position, normal):
         """Adds new terrain point to storage.
 
@@ -61,11 +80,25 @@ class TerrainPntsTrans:
         key = str(variant_index) + ":" + str(node_index)
         if key not in self.__storage:
             self.__storage[key] = []
+            self.__grids[key] = {}
 
-        # save only unique position points
+        grid = self.__grids[key]
         tp_entry = TerrainPntsTrans.Entry(position, normal)
-        if tp_entry not in self.__storage[key]:
-            self.__storage[key].append(tp_entry)
+
+        # save only unique position points, so check entries in neighbouring grid cells,
+        # as only there can be terrain points closer than minimal distance
+        cell_x, cell_y, cell_z = self.__get_cell__(position)
+        for x in (cell_x - 1, cell_x, cell_x + 1):
+            for y in (cell_y - 1, cell_y, cell_y + 1):
+                for z in (cell_z - 1, cell_z, cell_z + 1):
+                    if (x, y, z) in grid and tp_entry in grid[(x, y, z)]:
+                        return
+
+        self.__storage[key].append(tp_entry)
+
+        if (cell_x, cell_y, cell_z) not in grid:
+            grid[(cell_x, cell_y, cell_z)] = []
+        grid[(cell_x, cell_y, cell_z)].append(tp_entry)
 
     def ensure_entry(self, variant_index, node_index):
         """Ensures that variant in given node is present.
@@ -81,6 +114,7 @@ class TerrainPntsTrans:
         key = str(variant_index) + ":" + str(node_index)
         if key not in self.__storage:
             self.__storage[key] = []
+            self.__grids[key] = {}
 
     def get(self, node_index):
         """Get terrain point for given node index.
@@ -124,6 +124,33 @@ def _get_anim_channels(pia_container, section_name="BoneChannel"):
     return channels
 
 
+def _get_keyframe_frames(time_stream):
+    """Gets frames of keyframes from given "_TIME" stream, where each value is time elapsed since previous keyframe.
+
+    Time of the first keyframe is taken as time of one frame, as keyframes are exported from the second frame on
+    and time of keyframes following reduced ones is multiple of it. So animation without reduced keyframes
+    gets one keyframe per frame starting at frame one.
+
+    :param time_stream: data of "_TIME" stream
+    :type time_stream: collections.abc.Iterable
+    :return: frame of each keyframe
+    :rtype: list[int]
+    """
+    frames = []
+    frame_time = None
+    frame = 0
+    for key_time in time_stream:
+
+        if frame_time is None:
+            frame_time = key_time[0]
+
+        # keep at least one frame between keyframes, also when times are invalid
+        frame += max(1, round(key_time[0] / frame_time)) if frame_time > 0 else 1
+        frames.append(frame)
+
+    return frames
+
+
 def _create_fcurves(anim_action, anim_group, anim_curve, rot_euler=True, types='LocRotSca'):
     """Creates animation curves for provided Action / Group (Bone).
 
@@ -221,7 +248,7 @@ def load(root_object, pia_files, armature, pis_filepath=None, bones=None):
 
         if skeleton_match:
             lprint('I ++ "%s" IMPORTING animation data...', (os.path.basename(pia_filepath),))
-            pia_container = _pix_container.get_data_from_file(pia_filepath, ind)
+            pia_container = _pix_container.get_data_from_file(pia_filepath, ind, tokenized=True, use_cache=True)
             if not pia_container:
                 lprint('\nE File "%s" is empty!', (_path_utils.readable_norm(pia_filepath),))
                 continue
@@ -299,8 +326,8 @@ def load(root_object, pia_files, armature, pis_filepath=None, bones=None):
                             parent_bone_rest_matrix_scs = Matrix()
                             parent_bone_rest_matrix_scs.identity()
 
-                        for key_time_i, key_time in enumerate(streams[0]):
-                            keyframe = key_time_i + 1
+                        # keyframes might be reduced on export, so they have to be placed by their time
+                        for key_time_i, keyframe in enumerate(_get_keyframe_frames(streams[0])):
 
                             # GET BONE ANIMATION MATRIX
                             bone_animation_matrix_scs = streams[1][key_time_i].transposed()
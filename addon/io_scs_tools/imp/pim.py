@@ -19,10 +19,8 @@
 # Copyright (C) 2013-2022: SCS Software
 
 import bpy
-import bmesh
-import array
+import numpy
 from re import match
-from mathutils import Vector
 from io_scs_tools.consts import Mesh as _MESH_consts
 from io_scs_tools.consts import Operators as _OP_consts
 from io_scs_tools.imp.transition_structs.terrain_points import TerrainPntsTrans
@@ -32,6 +30,7 @@ from io_scs_tools.utils.printout import handle_unused_arg
 from io_scs_tools.utils import convert as _convert_utils
 from io_scs_tools.utils import object as _object_utils
 from io_scs_tools.utils import mesh as _mesh_utils
+from io_scs_tools.utils import profiler as _profiler
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 
 
@@ -412,29 +411,34 @@ def _create_piece(
 
     mesh = bpy.data.meshes.new(name)
 
+    # VERTICES WELDING - duplicated vertices are left out from the mesh and mapped to their original counterparts
+    used_vertices, vertices_map = _mesh_utils.get_welded_vertices_map(len(mesh_vertices), points_to_weld_list)
+
     # COORDINATES TRANSFORMATION
-    transformed_mesh_vertices = [_convert_utils.change_to_scs_xyz_coordinates(vec, import_scale) for vec in mesh_vertices]
+    transformed_mesh_vertices = [_convert_utils.change_to_scs_xyz_coordinates(mesh_vertices[i], import_scale) for i in used_vertices.tolist()]
 
     context.window_manager.progress_update(0.1)
 
     # VISUALISE IMPORTED NORMALS (DEBUG)
     # visualise_normals(name, transformed_mesh_vertices, mesh_normals, import_scale)
 
-    # MESH CREATION
-    bm = bmesh.new()
-
-    # VERTICES
-    _mesh_utils.bm_make_vertices(bm, transformed_mesh_vertices)
+    # FACES
+    mesh_triangles, mapped_triangles, back_triangles = _mesh_utils.make_faces(mesh_triangles, vertices_map)
     context.window_manager.progress_update(0.2)
 
-    # FACES
-    mesh_triangles, back_triangles = _mesh_utils.bm_make_faces(bm, mesh_triangles, points_to_weld_list)
+    # MESH CREATION
+    _mesh_utils.make_mesh(mesh, transformed_mesh_vertices, mapped_triangles)
     context.window_manager.progress_update(0.3)
 
+    # loops vertex indices: original ones as written in triangles and ones of welded vertices, both indexing PIM streams
+    loops_vertices = mesh_triangles.ravel()
+    loops_welded_vertices = used_vertices[mapped_triangles.ravel()]
+
     # UV LAYERS
     if mesh_uv:
         for uv_layer_name in mesh_uv:
-            _mesh_utils.bm_make_uv_layer(5, bm, mesh_triangles, uv_layer_name, mesh_uv[uv_layer_name]["data"])
+            uvs = numpy.array(mesh_uv[uv_layer_name]["data"], dtype=numpy.float64)
+            _mesh_utils.make_uv_layer(mesh, uv_layer_name, uvs[loops_vertices])
     context.window_manager.progress_update(0.4)
 
     # VERTEX COLOR
@@ -448,59 +452,43 @@ def _create_piece(
     vcolor_corrupt = False
     for vc_layer_name in mesh_rgb_final:
 
+        vcolors = numpy.array(mesh_rgb_final[vc_layer_name], dtype=numpy.float64)
+
         # check for vcolor bigger than possible float range (since we divide our vcolor by 2 max value is 2)
         max_vcolor = 2.0
-        for k, vc_entry in enumerate(mesh_rgb_final[vc_layer_name]):
-            for j, value in enumerate(vc_entry):
-                if value > max_vcolor:
-                    mesh_rgb_final[vc_layer_name][k][j] = max_vcolor
-                    vcolor_corrupt = True
+        if numpy.any(vcolors > max_vcolor):
+            numpy.minimum(vcolors, max_vcolor, out=vcolors)
+            vcolor_corrupt = True
 
-        _mesh_utils.bm_make_vc_layer(5, bm, vc_layer_name, mesh_rgb_final[vc_layer_name])
+        _mesh_utils.make_vc_layer(mesh, vc_layer_name, vcolors[loops_welded_vertices])
 
     if vcolor_corrupt:
         lprint("W Piece %r has vertices with vertex color greater the 1.0, clamping it!", (name,))
 
     context.window_manager.progress_update(0.5)
 
-    bm.to_mesh(mesh)
-    mesh.update()
-    bm.free()
-
     if _MESH_consts.default_vcol in mesh.color_attributes:
         # make sure to set default vcolor attribute as active
         mesh.color_attributes.active_color = mesh.color_attributes[_MESH_consts.default_vcol]
         mesh.color_attributes.render_color_index = mesh.color_attributes.active_color_index
 
-    # NORMALS - has to be applied after bmesh creation as they are set directly to mesh
-    if _get_scs_globals().import_use_normals:
-
-        mesh.create_normals_split()
+    # set polygons to use smooth representation
+    mesh.polygons.foreach_set("use_smooth", numpy.ones(len(mesh.polygons), dtype=bool))
 
-        # first set normals directly to loops
-        for loop in mesh.loops:
-            curr_n = _convert_utils.scs_to_blend_matrix() @ Vector(mesh_normals[loop.vertex_index])
-            loop.normal[:] = curr_n
+    # NORMALS - custom split normals are set directly from PIM normals of welded vertices per loop
+    if _get_scs_globals().import_use_normals:
 
-        # then we have to go trough very important step they say,
+        # we have to go trough very important step they say,
         # as without validation we get wrong result for some normals
         mesh.validate(clean_customdata=False)  # *Very* important to not remove lnors here!
 
-        # set polygons to use smooth representation
-        mesh.polygons.foreach_set("use_smooth", [True] * len(mesh.polygons))
+        normals_transf_mat = numpy.array(_convert_utils.scs_to_blend_matrix().to_3x3(), dtype=numpy.float64)
+        loops_normals = numpy.array(mesh_normals, dtype=numpy.float64)[loops_welded_vertices] @ normals_transf_mat.T
 
-        # finally fill clnors from loops normals and apply them (taken from official Blenders scripts)
-        clnors = array.array('f', [0.0] * (len(mesh.loops) * 3))
-        mesh.loops.foreach_get("normal", clnors)
-        mesh.normals_split_custom_set(tuple(zip(*(iter(clnors),) * 3)))
+        mesh.normals_split_custom_set(loops_normals.tolist())
         mesh.use_auto_smooth = True
         mesh.auto_smooth_angle = 3.14
 
-        mesh.free_normals_split()
-    else:
-        # set polygons to use smooth representation only
-        mesh.polygons.foreach_set("use_smooth", [True] * len(mesh.polygons))
-
     context.window_manager.progress_update(0.6)
 
     # Create object out of mesh and link it to active layer collection.
@@ -517,58 +505,51 @@ def _create_piece(
     context.window_manager.progress_update(0.8)
 
     # TERRAIN POINTS (VERTEX GROUPS)
-    for vertex_i, vertex_pos in enumerate(mesh_vertices):
+    tp_members = terrain_points_trans.get_members([mesh_vertices[i] for i in used_vertices.tolist()])
 
-        tp_entries = terrain_points_trans.get(vertex_pos)
+    # add vertices to all combinations of variants/nodes
+    # from found terrain points transitional structures
+    for (variant_i, node_i), vertices in tp_members.items():
 
-        # add current vertex to all combinations of variants/nodes
-        # from found terrain points transitional structures
-        for tp_entry in tp_entries:
+        # first 6 chars in vertex group name will represent variant index
+        # this way we will be able to identify variant during vertex groups
+        # cleanup if this vertex will be set to multiple variants
+        vg_name = str(variant_i).zfill(6) + _OP_consts.TerrainPoints.vg_name_prefix + str(node_i)
 
-            # first 6 chars in vertex group name will represent variant index
-            # this way we will be able to identify variant during vertex groups
-            # cleanup if this vertex will be set to multiple variants
-            vg_name = str(tp_entry.variant_i).zfill(6) + _OP_consts.TerrainPoints.vg_name_prefix + str(tp_entry.node_i)
+        if vg_name not in obj.vertex_groups:
+            obj.vertex_groups.new(name=vg_name)
 
-            if vg_name not in obj.vertex_groups:
-                obj.vertex_groups.new(name=vg_name)
-
-            vertex_group = obj.vertex_groups[vg_name]
-            vertex_group.add([vertex_i], 1.0, "REPLACE")
+        obj.vertex_groups[vg_name].add(vertices.tolist(), 1.0, "REPLACE")
 
     # SKINNING (VERTEX GROUPS)
     if object_skinning:
         if name in object_skinning:
             for vertex_group_name in object_skinning[name]:
                 vertex_group = obj.vertex_groups.new(name=vertex_group_name)
-                for vertex_i, vertex in enumerate(object_skinning[name][vertex_group_name]):
-                    weight = object_skinning[name][vertex_group_name][vertex]
+
+                # weights of duplicated vertices are added to their original counterparts
+                vertices_weights = {}
+                for vertex, weight in object_skinning[name][vertex_group_name].items():
                     if weight != 0.0:
-                        if vertex in points_to_weld_list:
-                            vertex = points_to_weld_list[vertex]
-                        vertex_group.add([vertex], weight, "ADD")
+                        vertex = int(vertices_map[vertex])
+                        if vertex in vertices_weights:
+                            weight = min(max(vertices_weights[vertex] + weight, 0.0), 1.0)
+                        vertices_weights[vertex] = weight
+
+                # add all vertices with the same weight at once
+                weights_vertices = {}
+                for vertex, weight in vertices_weights.items():
+                    if weight not in weights_vertices:
+                        weights_vertices[weight] = []
+                    weights_vertices[weight].append(vertex)
+
+                for weight, vertices in weights_vertices.items():
+                    vertex_group.add(vertices, weight, "REPLACE")
         else:
             lprint('\nE Missing skin group %r! Skipping...', name)
 
     context.window_manager.progress_update(0.9)
 
-    # DELETE ORPHAN VERTICES (LEFT IN THE GEOMETRY FROM SMOOTHING RECONSTRUCTION)
-    if points_to_weld_list:
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-
-        bm.verts.ensure_lookup_table()
-        for vert_i in points_to_weld_list.keys():
-            bm.verts[vert_i].select_set(True)
-
-        verts = [v for v in bm.verts if v.select]
-        if verts:
-            bmesh.ops.delete(bm, geom=verts, context='VERTS')
-
-        # APPLYING BMESH TO MESH
-        bm.to_mesh(mesh)
-        bm.free()
-
     context.window_manager.progress_update(1.0)
 
     # MATERIAL
@@ -698,7 +679,7 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
     lprint("I Reading data from PIM file ...", immediate_timeout=0)
 
     ind = '    '
-    pim_container = _pix_container.get_data_from_file(filepath, ind, print_progress=True)
+    pim_container = _pix_container.get_data_from_file(filepath, ind, print_progress=True, tokenized=True, use_cache=True)
 
     lprint("I Assembling data ...", immediate_timeout=0)
 
@@ -721,6 +702,8 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
      skeleton,
      piece_skin_count) = get_global(pim_container)
 
+    _profiler.add_items(vertex_count)
+
     # DATA LOADING
     materials_data = {}
     objects_data = {}
@@ -764,7 +747,7 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
                  mesh_uv,
                  mesh_tuv,
                  mesh_triangles) = _get_piece_streams(section)
-                points_to_weld_list = {}
+                points_to_weld_list = None
                 if mesh_normals:
                     # print('Piece %i going to "make_posnorm_list"...' % ob_index)
                     if scs_globals.import_use_welding:
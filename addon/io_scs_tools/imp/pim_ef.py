@@ -261,7 +261,7 @@ def _create_piece(
 
     # FACES
     # for fac_i, fac in enumerate(mesh_faces): print('     face[%i]: %s' % (fac_i, str(fac)))
-    mesh_faces, back_faces = _mesh_utils.bm_make_faces(bm, mesh_faces, [])
+    mesh_faces, back_faces = _mesh_utils.bm_make_faces(bm, mesh_faces, None)
     context.window_manager.progress_update(0.3)
 
     # SHARP EDGES
@@ -367,24 +367,21 @@ def _create_piece(
     context.window_manager.progress_update(0.7)
 
     # TERRAIN POINTS (VERTEX GROUPS)
-    for vertex_i, vertex_pos in enumerate(mesh_vertices):
+    tp_members = terrain_points_trans.get_members(mesh_vertices)
 
-        tp_entries = terrain_points_trans.get(vertex_pos)
+    # add vertices to all combinations of variants/nodes
+    # from found terrain points transitional structures
+    for (variant_i, node_i), vertices in tp_members.items():
 
-        # add current vertex to all combinations of variants/nodes
-        # from found terrain points transitional structures
-        for tp_entry in tp_entries:
+        # first 6 chars in vertex group name will represent variant index
+        # this way we will be able to identify variant during vertex groups
+        # cleanup if this vertex will be set to multiple variants
+        vg_name = str(variant_i).zfill(6) + _OP_consts.TerrainPoints.vg_name_prefix + str(node_i)
 
-            # first 6 chars in vertex group name will represent variant index
-            # this way we will be able to identify variant during vertex groups
-            # cleanup if this vertex will be set to multiple variants
-            vg_name = str(tp_entry.variant_i).zfill(6) + _OP_consts.TerrainPoints.vg_name_prefix + str(tp_entry.node_i)
+        if vg_name not in obj.vertex_groups:
+            obj.vertex_groups.new(name=vg_name)
 
-            if vg_name not in obj.vertex_groups:
-                obj.vertex_groups.new(name=vg_name)
-
-            vertex_group = obj.vertex_groups[vg_name]
-            vertex_group.add([vertex_i], 1.0, "REPLACE")
+        obj.vertex_groups[vg_name].add(vertices.tolist(), 1.0, "REPLACE")
 
     # SKINNING (VERTEX GROUPS)
     if object_skinning:
@@ -477,7 +474,7 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
 
     scs_globals = _get_scs_globals()
     ind = '    '
-    pim_container = _pix_container.get_data_from_file(filepath, ind, print_progress=True)
+    pim_container = _pix_container.get_data_from_file(filepath, ind, print_progress=True, use_cache=True)
 
     lprint("I Assembling data ...", immediate_timeout=0)
 
@@ -638,7 +638,7 @@ def load(filepath, terrain_points_trans):
 
     # scene = context.scene
     ind = '    '
-    pip_container = _pix_container.get_data_from_file(filepath, ind)
+    pip_container = _pix_container.get_data_from_file(filepath, ind, tokenized=True, use_cache=True)
 
     # LOAD HEADER
     '''
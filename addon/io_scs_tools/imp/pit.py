@@ -259,7 +259,7 @@ def load(filepath):
     print("************************************\n")
 
     ind = '    '
-    pit_container = _pix_container.get_data_from_file(filepath, ind)
+    pit_container = _pix_container.get_data_from_file(filepath, ind, use_cache=True)
 
     # TEST PRINTOUTS
     # ind = '  '
@@ -30,11 +30,13 @@ from io_scs_tools.imp import pis as _pis
 from io_scs_tools.imp import pit as _pit
 from io_scs_tools.imp.transition_structs.terrain_points import TerrainPntsTrans
 from io_scs_tools.internals import inventory as _inventory
+from io_scs_tools.internals.containers import pix as _pix_container
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.utils import material as _material_utils
 from io_scs_tools.utils import name as _name_utils
 from io_scs_tools.utils import object as _object_utils
 from io_scs_tools.utils import path as _path_utils
+from io_scs_tools.utils import profiler as _profiler
 from io_scs_tools.utils.printout import lprint
 
 
@@ -372,6 +374,10 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
     if not suppress_reports:
         lprint("", report_errors=-1, report_warnings=-1)  # Clear the 'error_messages' and 'warning_messages'
 
+    _pix_container.reset_parse_cache_stats()
+    _path_utils.reset_project_index_stats()
+    _profiler.start("Import")
+
     collision_locators = []
     prefab_locators = []
     loaded_variants = []
@@ -391,7 +397,8 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
         if os.path.isfile(pip_filepath):
             lprint('\nD PIP filepath:\n  %s', (pip_filepath,))
             # print('PIP filepath:\n  %s' % pip_filepath)
-            result, prefab_locators = _pip.load(pip_filepath, terrain_points)
+            with _profiler.stage("PIP"):
+                result, prefab_locators = _pip.load(pip_filepath, terrain_points)
         else:
             lprint('\nI No PIP file.')
             # print('INFO - No PIP file.')
@@ -404,20 +411,21 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
             if os.path.isfile(pim_filepath):
                 lprint('\nD PIM filepath:\n  %s', (_path_utils.readable_norm(pim_filepath),))
 
-                if pim_filepath.endswith(".pim"):
-                    result, objects, locators, armature, skeleton, mats_info = _pim.load(
-                        context,
-                        pim_filepath,
-                        terrain_points_trans=terrain_points
-                    )
-                elif pim_filepath.endswith(".pim.ef"):
-                    result, objects, locators, armature, skeleton, mats_info = _pim_ef.load(
-                        context,
-                        pim_filepath,
-                        terrain_points_trans=terrain_points
-                    )
-                else:
-                    lprint("\nE Unknown PIM file extension! Shouldn't happen...")
+                with _profiler.stage("PIM"):
+                    if pim_filepath.endswith(".pim"):
+                        result, objects, locators, armature, skeleton, mats_info = _pim.load(
+                            context,
+                            pim_filepath,
+                            terrain_points_trans=terrain_points
+                        )
+                    elif pim_filepath.endswith(".pim.ef"):
+                        result, objects, locators, armature, skeleton, mats_info = _pim_ef.load(
+                            context,
+                            pim_filepath,
+                            terrain_points_trans=terrain_points
+                        )
+                    else:
+                        lprint("\nE Unknown PIM file extension! Shouldn't happen...")
             else:
                 lprint('\nI No file found at %r!' % (_path_utils.readable_norm(pim_filepath),))
         else:
@@ -431,7 +439,8 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
         if os.path.isfile(pit_filepath):
             lprint('\nD PIT filepath:\n  %s', (pit_filepath,))
             # print('PIT filepath:\n  %s' % pit_filepath)
-            result, loaded_variants, loaded_looks = _pit.load(pit_filepath)
+            with _profiler.stage("PIT"):
+                result, loaded_variants, loaded_looks = _pit.load(pit_filepath)
         else:
             lprint('\nI No PIT file.')
             # print('INFO - No PIT file.')
@@ -443,7 +452,8 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
         if os.path.isfile(pic_filepath):
             lprint('\nD PIC filepath:\n  %s', (pic_filepath,))
             # print('PIC filepath:\n  %s' % pic_filepath)
-            result, collision_locators = _pic.load(pic_filepath)
+            with _profiler.stage("PIC"):
+                result, collision_locators = _pic.load(pic_filepath)
         else:
             lprint('\nI No PIC file.')
             # print('INFO - No PIC file.')
@@ -456,7 +466,8 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
         locators.append(item)
     path, filename = os.path.split(filepath)
     if objects or locators or (armature and skeleton):
-        scs_root_object = _create_scs_root_object(filename, loaded_variants, loaded_looks, mats_info, objects, locators, armature)
+        with _profiler.stage("SCS Root Object"):
+            scs_root_object = _create_scs_root_object(filename, loaded_variants, loaded_looks, mats_info, objects, locators, armature)
 
         # Additionally if user wants to have automatically set custom export path, then let him have it :P
         if scs_globals.import_preserve_path_for_export:
@@ -488,7 +499,8 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
                                                                                                scs_globals.scs_project_path)
                 armature.scs_props.scs_skeleton_custom_name = os.path.basename(skeleton[:-4])
 
-            bones = _pis.load(pis_filepath, armature)
+            with _profiler.stage("PIS"):
+                bones = _pis.load(pis_filepath, armature)
         else:
             bones = None
             lprint('\nI No PIS file.')
@@ -518,7 +530,8 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
                 for pia_filepath in pia_files:
                     lprint('D %r', pia_filepath)
                 # print('armature: %s\nskeleton: %r\nbones: %s\n' % (str(armature), str(skeleton), str(bones)))
-                _pia.load(scs_root_object, pia_files, armature, pis_filepath, bones)
+                with _profiler.stage("PIA", items=len(pia_files)):
+                    _pia.load(scs_root_object, pia_files, armature, pis_filepath, bones)
             else:
                 lprint('\nI No PIA files.')
 
@@ -527,9 +540,16 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
 
     # FINAL FEEDBACK
     bpy.context.window.cursor_modal_restore()
+    if scs_globals.import_use_parse_cache:
+        cache_hits, cache_misses = _pix_container.get_parse_cache_stats()
+        lprint('\nI Parse cache: %i hit(s), %i miss(es).', (cache_hits, cache_misses))
+    index_avoided, index_performed = _path_utils.get_project_index_stats()
+    lprint('\nD Project index: %i filesystem check(s) answered from memory, %i filesystem access(es) done.', (index_avoided, index_performed))
     if suppress_reports:
         lprint('\nI Import completed in %.3f sec.', time.time() - t)
     else:
         lprint('\nI Import completed in %.3f sec.', time.time() - t, report_errors=True, report_warnings=True)
 
+    _profiler.finish()
+
     return True
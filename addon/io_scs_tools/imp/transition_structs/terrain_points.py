@@ -19,9 +19,14 @@
 # Copyright (C) 2015: SCS Software
 
 
+import numpy
+
+
 class TerrainPntsTrans:
     """Transitional terrain points class for storing terrain points position and normal per variant index and node index.
     This storage shall be use to collect&store terrain points in PIP importer and then used it in PIM importer.
+
+    Terrain points are stored in spatial hash, where positions are quantized to integer grid.
     """
 
     class Entry:
@@ -32,26 +37,30 @@ class TerrainPntsTrans:
         def __eq__(self, other):
             return self.variant_i == other.variant_i and self.node_i == other.node_i
 
-    @staticmethod
-    def __stringfy_key__(position):
-        """Creates string key from position vector.
+    KEY_PRECISION = 1000
+    """Number of grid cells per unit used for quantization of positions.
 
-        NOTE: currently matching is done on milimeter precision, because
-        better precision in some cases didn't recover all of the points.
+    NOTE: currently matching is done on milimeter precision, because
+    better precision in some cases didn't recover all of the points.
+    """
+
+    @staticmethod
+    def __quantize__(positions):
+        """Quantizes positions to integer grid.
 
-        :param position:
-        :type position: mathutils.Vector | tuple
-        :return: string representation of position
-        :rtype: str
+        :param positions: positions as (N, 3) array
+        :type positions: numpy.ndarray | list[mathutils.Vector | tuple]
+        :return: quantized positions as (N, 3) array
+        :rtype: numpy.ndarray
         """
-        return "%.3f;%.3f;%.3f" % (position[0], position[1], position[2])
+        return numpy.rint(numpy.asarray(positions, dtype=numpy.float64) * TerrainPntsTrans.KEY_PRECISION).astype(numpy.int64)
 
     def __init__(self):
         """Creates class instance of terrain points transitional structure.
         """
 
         self.__storage = {}
-        """:type: dict[str, list[TerrainPoints.Entry]]"""
+        """:type: dict[tuple[int, int, int], list[TerrainPntsTrans.Entry]]"""
 
     def add(self, variant_index, node_index, position, normal):
         """Adds new terrain point to storage.
@@ -70,7 +79,7 @@ class TerrainPntsTrans:
         if normal:
             pass
 
-        key = TerrainPntsTrans.__stringfy_key__(position)
+        key = tuple(round(axis * TerrainPntsTrans.KEY_PRECISION) for axis in position[:3])
         if key not in self.__storage:
             self.__storage[key] = []
 
@@ -79,17 +88,34 @@ class TerrainPntsTrans:
         if tp_entry not in self.__storage[key]:
             self.__storage[key].append(tp_entry)
 
-    def get(self, position):
-        """Get terrain points for given position.
+    def get_members(self, positions):
+        """Get indices of given positions per variant and node of terrain points on those positions.
 
-        :param position: position for which terrain points shall be returned
-        :type position: mathutils.Vector | tuple
-        :return: list of terrain points entries on given location
-        :rtype: list[TerrainPntsTrans.Entry]
+        :param positions: positions for which terrain points shall be returned
+        :type positions: numpy.ndarray | list[mathutils.Vector | tuple]
+        :return: array of position indices per variant index and node index, in order of first appearance
+        :rtype: dict[tuple[int, int], numpy.ndarray]
         """
 
-        key = self.__stringfy_key__(position)
-        if key in self.__storage:
-            return self.__storage[key]
-        else:
-            return []
+        if not self.__storage or len(positions) == 0:
+            return {}
+
+        keys = self.__quantize__(positions)
+
+        # only positions inside bounding box of stored terrain points can be found in storage
+        stored_keys = numpy.array(list(self.__storage.keys()), dtype=numpy.int64)
+        candidates = numpy.flatnonzero(numpy.all((keys >= stored_keys.min(axis=0)) & (keys <= stored_keys.max(axis=0)), axis=1))
+
+        members = {}
+        for position_i, key in zip(candidates.tolist(), map(tuple, keys[candidates].tolist())):
+
+            if key not in self.__storage:
+                continue
+
+            for tp_entry in self.__storage[key]:
+                member_key = (tp_entry.variant_i, tp_entry.node_i)
+                if member_key not in members:
+                    members[member_key] = []
+                members[member_key].append(position_i)
+
+        return {member_key: numpy.array(indices, dtype=numpy.int64) for member_key, indices in members.items()}
@@ -38,7 +38,8 @@ def enable(mode="Normal"):
     if bpy.app.background:
         return
 
-    # fill buffers when initiated
+    # fill buffers when initiated, retained elements might belong to previously loaded blend file, so drop them
+    _gl_core.invalidate_buffers()
     if hasattr(bpy.context, "visible_objects"):
         _gl_core.fill_buffers(bpy.context.visible_objects)
 
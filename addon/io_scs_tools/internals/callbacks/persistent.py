@@ -43,6 +43,7 @@ def enable():
     bpy.app.handlers.load_post.append(_persistent_init.post_load)
 
     bpy.app.handlers.depsgraph_update_pre.append(_persistent_loop.object_data_check)
+    bpy.app.handlers.depsgraph_update_post.append(_persistent_loop.collect_updated_objects)
 
     # register custom drawing and shaders callbacks only in none-background mode
     if not bpy.app.background:
@@ -65,6 +66,8 @@ def disable():
         bpy.app.handlers.load_post.remove(_persistent_init.post_load)
     if _persistent_loop.object_data_check in bpy.app.handlers.depsgraph_update_pre:
         bpy.app.handlers.depsgraph_update_pre.remove(_persistent_loop.object_data_check)
+    if _persistent_loop.collect_updated_objects in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_persistent_loop.collect_updated_objects)
     if _persistent_open_gl.post_depsgraph in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(_persistent_open_gl.post_depsgraph)
     if _persistent_open_gl.post_frame_change in bpy.app.handlers.frame_change_post:
@@ -34,7 +34,7 @@ def collect_nav_curve_data(loc0_obj, loc1_obj):
     :param loc1_obj: in locator object
     :type loc1_obj: bpy.types.Object
     :return: curve data prepared for drawing
-    :rtype: {"curve_points": list of Vector,
+    :rtype: {"curve_points": list of list[float],
              "curve_steps": int,
              "curve_color0": tuple,
              "curve_color1": tuple,
@@ -132,6 +132,8 @@ def update_for_redraw(data_block, selection):
     :type data_block: bpy_struct
     :param selection: list of objects to update connections on; if None current Blender selection is taken as initial list
     :type selection: list of bpy.types.Object | None
+    :return: keys of recalculated connections
+    :rtype: list[str]
     """
 
     data = data_block[MAIN_DICT]
@@ -190,12 +192,15 @@ def update_for_redraw(data_block, selection):
                     conns_to_recalc[conn_key] = 1
 
     # now that curves are marked for recalculation recalculate them
-    for conn_key in conns_to_recalc.keys():
+    recalculated_conn_keys = list(conns_to_recalc.keys())
+    for conn_key in recalculated_conn_keys:
 
         __recalculate_connection_entry__(data_block, conn_key)
 
     conns_to_recalc.clear()
 
+    return recalculated_conn_keys
+
 
 def gather_connections_upon_selected(data_block, loc_names):
     """Gets connections of given locators if both locators of connection are members of loc_names dictionary.
@@ -249,7 +249,10 @@ def force_recalculate(object_list):
     :param object_list: list of the objects for which connection update should be triggered
     :type object_list: list of bpy.types.Object
     """
-    _core.update_for_redraw(bpy.data.collections[_COLLECTION_NAME], object_list)
+    recalculated_conn_keys = _core.update_for_redraw(bpy.data.collections[_COLLECTION_NAME], object_list)
+
+    # drop retained drawing of recalculated connections
+    _gl_primitive.delete_records(_gl_primitive.RecordTypes.CONNECTION, recalculated_conn_keys)
 
 
 def invalidate():
@@ -268,7 +271,12 @@ def update_for_redraw():
     # if data was marked as updated
     if not _CACHE[_DATA_UP_TO_DATE]:
         # recalculate curves and lines whos locators were visibly changed
-        _core.update_for_redraw(bpy.data.collections[_COLLECTION_NAME], None)
+        recalculated_conn_keys = _core.update_for_redraw(bpy.data.collections[_COLLECTION_NAME], None)
+
+        # drop retained drawing of recalculated and deleted connections
+        _gl_primitive.delete_records(_gl_primitive.RecordTypes.CONNECTION, recalculated_conn_keys)
+        _gl_primitive.purge_records(_gl_primitive.RecordTypes.CONNECTION,
+                                    bpy.data.collections[_COLLECTION_NAME][_core.MAIN_DICT][_core.REFS][_core.CONNECTIONS][_core.ENTRIES])
 
     _CACHE[_DATA_UP_TO_DATE] = True
 
@@ -292,15 +300,21 @@ def draw(visible_loc_names):
 
         connections = bpy.data.collections[_COLLECTION_NAME][_core.MAIN_DICT][_core.REFS][_core.CONNECTIONS][_core.ENTRIES]
 
-        # gets visible connections and draw them
+        # gets visible connections and draw them, calculating elements only for connections without retained record
         conns_to_draw = _core.gather_connections_upon_selected(bpy.data.collections[_COLLECTION_NAME], visible_loc_names)
         for conn_key in conns_to_draw.keys():
 
-            conn_entry = connections[conn_key]
+            if not _gl_primitive.has_record(_gl_primitive.RecordTypes.CONNECTION, conn_key):
+
+                conn_entry = connections[conn_key]
 
-            locator_type = bpy.data.objects[conn_entry[_core.IN]].scs_props.locator_prefab_type
+                locator_type = bpy.data.objects[conn_entry[_core.IN]].scs_props.locator_prefab_type
+
+                _gl_primitive.begin_record(_gl_primitive.RecordTypes.CONNECTION, conn_key)
+                if locator_type == "Navigation Point":
+                    _gl_primitive.draw_shape_curve(conn_entry[_core.DATA], not conn_entry[_core.VALID], scs_globals)
+                else:
+                    _gl_primitive.draw_shape_line(conn_entry[_core.DATA], not conn_entry[_core.VALID], locator_type == "Map Point", scs_globals)
+                _gl_primitive.end_record()
 
-            if locator_type == "Navigation Point":
-                _gl_primitive.draw_shape_curve(conn_entry[_core.DATA], not conn_entry[_core.VALID], scs_globals)
-            else:
-                _gl_primitive.draw_shape_line(conn_entry[_core.DATA], not conn_entry[_core.VALID], locator_type == "Map Point", scs_globals)
+            _gl_primitive.append_record(_gl_primitive.RecordTypes.CONNECTION, conn_key)
@@ -22,12 +22,15 @@ import bpy
 import os
 import pickle
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha256
 from time import time
 from io_scs_tools.consts import Icons as _ICONS_consts
 from io_scs_tools.consts import Cache as _CACHE_consts
 from io_scs_tools.utils.printout import lprint
 from io_scs_tools.utils import path as _path_utils
+from io_scs_tools.utils import printout as _printout
 from io_scs_tools.utils import view3d as _view3d_utils
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.utils import get_scs_inventories as _get_scs_inventories
@@ -52,6 +55,8 @@ class _PathsCache:
     """
     __cache = {}
     """Main cache static variable, saving all cached entries."""
+    __lock = threading.Lock()
+    """Lock guarding cached entries, as validity of the cache is also checked from worker threads."""
 
     def __init__(self, inventory_type):
         """Construct cache instance, for given inventory type.
@@ -79,34 +84,37 @@ class _PathsCache:
         if paths_count <= 0:
             return False
 
-        # no entries yet, invalid
-        if self.__dict_key not in _PathsCache.__cache:
-            return False
+        with _PathsCache.__lock:
 
-        # different number of paths, invalid because
-        # if more/less paths is provided, than we cached alredy,
-        # we have potentially different entries in library
-        if paths_count != len(_PathsCache.__cache[self.__dict_key]):
-            return False
+            # no entries yet, invalid
+            if self.__dict_key not in _PathsCache.__cache:
+                return False
 
-        # finally check cache for already loaded paths
-        for path in paths:
-            # path not yet cached, invalid
-            if path not in _PathsCache.__cache[self.__dict_key]:
-                break
-            # last modified time is more recent than the cached one, invalid
-            if os.path.getmtime(path) > _PathsCache.__cache[self.__dict_key][path]:
-                break
-        else:
-            return True
+            # different number of paths, invalid because
+            # if more/less paths is provided, than we cached alredy,
+            # we have potentially different entries in library
+            if paths_count != len(_PathsCache.__cache[self.__dict_key]):
+                return False
+
+            # finally check cache for already loaded paths
+            for path in paths:
+                # path not yet cached, invalid
+                if path not in _PathsCache.__cache[self.__dict_key]:
+                    break
+                # last modified time is more recent than the cached one, invalid
+                if os.path.getmtime(path) > _PathsCache.__cache[self.__dict_key][path]:
+                    break
+            else:
+                return True
 
         return False
 
     def clear(self):
         """Clear cached paths.
         """
-        if self.__dict_key in _PathsCache.__cache:
-            _PathsCache.__cache[self.__dict_key].clear()
+        with _PathsCache.__lock:
+            if self.__dict_key in _PathsCache.__cache:
+                _PathsCache.__cache[self.__dict_key].clear()
 
     def add_path(self, path):
         """Adds a path last modified time into the cache. If entry exists, it will be overwritten.
@@ -115,11 +123,13 @@ class _PathsCache:
         :type path: str
         """
 
-        if self.__dict_key not in _PathsCache.__cache:
-            _PathsCache.__cache[self.__dict_key] = {}
+        with _PathsCache.__lock:
+
+            if self.__dict_key not in _PathsCache.__cache:
+                _PathsCache.__cache[self.__dict_key] = {}
 
-        if os.path.isfile(path):
-            _PathsCache.__cache[self.__dict_key][path] = os.path.getmtime(path)
+            if os.path.isfile(path):
+                _PathsCache.__cache[self.__dict_key][path] = os.path.getmtime(path)
 
 
 class _ContainersCache:
@@ -159,6 +169,11 @@ class _ContainersCache:
 
         return os.path.join(_ContainersCache.__tmp_dir, file_name_hash)
 
+    __lock = threading.Lock()
+    """Lock guarding temporary directory and prefetched containers, as containers can also be loaded from worker threads."""
+    __prefetched = {}
+    """Containers already loaded by worker threads waiting to be retrieved. Key is normalized path, value is tuple (mtime, container)."""
+
     @staticmethod
     def __retrieve_from_cache(path):
         """Retrieves container that is cached for given path. None if not entry is found.
@@ -176,10 +191,17 @@ class _ContainersCache:
 
         container = None
         if original_file_exists and hashed_file_exists:  # both need to exist to retrieve
-            with open(hashed_path, mode='rb') as file:
-                container = pickle.load(file)
+
+            # entries are always replaced as a whole, so they can be loaded without locking
+            try:
+                with open(hashed_path, mode='rb') as file:
+                    container = pickle.load(file)
+            except OSError:  # entry was removed by cleanup of other thread in the meantime
+                container = None
+
         elif hashed_file_exists:  # remove hashed entry if original file was deleted
-            _path_utils.rmtree(hashed_path)
+            with _ContainersCache.__lock:
+                _path_utils.rmtree(hashed_path)
 
         return container
 
@@ -196,27 +218,42 @@ class _ContainersCache:
         if not container:
             return
 
+        hashed_path = _ContainersCache.__hashed_path(path)
+        if not hashed_path:
+            return
+
+        # dump the container before locking, so multiple threads can dump their containers at once
+        data = pickle.dumps(container)
+
         tmp_dir = _ContainersCache.__tmp_dir
 
-        # check temp directory max size and do a cleanup if cache exceeded it
-        if _path_utils.get_tree_size(tmp_dir) >= _CACHE_consts.max_size:
-            _path_utils.rmtree(tmp_dir)
+        with _ContainersCache.__lock:
 
-        # ensure temp directory
-        os.makedirs(tmp_dir, exist_ok=True)
+            # check temp directory max size and do a cleanup if cache exceeded it
+            if _path_utils.get_tree_size(tmp_dir) >= _CACHE_consts.max_size:
+                _path_utils.rmtree(tmp_dir)
 
-        # dump the container into hashed path
-        with open(_ContainersCache.__hashed_path(path), mode='wb') as file:
-            pickle.dump(container, file)
+            # ensure temp directory
+            os.makedirs(tmp_dir, exist_ok=True)
 
-    @staticmethod
-    def retrieve(path):
-        """Retrieve SII container for given path.
+        # write into temporary file first and replace hashed path with it, so entry is never read partially written
+        tmp_hashed_path = "%s.%i.tmp" % (hashed_path, threading.get_ident())
+        try:
+            with open(tmp_hashed_path, mode='wb') as file:
+                file.write(data)
+            os.replace(tmp_hashed_path, hashed_path)
+        except OSError:  # temporary directory was cleaned up by other thread in the meantime, skip caching
+            if os.path.isfile(tmp_hashed_path):
+                os.remove(tmp_hashed_path)
 
-        If item is not yet in cache SII file is accessed and read directly, then cached and returned.
+    @staticmethod
+    def __load(path, scs_project_path=None):
+        """Loads SII container for given path either from temporary directory or by parsing SII file and caching it afterwards.
 
         :param path: absolute path of the container
         :type path: str
+        :param scs_project_path: project path used for resolving SII includes; if None currently set SCS Project Path is used
+        :type scs_project_path: str | None
         :return: list of SII Units if parsing succeded; otherwise None
         :rtype: list[io_scs_tools.internals.structure.UnitData] | None
         """
@@ -227,13 +264,81 @@ class _ContainersCache:
             return cached_container
 
         # otherwise get fresh data
-        sii_container = _sii.get_data_from_file(path)
+        sii_container = _sii.get_data_from_file(path, scs_project_path=scs_project_path)
 
         # and cache it before return
         _ContainersCache.__cache_it(path, sii_container)
 
         return sii_container
 
+    @staticmethod
+    def prefetch(path, scs_project_path):
+        """Loads SII container for given path, so it can be added to prefetched containers later.
+
+        Meant to be called from worker threads, thus no blender data is accessed and
+        SCS Project Path has to be given explicitly.
+
+        :param path: absolute path of the container
+        :type path: str
+        :param scs_project_path: project path used for resolving SII includes
+        :type scs_project_path: str
+        :return: tuple of file last modified time and list of SII Units; None if file doesn't exist
+        :rtype: tuple[float, list[io_scs_tools.internals.structure.UnitData] | None] | None
+        """
+
+        if not os.path.isfile(path):
+            return None
+
+        mtime = os.path.getmtime(path)
+        container = _ContainersCache.__load(path, scs_project_path=scs_project_path)
+
+        return mtime, container
+
+    @staticmethod
+    def add_prefetched(path, mtime, container):
+        """Keeps given prefetched container in memory until it's retrieved.
+
+        :param path: absolute path of the container
+        :type path: str
+        :param mtime: last modified time of the file when container was loaded
+        :type mtime: float
+        :param container: list of SII Units
+        :type container: list[io_scs_tools.internals.structure.UnitData] | None
+        """
+
+        with _ContainersCache.__lock:
+            _ContainersCache.__prefetched[_path_utils.full_norm(path)] = (mtime, container)
+
+    @staticmethod
+    def clear_prefetched():
+        """Clears all prefetched containers which were not yet retrieved.
+        """
+
+        with _ContainersCache.__lock:
+            _ContainersCache.__prefetched.clear()
+
+    @staticmethod
+    def retrieve(path):
+        """Retrieve SII container for given path.
+
+        If container was already prefetched it's used directly, otherwise if item is not yet in cache
+        SII file is accessed and read directly, then cached and returned.
+
+        :param path: absolute path of the container
+        :type path: str
+        :return: list of SII Units if parsing succeded; otherwise None
+        :rtype: list[io_scs_tools.internals.structure.UnitData] | None
+        """
+
+        with _ContainersCache.__lock:
+            prefetched_entry = _ContainersCache.__prefetched.pop(_path_utils.full_norm(path), None)
+
+        # use prefetched container only if file wasn't modified in the meantime
+        if prefetched_entry and os.path.isfile(path) and prefetched_entry[0] == os.path.getmtime(path):
+            return prefetched_entry[1]
+
+        return _ContainersCache.__load(path)
+
 
 class _ConfigSection:
     """Class implementing common functionalities of all config sections."""
@@ -451,6 +556,8 @@ class Import(_ConfigSection):
             "BoneImportScale": (float, get_default(scs_globals, 'import_bone_scale'), 'import_bone_scale'),
             "ImportPiaFile": (int, get_default(scs_globals, 'import_pia_file'), 'import_pia_file'),
             "IncludeSubdirsForPia": (int, get_default(scs_globals, 'import_include_subdirs_for_pia'), 'import_include_subdirs_for_pia'),
+            "UseParseCache": (int, get_default(scs_globals, 'import_use_parse_cache'), 'import_use_parse_cache'),
+            "ParseCacheDir": (str, get_default(scs_globals, 'import_parse_cache_dir'), 'import_parse_cache_dir'),
         }
 
 
@@ -480,6 +587,7 @@ class Export(_ConfigSection):
             "ExportPicFile": (int, get_default(scs_globals, 'export_pic_file'), 'export_pic_file'),
             "ExportPipFile": (int, get_default(scs_globals, 'export_pip_file'), 'export_pip_file'),
             "SignExport": (int, get_default(scs_globals, 'export_write_signature'), 'export_write_signature'),
+            "Incremental": (int, get_default(scs_globals, 'export_incremental'), 'export_incremental'),
         }
 
 
@@ -637,6 +745,26 @@ class AsyncPathsInit:
     __callbacks = []
     """Static variable holding list of callbacks that will be executed once operator is finished or cancelled.
     """
+    __executor = None
+    """Static variable holding thread pool executor used for prefetching library containers. Created on demand."""
+    __generation = 0
+    """Static variable holding number of finished initializations. Prefetching results of previous initializations are discarded."""
+
+    PREFETCHED_LIBRARIES = {
+        "trigger_actions_rel_path": ("TriggerActions", "trigger_actions_use_infixed"),
+        "sign_library_rel_path": ("SignModels", "sign_library_use_infixed"),
+        "tsem_library_rel_path": ("TsemProfiles", "tsem_library_use_infixed"),
+        "traffic_rules_library_rel_path": ("TrafficRules", "traffic_rules_library_use_infixed"),
+        "hookup_library_rel_path": ("Hookups", None),
+        "matsubs_library_rel_path": ("MatSubs", None),
+        "sun_profiles_lib_path": ("SunProfiles", None),
+    }
+    """Constant dictionary of library attributes which containers can be prefetched in worker threads.
+    Each entry holds tuple of paths cache type and name of infixed search attribute (None if library doesn't support infixed search).
+    """
+
+    MAX_PREFETCH_WORKERS = 4
+    """Constant for maximum number of worker threads used for prefetching library containers."""
 
     @staticmethod
     def _report_progress(message="", abort=False, hide_controls=False):
@@ -671,6 +799,14 @@ class AsyncPathsInit:
         AsyncPathsInit.__message = ""
         AsyncPathsInit.__paths_list.clear()
 
+        # stop prefetching and free containers which weren't used (eg. library was already up-to date),
+        # workers still running can't be stopped, but their results will be discarded
+        AsyncPathsInit.__generation += 1
+        if AsyncPathsInit.__executor:
+            AsyncPathsInit.__executor.shutdown(wait=False, cancel_futures=True)
+            AsyncPathsInit.__executor = None
+        _ContainersCache.clear_prefetched()
+
         # report finished progress to 3d view report mechanism
         if int(_get_scs_globals().dump_level) < AsyncPathsInit.DUMP_LEVEL:
             AsyncPathsInit._report_progress(abort=True)
@@ -689,10 +825,124 @@ class AsyncPathsInit:
 
         lprint("D Paths initialization finish invoked!")
 
+    @staticmethod
+    def _prefetch_library(generation, cache_type, sources, is_dir, scs_project_path):
+        """Worker function collecting library files from given sources and prefetching their containers.
+
+        No blender data is accessed and nothing is printed out, so it can be safely executed in worker thread.
+        Prefetched containers and messages are only returned, it's up to the main thread to use them.
+
+        :param generation: initialization generation for which library is prefetched
+        :type generation: int
+        :param cache_type: type of paths cache for the library
+        :type cache_type: str
+        :param sources: absolute paths of library files or directories
+        :type sources: list[str]
+        :param is_dir: are given sources library directories from which all SII files should be collected
+        :type is_dir: bool
+        :param scs_project_path: project path used for resolving SII includes
+        :type scs_project_path: str
+        :return: initialization generation, list of prefetched entries (path, mtime, container), collected messages
+        and time needed for prefetching
+        :rtype: tuple[int, list[tuple], list[tuple[str, tuple]], float]
+        """
+
+        start_time = time()
+
+        prefetched = []
+        _printout.start_collecting()
+        try:
+
+            if is_dir:
+                library_filepaths = _get_hookup_library_filepaths(sources)
+            else:
+                library_filepaths = sources
+
+            # nothing to prefetch, as library will not be reloaded anyway
+            if not _PathsCache(cache_type).is_valid(library_filepaths):
+
+                for library_filepath in library_filepaths:
+
+                    # initialization already finished, results wouldn't be used anyway
+                    if generation != AsyncPathsInit.__generation:
+                        break
+
+                    prefetch_result = _ContainersCache.prefetch(library_filepath, scs_project_path)
+                    if prefetch_result:
+                        prefetched.append((library_filepath,) + prefetch_result)
+
+        finally:
+            messages = _printout.finish_collecting()
+
+        return generation, prefetched, messages, time() - start_time
+
+    @staticmethod
+    def _submit_prefetches():
+        """Submits prefetching of containers for all pending libraries into thread pool.
+
+        Prefetching is postponed until project base path is applied, as library paths are relative to it.
+        """
+
+        # library paths would be resolved against old project path, so wait for it to be applied first
+        if any(entry["attr"] == "scs_project_path" for entry in AsyncPathsInit.__paths_list):
+            return
+
+        scs_globals = _get_scs_globals()
+
+        for entry in AsyncPathsInit.__paths_list:
+
+            if entry["attr"] not in AsyncPathsInit.PREFETCHED_LIBRARIES or "prefetch" in entry:
+                continue
+
+            cache_type, infixed_attr = AsyncPathsInit.PREFETCHED_LIBRARIES[entry["attr"]]
+
+            # resolve library paths on main thread as it depends on SCS globals
+            is_dir = entry["attr"] == "hookup_library_rel_path"
+            if is_dir:
+                sources = list(_path_utils.get_abs_paths(entry["path"], is_dir=True))
+            elif infixed_attr:
+                sources = list(_path_utils.get_abs_paths(entry["path"], use_infixed_search=getattr(scs_globals, infixed_attr)))
+            else:
+                abs_path = _path_utils.get_abs_path(entry["path"])
+                sources = [abs_path] if abs_path else []
+
+            if not AsyncPathsInit.__executor:
+                max_workers = min(AsyncPathsInit.MAX_PREFETCH_WORKERS, os.cpu_count() or 1)
+                AsyncPathsInit.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="SCSPathsInit")
+
+            entry["prefetch"] = AsyncPathsInit.__executor.submit(AsyncPathsInit._prefetch_library, AsyncPathsInit.__generation,
+                                                                  cache_type, sources, is_dir, scs_globals.scs_project_path)
+
+    @staticmethod
+    def _pop_ready_path():
+        """Removes and returns first path entry that is ready to be applied.
+
+        Entry is ready if its containers prefetch is done or if it doesn't use prefetching at all.
+        Project base path is always applied first, as all the libraries depend on it.
+
+        :return: path entry ready to be applied; None if all remaining entries are still being prefetched
+        :rtype: dict | None
+        """
+
+        paths_list = AsyncPathsInit.__paths_list
+
+        for i, entry in enumerate(paths_list):
+            if entry["attr"] == "scs_project_path":
+                return paths_list.pop(i)
+
+        for i, entry in enumerate(paths_list):
+            if "prefetch" not in entry or entry["prefetch"].done():
+                return paths_list.pop(i)
+
+        return None
+
     @staticmethod
     def _process_paths():
         """Timer function for processing paths that are currently saved in static paths list.
 
+        Libraries containers are prefetched in worker threads, while inventories are filled here on main thread,
+        as soon as prefetching of the library is done.
+
         :return: time after which next path should be processed; None when all paths are being processed
         :rtype: float | None
         """
@@ -703,18 +953,41 @@ class AsyncPathsInit:
             lprint("I Paths initialization finished, timer unregistered!")
             return None
 
+        AsyncPathsInit._submit_prefetches()
+
+        # wait for worker threads if none of the libraries is prefetched yet
+        path_entry = AsyncPathsInit._pop_ready_path()
+        if path_entry is None:
+            return 0.05
+
         scs_globals = _get_scs_globals()
 
+        # get prefetching results, on failure library containers will simply be loaded on main thread
+        prefetch_report = ""
+        if "prefetch" in path_entry:
+            try:
+                generation, prefetched, messages, prefetch_time = path_entry["prefetch"].result()
+                _printout.print_collected(messages)
+
+                if generation == AsyncPathsInit.__generation:
+                    for library_filepath, mtime, container in prefetched:
+                        _ContainersCache.add_prefetched(library_filepath, mtime, container)
+
+                    if len(prefetched) > 0:
+                        prefetch_report = " (%i file(s) parsed in %.2f s)" % (len(prefetched), prefetch_time)
+
+            except Exception as e:
+                lprint("E Prefetching of %s failed, loading it directly: %s", (path_entry["name"], e))
+
         start_time = time()
 
         # update message with current path and apply it
-        AsyncPathsInit.__message += "Initializing " + AsyncPathsInit.__paths_list[0]["name"] + "..."
-        setattr(scs_globals, AsyncPathsInit.__paths_list[0]["attr"], AsyncPathsInit.__paths_list[0]["path"])
+        AsyncPathsInit.__message += "Initializing " + path_entry["name"] + "..."
+        setattr(scs_globals, path_entry["attr"], path_entry["path"])
 
-        # calculate execution time, remove processed path, update message and counter
+        # calculate execution time, update message and counter
         execution_time = time() - start_time
-        AsyncPathsInit.__paths_list = AsyncPathsInit.__paths_list[1:]  # remove just processed item
-        AsyncPathsInit.__message += " Done in %.2f s!\n" % execution_time
+        AsyncPathsInit.__message += " Done in %.2f s%s!\n" % (execution_time, prefetch_report)
         AsyncPathsInit.__paths_done += 1
 
         # when executing last one, also print out hiding message
@@ -790,6 +1063,7 @@ class AsyncPathsInit:
             if old_item:
                 old_item["name"] = filepath_prop["name"]
                 old_item["path"] = filepath_prop["path"]
+                old_item.pop("prefetch", None)  # path might be changed, so prefetch has to be submitted again
             else:
                 AsyncPathsInit.__paths_list.append(
                     {
@@ -1266,6 +1540,35 @@ def update_traffic_rules_library_rel_path(traffic_rules_library_rel_path, reload
         cache.add_path(traffic_rules_library_filepath)
 
 
+def _get_hookup_library_filepaths(hookup_dir_paths):
+    """Collects all SII files from given hookup library directories and their subdirectories.
+    No blender data is accessed, so it's safe to be used from worker threads.
+
+    :param hookup_dir_paths: absolute paths of hookup library directories
+    :type hookup_dir_paths: collections.Iterable[str]
+    :return: list of absolute hookup SII file paths
+    :rtype: list[str]
+    """
+
+    hookup_sii_paths = []
+    for abs_path in hookup_dir_paths:
+
+        if abs_path:
+
+            # READ ALL "SII" FILES IN INVENTORY FOLDER
+            for root, dirs, files in os.walk(abs_path):
+
+                for file in files:
+                    if file.endswith(".sii"):
+                        filepath = os.path.join(root, file)
+                        hookup_sii_paths.append(filepath)
+
+                if '.svn' in dirs:
+                    dirs.remove('.svn')  # ignore SVN
+
+    return hookup_sii_paths
+
+
 def update_hookup_library_rel_path(hookup_library_rel_path, reload_only=False):
     """The function deletes and populates again a list of Hookup names in inventory. It also updates corresponding record in config file.
 
@@ -1287,25 +1590,11 @@ def update_hookup_library_rel_path(hookup_library_rel_path, reload_only=False):
     gathered_hookups_paths = _path_utils.get_abs_paths(hookup_library_rel_path, is_dir=True)
     scs_hookup_inventory = _get_scs_inventories().hookups
 
-    # collect final hookups SII files from all directories
-    final_hookups_sii_paths = []
     for abs_path in gathered_hookups_paths:
+        lprint("D Going to collect hookup files from directory:\n\t   %r", (abs_path,))
 
-        if abs_path:
-
-            # READ ALL "SII" FILES IN INVENTORY FOLDER
-            for root, dirs, files in os.walk(abs_path):
-
-                lprint("D Going to collect hookup files from directory:\n\t   %r", (root,))
-
-                # print('   root: "%s"\n  dirs: "%s"\n files: "%s"' % (root, dirs, files))
-                for file in files:
-                    if file.endswith(".sii"):
-                        filepath = os.path.join(root, file)
-                        final_hookups_sii_paths.append(filepath)
-
-                if '.svn' in dirs:
-                    dirs.remove('.svn')  # ignore SVN
+    # collect final hookups SII files from all directories
+    final_hookups_sii_paths = _get_hookup_library_filepaths(gathered_hookups_paths)
 
     # get cache for hookups
     cache = _PathsCache("Hookups")
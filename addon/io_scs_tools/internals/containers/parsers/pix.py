@@ -20,11 +20,14 @@
 
 import re
 import os
+from array import array
 from mathutils import Matrix
 from io_scs_tools.utils.printout import print_section
 from io_scs_tools.utils.printout import lprint
 from io_scs_tools.internals.structure import SectionData as _SectionData
+from io_scs_tools.internals.structure import StreamData as _StreamData
 from io_scs_tools.utils.convert import hex_string_to_float
+from io_scs_tools.utils.convert import hex_strings_to_floats
 
 _PROP_REGEX = re.compile(r'[:\(\r\n]+')
 _PROP_ARRAY_REGEX = re.compile(r'[, ]+')
@@ -38,6 +41,9 @@ _PROP_MATRIX_TYPES_SET = {"FLOAT4x4", }
 _PURE_PROP_VALS_SET = {"default", "true", "false"}
 _DATA_TYPE_END_SET = {'EOF', 'ERR'}
 
+_READ_BLOCK_SIZE = 4 * 1024 * 1024
+"""Size of the block in characters read at once by tokenized reader."""
+
 
 def _get_prop(line):
     """Takes single data line and returns data properties.
@@ -141,8 +147,7 @@ def _read_matrix(file, line_split):
     """Reads the other lines to make a matrix."""
     matrix = Matrix()
     for row in range(4):
-        for col in range(4):
-            matrix[row][col] = hex_string_to_float(line_split[col])
+        matrix[row] = hex_strings_to_floats(line_split[:4])
         if row < 3:
             data_type, line = next_line(file)
             line_split = _SPACE_REGEX.split(line.strip())
@@ -242,12 +247,11 @@ def _get_data(file, line):
         else:
             # print(' data_str_values: %s' % data_str_values)
             if data_str_values[0][0] == '&':
-                convert_func = hex_string_to_float
+                data = hex_strings_to_floats(data_str_values).tolist()
             elif data_str_values[0].find('.') > -1:
-                convert_func = float
+                data = list(map(float, data_str_values))
             else:
-                convert_func = int
-            data = list(map(convert_func, data_str_values))
+                data = list(map(int, data_str_values))
     return data_index, data
 
 
@@ -312,7 +316,6 @@ def _read_section(file, section_ids):
 
 def next_line(file):
     """Takes a file..."""
-    data_type = ''
     try:
         line = file.readline()
     except UnicodeDecodeError:
@@ -320,7 +323,18 @@ def next_line(file):
     if not line:
         return 'EOF', ''
 
-    line = line.rstrip("\r\n")
+    return _classify_line(line.rstrip("\r\n"))
+
+
+def _classify_line(line):
+    """Classifies single line without line ending and cuts off the comment from it.
+
+    :param line: A single line from a file
+    :type line: str
+    :return: (data type of the line, line without comment)
+    :rtype: tuple[str, str]
+    """
+    data_type = ''
 
     # remove comments starting in the middle,
     # in case hashtag character is not part of string
@@ -359,7 +373,249 @@ def next_line(file):
     return data_type, line
 
 
-def read_data(filepath, ind, print_progress=False, print_info=False):
+class _BlockLineReader:
+    """Line reader for tokenized reader mode.
+
+    It reads the file in big blocks, classifies each line only once and enables to push back
+    one classified line. It also provides "readline" method, so it can be passed instead of opened file
+    to helpers reading multi-line data records.
+    """
+
+    def __init__(self, file):
+        self.__file = file
+        self.__lines = []
+        self.__line_i = 0
+        self.__remainder = ""
+        self.__is_eof = False
+        self.__pending = None
+
+        self.read_chars = 0
+        """Number of characters already read from the file, used for progress reporting."""
+
+    def __fill(self):
+        """Reads next block of the file and splits it into lines.
+
+        :return: True if any new line is available; False on the end of the file
+        :rtype: bool
+        """
+        while not self.__is_eof:
+            block = self.__file.read(_READ_BLOCK_SIZE)
+
+            if not block:
+                self.__is_eof = True
+                self.__lines = [self.__remainder] if self.__remainder else []
+                self.__line_i = 0
+                self.__remainder = ""
+                return len(self.__lines) > 0
+
+            self.read_chars += len(block)
+            lines = (self.__remainder + block).split("\n")
+            self.__remainder = lines.pop()
+
+            if lines:
+                self.__lines = lines
+                self.__line_i = 0
+                return True
+
+        return False
+
+    def readline(self):
+        """Reads next raw line, same as "readline" of text file.
+
+        :return: next line with line ending or empty string on the end of file
+        :rtype: str
+        """
+        if self.__line_i >= len(self.__lines) and not self.__fill():
+            return ""
+
+        line = self.__lines[self.__line_i]
+        self.__line_i += 1
+        return line + "\n"
+
+    def next_line(self):
+        """Gets next classified line.
+
+        :return: (data type of the line, line without comment)
+        :rtype: tuple[str, str]
+        """
+        if self.__pending is not None:
+            pending = self.__pending
+            self.__pending = None
+            return pending
+
+        try:
+            if self.__line_i >= len(self.__lines) and not self.__fill():
+                return 'EOF', ''
+        except UnicodeDecodeError:
+            return 'ERR', ''
+
+        line = self.__lines[self.__line_i]
+        self.__line_i += 1
+        return _classify_line(line.rstrip("\r"))
+
+    def push_back(self, data_type, line):
+        """Pushes back classified line, so it will be returned again by next call of "next_line".
+
+        :param data_type: data type of the line
+        :type data_type: str
+        :param line: line without comment
+        :type line: str
+        """
+        self.__pending = (data_type, line)
+
+
+def _tokenize_data_line(line):
+    """Tokenizes one-line data record in form of: "<index> ( <value> <value> ... )".
+
+    :param line: A single data line
+    :type line: str
+    :return: (data index, value tokens, value kind) or None if line is not one-line record of numbers
+    :rtype: tuple[int, list[str], str] | None
+    """
+    if line[-1] != ")":
+        return None
+
+    tokens = line.split()
+    if len(tokens) < 4 or tokens[1] != "(" or tokens[-1] != ")" or not tokens[0].isdigit():
+        return None
+
+    first_value = tokens[2]
+    if first_value[0] == "&":
+        kind = "f"
+    elif first_value[0] in "(\"":
+        return None
+    elif "." in first_value:
+        kind = "d"
+    else:
+        kind = "i"
+
+    return int(tokens[0]), tokens[2:-1], kind
+
+
+def _decode_values(values, kind):
+    """Decodes all value tokens of homogeneous data block at once into packed array.
+
+    :param values: value tokens
+    :type values: list[str]
+    :param kind: kind of the values: "f" for hex floats, "d" for decimal floats, "i" for integers
+    :type kind: str
+    :return: packed values
+    :rtype: array
+    """
+    if kind == "f":
+        joined_values = "".join(values)
+        if len(joined_values) == len(values) * 9:
+            return hex_strings_to_floats(joined_values)
+
+        return array("f", map(hex_string_to_float, values))
+    elif kind == "d":
+        return array("d", map(float, values))
+    else:
+        try:
+            return array("i", map(int, values))
+        except OverflowError:
+            return array("q", map(int, values))
+
+
+def _read_data_block(reader, tokens, data_index):
+    """Reads homogeneous block of one-line data records starting with already tokenized data line.
+    Block ends on first line which is not one-line record with the same value count, value kind and expected index.
+    Such line is pushed back to the reader.
+
+    :param reader: line reader
+    :type reader: _BlockLineReader
+    :param tokens: tokens of the first data line of the block
+    :type tokens: tuple[int, list[str], str]
+    :param data_index: expected index of the first data line
+    :type data_index: int
+    :return: packed data of the block
+    :rtype: io_scs_tools.internals.structure.StreamData
+    """
+    __, values, kind = tokens
+    stride = len(values)
+    values = list(values)
+    data_index += 1
+
+    while 1:
+        data_type, line = reader.next_line()
+        if data_type != 'data':
+            reader.push_back(data_type, line)
+            break
+
+        line_tokens = _tokenize_data_line(line)
+        if line_tokens is None or line_tokens[0] != data_index or line_tokens[2] != kind or len(line_tokens[1]) != stride:
+            reader.push_back(data_type, line)
+            break
+
+        values.extend(line_tokens[1])
+        data_index += 1
+
+    return _StreamData(_decode_values(values, kind), stride)
+
+
+def _read_section_tokenized(reader, section):
+    """Reads the nested sections with tokenized reader. It recursively
+    calls itself to read all levels of data hierarchy."""
+
+    props = section.props
+    data = section.data
+    data_index = 0
+    while 1:
+        data_type, line = reader.next_line()
+        if data_type in _DATA_TYPE_END_SET or data_type == 'SE_E':
+            break
+
+        if data_type == 'Prop':
+            prop = _get_prop(line)
+            if prop is not None:
+                props.append(prop)
+        elif data_type == 'data':
+            tokens = _tokenize_data_line(line)
+            if tokens is not None and tokens[0] == data_index:
+                block = _read_data_block(reader, tokens, data_index)
+                data_index += len(block)
+
+                # keep packed block only if it's the only data of the section
+                if data_index == len(block):
+                    data = block
+                else:
+                    data = list(data)
+                    data.extend(block)
+                continue
+
+            dat_index, dat = _get_data(reader, line)
+            if dat_index == data_index:
+                data_index += 1
+                if dat != []:
+                    if isinstance(data, _StreamData):
+                        data = list(data)
+                    data.append(dat)
+            else:
+                print('WARNING - Inconsistent data indexing in line: "%s"! Skipping...' % line)
+        elif data_type == 'empty_line':
+            props.append(("", ""))
+        elif data_type == 'line_C':
+            comment = line.strip()
+            props.append(("#", comment[2:]))
+        elif data_type == 'SE_C':
+            print('comment section: "%s"' % line)
+        elif data_type == 'SE_S':
+            type_line = _SPACE_SINGLE_REGEX.split(line)
+            for rec in type_line:
+                if rec != '':
+                    try:
+                        section_type = type_line[1]
+                    except:
+                        section_type = ''
+                        print('WARNING - Unknown data in line: "%s"! Skipping...' % line)
+                    break
+            section.sections.append(_read_section_tokenized(reader, _SectionData(section_type)))
+
+    section.data = data
+    return section
+
+
+def read_data(filepath, ind, print_progress=False, print_info=False, tokenized=False):
     """This function is called from outside of this script. It loads
     all data form the file and returns data container.
 
@@ -371,12 +627,75 @@ def read_data(filepath, ind, print_progress=False, print_info=False):
     :type print_progress: bool
     :param print_info: Whether to print the debug printouts
     :type print_info: bool
+    :param tokenized: use tokenized reader mode, which reads file in big blocks, tokenizes each line once
+    and decodes homogeneous data blocks into packed data (io_scs_tools.internals.structure.StreamData)
+    :type tokenized: bool
     :return: (PIX Section Object Data [io_scs_tools.internals.structures.SectionData], Data type [str])
     :rtype: tuple of (list of SectionData, str)
     """
     if print_info:
         print('** PIx Parser ...')
         print('   filepath: %r' % str(filepath))
+
+    if tokenized:
+        pix_container, data_type = _read_data_tokenized(filepath, print_progress)
+    else:
+        pix_container, data_type = _read_data_by_lines(filepath, print_progress)
+
+    if print_info:
+        for section in pix_container:
+            print('SEC.: "%s"' % section.type)
+            for prop in section.props:
+                print('%sProp: %s' % (ind, prop))
+            for data in section.data:
+                print('%sdata: %s' % (ind, data))
+            for sec in section.sections:
+                print_section(sec, ind)
+        print('** PIx Parser END')
+    return pix_container, data_type
+
+
+def _read_data_tokenized(filepath, print_progress):
+    """Reads all data from the file with tokenized reader.
+
+    :param filepath: File path to be read
+    :type filepath: str
+    :param print_progress: should progress be reported with immediate reports
+    :type print_progress: bool
+    :return: (PIX Section Object Data, Data type)
+    :rtype: tuple of (list of SectionData, str)
+    """
+    pix_container = []
+
+    filesize = os.path.getsize(filepath)
+    with open(filepath, mode="r", encoding="utf8") as file:
+        reader = _BlockLineReader(file)
+        while 1:
+            data_type, line = reader.next_line()
+            if data_type in _DATA_TYPE_END_SET:
+                break
+
+            if data_type == 'SE_S':
+                section_type = _SPACE_SINGLE_REGEX.split(line)[0]
+                pix_container.append(_read_section_tokenized(reader, _SectionData(section_type)))
+
+            if print_progress:
+                lprint("S Reading data from %s file - %i%% done ...", (filepath[-3:].upper(), min(reader.read_chars / filesize * 100, 100)),
+                       immediate_timeout=5)
+
+    return pix_container, data_type
+
+
+def _read_data_by_lines(filepath, print_progress):
+    """Reads all data from the file line by line.
+
+    :param filepath: File path to be read
+    :type filepath: str
+    :param print_progress: should progress be reported with immediate reports
+    :type print_progress: bool
+    :return: (PIX Section Object Data, Data type)
+    :rtype: tuple of (list of SectionData, str)
+    """
     pix_container = []
 
     filesize = os.path.getsize(filepath)
@@ -396,14 +715,4 @@ def read_data(filepath, ind, print_progress=False, print_info=False):
             lprint("S Reading data from %s file - %i%% done ...", (filepath[-3:].upper(), file.tell() / filesize * 100), immediate_timeout=5)
     file.close()
 
-    if print_info:
-        for section in pix_container:
-            print('SEC.: "%s"' % section.type)
-            for prop in section.props:
-                print('%sProp: %s' % (ind, prop))
-            for data in section.data:
-                print('%sdata: %s' % (ind, data))
-            for sec in section.sections:
-                print_section(sec, ind)
-        print('** PIx Parser END')
     return pix_container, data_type
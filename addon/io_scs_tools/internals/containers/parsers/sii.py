@@ -20,23 +20,145 @@
 
 import re
 import os
+import threading
+from collections import OrderedDict
 from io_scs_tools.internals.structure import UnitData as _UnitData
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.utils.printout import lprint
 
 
+_TOKEN_REGEX = re.compile(r'''
+    (?P<whitespace>[ \t\n\r]+)
+    | @include[^\S\n]+"(?P<include>[^"\n]+)"
+    | (?P<comment>(?:\#|//)[^\n]*)
+    | (?P<block_comment>/\*)
+    | (?P<id>\w+)
+    | "(?P<string>[^"\n]*)"
+    | (?P<char>.)
+''', re.VERBOSE)
+"""Master regex for scanning of all the SII tokens, name of the matched group is type of the token."""
+
+_INCLUDES_CACHE = OrderedDict()
+"""Tokens of recently read included files, cached as {file path: ((modification time in ns, size), tokens)},
+least recently used file is the first one."""
+
+_INCLUDES_CACHE_MAX_ENTRIES = 256
+"""Maximum number of included files which tokens are kept in the cache."""
+
+_INCLUDES_CACHE_LOCK = threading.Lock()
+"""Lock of included files cache, as SII files are also parsed from library prefetching threads."""
+
+
 class _Token():
     def __init__(self, data_type, value):
-        self.type = data_type  # Type (number, id, string, char, eof)
+        self.type = data_type  # Type (number, id, string, char, include, eof)
         self.value = value  # Value (1.5, some_name, "ab cd", ;)
 
 
+_EOF_TOKEN = _Token('eof', '')
+
+
+def _skip_block_comment(text, pos):
+    """Finds end of the block comment starting at given position.
+    Block comment ends with last closing mark in the line, where first closing mark is found.
+
+    :param text: text being tokenized
+    :type text: str
+    :param pos: position right after opening mark of block comment
+    :type pos: int
+    :return: position right after the end of block comment or end of the text if block comment isn't closed
+    :rtype: int
+    """
+    text_length = len(text)
+    while pos < text_length:
+
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            line_end = text_length
+
+        comment_end = text.rfind("*/", pos, line_end)
+        if comment_end != -1:
+            return comment_end + 2
+
+        pos = line_end + 1
+
+    return text_length
+
+
+def _tokenize(text):
+    """Scans whole text at once and returns list of its tokens.
+    Includes are returned as tokens of 'include' type with included file path as value, rest of the line after include is ignored.
+
+    :param text: text to be tokenized
+    :type text: str
+    :return: list of tokens
+    :rtype: list[_Token]
+    """
+    tokens = []
+    append = tokens.append
+    match = _TOKEN_REGEX.match
+
+    pos = 0
+    text_length = len(text)
+    while pos < text_length:
+
+        token_match = match(text, pos)
+        token_type = token_match.lastgroup
+        pos = token_match.end()
+
+        if token_type == 'whitespace' or token_type == 'comment':
+            continue
+
+        if token_type == 'block_comment':
+            pos = _skip_block_comment(text, pos)
+            continue
+
+        append(_Token(token_type, token_match.group(token_type)))
+
+        if token_type == 'include':
+            pos = text.find("\n", pos)
+            if pos == -1:
+                break
+
+    return tokens
+
+
+def _get_included_tokens(filepath):
+    """Gets tokens of included file. Each included file is read and tokenized only once,
+    after that tokens are taken from cache until file gets modified or it is pushed out of the cache
+    by more recently used files.
+
+    :param filepath: path of included file
+    :type filepath: str
+    :return: list of tokens
+    :rtype: list[_Token]
+    """
+    stat = os.stat(filepath)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _INCLUDES_CACHE_LOCK:
+        cached = _INCLUDES_CACHE.get(filepath)
+        if cached is not None and cached[0] == signature:
+            _INCLUDES_CACHE.move_to_end(filepath)
+            return cached[1]
+
+    # read and tokenize without holding the lock, so other threads don't have to wait for it
+    with open(filepath, mode="r", encoding="utf8") as file:
+        tokens = _tokenize(file.read())
+
+    with _INCLUDES_CACHE_LOCK:
+        _INCLUDES_CACHE[filepath] = (signature, tokens)
+        _INCLUDES_CACHE.move_to_end(filepath)
+        while len(_INCLUDES_CACHE) > _INCLUDES_CACHE_MAX_ENTRIES:
+            _INCLUDES_CACHE.popitem(last=False)
+
+    return tokens
+
+
 class _Tokenizer():
     def __init__(self, data_input, filepath, include_paths):
-        self.input = data_input  # Array of input lines
+        self.streams = [iter(_tokenize(data_input))]  # Stack of token streams, included files are pushed on top of it
         self.filepath = filepath
-        self.current_line = 0  # The currently processed line. If equal to length of input array, we are at end of the input
-        self.current_pos = 0  # Character position in the line
         self.active_token = None  # Currently active token
         self.include_paths = include_paths
 
@@ -67,109 +189,41 @@ class _Tokenizer():
         return self.consume_token()
 
     def parse_token(self):
-        """Parses next token from the input."""
-        while self.current_line < len(self.input):
-
-            # If we processed entire line, advance to next one.
-            line_length = len(self.input[self.current_line])
-            if self.current_pos >= line_length:
-                self.current_line += 1
-                self.current_pos = 0
-                continue
+        """Takes next token from the top most token stream."""
+        while self.streams:
 
-            # Unprocessed remainder of the line.
-            # line_remainder = str(self.input[self.current_line][self.current_pos:])[2:-1]
-            line_remainder = self.input[self.current_line][self.current_pos:]
+            token = next(self.streams[-1], None)
 
-            # Skip all leading whitespace.
-            # print('line_remainder: %s' % str(line_remainder))
-            match = re.match('[ \t\n\r]+', line_remainder)
-            if match:
-                self.current_pos += match.end(0)
+            # stream ended, continue with the one which included it
+            if token is None:
+                self.streams.pop()
                 continue
 
             # Handle includes.
-            match = re.match('@include\s+"([^"]+)"', line_remainder)
-            if match:
-
-                included_lines = []
+            if token.type == 'include':
 
                 for include_path in self.include_paths:
 
-                    file_name = include_path + match.group(1)
+                    file_name = include_path + token.value
 
                     if not os.path.isfile(file_name):
                         continue
 
-                    file = open(file_name, mode="r", encoding="utf8")
-                    included_lines = file.readlines()
-                    file.close()
+                    self.streams.append(iter(_get_included_tokens(file_name)))
                     break
 
                 else:
 
                     lprint("D No included SII file found, ignoring include: %r\n\t   from: %r",
-                           (match.group(1), self.filepath))
-
-                new_array = self.input[:self.current_line]
-                new_array.extend(included_lines)
-                new_array.extend(self.input[self.current_line + 1:])
+                           (token.value, self.filepath))
 
-                self.input = new_array
-                self.current_pos = 0
                 continue
 
-            # Skip comments up to end of the line.
-            if re.match('(#|//).*$', line_remainder):
-                self.current_line += 1
-                self.current_pos = 0
-                continue
-
-            # Skip block comments.
-            if re.match('/\*.*$', line_remainder):
-                self.current_pos += 2
-                self.skip_to_end_of_block_comment()
-                continue
-
-            # Is this a identifier?
-            match = re.match('\w+', line_remainder)
-            if match:
-                self.current_pos += match.end(0)
-                return _Token('id', line_remainder[0:match.end(0)])
-
-            # Is this a string? Currently does not support escape sequences.
-            match = re.match('"([^"]*)"', line_remainder)
-            if match:
-                self.current_pos += match.end(0)
-                return _Token('string', line_remainder[1:match.end(0) - 1])
-
-            # Return the value as character.
-            self.current_pos += 1
-            return _Token('char', line_remainder[0])
+            return token
 
         # Once we get to the end of the stream, always return the 'eof' token
         # even if we are called more than once for some reason.
-        return _Token('eof', '')
-
-    def skip_to_end_of_block_comment(self):
-        """Parses input contents until it reaches end of the block comment."""
-
-        # end if we are at eof already
-        if self.current_line >= len(self.input):
-            return
-
-        line_remainder = self.input[self.current_line][self.current_pos:]
-
-        # inline block comment
-        match = re.match('.*\*/', line_remainder)
-        if match:
-            self.current_pos += match.end(0)
-            return
-
-        # jump to next line and do recursive parsing until we reach eof or end of comment
-        self.current_line += 1
-        self.current_pos = 0
-        self.skip_to_end_of_block_comment()
+        return _EOF_TOKEN
 
 
 def _parse_unit_name(tokenizer):
@@ -354,10 +408,10 @@ def _parse_bare_file(filepath, print_info=False):
     unit = _UnitData("", "", is_headless=True)
 
     file = open(filepath, mode="r", encoding="utf8")
-    lines = file.readlines()
+    text = file.read()
     file.close()
 
-    tokenizer = _Tokenizer(lines, filepath, [])
+    tokenizer = _Tokenizer(text, filepath, [])
 
     while 1:
         if tokenizer.consume_token_if_match('eof', '') is not None:
@@ -370,9 +424,10 @@ def _parse_bare_file(filepath, print_info=False):
             return None
 
 
-def parse_file(filepath, is_sui=False, print_info=False):
+def parse_file(filepath, is_sui=False, print_info=False, scs_project_path=None):
     """
     Reads SCS SII definition file from disk, parse it and return its full content in a form of hierarchical structure.
+    If SCS project path is not given, currently set one from SCS globals is used for resolving includes.
     """
 
     if is_sui:
@@ -383,15 +438,18 @@ def parse_file(filepath, is_sui=False, print_info=False):
     sii_container = []
 
     file = open(filepath, mode="r", encoding="utf8")
-    lines = file.readlines()
+    text = file.read()
     file.close()
 
     # create proper paths for parsing any possible included sii files:
     # 1. is directory of given filepath
     # 2. is directory of current scs project path
-    include_paths = [os.path.split(filepath)[0] + os.sep, _get_scs_globals().scs_project_path]
+    if scs_project_path is None:
+        scs_project_path = _get_scs_globals().scs_project_path
+
+    include_paths = [os.path.split(filepath)[0] + os.sep, scs_project_path]
 
-    tokenizer = _Tokenizer(lines, filepath, include_paths)
+    tokenizer = _Tokenizer(text, filepath, include_paths)
     if tokenizer.consume_token_if_match('id', 'SiiNunit') is None:
         print("Expected SiiNunit")
         return None
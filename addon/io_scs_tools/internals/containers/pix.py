@@ -20,14 +20,378 @@
 
 import os
 import re
-from mathutils import Vector
+import pickle
+import tempfile
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from io import BytesIO
+from mathutils import Matrix, Vector
+from io_scs_tools.consts import Cache as _CACHE_consts
 from io_scs_tools.internals.containers.parsers import pix as _pix_parser
 from io_scs_tools.internals.containers.writers import pix as _pix_writer
 from io_scs_tools.internals.structure import SectionData as _SectionData
 from io_scs_tools.utils import path as _path_utils
+from io_scs_tools.utils import profiler as _profiler
+from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.utils.printout import lprint
 
 
+def _matrix_from_rows(rows):
+    """Recreates matrix from its rows, used when loading pickled containers, as mathutils types can't be pickled directly."""
+    return Matrix(rows)
+
+
+def _vector_from_values(values):
+    """Recreates vector from its values, used when loading pickled containers, as mathutils types can't be pickled directly."""
+    return Vector(values)
+
+
+class _ParseCache:
+    """Class for caching parsed PIX containers on disk, so re-importing unchanged files doesn't parse them again.
+
+    Containers are dumped with pickle in binary format, where data blocks parsed in tokenized mode
+    are stored as raw float arrays. Each cached file is keyed by hash of path, last modified time and parsing options,
+    thus any change of the original file results in new entry. Once cache directory exceeds its maximum size,
+    least recently used entries are removed.
+    """
+
+    __format_version = 1
+    """Version of cached data, it has to be increased whenever parser output changes, so old entries are not used anymore."""
+
+    __hits = 0
+    __misses = 0
+
+    @staticmethod
+    def __dumps(container):
+        """Pickles given container, where matrices and vectors are stored as plain tuples and recreated on load.
+
+        :param container: parsed container
+        :type container: list[io_scs_tools.internals.structure.SectionData]
+        :return: pickled container
+        :rtype: bytes
+        """
+        buffer = BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.dispatch_table = {
+            Matrix: lambda matrix: (_matrix_from_rows, (tuple(tuple(row) for row in matrix),)),
+            Vector: lambda vector: (_vector_from_values, (tuple(vector),)),
+        }
+        pickler.dump(container)
+        return buffer.getvalue()
+
+    @staticmethod
+    def get_dir():
+        """Gets cache directory, either the one set by user or default one inside temporary directory.
+
+        :return: absolute path to cache directory
+        :rtype: str
+        """
+        cache_dir = _get_scs_globals().import_parse_cache_dir
+        if cache_dir == "":
+            cache_dir = os.path.join(tempfile.gettempdir(), _CACHE_consts.dir_name)
+
+        return os.path.join(cache_dir, _CACHE_consts.pix_dir_name)
+
+    @staticmethod
+    def __hashed_path(path, ind, tokenized):
+        """Returns hashed path of the cached container.
+
+        :param path: absolute path of the PIX file
+        :type path: str
+        :param ind: indentation used on reading
+        :type ind: str
+        :param tokenized: tokenized reader mode
+        :type tokenized: bool
+        :return: path of cache file for given PIX file in its current state; empty string if path is non-existing
+        :rtype: str
+        """
+
+        if not os.path.isfile(path):
+            return ""
+
+        str_to_hash = "%s|%s|%r|%i|%s" % (os.path.getmtime(path), os.path.getsize(path), ind, tokenized, _path_utils.full_norm(path))
+        file_name_hash = sha256(str_to_hash.encode('utf-8')).hexdigest()
+
+        return os.path.join(_ParseCache.get_dir(), "%s.v%i" % (file_name_hash, _ParseCache.__format_version))
+
+    @staticmethod
+    def __evict(cache_dir, required_size):
+        """Removes least recently used entries until given size can be added to cache without exceeding its maximum size.
+
+        :param cache_dir: cache directory
+        :type cache_dir: str
+        :param required_size: size of the new entry
+        :type required_size: int
+        """
+
+        entries = []
+        total_size = 0
+        for entry in os.scandir(cache_dir):
+            if entry.is_file(follow_symlinks=False):
+                entry_stat = entry.stat(follow_symlinks=False)
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+                total_size += entry_stat.st_size
+
+        # entries modification time is updated on each use, so the oldest are the least recently used ones
+        entries.sort()
+        for __, entry_size, entry_path in entries:
+
+            if total_size + required_size <= _CACHE_consts.pix_max_size:
+                break
+
+            try:
+                os.remove(entry_path)
+                total_size -= entry_size
+            except OSError:
+                pass
+
+    @staticmethod
+    def retrieve(path, ind, tokenized):
+        """Retrieve cached container for given PIX file.
+
+        :param path: absolute path of the PIX file
+        :type path: str
+        :param ind: indentation used on reading
+        :type ind: str
+        :param tokenized: tokenized reader mode
+        :type tokenized: bool
+        :return: cached container or None if file is not cached yet
+        :rtype: list[io_scs_tools.internals.structure.SectionData] | None
+        """
+
+        hashed_path = _ParseCache.__hashed_path(path, ind, tokenized)
+
+        container = None
+        if hashed_path and os.path.isfile(hashed_path):
+            try:
+                with open(hashed_path, mode='rb') as file:
+                    container = pickle.load(file)
+
+                # mark entry as used
+                os.utime(hashed_path)
+            except Exception as e:
+                lprint("D Removing invalid parse cache entry for %r: %s", (_path_utils.readable_norm(path), e))
+                container = None
+                try:
+                    os.remove(hashed_path)
+                except OSError:
+                    pass
+
+        if container is None:
+            _ParseCache.__misses += 1
+        else:
+            _ParseCache.__hits += 1
+
+        return container
+
+    @staticmethod
+    def cache_it(path, ind, tokenized, container):
+        """Caches given container for given PIX file. If container is empty nothing will be cached.
+
+        :param path: absolute path of the PIX file
+        :type path: str
+        :param ind: indentation used on reading
+        :type ind: str
+        :param tokenized: tokenized reader mode
+        :type tokenized: bool
+        :param container: parsed container
+        :type container: list[io_scs_tools.internals.structure.SectionData]
+        """
+
+        if not container:
+            return
+
+        hashed_path = _ParseCache.__hashed_path(path, ind, tokenized)
+        if not hashed_path:
+            return
+
+        try:
+            data = _ParseCache.__dumps(container)
+
+            cache_dir = os.path.dirname(hashed_path)
+            os.makedirs(cache_dir, exist_ok=True)
+
+            _ParseCache.__evict(cache_dir, len(data))
+
+            # write to temporary file first, so other instances never read partially written entry
+            tmp_path = "%s.%i.tmp" % (hashed_path, os.getpid())
+            with open(tmp_path, mode='wb') as file:
+                file.write(data)
+            os.replace(tmp_path, hashed_path)
+
+        except (OSError, TypeError, pickle.PicklingError) as e:
+            lprint("D Parsed PIX file %r couldn't be cached: %s", (_path_utils.readable_norm(path), e))
+
+    @staticmethod
+    def get_stats():
+        """Gets number of cache hits and misses since last reset.
+
+        :return: tuple of (hits, misses)
+        :rtype: tuple[int, int]
+        """
+        return _ParseCache.__hits, _ParseCache.__misses
+
+    @staticmethod
+    def reset_stats():
+        """Resets number of cache hits and misses."""
+        _ParseCache.__hits = 0
+        _ParseCache.__misses = 0
+
+
+class _DeferredWriting:
+    """Class for writing PIX containers in worker threads.
+
+    While deferred writing is active, containers given for writing are only submitted to the thread pool,
+    so formatting and writing of files runs while data for next files is still being gathered on the main thread.
+    Results are reported in submission order once deferred writing is finished.
+
+    NOTE: containers given as generators are consumed on submission, so sections are created on the main thread,
+    as creation of them may access Blender data or print out messages, which is not allowed in worker threads.
+    """
+
+    __executor = None
+    __jobs = []
+
+    @staticmethod
+    def __write(container, filepath, ind, print_info):
+        """Writes given container into file, meant to be executed in worker thread.
+
+        :return: None if writing was successful, otherwise error description
+        :rtype: str | None
+        """
+
+        try:
+            with _profiler.stage("writing"):
+                result = _pix_writer.write_data(container, filepath, ind, False, print_info)
+        except Exception:
+            return traceback.format_exc().replace("\n", "\n\t   ")
+
+        if result != {'FINISHED'}:
+            return "For details check printouts above."
+
+        return None
+
+    @staticmethod
+    def is_active():
+        """Is deferred writing active?
+
+        :return: True if containers should be submitted for deferred writing; False otherwise
+        :rtype: bool
+        """
+        return _DeferredWriting.__executor is not None
+
+    @staticmethod
+    def start():
+        """Starts deferred writing with as many worker threads as there are cores."""
+
+        if _DeferredWriting.__executor is None:
+            _DeferredWriting.__executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+    @staticmethod
+    def submit(container, filepath, ind, print_info):
+        """Submits given container for writing.
+
+        :param container: sections to be written
+        :type container: collections.abc.Iterable[io_scs_tools.internals.structure.SectionData]
+        :param filepath: path to file where container should be exported
+        :type filepath: str
+        :param ind: intendention for printout
+        :type ind: str
+        :param print_info: should infos be printed
+        :type print_info: bool
+        """
+
+        # create all sections now, so worker threads only format and write already created data
+        container = list(container)
+
+        # the same file can't be written by two threads at once, so wait for the previous writing of it
+        for job_filepath, job_future in _DeferredWriting.__jobs:
+            if job_filepath == filepath:
+                job_future.result()
+
+        future = _DeferredWriting.__executor.submit(_DeferredWriting.__write, container, filepath, ind, print_info)
+        _DeferredWriting.__jobs.append((filepath, future))
+
+    @staticmethod
+    def get_filepaths():
+        """Gets paths of all files submitted for writing so far.
+
+        :return: paths of submitted files in submission order
+        :rtype: list[str]
+        """
+        return [filepath for filepath, __ in _DeferredWriting.__jobs]
+
+    @staticmethod
+    def finish():
+        """Waits for all submitted files, reports their results and stops deferred writing.
+
+        :return: paths of the files which writing failed
+        :rtype: list[str]
+        """
+
+        if _DeferredWriting.__executor is None:
+            return []
+
+        failed_filepaths = []
+
+        try:
+            for filepath, future in _DeferredWriting.__jobs:
+
+                error = future.result()
+                if error is None:
+                    lprint("I File %r successfully written!", (os.path.basename(filepath),))
+                else:
+                    lprint("E Unable to export data into file:\n\t   %r\n\t   %s", (filepath, error))
+                    failed_filepaths.append(filepath)
+
+        finally:
+            _DeferredWriting.__executor.shutdown()
+            _DeferredWriting.__executor = None
+            _DeferredWriting.__jobs = []
+
+        return failed_filepaths
+
+
+def start_deferred_writing():
+    """Starts deferred writing, from now on containers given to write_data_to_file are written in worker threads
+    and it's up to the caller to finish deferred writing once all the containers are submitted.
+    """
+    _DeferredWriting.start()
+
+
+def get_deferred_writing_filepaths():
+    """Gets paths of all files submitted for deferred writing so far.
+
+    :return: paths of submitted files in submission order
+    :rtype: list[str]
+    """
+    return _DeferredWriting.get_filepaths()
+
+
+def finish_deferred_writing():
+    """Waits for all deferred writing to be done and stops it.
+
+    :return: paths of the files which writing failed
+    :rtype: list[str]
+    """
+    return _DeferredWriting.finish()
+
+
+def get_parse_cache_stats():
+    """Gets number of parse cache hits and misses since last reset.
+
+    :return: tuple of (hits, misses)
+    :rtype: tuple[int, int]
+    """
+    return _ParseCache.get_stats()
+
+
+def reset_parse_cache_stats():
+    """Resets number of parse cache hits and misses."""
+    _ParseCache.reset_stats()
+
+
 def fast_check_for_pia_skeleton(pia_filepath, skeleton):
     """Check for the skeleton record in PIA file without parsing the whole file.
     It takes filepath and skeleton name (string) and returns True if the skeleton
@@ -178,7 +542,7 @@ def make_vertex_stream(stream_raw, name=''):
     return stream
 
 
-def get_data_from_file(filepath, ind, print_progress=False, print_info=False):
+def get_data_from_file(filepath, ind, print_progress=False, print_info=False, tokenized=False, use_cache=False):
     """Returns entire data in data container from specified PIX file.
 
     :param filepath: File path to be read
@@ -189,6 +553,10 @@ def get_data_from_file(filepath, ind, print_progress=False, print_info=False):
     :type print_progress: bool
     :param print_info: Whether to print the debug printouts
     :type print_info: bool
+    :param tokenized: use tokenized reader mode, homogeneous data blocks are returned as packed stream data
+    :type tokenized: bool
+    :param use_cache: use parse cache if enabled in settings; container is taken from cache or cached after parsing
+    :type use_cache: bool
     :return: PIX Section Object Data
     :rtype: list of SectionData
     """
@@ -197,8 +565,22 @@ def get_data_from_file(filepath, ind, print_progress=False, print_info=False):
         lprint("D Aborting PIX file read, 'None' file!")
         return None
 
+    use_cache = use_cache and _get_scs_globals().import_use_parse_cache
+
+    if use_cache:
+        with _profiler.stage("parse cache retrieve"):
+            container = _ParseCache.retrieve(filepath, ind, tokenized)
+        if container is not None:
+            return container
+
     # print('    filepath: "%s"\n' % filepath)
-    container, state = _pix_parser.read_data(filepath, ind, print_progress, print_info)
+    with _profiler.stage("parsing"):
+        container, state = _pix_parser.read_data(filepath, ind, print_progress, print_info, tokenized=tokenized)
+
+    if use_cache and state != 'ERR':
+        with _profiler.stage("parse cache store"):
+            _ParseCache.cache_it(filepath, ind, tokenized, container)
+
     if len(container) < 1:
         lprint('\nE File "%s" is empty!', (_path_utils.readable_norm(filepath),))
         return None
@@ -211,9 +593,10 @@ def get_data_from_file(filepath, ind, print_progress=False, print_info=False):
 
 def write_data_to_file(container, filepath, ind, print_progress=False, print_info=False):
     """Exports given container in given filepath.
+    If deferred writing is active, container is only submitted for writing in worker thread.
 
-    :param container:
-    :type container:
+    :param container: sections to be written, can also be generator so sections are created while being written
+    :type container: collections.abc.Iterable[io_scs_tools.internals.structure.SectionData]
     :param filepath: path to file where container should be exported
     :type filepath: str
     :param ind: intendention for printout
@@ -230,7 +613,13 @@ def write_data_to_file(container, filepath, ind, print_progress=False, print_inf
     # path will be properly readable even on windows. Without mixed back and forward slashes.
     filepath = _path_utils.readable_norm(filepath)
 
-    result = _pix_writer.write_data(container, filepath, ind, print_progress, print_info)
+    # with deferred writing errors are reported only once writing is finished
+    if _DeferredWriting.is_active():
+        _DeferredWriting.submit(container, filepath, ind, print_info)
+        return True
+
+    with _profiler.stage("writing"):
+        result = _pix_writer.write_data(container, filepath, ind, print_progress, print_info)
     if result != {'FINISHED'}:
         lprint("E Unable to export data into file:\n\t   %r\n\t   For details check printouts above.", (filepath,))
         return False
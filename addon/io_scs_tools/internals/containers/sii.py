@@ -25,13 +25,15 @@ from io_scs_tools.internals.containers.parsers import sii as _sii_reader
 from io_scs_tools.internals.containers.writers import sii as _sii_writer
 
 
-def get_data_from_file(filepath, is_sui=False):
+def get_data_from_file(filepath, is_sui=False, scs_project_path=None):
     """Returns entire data in data container from specified SII definition file.
 
     :param filepath: absolute file path where SII should be read from
     :type filepath: str
     :param is_sui: True if file should be read as SUI, in that case only one unit will be returned
     :type is_sui: bool
+    :param scs_project_path: project path used for resolving includes; if None currently set SCS Project Path is used
+    :type scs_project_path: str | None
     :return: list of SII Units if parsing succeded; otherwise None
     :rtype: list[io_scs_tools.internals.structure.UnitData] | None
     """
@@ -39,7 +41,7 @@ def get_data_from_file(filepath, is_sui=False):
     container = None
     if filepath:
         if os.path.isfile(filepath):
-            container = _sii_reader.parse_file(filepath, is_sui=is_sui)
+            container = _sii_reader.parse_file(filepath, is_sui=is_sui, scs_project_path=scs_project_path)
             if container:
                 if len(container) < 1:
                     lprint('D SII file "%s" is empty!', (_path_utils.readable_norm(filepath),))
@@ -184,6 +184,8 @@ class TobjContainer:
             lprint("E Can't write TOBJ file into path:\n\t   %r", (self.filepath,))
             return False
 
+        _path_utils.invalidate_project_index(self.filepath)
+
         fw = file.write
 
         # MAP
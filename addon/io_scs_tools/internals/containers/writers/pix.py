@@ -18,10 +18,23 @@
 
 # Copyright (C) 2013-2022: SCS Software
 
-from io_scs_tools.utils.convert import float_to_hex_string, float_array_to_hex_string
+import os
+import numpy
+from itertools import chain
+from io_scs_tools.internals.structure import StreamData as _StreamData
+from io_scs_tools.utils import path as _path_utils
+from io_scs_tools.utils.convert import float_to_hex_string, floats_to_hex_string
 from io_scs_tools.utils.printout import lprint
 
+_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+_DATA_LINE_MARKERS = {"__bone__", "__string__", "__skin__", "__matrix__", "__time__"}
+_DIGIT_CHARS = numpy.frombuffer(b"0123456789", dtype=numpy.uint8)
+_LINE_START_CHARS = numpy.frombuffer(b"( ", dtype=numpy.uint8)
+_LINE_END_CHARS = numpy.frombuffer(b" )\n", dtype=numpy.uint8)
+_INTS_CHARS_TABLE = None  # characters of all five digits integers left aligned to five characters, created on first use
+
 _LIST_TYPE = list
+_TUPLE_TYPE = tuple
 _STR_TYPE = str
 _FLOAT_TYPE = float
 _INT_TYPE = int
@@ -29,16 +42,12 @@ _STR_PROHIBITED_TYPES = {"FLOAT", "FLOAT2", "FLOAT3", "FLOAT4", "FLOAT5", "FLOAT
 
 
 def _format_matrix(mat, ind, offset):
-    str_mat = ""
-    for line in mat:
-        str_line = ""
-        for val in line:
-            str_line = str_line + " " + float_to_hex_string(val) + " "
-        if str_mat == "":
-            str_mat = str_line
-        else:
-            str_mat = str_mat + "\n" + ind + offset + str_line[:-1]
-    return str_mat
+    str_lines = [" %s" % floats_to_hex_string(line) for line in mat]
+    if not str_lines:
+        return ""
+
+    line_start = "\n" + ind + offset
+    return str_lines[0] + " " + "".join([line_start + str_line for str_line in str_lines[1:]])
 
 
 def _format_bone(data_line, ind):
@@ -46,10 +55,7 @@ def _format_bone(data_line, ind):
     formatted line of hexadecimal values in a string."""
     line_start = str(ind + (8 * " "))
     bone_name = data_line[1]
-    if data_line[2]:
-        bone_parent = str(data_line[2].name)
-    else:
-        bone_parent = ""
+    bone_parent = data_line[2]
     bone_matrix = _format_matrix(data_line[3], ind, str(17 * " "))
     data = str('Name:  "' + bone_name + '"\n' + line_start + 'Parent: "' + bone_parent + '"\n' + line_start + 'Matrix: (' + bone_matrix + ' )')
     return data
@@ -61,8 +67,7 @@ def _format_data(data_line, data_line_type, spaces=5, data_hex=True):
 
     if data_line_type == _FLOAT_TYPE:
         if data_hex:
-            data = float_array_to_hex_string(data_line)
-            # data = '  '.join([float_to_hex_string(x) for x in data_line])
+            data = floats_to_hex_string(data_line)
         else:
             data = ' '.join([str(x) for x in data_line])
     elif data_line_type == _STR_TYPE:
@@ -76,6 +81,197 @@ def _format_data(data_line, data_line_type, spaces=5, data_hex=True):
     return data
 
 
+class _BufferedWriter:
+    """Collects written strings and writes them to the file in big chunks."""
+
+    def __init__(self, file, buffer_size=_WRITE_BUFFER_SIZE):
+        self.__file = file
+        self.__buffer_size = buffer_size
+        self.__buffer = []
+        self.__buffered_size = 0
+
+    def write(self, string):
+        self.__buffer.append(string)
+        self.__buffered_size += len(string)
+
+        if self.__buffered_size >= self.__buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.__file.write("".join(self.__buffer))
+        self.__buffer.clear()
+        self.__buffered_size = 0
+
+
+def _format_left_aligned_ints(values, width):
+    """Takes array of non negative integers and returns their characters matrix,
+    where each integer is left aligned and padded with spaces to given width.
+    NOTE: integers have to fit into given width, there is no check for it!"""
+
+    digits_counts = numpy.ones(values.shape, dtype=numpy.int64)
+    for power in range(1, width):
+        digits_counts += values >= 10 ** power
+
+    chars = numpy.full(values.shape + (width,), ord(" "), dtype=numpy.uint8)
+    for char_i in range(width):
+        has_digit = digits_counts > char_i
+        divisors = numpy.power(10, digits_counts[has_digit] - 1 - char_i)
+        chars[..., char_i][has_digit] = _DIGIT_CHARS[(values[has_digit] // divisors) % 10]
+
+    return chars
+
+
+def _format_five_chars_ints(values):
+    """Takes array of non negative integers smaller than 100000 and returns their characters matrix,
+    where each integer is left aligned and padded with spaces to five characters.
+    Characters are taken from lookup table of all such integers."""
+
+    global _INTS_CHARS_TABLE
+    if _INTS_CHARS_TABLE is None:
+        _INTS_CHARS_TABLE = _format_left_aligned_ints(numpy.arange(100000), 5)
+
+    return _INTS_CHARS_TABLE[values]
+
+
+def _format_lines_block(lines_chars, ind):
+    """Takes characters matrix of data lines content and returns all data lines
+    with indentation, line indices and brackets in one string."""
+
+    ind_chars = numpy.frombuffer(ind.encode("ascii"), dtype=numpy.uint8)
+    ind_width = len(ind_chars)
+    content_width = lines_chars.shape[1]
+
+    # line indices are left aligned to five characters, bigger indices are wider, so each width gets own chunk
+    chunks = []
+    chunk_start = 0
+    index_width = 5
+    while chunk_start < len(lines_chars):
+        chunk_end = min(len(lines_chars), 10 ** index_width)
+
+        chunk = numpy.empty((chunk_end - chunk_start, ind_width + index_width + content_width + 5), dtype=numpy.uint8)
+        chunk[:, :ind_width] = ind_chars
+        if index_width == 5:
+            chunk[:, ind_width:ind_width + index_width] = _format_five_chars_ints(numpy.arange(chunk_start, chunk_end))
+        else:
+            chunk[:, ind_width:ind_width + index_width] = _format_left_aligned_ints(numpy.arange(chunk_start, chunk_end), index_width)
+        chunk[:, ind_width + index_width:ind_width + index_width + 2] = _LINE_START_CHARS
+        chunk[:, ind_width + index_width + 2:-3] = lines_chars[chunk_start:chunk_end]
+        chunk[:, -3:] = _LINE_END_CHARS
+
+        chunks.append(chunk.tobytes().decode("ascii"))
+
+        chunk_start = chunk_end
+        index_width += 1
+
+    return "".join(chunks)
+
+
+def _get_data_block_values(data, dtype):
+    """Takes whole data block and returns its values as 2D array of given type.
+    Returns None if lines are not of the same length or values can not be converted."""
+
+    lines_lengths = set(map(len, data))
+    if len(lines_lengths) != 1:
+        return None
+
+    values_count = lines_lengths.pop()
+    if values_count < 1:
+        return None
+
+    try:
+        values = numpy.fromiter(chain.from_iterable(data), dtype=dtype, count=len(data) * values_count)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+    return values.reshape(len(data), values_count)
+
+
+def _format_float_data_block(data, ind):
+    """Takes whole data block of float lines and returns all lines formatted in one string.
+    Returns None if lines are not of the same length."""
+
+    if isinstance(data, _StreamData):
+        if data.values.typecode != "f" or data.stride < 1:
+            return None
+        values = numpy.frombuffer(data.values, dtype=numpy.float32).reshape(-1, data.stride)
+    else:
+        values = _get_data_block_values(data, numpy.float32)
+        if values is None:
+            return None
+
+    # convert all values at once and cut hexadecimal string into lines
+    hex_string = floats_to_hex_string(values.reshape(-1)) + "  "
+    hex_chars = numpy.frombuffer(hex_string.encode("ascii"), dtype=numpy.uint8).reshape(len(values), -1)
+
+    return _format_lines_block(hex_chars[:, :-2], ind)
+
+
+def _format_int_data_block(data, ind):
+    """Takes whole data block of integer lines and returns all lines formatted in one string.
+    Returns None if lines are not of the same length or values are not of the common size."""
+
+    values = _get_data_block_values(data, numpy.int64)
+    if values is None:
+        return None
+
+    # only most common values fitting to fixed width are formatted with arrays,
+    # for the rest we don't bother and do formatting line by line
+    if values.min() < 0 or values.max() > 99999:
+        return None
+
+    # each value is left aligned to five characters and followed by one space
+    values_chars = numpy.full((len(values), values.shape[1], 6), ord(" "), dtype=numpy.uint8)
+    values_chars[:, :, :5] = _format_five_chars_ints(values)
+
+    return _format_lines_block(values_chars.reshape(len(values), -1)[:, :-1], ind)
+
+
+def _format_data_block(data, ind):
+    """Takes whole data block of plain value lines and returns all lines formatted in one string.
+    Returns None if block can not be formatted at once,
+    either because lines are of different length and type or there are special data lines inside."""
+
+    if len(data) == 0:
+        return None
+
+    if isinstance(data, _StreamData):
+        return _format_float_data_block(data, ind)
+
+    if not isinstance(data, (_LIST_TYPE, _TUPLE_TYPE)):
+        return None
+
+    first_line = data[0]
+    values_count = len(first_line)
+    if values_count == 0:
+        return None
+
+    if isinstance(first_line[0], _FLOAT_TYPE):
+        return _format_float_data_block(data, ind)
+
+    if isinstance(first_line[0], _STR_TYPE):
+        if first_line[0] in _DATA_LINE_MARKERS:
+            return None
+
+        for data_line in data:
+            if len(data_line) != values_count or not isinstance(data_line[0], _STR_TYPE) or data_line[0] in _DATA_LINE_MARKERS:
+                return None
+
+        line_format = ind + "%-5s( " + " ".join(['"%s"'] * values_count) + " )\n"
+    else:
+        if set(map(type, chain.from_iterable(data))) == {_INT_TYPE}:
+            data_block = _format_int_data_block(data, ind)
+            if data_block is not None:
+                return data_block
+
+        for data_line in data:
+            if len(data_line) != values_count or isinstance(data_line[0], _STR_TYPE):
+                return None
+
+        line_format = ind + "%-5s( " + " ".join(["%-5s"] * values_count) + " )\n"
+
+    return "".join([line_format % ((line_i,) + tuple(data_line)) for line_i, data_line in enumerate(data)])
+
+
 def _write_properties_and_data(fw, section, ind, print_info):
     """Takes a single section data and writes all its "properties"
     and "data" to the file."""
@@ -113,6 +309,13 @@ def _write_properties_and_data(fw, section, ind, print_info):
         if print_info:
             print('%sProp: %s' % (ind, prop))
 
+    # most of the data blocks are made of plain value lines, so try to format them at once
+    if not print_info:
+        data_block = _format_data_block(section.data, ind)
+        if data_block is not None:
+            fw(data_block)
+            return
+
     data_line_type = None
     for data_line_i, data_line in enumerate(section.data):
         # print('-- data_line: %s' % str(data_line))
@@ -128,16 +331,8 @@ def _write_properties_and_data(fw, section, ind, print_info):
                 ind, str(data_line_i).ljust(6, ' '), float_to_hex_string(data_line[1][0][0]), float_to_hex_string(data_line[1][0][1]),
                 float_to_hex_string(data_line[1][0][2])))
 
-            weight_string = ""
-            for i_i, i in enumerate(data_line[1][1]):
-                if i_i == 0:
-                    weight_string = weight_string + str(i[0]).ljust(5, ' ') + float_to_hex_string(i[1])
-                else:
-                    weight_string = weight_string + "   " + str(i[0]).ljust(5, ' ') + float_to_hex_string(i[1])
-
-            vertex_indices_string = ""
-            for i_i, i in enumerate(data_line[1][2]):
-                vertex_indices_string = vertex_indices_string + str(i).ljust(6, ' ')
+            weight_string = "   ".join([str(i[0]).ljust(5, ' ') + float_to_hex_string(i[1]) for i in data_line[1][1]])
+            vertex_indices_string = "".join([str(i).ljust(6, ' ') for i in data_line[1][2]])
 
             fw('%s%sWeights: %s%s\n' % (ind, 8 * " ", str(len(data_line[1][1])).ljust(7, ' '), weight_string))
             fw('%s%sVertexIndices: %s%s\n' % (ind, 8 * " ", str(len(data_line[1][2])).ljust(7, ' '), vertex_indices_string))
@@ -184,25 +379,43 @@ def write_data(container, filepath, ind, print_progress, print_info):
     orig_ind = ind
 
     # WRITE TO FILE
-    file = open(filepath, mode="w", encoding="utf8", newline="\n")
-    fw = file.write
-
-    sections_count = len(container)
-    for section_i, section in enumerate(container):
-        if section.type != "#comment":
-            fw('%s {\n' % section.type)
-            if print_info:
-                print('SEC.: "%s"' % section.type)
-            _write_properties_and_data(fw, section, ind, print_info)
-            for sec in section.sections:
-                _write_section(fw, sec, ind, orig_ind, print_info)
-            fw('}\n')
-        else:
-            for comment in section.props:
-                fw('%s\n' % comment[1])
-        if print_progress:
-            lprint("S Writting %s file - %i%% done ...", (filepath[-3:].upper(), (section_i + 1) / sections_count * 100), immediate_timeout=5)
-    fw('\n')
-    file.close()
+    # data are written to temporary file first, so failed writing never leaves partially written file behind
+    tmp_filepath = "%s.%i.tmp" % (filepath, os.getpid())
+    try:
+        with open(tmp_filepath, mode="w", encoding="utf8", newline="\n") as file:
+            writer = _BufferedWriter(file)
+            fw = writer.write
+
+            # container can also be generator, so sections can be created while they are written
+            sections_count = len(container) if hasattr(container, "__len__") else None
+            for section_i, section in enumerate(container):
+                if section.type != "#comment":
+                    fw('%s {\n' % section.type)
+                    if print_info:
+                        print('SEC.: "%s"' % section.type)
+                    _write_properties_and_data(fw, section, ind, print_info)
+                    for sec in section.sections:
+                        _write_section(fw, sec, ind, orig_ind, print_info)
+                    fw('}\n')
+                else:
+                    for comment in section.props:
+                        fw('%s\n' % comment[1])
+                if print_progress:
+                    if sections_count is None:
+                        lprint("S Writting %s file - %i sections done ...", (filepath[-3:].upper(), section_i + 1), immediate_timeout=5)
+                    else:
+                        lprint("S Writting %s file - %i%% done ...", (filepath[-3:].upper(), (section_i + 1) / sections_count * 100),
+                               immediate_timeout=5)
+            fw('\n')
+            writer.flush()
+
+        os.replace(tmp_filepath, filepath)
+
+    finally:
+
+        if os.path.isfile(tmp_filepath):
+            os.remove(tmp_filepath)
+
+    _path_utils.invalidate_project_index(filepath)
 
     return {'FINISHED'}
@@ -19,6 +19,7 @@
 # Copyright (C) 2017: SCS Software
 
 import os
+from io_scs_tools.utils import path as _path_utils
 from io_scs_tools.utils.printout import lprint
 
 
@@ -164,6 +165,8 @@ def write_data(filepath, container, ind="\t", is_sui=False, create_dirs=False, p
         if not is_sui:
             f.write("}\n")
 
+    _path_utils.invalidate_project_index(filepath)
+
     if print_on_success:
         file_type = "SUI" if is_sui else "SII"
         lprint("I Writting %s file to: %r", (file_type, filepath))
@@ -83,6 +83,10 @@ def apply_active_look(root_obj, force_apply=False):
     saved in material entries of active look.
     It will also try to unset any unused properties.
 
+    Only properties which differ from current material values are written. Values are written directly to ID properties,
+    so no update function is invoked per property, instead nodes of each material are updated once with all changes.
+    Texture images are looked up only once per texture path for all materials.
+
     :param root_obj: scs root object on from which active look should be applied
     :type root_obj: bpy.types.Object
     :param force_apply: optional flag indicating if apply has to be forced even if only one look is defined
@@ -102,6 +106,9 @@ def apply_active_look(root_obj, force_apply=False):
         lprint("D Look entry with ID: %s does not exists in %r", (look_id_str, root_obj.name))
         return
 
+    images_cache = {}
+    changed_props_count = unchanged_props_count = updated_materials_count = 0
+
     look_data = root_obj[_MAIN_DICT][look_id_str]
     for material in __collect_materials__(root_obj):
         lprint("D Applying material: %r:", (material.name,))
@@ -112,40 +119,13 @@ def apply_active_look(root_obj, force_apply=False):
             continue
 
         mat_data = look_data[mat_id_str]
-        for prop in mat_data:
-            lprint("S |- attr set: %r => %r", (prop, mat_data[prop]))
-
-            different = False  # apply value change and invoke update only if property is different
-            if isinstance(mat_data[prop], Iterable) and "CollectionProperty" in mat_data[prop]:
-                coll_property = getattr(material.scs_props, prop, None)
-                if coll_property:
-                    different = True
-                    last_entry = None
-                    coll_property.clear()
-                    for entry in mat_data[prop]["entries"]:
-                        new_entry = coll_property.add()
-                        for key in entry:
-                            new_entry[key] = entry[key]
-
-                        last_entry = new_entry
-
-                    # apply update_value function if exists only on last collection property item
-                    # this will update: aux and uv layer items
-                    update_func = getattr(last_entry, "update_value", None)
-                    if update_func and different:
-                        update_func(material)
-            else:
-                different = (prop not in material.scs_props or material.scs_props[prop] != mat_data[prop])
-                if different:
-                    material.scs_props[prop] = mat_data[prop]
+        changed_props = __apply_material_entry__(material, mat_data)
 
-            update_func = getattr(material.scs_props, "update_" + prop, None)
-            # invoke update function on property if exists
-            if update_func and different:
-                try:
-                    update_func(material)
-                except KeyError:
-                    lprint("E Can't update material attribute: %r on material: %r, expect desynced looks!" % (prop, material.name))
+        changed_props_count += len(changed_props)
+        unchanged_props_count += len(mat_data) - len(changed_props)
+
+        if __update_material__(material, mat_data, changed_props, images_cache):
+            updated_materials_count += 1
 
         # unset any unused
         for prop in list(material.scs_props.keys()):
@@ -155,6 +135,9 @@ def apply_active_look(root_obj, force_apply=False):
                 lprint("S |- attr unset: %r", (prop,))
                 material.scs_props.property_unset(prop)
 
+    lprint("D Look with id %r applied to %r: %i changed and %i unchanged propert(ies), nodes updated on %i material(s).",
+           (look_id_str, root_obj.name, changed_props_count, unchanged_props_count, updated_materials_count))
+
 
 def update_look_from_material(root_obj, material, preset_change=False):
     """Updates look entry from given material. If look or material inside look doesn't exists update will fail.
@@ -570,6 +553,163 @@ def __collect_materials__(root_obj):
     return collected_mats.values()
 
 
+def __to_comparable__(value):
+    """Converts given ID property value to plain python value, so it can be compared with values of other ID properties.
+
+    :param value: value of ID property
+    :type value: object
+    :return: plain python value
+    :rtype: object
+    """
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    elif hasattr(value, "to_list"):
+        return value.to_list()
+    return value
+
+
+def __is_collection_different__(coll_property, entries):
+    """Checks if entries of given collection property differ from given look entries.
+
+    :param coll_property: collection property of material
+    :type coll_property: bpy.types.bpy_prop_collection
+    :param entries: entries of collection property saved in look
+    :type entries: list[dict]
+    :return: True if collection has to be rebuilt; False otherwise
+    :rtype: bool
+    """
+
+    if len(coll_property) != len(entries):
+        return True
+
+    for coll_entry, entry in zip(coll_property, entries):
+
+        if set(coll_entry.keys()) != set(entry.keys()):
+            return True
+
+        for key in entry:
+            if __to_comparable__(getattr(coll_entry, key)) != __to_comparable__(entry[key]):
+                return True
+
+    return False
+
+
+def __apply_material_entry__(material, mat_data):
+    """Writes properties from given look material entry to the material, which differ from current material values.
+    Values are written to ID properties directly, so update functions of properties are not invoked.
+
+    :param material: material to which values should be written
+    :type material: bpy.types.Material
+    :param mat_data: material entry from look
+    :type mat_data: dict
+    :return: names of changed properties
+    :rtype: list[str]
+    """
+
+    changed_props = []
+    for prop in mat_data:
+
+        if isinstance(mat_data[prop], Iterable) and "CollectionProperty" in mat_data[prop]:
+            coll_property = getattr(material.scs_props, prop, None)
+            if coll_property is None or not __is_collection_different__(coll_property, mat_data[prop]["entries"]):
+                continue
+
+            coll_property.clear()
+            for entry in mat_data[prop]["entries"]:
+                new_entry = coll_property.add()
+                for key in entry:
+                    new_entry[key] = entry[key]
+
+        else:
+            if prop in material.scs_props and __to_comparable__(material.scs_props[prop]) == __to_comparable__(mat_data[prop]):
+                continue
+
+            material.scs_props[prop] = mat_data[prop]
+
+        lprint("S |- attr set: %r => %r", (prop, mat_data[prop]))
+        changed_props.append(prop)
+
+    return changed_props
+
+
+def __update_material__(material, mat_data, changed_props, images_cache):
+    """Updates material for given changed properties, as their update functions would do, but with one update of material nodes.
+
+    :param material: material which properties were changed
+    :type material: bpy.types.Material
+    :param mat_data: material entry from look
+    :type mat_data: dict
+    :param changed_props: names of changed properties
+    :type changed_props: list[str]
+    :param images_cache: images already looked up during this look apply
+    :type images_cache: dict
+    :return: True if material nodes were updated; False otherwise
+    :rtype: bool
+    """
+    from io_scs_tools.internals.shaders import shader as _shader
+    from io_scs_tools.utils import material as _material_utils
+    from io_scs_tools.utils import path as _path_utils
+
+    attr_dict = {}
+    tex_dict = {}
+    tex_settings_dict = {}
+    uvs_dict = {}
+
+    texture_types = material.scs_props.get_texture_types()
+    for prop in changed_props:
+
+        value = getattr(material.scs_props, prop, None)
+
+        if isinstance(mat_data[prop], Iterable) and "CollectionProperty" in mat_data[prop]:
+
+            # as with update function invoke, only last collection item is used,
+            # this will update: aux and uv layer items
+            if len(value) == 0:
+                continue
+
+            last_entry = value[-1]
+            if hasattr(last_entry, "aux_type"):
+                attr_dict[last_entry.aux_type] = getattr(material.scs_props, "shader_attribute_" + last_entry.aux_type, None)
+            elif hasattr(last_entry, "texture_type"):
+                uvs_dict[last_entry.texture_type] = (last_entry.value, last_entry.tex_coord)
+
+        elif prop.startswith("shader_attribute_") and hasattr(material.scs_props, "update_" + prop):
+
+            attr_dict[prop[len("shader_attribute_"):]] = value
+
+        elif prop.startswith("shader_texture_") and prop[len("shader_texture_"):] in texture_types:
+
+            tex_type = prop[len("shader_texture_"):]
+
+            # correct scs texture path string, as texture update function would do
+            texture_path = material.scs_props[prop] = _path_utils.get_scs_texture_str(value)
+            tex_dict[tex_type] = _material_utils.get_texture_image(texture_path, tex_type, report_invalid=True, images_cache=images_cache)
+
+            settings = _material_utils.reload_tobj_settings(material, tex_type, update_shader=False)
+            if settings is not None:
+                tex_settings_dict[tex_type] = settings
+
+        else:
+
+            # any other property having update function has to be updated on its own
+            update_func = getattr(material.scs_props, "update_" + prop, None)
+            if update_func:
+                try:
+                    update_func(material)
+                except KeyError:
+                    lprint("E Can't update material attribute: %r on material: %r, expect desynced looks!" % (prop, material.name))
+
+    if not (attr_dict or tex_dict or tex_settings_dict or uvs_dict):
+        return False
+
+    try:
+        _shader.update_nodes(material, attr_dict, tex_dict, tex_settings_dict, uvs_dict)
+    except KeyError:
+        lprint("E Can't update material attributes: %r on material: %r, expect desynced looks!" % (changed_props, material.name))
+
+    return True
+
+
 def __create_material_entry__(material):
     """Create material entry for looks dictionary from given material.
 
@@ -31,12 +31,20 @@ from io_scs_tools.internals.open_gl.storage import terrain_points as _terrain_po
 from io_scs_tools.internals.connections.wrappers import collection as _connections_wrapper
 from io_scs_tools.utils import info as _info_utils
 from io_scs_tools.utils import object as _object_utils
+from io_scs_tools.utils import profiler as _profiler
 from io_scs_tools.utils import view3d as _view3d_utils
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.utils.printout import get_immediate_msg as _get_immediate_msg
 
 _2d_elements_cache = LocatorsCache()
 
+_LOCATOR_DRAW_FUNCS = {
+    'Prefab': _locators.prefab.draw_prefab_locator,
+    'Model': _locators.model.draw_model_locator,
+    'Collision': _locators.collider.draw_collision_locator,
+}
+"""Drawing functions for each of the locator types."""
+
 
 def _cache_custom_2d_elements(region, region_3d, space):
     """Caches custom 2D visual elements, that require custom OpenGL drawing in given 2D region of given 3D view.
@@ -333,50 +341,256 @@ def _draw_3dview_immediate_report(region):
     blf.disable(0, blf.SHADOW)
 
 
-def fill_buffers(object_list):
-    """Fill drawing buffers with custom 3D visual elements for given objects.
+class _OverlayLocators:
+    """Cache of SCS locators displayed with custom drawing, split by locator type.
 
-    :param object_list: visible objects that should be checked and filled as custom visual elements; empty list when buffers should be emptied
-    :type object_list: collections.Iterable
+    Cache is rebuilt from all visible objects only after it was invalidated, otherwise only objects
+    marked as changed are re-inspected. It also holds state of last buffers fill, so fill can be skipped
+    if nothing drawn has changed in the meantime.
     """
 
-    # assemble locators dictionaries and properly set empties display sizes
-    prefab_locators = {}
-    model_locators = {}
-    collision_locators = {}
+    __locators = {locator_type: {} for locator_type in _LOCATOR_DRAW_FUNCS}
+    """Displayed locators by their type; key: object name."""
+    __is_valid = False
+    __changed_names = set()
+    __last_fill_state = None
+
+    @staticmethod
+    def invalidate():
+        """Invalidates cache, so it will be rebuilt from all visible objects on next fill."""
+        _OverlayLocators.__is_valid = False
+        _OverlayLocators.__changed_names.clear()
+        _OverlayLocators.__last_fill_state = None
+
+    @staticmethod
+    def mark_changed(object_names):
+        """Marks given changed objects for re-inspection on next fill, if they are or should become displayed locators.
+
+        :param object_names: names of changed objects
+        :type object_names: collections.Iterable[str]
+        :return: True if any of the objects is or should become displayed locator; False otherwise
+        :rtype: bool
+        """
+        is_any_changed = False
+        for obj_name in object_names:
+
+            is_cached = any(obj_name in locators for locators in _OverlayLocators.__locators.values())
+
+            obj = bpy.data.objects.get(obj_name)
+            if is_cached or (obj and obj.type == 'EMPTY' and obj.scs_props.empty_object_type == 'Locator'):
+                _OverlayLocators.__changed_names.add(obj_name)
+                is_any_changed = True
+
+        return is_any_changed
+
+    @staticmethod
+    def update(object_list):
+        """Updates cache, by rebuilding it from given objects if invalid, otherwise only changed objects are re-inspected.
+
+        :param object_list: visible objects, used only if cache has to be rebuilt
+        :type object_list: collections.Iterable
+        :return: number of inspected objects
+        :rtype: int
+        """
+        locators = _OverlayLocators.__locators
+
+        if not _OverlayLocators.__is_valid:
 
-    for visib_obj in object_list:
+            for type_locators in locators.values():
+                type_locators.clear()
+
+            objects = object_list
+            _OverlayLocators.__is_valid = True
+
+        else:
+
+            # drop removed and renamed locators, renamed ones are reported as changed under their new name
+            for type_locators in locators.values():
+                for obj_name, obj in list(type_locators.items()):
+                    try:
+                        if obj.name != obj_name:
+                            del type_locators[obj_name]
+                    except ReferenceError:
+                        del type_locators[obj_name]
+
+            objects = []
+            for obj_name in _OverlayLocators.__changed_names:
+
+                for type_locators in locators.values():
+                    if obj_name in type_locators:
+                        del type_locators[obj_name]
+
+                obj = bpy.data.objects.get(obj_name)
+                if obj:
+                    objects.append(obj)
+
+        _OverlayLocators.__changed_names.clear()
+
+        inspected_count = 0
+        for obj in objects:
+            _OverlayLocators.__inspect_object(obj)
+            inspected_count += 1
+
+        return inspected_count
+
+    @staticmethod
+    def __inspect_object(obj):
+        """Inspects given object, adds it to cache if it's displayed locator and properly sets its empty display size.
+
+        :param obj: object to inspect
+        :type obj: bpy.types.Object
+        """
 
         # passed object reference got removed
         try:
             # do simple name access, to trigger possible reference error.
-            _ = visib_obj.name
+            _ = obj.name
         except ReferenceError:
-            continue
+            return
+
+        if obj.type != 'EMPTY':
+            return
+
+        if obj.scs_props.empty_object_type != 'Locator':
+            return
+
+        if not obj.visible_get():
+            return
+
+        if obj.scs_props.locator_type == 'Prefab':
+            _OverlayLocators.__locators['Prefab'][obj.name] = obj
+            _object_utils.store_locators_original_display_size_and_type(obj)
+            _object_utils.set_locators_prefab_display_size_and_type(obj)
+        elif obj.scs_props.locator_type == 'Model':
+            _OverlayLocators.__locators['Model'][obj.name] = obj
+            _object_utils.store_locators_original_display_size_and_type(obj)
+            _object_utils.set_locators_model_display_size_and_type(obj)
+        elif obj.scs_props.locator_type == 'Collision':
+            _OverlayLocators.__locators['Collision'][obj.name] = obj
+            _object_utils.store_locators_original_display_size_and_type(obj)
+            _object_utils.set_locators_coll_display_size_and_type(obj)
+        elif obj.scs_props.locators_orig_display_size != 0.0:
+            _object_utils.set_locators_original_size_and_type(obj)
+
+    @staticmethod
+    def get_locators(locator_type):
+        """Gets cached displayed locators of given type.
+
+        :param locator_type: type of SCS locator: 'Prefab', 'Model' or 'Collision'
+        :type locator_type: str
+        :return: displayed locators of given type; key: object name
+        :rtype: dict[str, bpy.types.Object]
+        """
+        return _OverlayLocators.__locators[locator_type]
+
+    @staticmethod
+    def get_fill_state(local_view_spaces):
+        """Gets state of everything drawn into buffers besides locators, used to detect if buffers have to be refilled.
+
+        :param local_view_spaces: spaces with active local view
+        :type local_view_spaces: list[bpy.types.SpaceView3D]
+        :return: current fill state
+        :rtype: tuple
+        """
+        return (_terrain_points_storage.get_version(),
+                _connections_wrapper.ready_for_draw(),
+                _primitive.get_records_version(_primitive.RecordTypes.LOCATOR),
+                _primitive.get_records_version(_primitive.RecordTypes.CONNECTION),
+                tuple(space.local_view for space in local_view_spaces))
+
+    @staticmethod
+    def is_fill_needed(fill_state, has_changed_locators):
+        """Checks if buffers have to be refilled.
+
+        :param fill_state: current fill state
+        :type fill_state: tuple
+        :param has_changed_locators: flag indicating that some locators were changed
+        :type has_changed_locators: bool
+        :return: True if buffers have to be refilled; False if they are up to date
+        :rtype: bool
+        """
+        return has_changed_locators or fill_state != _OverlayLocators.__last_fill_state
+
+    @staticmethod
+    def has_changes():
+        """Are there any objects waiting for re-inspection or has cache to be rebuilt?
+
+        :return: True if cache has changes to process; False otherwise
+        :rtype: bool
+        """
+        return not _OverlayLocators.__is_valid or len(_OverlayLocators.__changed_names) > 0
+
+    @staticmethod
+    def set_last_fill_state(fill_state):
+        """Sets state of the last buffers fill.
+
+        :param fill_state: fill state to set, None if next fill must not be skipped
+        :type fill_state: tuple | None
+        """
+        _OverlayLocators.__last_fill_state = fill_state
+
+
+def invalidate_buffers(object_names=None):
+    """Invalidates retained drawing elements of given objects, so they will be re-calculated on next buffers fill.
+
+    :param object_names: names of the objects that were changed; if None all retained elements are invalidated
+    :type object_names: collections.Iterable[str] | None
+    :return: True if any of given objects is displayed locator or should become one, so buffers have to be refilled
+    :rtype: bool
+    """
+    if object_names is None:
+        _primitive.delete_records(_primitive.RecordTypes.LOCATOR)
+        _primitive.delete_records(_primitive.RecordTypes.CONNECTION)
+        _OverlayLocators.invalidate()
+        return True
+    else:
+        object_names = list(object_names)
+        _primitive.delete_records(_primitive.RecordTypes.LOCATOR, object_names)
+        return _OverlayLocators.mark_changed(object_names)
 
-        if visib_obj.type != 'EMPTY':
-            continue
 
-        if visib_obj.scs_props.empty_object_type != 'Locator':
-            continue
+def clear_buffers():
+    """Empties drawing buffers, while retained elements and cached locators are kept, so next fill will use them."""
+    _primitive.clear_buffers()
+    _primitive.set_active_buffers(None)
+    _OverlayLocators.set_last_fill_state(None)
 
-        if not visib_obj.visible_get():
-            continue
 
-        if visib_obj.scs_props.locator_type == 'Prefab':
-            prefab_locators[visib_obj.name] = visib_obj
-            _object_utils.store_locators_original_display_size_and_type(visib_obj)
-            _object_utils.set_locators_prefab_display_size_and_type(visib_obj)
-        elif visib_obj.scs_props.locator_type == 'Model':
-            model_locators[visib_obj.name] = visib_obj
-            _object_utils.store_locators_original_display_size_and_type(visib_obj)
-            _object_utils.set_locators_model_display_size_and_type(visib_obj)
-        elif visib_obj.scs_props.locator_type == 'Collision':
-            collision_locators[visib_obj.name] = visib_obj
-            _object_utils.store_locators_original_display_size_and_type(visib_obj)
-            _object_utils.set_locators_coll_display_size_and_type(visib_obj)
-        elif visib_obj.scs_props.locators_orig_display_size != 0.0:
-            _object_utils.set_locators_original_size_and_type(visib_obj)
+def fill_buffers(object_list):
+    """Fill drawing buffers with custom 3D visual elements for given objects.
+
+    Displayed locators are cached and only locators invalidated in the meantime are re-inspected and re-calculated,
+    given objects are inspected only if cache was invalidated as whole. If no locator, connection nor terrain point
+    changed since last fill, buffers are left as they are.
+
+    :param object_list: visible objects that should be checked and filled as custom visual elements; empty list when buffers should be emptied
+    :type object_list: collections.Iterable
+    """
+
+    # empty list means buffers have to be emptied, so drop cached locators too
+    if not object_list:
+        _OverlayLocators.invalidate()
+        clear_buffers()
+        return
+
+    local_view_spaces = _view3d_utils.get_spaces_with_local_view()
+
+    has_changed_locators = _OverlayLocators.has_changes()
+    if not _OverlayLocators.is_fill_needed(_OverlayLocators.get_fill_state(local_view_spaces), has_changed_locators):
+        return
+
+    # profile refill on it's own, if it's not part of already profiled operation
+    is_profiled_on_own = not _profiler.is_active()
+    if is_profiled_on_own:
+        _profiler.start("Overlay Refill")
+
+    # assemble locators dictionaries and properly set empties display sizes
+    with _profiler.stage("locators inspection"):
+        _profiler.add_items(_OverlayLocators.update(object_list))
+
+    prefab_locators = _OverlayLocators.get_locators('Prefab')
+    model_locators = _OverlayLocators.get_locators('Model')
+    collision_locators = _OverlayLocators.get_locators('Collision')
 
     # clear buffers
     _primitive.clear_buffers()
@@ -385,10 +599,13 @@ def fill_buffers(object_list):
     _primitive.set_active_buffers(None)
 
     # fill buffers for main view
-    _fill_active_buffers(prefab_locators, model_locators, collision_locators)
+    with _profiler.stage("main view"):
+        _fill_active_buffers(prefab_locators, model_locators, collision_locators)
 
     # extra buffers filling for each local view
-    for space in _view3d_utils.get_spaces_with_local_view():
+    for space in local_view_spaces:
+
+        _profiler.begin("local views")
 
         local_prefab_locators = {}
         local_model_locators = {}
@@ -412,6 +629,17 @@ def fill_buffers(object_list):
         # now fill in locators visible in this space
         _fill_active_buffers(local_prefab_locators, local_model_locators, local_collision_locators)
 
+        _profiler.end()
+
+    # drop retained elements of locators which are not visible anymore (deleted, renamed or hidden)
+    _primitive.purge_records(_primitive.RecordTypes.LOCATOR, {**prefab_locators, **model_locators, **collision_locators})
+
+    # remember what was filled, so next fill can be skipped if nothing changes
+    _OverlayLocators.set_last_fill_state(_OverlayLocators.get_fill_state(local_view_spaces))
+
+    if is_profiled_on_own:
+        _profiler.finish()
+
 
 def _fill_active_buffers(prefab_locators, model_locators, collision_locators):
     """Fill active buffers with given locator dictionaries.
@@ -426,24 +654,33 @@ def _fill_active_buffers(prefab_locators, model_locators, collision_locators):
     scs_globals = _get_scs_globals()
 
     # fill terrain points always
-    for tp_position, tp_color in _terrain_points_storage.get_positions_and_colors():
-        _primitive.draw_point(tp_position, tp_color, 5.0)
+    with _profiler.stage("terrain points"):
+        for tp_position, tp_color in _terrain_points_storage.get_positions_and_colors():
+            _primitive.draw_point(tp_position, tp_color, 5.0)
 
     # fill curves and lines
     if scs_globals.display_connections:
-        _connections_wrapper.draw(prefab_locators)
+        with _profiler.stage("connections"):
+            _connections_wrapper.draw(prefab_locators)
 
-    # fill locators
+    # fill locators, calculating elements only for locators without retained record
     if scs_globals.display_locators:
 
-        for obj in prefab_locators.values():
-            _locators.prefab.draw_prefab_locator(obj, scs_globals)
+        _profiler.begin("locators", len(prefab_locators) + len(model_locators) + len(collision_locators))
+
+        for locators in (prefab_locators, model_locators, collision_locators):
+            for obj_name, obj in locators.items():
+
+                if not _primitive.has_record(_primitive.RecordTypes.LOCATOR, obj_name):
+                    _profiler.begin("calculation", 1)
+                    _primitive.begin_record(_primitive.RecordTypes.LOCATOR, obj_name)
+                    _LOCATOR_DRAW_FUNCS[obj.scs_props.locator_type](obj, scs_globals)
+                    _primitive.end_record()
+                    _profiler.end()
 
-        for obj in model_locators.values():
-            _locators.model.draw_model_locator(obj, scs_globals)
+                _primitive.append_record(_primitive.RecordTypes.LOCATOR, obj_name)
 
-        for obj in collision_locators.values():
-            _locators.collider.draw_collision_locator(obj, scs_globals)
+        _profiler.end()
 
 
 def draw_custom_3d_elements(mode):
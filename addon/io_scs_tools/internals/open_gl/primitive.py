@@ -21,6 +21,7 @@
 import bgl
 import blf
 import gpu
+import numpy
 from array import array
 from gpu_extras.batch import batch_for_shader
 from mathutils import Vector
@@ -28,14 +29,18 @@ from io_scs_tools.internals.open_gl.shaders import get_shader, ShaderTypes
 
 
 class _Buffer:
-    """Buffer class being able to store and dispatch drawing of primitives."""
+    """Buffer class being able to store and dispatch drawing of primitives.
+
+    Attributes data are stored in flat float arrays and GPU batch created out of them is retained
+    until buffer content changes, so redraws without buffer changes only bind and draw the batch.
+    """
 
     class Types:
         POINTS = 1
         LINES = 2
         TRIS = 3
 
-    def __init__(self, buffer_type, draw_size, shader_type, attr_names):
+    def __init__(self, buffer_type, draw_size, shader_type, attrs):
         """Create buffer instance with given type drawing size and shader type.
 
         :param buffer_type: type of the buffer from _Buffer.Types
@@ -44,19 +49,22 @@ class _Buffer:
         :type draw_size: float
         :param shader_type: type of the shader for given buffer from ShaderTypes
         :type shader_type: int
-        :param attr_names: tuple of string defining attributes that this buffer is holding
-        :type attr_names: tuple[str]
+        :param attrs: tuple of attributes, each defined with its name and components count, that this buffer is holding
+        :type attrs: tuple[tuple[str, int]]
         """
         if buffer_type not in {_Buffer.Types.LINES, _Buffer.Types.POINTS, _Buffer.Types.TRIS}:
             raise TypeError("Unsupported buffer type requested: %s!" % buffer_type)
 
         self.__type = buffer_type
         self.__draw_size = draw_size
-        self.__shader = get_shader(shader_type)
+        self.__shader_type = shader_type
         self.__data = {}
+        self.__comps = {}
+        self.__batch = None
 
-        for att_name in attr_names:
-            self.__data[att_name] = []
+        for att_name, att_comps in attrs:
+            self.__data[att_name] = array('f')
+            self.__comps[att_name] = att_comps
 
         # depending on type  setup callbacks executed before and after dispatching
         if buffer_type == _Buffer.Types.LINES:
@@ -87,18 +95,48 @@ class _Buffer:
         :param attr_name: name of the attribute for which value should be append
         :type attr_name: str
         :param value: value that should be append (tuple of floats for position, color etc.)
-        :type value: tuple[float] | tuple[int] | float | int
+        :type value: collections.Iterable[float]
+        """
+        self.__data[attr_name].extend(value)
+        self.__batch = None
+
+    def append_attr_array(self, attr_name, values):
+        """Appends all given values at once into the data fields for given attribute name
+
+        NOTE: for performance no safety checks on existing attribute name are made
+        :param attr_name: name of the attribute for which values should be append
+        :type attr_name: str
+        :param values: values that should be append, one value per row (positions, colors etc.)
+        :type values: numpy.ndarray
+        """
+        self.__data[attr_name].frombytes(numpy.ascontiguousarray(values, dtype=numpy.float32).tobytes())
+        self.__batch = None
+
+    def extend(self, buffer):
+        """Extends this buffer with all the entries from given buffer.
+
+        NOTE: given buffer has to hold the same attributes as this one
+        :param buffer: buffer from which entries should be copied
+        :type buffer: _Buffer
         """
-        self.__data[attr_name].append(value)
+        if not buffer.has_entries():
+            return
+
+        for attr_name, attr_data in self.__data.items():
+            attr_data.extend(buffer.__data[attr_name])
+
+        self.__batch = None
 
     def clear(self):
         """Clears all entries in the buffer.
         """
-        for attr_name in self.__data:
-            self.__data[attr_name].clear()
+        for attr_data in self.__data.values():
+            del attr_data[:]
+
+        self.__batch = None
 
     def draw(self, uniforms, space_3d):
-        """Dispatches drawing for the buffer by creating and drawing batch.
+        """Dispatches drawing for the buffer by drawing retained batch, batch is created only if buffer was changed.
 
         :param uniforms: list of uniforms tuples to be sent to shader
         :type uniforms: collections.Iterable[(str, type, bytearray, int, int)]
@@ -114,24 +152,35 @@ class _Buffer:
         if self.__type == _Buffer.Types.TRIS and space_3d.shading.type == 'WIREFRAME':
             return
 
+        shader = get_shader(self.__shader_type)
+
+        # create batch only if buffer content changed, arrays are passed as two dimensional views,
+        # so vertex buffer is filled directly from them without any conversion
+        if self.__batch is None:
+            content = {}
+            for attr_name, attr_data in self.__data.items():
+                attr_comps = self.__comps[attr_name]
+                content[attr_name] = memoryview(attr_data).cast('B').cast('f', (len(attr_data) // attr_comps, attr_comps))
+
+            self.__batch = batch_for_shader(shader, self.__draw_type, content)
+
         self.__bgl_callback(self.__bgl_callback_param_before)
 
         # bind shader
-        self.__shader.bind()
+        shader.bind()
 
         # fill the uniforms to binded shader
         for uniform_name, uniform_type, uniform_data, uniform_length, uniform_count in uniforms:
-            uniform_loc = self.__shader.uniform_from_name(uniform_name)
+            uniform_loc = shader.uniform_from_name(uniform_name)
             if uniform_type == float:
-                self.__shader.uniform_vector_float(uniform_loc, uniform_data, uniform_length, uniform_count)
+                shader.uniform_vector_float(uniform_loc, uniform_data, uniform_length, uniform_count)
             elif uniform_type == int:
-                self.__shader.uniform_vector_int(uniform_loc, uniform_data, uniform_length, uniform_count)
+                shader.uniform_vector_int(uniform_loc, uniform_data, uniform_length, uniform_count)
             else:
                 raise TypeError("Invalid uniform type: %s" % uniform_type)
 
-        # create batch and dispatch draw
-        batch = batch_for_shader(self.__shader, self.__draw_type, self.__data)
-        batch.draw(self.__shader)
+        # dispatch draw
+        self.__batch.draw(shader)
 
         self.__bgl_callback(self.__bgl_callback_param_after)
 
@@ -144,8 +193,19 @@ class _Buffer:
         return len(self.__data["pos"]) + len(self.__data["color"]) > 0
 
 
+class RecordTypes:
+    """Types of retained records, each type has its own keys namespace."""
+    LOCATOR = 1
+    CONNECTION = 2
+
+
 class _ViewsBufferHandler:
-    """Buffers handler class used to implement main view and all local view buffers."""
+    """Buffers handler class used to implement main view and all local view buffers.
+
+    Besides view buffers handler also holds retained records. Record is a set of buffers filled
+    with elements of one entity (eg. locator or connection), which can be appended to view buffers
+    over and over again without re-calculating its elements, until record is deleted.
+    """
 
     @staticmethod
     def __get_new_buffers__():
@@ -154,12 +214,13 @@ class _ViewsBufferHandler:
         :return: currently we have 5 buffers: 1 for trises, 1 for stipple lines, 1 for normal lines and 2 for points of different size
         :rtype: tuple[_Buffer]
         """
+        attrs = (("pos", 3), ("color", 4))
         return (
-            _Buffer(_Buffer.Types.TRIS, 0, ShaderTypes.SMOOTH_COLOR_CLIPPED_3D, ("pos", "color")),  # 0
-            _Buffer(_Buffer.Types.LINES, 2, ShaderTypes.SMOOTH_COLOR_STIPPLE_CLIPPED_3D, ("pos", "color")),  # 1
-            _Buffer(_Buffer.Types.LINES, 2, ShaderTypes.SMOOTH_COLOR_CLIPPED_3D, ("pos", "color")),  # 2
-            _Buffer(_Buffer.Types.POINTS, 5, ShaderTypes.SMOOTH_COLOR_CLIPPED_3D, ("pos", "color")),  # 3
-            _Buffer(_Buffer.Types.POINTS, 12, ShaderTypes.SMOOTH_COLOR_CLIPPED_3D, ("pos", "color")),  # 4
+            _Buffer(_Buffer.Types.TRIS, 0, ShaderTypes.SMOOTH_COLOR_CLIPPED_3D, attrs),  # 0
+            _Buffer(_Buffer.Types.LINES, 2, ShaderTypes.SMOOTH_COLOR_STIPPLE_CLIPPED_3D, attrs),  # 1
+            _Buffer(_Buffer.Types.LINES, 2, ShaderTypes.SMOOTH_COLOR_CLIPPED_3D, attrs),  # 2
+            _Buffer(_Buffer.Types.POINTS, 5, ShaderTypes.SMOOTH_COLOR_CLIPPED_3D, attrs),  # 3
+            _Buffer(_Buffer.Types.POINTS, 12, ShaderTypes.SMOOTH_COLOR_CLIPPED_3D, attrs),  # 4
         )
 
     def __init__(self):
@@ -167,6 +228,9 @@ class _ViewsBufferHandler:
         """
         self.__current = None
         self.__buffers = {}
+        self.__active = None
+        self.__records = {RecordTypes.LOCATOR: {}, RecordTypes.CONNECTION: {}}
+        self.__records_versions = {RecordTypes.LOCATOR: 0, RecordTypes.CONNECTION: 0}
 
     def __get_buffers__(self, space_3d):
         """Return list of bufffers for given space 3d view. If none is given empty list is returned.
@@ -192,6 +256,8 @@ class _ViewsBufferHandler:
         if self.__current not in self.__buffers:
             self.__buffers[self.__current] = self.__get_new_buffers__()
 
+        self.__active = self.__buffers[self.__current]
+
     def append_tris_vertex(self, pos, color):
         """Appends new tris vertex into the current buffers.
 
@@ -200,10 +266,10 @@ class _ViewsBufferHandler:
         :param color: color of the vertex, has to be of size 4 and fromat: (r, g, b, a)
         :type color: mathutils.Vector | bpy.types.bpy_prop_collection | tuple
         """
-        buffer = self.__buffers[self.__current][0]
+        buffer = self.__active[0]
 
-        buffer.append_attr("pos", tuple(pos))
-        buffer.append_attr("color", tuple(color))
+        buffer.append_attr("pos", pos)
+        buffer.append_attr("color", color)
 
     def append_line_vertex(self, pos, color, is_stipple=False):
         """Appends new line start/end segment into the current buffers.
@@ -216,12 +282,30 @@ class _ViewsBufferHandler:
         :type is_stipple: bool
         """
         if is_stipple:
-            buffer = self.__buffers[self.__current][1]
+            buffer = self.__active[1]
+        else:
+            buffer = self.__active[2]
+
+        buffer.append_attr("pos", pos)
+        buffer.append_attr("color", color)
+
+    def append_line_vertices(self, positions, colors, is_stipple=False):
+        """Appends multiple line start/end segments into the current buffers at once.
+
+        :param positions: world space positions of the start/end line points in array of shape (vertices count, 3)
+        :type positions: numpy.ndarray
+        :param colors: colors of the start/end line points in array of shape (vertices count, 4) and fromat: (r, g, b, a)
+        :type colors: numpy.ndarray
+        :param is_stipple: should lines be stippled?
+        :type is_stipple: bool
+        """
+        if is_stipple:
+            buffer = self.__active[1]
         else:
-            buffer = self.__buffers[self.__current][2]
+            buffer = self.__active[2]
 
-        buffer.append_attr("pos", tuple(pos))
-        buffer.append_attr("color", tuple(color))
+        buffer.append_attr_array("pos", positions)
+        buffer.append_attr_array("color", colors)
 
     def append_point_vertex(self, pos, color, size):
         """Appends new point into the current buffers.
@@ -234,14 +318,14 @@ class _ViewsBufferHandler:
         :type size: float
         """
         if size == 5.0:
-            buffer = self.__buffers[self.__current][3]
+            buffer = self.__active[3]
         elif size == 12.0:
-            buffer = self.__buffers[self.__current][4]
+            buffer = self.__active[4]
         else:
             raise ValueError("Unsupported point size: %.2f. Only 5.0 or 12.0 are supported!" % size)
 
-        buffer.append_attr("pos", tuple(pos))
-        buffer.append_attr("color", tuple(color))
+        buffer.append_attr("pos", pos)
+        buffer.append_attr("color", color)
 
     def clear_buffers(self):
         """Clears all the buffers in handler. Then deletes all of them except the main one.
@@ -258,6 +342,97 @@ class _ViewsBufferHandler:
             # delete other local space buffers
             del self.__buffers[space_3d]
 
+    def begin_record(self, record_type, key):
+        """Starts filling of the record with given type and key. Until record is ended, all appended elements go to the record.
+
+        :param record_type: type of the record from RecordTypes
+        :type record_type: int
+        :param key: unique key of the record within its type
+        :type key: collections.Hashable
+        """
+        records = self.__records[record_type]
+
+        if key in records:
+            for buffer in records[key]:
+                buffer.clear()
+        else:
+            records[key] = self.__get_new_buffers__()
+
+        self.__active = records[key]
+
+    def end_record(self):
+        """Ends filling of the record, current view buffers become active again.
+        """
+        self.__active = self.__buffers[self.__current]
+
+    def has_record(self, record_type, key):
+        """Checks if record with given type and key exists.
+
+        :param record_type: type of the record from RecordTypes
+        :type record_type: int
+        :param key: key of the record
+        :type key: collections.Hashable
+        :return: True if record exists; False otherwise
+        :rtype: bool
+        """
+        return key in self.__records[record_type]
+
+    def append_record(self, record_type, key):
+        """Appends elements of record with given type and key into current view buffers.
+
+        :param record_type: type of the record from RecordTypes
+        :type record_type: int
+        :param key: key of the record
+        :type key: collections.Hashable
+        """
+        for buffer, record_buffer in zip(self.__buffers[self.__current], self.__records[record_type][key]):
+            buffer.extend(record_buffer)
+
+    def delete_records(self, record_type, keys=None):
+        """Deletes records of given type and keys.
+
+        :param record_type: type of the record from RecordTypes
+        :type record_type: int
+        :param keys: keys of the records to delete; if None all records of given type are deleted
+        :type keys: collections.Iterable | None
+        """
+        records = self.__records[record_type]
+
+        if keys is None:
+            if records:
+                records.clear()
+                self.__records_versions[record_type] += 1
+            return
+
+        for key in keys:
+            if key in records:
+                del records[key]
+                self.__records_versions[record_type] += 1
+
+    def purge_records(self, record_type, used_keys):
+        """Deletes all records of given type which keys are not in given used keys.
+
+        :param record_type: type of the record from RecordTypes
+        :type record_type: int
+        :param used_keys: keys of the records which should be kept
+        :type used_keys: set | dict
+        """
+        records = self.__records[record_type]
+
+        for key in [key for key in records if key not in used_keys]:
+            del records[key]
+            self.__records_versions[record_type] += 1
+
+    def get_records_version(self, record_type):
+        """Gets version of records of given type, which changes each time any of the records is deleted.
+
+        :param record_type: type of the record from RecordTypes
+        :type record_type: int
+        :return: version of records
+        :rtype: int
+        """
+        return self.__records_versions[record_type]
+
     def draw_buffers(self, space_3d):
         """Draws buffers of given space. If no space is provided main buffers are drawn.
 
@@ -312,6 +487,82 @@ def draw_buffers(space_3d):
     _views_buffer_handler.draw_buffers(space_3d)
 
 
+def begin_record(record_type, key):
+    """Starts filling of retained record with given type and key. All elements drawn until record is ended are saved into it.
+    If record already exists, it's emptied first.
+
+    :param record_type: type of the record from RecordTypes
+    :type record_type: int
+    :param key: unique key of the record within its type (eg. locator name)
+    :type key: collections.Hashable
+    """
+    _views_buffer_handler.begin_record(record_type, key)
+
+
+def end_record():
+    """Ends filling of the retained record, afterwards elements are again drawn into active buffers.
+    """
+    _views_buffer_handler.end_record()
+
+
+def has_record(record_type, key):
+    """Checks if retained record with given type and key exists.
+
+    :param record_type: type of the record from RecordTypes
+    :type record_type: int
+    :param key: key of the record
+    :type key: collections.Hashable
+    :return: True if record exists; False otherwise
+    :rtype: bool
+    """
+    return _views_buffer_handler.has_record(record_type, key)
+
+
+def append_record(record_type, key):
+    """Appends elements of retained record with given type and key into active buffers.
+
+    :param record_type: type of the record from RecordTypes
+    :type record_type: int
+    :param key: key of the record
+    :type key: collections.Hashable
+    """
+    _views_buffer_handler.append_record(record_type, key)
+
+
+def delete_records(record_type, keys=None):
+    """Deletes retained records, so their elements will be re-calculated on next buffers fill.
+
+    :param record_type: type of the record from RecordTypes
+    :type record_type: int
+    :param keys: keys of the records to delete; if None all records of given type are deleted
+    :type keys: collections.Iterable | None
+    """
+    _views_buffer_handler.delete_records(record_type, keys=keys)
+
+
+def purge_records(record_type, used_keys):
+    """Deletes all retained records of given type, which keys are not in given used keys.
+
+    :param record_type: type of the record from RecordTypes
+    :type record_type: int
+    :param used_keys: keys of the records which should be kept
+    :type used_keys: set | dict
+    """
+    _views_buffer_handler.purge_records(record_type, used_keys)
+
+
+def get_records_version(record_type):
+    """Gets version of retained records of given type, which changes each time any of the records is deleted,
+    so it can be detected that buffers have to be refilled.
+
+    :param record_type: type of the record from RecordTypes
+    :type record_type: int
+    :return: version of records
+    :rtype: int
+    """
+    return _views_buffer_handler.get_records_version(record_type)
+
+
 def set_active_buffers(space_3d):
     """If given space has local view, then sets it as active, otherwise main buffers are set as active.
 
@@ -353,6 +604,21 @@ def append_line_vertex(pos, color, is_strip=False, is_stipple=False):
         append_line_vertex(pos, color, is_stipple=is_stipple)
 
 
+def append_line_strip(positions, colors, is_stipple=False):
+    """Appends lines connecting given points one after another to buffers at once. Similar to GL_LINE_STRIP.
+
+    :param positions: world space positions of the points in array of shape (points count, 3)
+    :type positions: numpy.ndarray
+    :param colors: colors of the points in array of shape (points count, 4) and fromat: (r, g, b, a)
+    :type colors: numpy.ndarray
+    :param is_stipple: should lines be stippled?
+    :type is_stipple: bool
+    """
+    # each inner point is used as end of one line and start of the next one
+    indices = numpy.arange(1, len(positions) * 2 - 1) // 2
+    _views_buffer_handler.append_line_vertices(positions[indices], colors[indices], is_stipple=is_stipple)
+
+
 def append_point_vertex(pos, color, size):
     """Appends point with given position color and size, to buffer
 
@@ -860,17 +1126,14 @@ def draw_shape_curve(curve, stipple, scs_globals):
                   scs_globals.np_connection_base_color.b,
                   1.0)
 
-    real_color = color0
+    positions = numpy.array(curve['curve_points'], dtype=numpy.float32).reshape(-1, 3)
 
-    last_item_i = len(curve['curve_points']) - 1
-    for vec_i, vec in enumerate(curve['curve_points']):
-        if vec_i == int(curve['curve_steps'] / 2 + 1.5):  # if vec_i > curve['curve_steps'] / 2 and switch:
-            real_color = color1
+    color_switch_i = int(curve['curve_steps'] / 2 + 1.5)
+    colors = numpy.empty((len(positions), 4), dtype=numpy.float32)
+    colors[:color_switch_i] = color0
+    colors[color_switch_i:] = color1
 
-        if vec_i == 0 or vec_i == last_item_i:
-            append_line_vertex(vec, real_color, is_stipple=stipple)
-        else:
-            append_line_vertex(vec, real_color, is_strip=True, is_stipple=stipple)
+    append_line_strip(positions, colors, is_stipple=stipple)
 
 
 def draw_text(text, font_id, x, y):
@@ -19,6 +19,8 @@
 # Copyright (C) 2015: SCS Software
 
 _terrain_points = {}
+_terrain_points_version = 0
+"""Incremented on each storage change, so drawing can detect if terrain points have to be refilled."""
 
 
 def add(position, is_visible):
@@ -29,15 +31,31 @@ def add(position, is_visible):
     :param is_visible: boolean indicating wheather mesh belonging terrain point is currently visible
     :type is_visible: bool
     """
+    global _terrain_points_version
+
     key = str(position)
     if key not in _terrain_points:
         _terrain_points[key] = (position, (1, 1, 0, 1) if is_visible else (0.5, 0.5, 0, 1))
+        _terrain_points_version += 1
 
 
 def clear():
     """Clear terrain points storage for drawing.
     """
-    _terrain_points.clear()
+    global _terrain_points_version
+
+    if _terrain_points:
+        _terrain_points.clear()
+        _terrain_points_version += 1
+
+
+def get_version():
+    """Gets version of the storage, which changes each time terrain points are added or cleared.
+
+    :return: version of the storage
+    :rtype: int
+    """
+    return _terrain_points_version
 
 
 def is_emtpy():
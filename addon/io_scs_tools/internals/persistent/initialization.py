@@ -26,6 +26,8 @@ from io_scs_tools.internals.callbacks import open_gl as _open_gl_callback
 from io_scs_tools.internals.callbacks import lighting_east_lock as _lighting_east_lock_callback
 from io_scs_tools.internals.containers import config as _config_container
 from io_scs_tools.internals.connections.wrappers import collection as _connections_wrapper
+from io_scs_tools.internals.persistent import loop_check as _loop_check
+from io_scs_tools.internals.shaders import shader as _shader
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.utils import info as _info_utils
 from io_scs_tools.utils.printout import lprint
@@ -39,6 +41,12 @@ def post_load(scene):
     :param scene: Blender scene
     :type scene: bpy.types.Scene
     """
+    # node tree templates are referencing data of previous blend file
+    _shader.clear_node_tree_templates()
+
+    # tracked objects states are referencing objects of previous blend file
+    _loop_check.reset_tracking()
+
     init_scs_tools()
 
 
@@ -95,6 +95,126 @@ class _Timer:
         return is_updated, is_data_updated, is_scene_updated, is_collections_updated
 
 
+class _TrackedObject:
+    """Last known state of tracked object."""
+
+    __slots__ = ("pointer", "parent_name", "material_ids")
+
+    def __init__(self, pointer, parent_name, material_ids):
+        self.pointer = pointer
+        self.parent_name = parent_name
+        self.material_ids = material_ids
+
+
+class _ObjectTracker:
+    """Class for tracking objects changes from depsgraph updates, so only changed objects have to be checked.
+
+    It holds identity index of already checked objects: name -> pointer, parent name and used material ids.
+    Entries are validated by object pointer, so entry of deleted or renamed object is never used for another object.
+    """
+
+    __index = {}
+    """:type: dict[str, _TrackedObject]"""
+    __updated = {}
+    """Names of objects updated in depsgraph since last check and flag if their materials should be checked."""
+
+    @staticmethod
+    def collect(depsgraph):
+        """Collects objects updated in given depsgraph.
+
+        :param depsgraph: depsgraph from which updates should be collected
+        :type depsgraph: bpy.types.Depsgraph
+        """
+        for update in depsgraph.updates:
+            if isinstance(update.id, bpy.types.Object):
+                name = update.id.original.name
+                check_materials = update.is_updated_geometry or update.is_updated_shading
+                _ObjectTracker.__updated[name] = _ObjectTracker.__updated.get(name, False) or check_materials
+
+    @staticmethod
+    def pop_updated():
+        """Gets objects updated since last call and clears them.
+
+        :return: updated objects and flag if their materials should be checked; key: object name
+        :rtype: dict[str, (bpy.types.Object, bool)]
+        """
+        updated_objs = {}
+        for name, check_materials in _ObjectTracker.__updated.items():
+            obj = bpy.data.objects.get(name)
+            if obj:
+                updated_objs[name] = (obj, check_materials)
+
+        _ObjectTracker.__updated.clear()
+        return updated_objs
+
+    @staticmethod
+    def get(obj):
+        """Gets last known state of given object.
+
+        :param obj: object
+        :type obj: bpy.types.Object
+        :return: last known state; None if object wasn't yet tracked
+        :rtype: _TrackedObject | None
+        """
+        entry = _ObjectTracker.__index.get(obj.name)
+        if entry and entry.pointer == obj.as_pointer():
+            return entry
+        return None
+
+    @staticmethod
+    def set(obj, parent_name, material_ids):
+        """Sets last known state of given object.
+
+        :param obj: object
+        :type obj: bpy.types.Object
+        :param parent_name: name of the parent, empty string if object has no parent
+        :type parent_name: str
+        :param material_ids: ids of used materials
+        :type material_ids: frozenset[str]
+        """
+        _ObjectTracker.__index[obj.name] = _TrackedObject(obj.as_pointer(), parent_name, material_ids)
+
+    @staticmethod
+    def remove(name):
+        """Removes state of object with given name.
+
+        :param name: name of the object
+        :type name: str
+        """
+        if name in _ObjectTracker.__index:
+            del _ObjectTracker.__index[name]
+
+    @staticmethod
+    def prune():
+        """Removes states of objects which don't exist anymore."""
+        for name in [name for name in _ObjectTracker.__index if name not in bpy.data.objects]:
+            del _ObjectTracker.__index[name]
+
+    @staticmethod
+    def clear():
+        """Clears all states and collected updates."""
+        _ObjectTracker.__index.clear()
+        _ObjectTracker.__updated.clear()
+
+
+def reset_tracking():
+    """Resets tracking of objects changes. Should be used when new blend file is loaded."""
+    _ObjectTracker.clear()
+
+
+@persistent
+def collect_updated_objects(scene):
+    """Collects objects updated in last depsgraph evaluation, so object data check has to inspect only them.
+
+    :param scene: current scene
+    :type scene: bpy.types.Scene
+    """
+
+    depsgraph = bpy.context.view_layer.depsgraph
+    if depsgraph:
+        _ObjectTracker.collect(depsgraph)
+
+
 @persistent
 def object_data_check(scene):
     # during rendering in Blender active_object doesn't exists so ignore this case
@@ -123,166 +243,166 @@ def object_data_check(scene):
     if objs_updated or scenes_updated or collections_updated:
         _preview_models.fix_visibilites()
 
-    # NEW/COPY
-    if len(scene.objects) > scene.scs_cached_num_objects:
+    # GATHER OBJECTS TO CHECK
+    # only objects updated in depsgraph are checked, however active object is checked in any case,
+    # as not all of the changes are reported by depsgraph (e.g. rename from panel)
+    objs_to_check = _ObjectTracker.pop_updated()
 
-        scene.scs_cached_num_objects = len(scene.objects)
+    if active_obj and active_obj.name not in objs_to_check:
+        objs_to_check[active_obj.name] = (active_obj, meshes_updated or objs_updated)
 
-        if len(selected_objs) > 0:
+    num_objects = len(scene.objects)
+    if num_objects > scene.scs_cached_num_objects:
+        for obj in selected_objs:
+            objs_to_check[obj.name] = (obj, True)
 
-            # create real selected list
-            # (in case that one of selected objects is parent then children are not in this list)
-            real_sel_objs = selected_objs.copy()
-            for sel_obj in selected_objs:
-                for child in sel_obj.children:
-                    if child.select_get():
-                        real_sel_objs.append(child)
+    objects_deleted = num_objects < scene.scs_cached_num_objects
+    scene.scs_cached_num_objects = num_objects
 
-            if real_sel_objs[0].scs_props.object_identity != "":
+    __check_objects__(list(objs_to_check.values()), objects_deleted)
 
-                old_objects = []
-                for obj in real_sel_objs:
-                    old_objects.append(bpy.data.objects[obj.scs_props.object_identity])
-                    obj.scs_props.object_identity = obj.name
+    # ACTIVE SCS ROOT CHANGED
+    if active_obj:
 
-                __objects_copy__(old_objects, real_sel_objs)
+        active_scs_root = _object_utils.get_scs_root(active_obj)
+        if active_scs_root and scene.scs_cached_active_scs_root != active_scs_root.name:
 
-                lprint("D ---> COPY of the objects: %s", (len(real_sel_objs),))
-                return
-            else:
+            __active_scs_root_change__(active_scs_root)
 
-                for obj in real_sel_objs:
-                    obj.scs_props.object_identity = obj.name
+            scene.scs_cached_active_scs_root = active_scs_root.name
+            lprint("D ---> ACTIVE SCS ROOT CHANGE: %r", (active_scs_root.name,))
 
-                lprint("D ---> NEW objects: %s", (len(real_sel_objs),))
-                return
 
-    # DELETE
-    if len(scene.objects) < scene.scs_cached_num_objects:
+def __check_objects__(objs_to_check, objects_deleted):
+    """Checks given objects against their last known state and dispatches hookup functions for detected changes.
 
-        scene.scs_cached_num_objects = len(scene.objects)
+    :param objs_to_check: objects to check and flag if their materials should be checked
+    :type objs_to_check: list[(bpy.types.Object, bool)]
+    :param objects_deleted: flag indicating that some objects were deleted
+    :type objects_deleted: bool
+    """
 
-        unparented_objects = []
-        for obj in scene.objects:
+    # NEW/COPY/RENAME
+    # identities are fixed first, so parent checks below already see new names
+    new_objs = []
+    old_objs = []
+    copied_objs = []
+    for obj, check_materials in objs_to_check:
 
-            if obj.scs_props.parent_identity != "" and obj.scs_props.parent_identity not in bpy.data.objects:
-                obj.scs_props.parent_identity = ""
-                unparented_objects.append(obj)
+        obj_identity = obj.scs_props.object_identity
+        if obj.name == obj_identity:
+            continue
 
-            obj.scs_cached_num_children = len(obj.children)
+        if obj_identity == "":
 
-        __objects_delete__(unparented_objects)
+            obj.scs_props.object_identity = obj.name
+            new_objs.append(obj)
+            continue
 
-        lprint("D ---> DELETE of the objects!")
-        return
+        # copy still has identity of the object it was created from, while original object keeps it's identity
+        old_obj = bpy.data.objects.get(obj_identity)
+        if old_obj and old_obj != obj and old_obj.scs_props.object_identity == obj_identity:
 
-    # if there is no active object then all of rest actions can not be executed at all
-    if active_obj:
+            obj.scs_props.object_identity = obj.name
+            old_objs.append(old_obj)
+            copied_objs.append(obj)
+            continue
 
-        # RENAME
-        active_obj_identity = active_obj.scs_props.object_identity
-        if active_obj.name != active_obj_identity and active_obj_identity != "":
+        old_name = obj_identity
+        new_name = obj.name
 
-            old_name = active_obj_identity
-            new_name = active_obj.name
+        obj.scs_props.object_identity = obj.name
+        _fix_children(obj)
+        _ObjectTracker.remove(old_name)
 
-            active_obj.scs_props.object_identity = active_obj.name
-            _fix_children(active_obj)
+        __object_rename__(old_name, new_name)
 
-            __object_rename__(old_name, new_name)
+        if old_name in bpy.data.objects:
 
-            if old_name in bpy.data.objects:
+            lprint("D ---> NAME SWITCHING")
+            bpy.data.objects[old_name].scs_props.object_identity = old_name
+            _fix_children(bpy.data.objects[old_name])
 
-                lprint("D ---> NAME SWITCHING")
-                bpy.data.objects[old_name].scs_props.object_identity = old_name
-                _fix_children(bpy.data.objects[old_name])
+            # switching names causes invalid connections data so recalculate curves for these objects
+            _connections_wrapper.force_recalculate([bpy.data.objects[old_name], bpy.data.objects[new_name]])
 
-                # switching names causes invalid connections data so recalculate curves for these objects
-                _connections_wrapper.force_recalculate([bpy.data.objects[old_name], bpy.data.objects[new_name]])
+        lprint("D ---> RENAME of the object: %r -> %r", (old_name, new_name))
 
-            lprint("D ---> RENAME of the active object!")
-            return
+    if len(copied_objs) > 0:
+        __objects_copy__(old_objs, copied_objs)
+        lprint("D ---> COPY of the objects: %s", (len(copied_objs),))
 
-        # RE/PARENT
-        active_obj_children_count = len(active_obj.children)
-        if active_obj_children_count > active_obj.scs_cached_num_children:
+    if len(new_objs) > 0:
+        lprint("D ---> NEW objects: %s", (len(new_objs),))
 
-            active_obj.scs_cached_num_children = active_obj_children_count
+    # RE/PARENT/UNPARENT & MATERIAL ASSIGNEMENT ACTION
+    reparented_objs = {}
+    unparented_objs = []
+    for obj, check_materials in objs_to_check:
 
-            for obj in selected_objs:
-                if obj != active_obj:
+        entry = _ObjectTracker.get(obj)
+        parent_name = obj.parent.name if obj.parent else ""
+
+        if entry is None or entry.parent_name != parent_name:
+
+            parent_identity = obj.scs_props.parent_identity
+            if parent_name != parent_identity:
+
+                if obj.parent:
 
                     _fix_ex_parent(obj)
-                    obj.scs_props.parent_identity = active_obj.name
-                    obj.scs_cached_num_children = len(obj.children)
+                    obj.scs_props.parent_identity = parent_name
 
-            __objects_reparent__(active_obj, selected_objs)
+                    if parent_name not in reparented_objs:
+                        reparented_objs[parent_name] = []
+                    reparented_objs[parent_name].append(obj)
 
-            lprint("D ---> RE/PARENT selected objects to active object %s", (len(selected_objs),))
-            return
+                elif parent_identity not in bpy.data.objects:  # parent was deleted
 
-        if active_obj.parent and active_obj.parent.name != active_obj.scs_props.parent_identity:
+                    obj.scs_props.parent_identity = ""
+                    unparented_objs.append(obj)
 
-            _fix_ex_parent(active_obj)
-            active_obj.scs_props.parent_identity = active_obj.parent.name
+                else:
 
-            __objects_reparent__(active_obj.parent, [active_obj])
+                    _fix_ex_parent(obj)
+                    obj.scs_props.parent_identity = ""
 
-            lprint("D ---> RE/PARENT active object to some other parent")
-            return
+                    lprint("D ---> UNPARENT object: %r", (obj.name,))
 
-        # UNPARENT
-        if not active_obj.select_get() and not active_obj.parent and active_obj.scs_props.parent_identity != "":
+        if entry is None or check_materials:
 
-            _fix_ex_parent(active_obj)
-            active_obj.scs_props.parent_identity = ""
+            mats_ids = frozenset(str(slot.material.scs_props.id) for slot in obj.material_slots if slot.material)
+            cached_mats_ids = entry.material_ids if entry else frozenset(obj.scs_cached_materials_ids.keys())
 
-            lprint("D ---> UNPARENT active object in panel")
-            return
+            if mats_ids != cached_mats_ids:
+                obj.scs_cached_materials_ids = dict.fromkeys(mats_ids, 1)
 
-        if ((not active_obj.parent and active_obj.scs_props.parent_identity != "") or
-                (len(selected_objs) > 0 and not selected_objs[0].parent and selected_objs[0].scs_props.parent_identity != "")):
+                __material_assignement__(obj, mats_ids - cached_mats_ids, cached_mats_ids - mats_ids)
 
-            for obj in selected_objs:
+                lprint("D ---> MATERIAL ASSIGNEMENT CHANGED: %r", (obj.name,))
 
-                _fix_ex_parent(obj)
-                obj.scs_props.parent_identity = ""
+        else:
 
-            lprint("D ---> UNPARENT selected objects in 3D view: %s", (len(selected_objs),))
-            return
+            mats_ids = entry.material_ids
 
-        # ACTIVE SCS ROOT CHANGED
-        active_scs_root = _object_utils.get_scs_root(active_obj)
-        if active_scs_root and scene.scs_cached_active_scs_root != active_scs_root.name:
+        _ObjectTracker.set(obj, parent_name, mats_ids)
 
-            __active_scs_root_change__(active_scs_root)
+    for parent_name, objs in reparented_objs.items():
 
-            scene.scs_cached_active_scs_root = active_scs_root.name
-            lprint("D ---> ACTIVE SCS ROOT CHANGE: %r", (active_scs_root.name,))
-            return
-
-        # MATERIAL ASSIGNEMENT ACTION
-        if meshes_updated or objs_updated:
-
-            mats_ids = {}
-            new_mats = {}
-            removed_mats = dict(active_obj.scs_cached_materials_ids)
-            for slot in active_obj.material_slots:
-                if slot.material:
-                    curr_id = str(slot.material.scs_props.id)
-                    mats_ids[curr_id] = 1
-                    if curr_id not in active_obj.scs_cached_materials_ids:  # if not in cached -> it's newly assigned
-                        new_mats[curr_id] = 1
-                    elif curr_id in removed_mats:  # if in cached remove it from dictionary which stores removed materials
-                        del removed_mats[curr_id]
-
-            if len(new_mats) > 0 or len(removed_mats) > 0:
-                active_obj.scs_cached_materials_ids = mats_ids
-
-                __material_assignement__(active_obj, new_mats.keys(), removed_mats.keys())
-
-                lprint("D ---> MATERIAL ASSIGNEMENT CHANGED")
-                return
+        parent = bpy.data.objects[parent_name]
+        parent.scs_cached_num_children = len(parent.children)
+
+        __objects_reparent__(parent, objs)
+
+        lprint("D ---> RE/PARENT objects to %r: %s", (parent_name, len(objs)))
+
+    if objects_deleted or len(unparented_objs) > 0:
+
+        _ObjectTracker.prune()
+
+        __objects_delete__(unparented_objs)
+
+        lprint("D ---> DELETE of the objects!")
 
 
 def __active_scs_root_change__(new_scs_root_obj):
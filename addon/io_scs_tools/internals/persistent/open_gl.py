@@ -88,6 +88,7 @@ def post_undo(scene):
     :param scene: current scene
     :type scene: bpy.type.Scene
     """
+    _open_gl_core.invalidate_buffers()
     post_depsgraph(scene)
 
 
@@ -98,6 +99,7 @@ def post_redo(scene):
     :param scene: current scene
     :type scene: bpy.type.Scene
     """
+    _open_gl_core.invalidate_buffers()
     post_depsgraph(scene)
 
 
@@ -116,16 +118,19 @@ def post_frame_change(scene):
     # on scene change we need to refill our buffers, as different objects will be displayed
     if scene != _cache[_LAST_SCENE]:
         _cache[_LAST_SCENE] = scene
+        _open_gl_core.invalidate_buffers()
         do_update = True
-    # take over during animation playback, where late update should be initiated each time objects are updated
+    # take over during animation playback, where late update should be initiated each time displayed locators are updated
     elif bpy.context.screen and bpy.context.screen.is_animation_playing and bpy.context.view_layer.depsgraph.id_type_updated('OBJECT'):
-        do_update = True
+        depsgraph = bpy.context.view_layer.depsgraph
+        do_update = _open_gl_core.invalidate_buffers([update.id.original.name for update in depsgraph.updates
+                                                      if isinstance(update.id, bpy.types.Object)])
 
     if do_update and not _get_scs_globals().import_in_progress:
         _connections_wrapper.invalidate()
 
         # in case of playback we don't want to slow down FPS, empty buffers and wait for delayed update to do it's job
-        _open_gl_core.fill_buffers([])
+        _open_gl_core.clear_buffers()
 
         # NOTE: while animation is playing context.visible_objects for some reason
         # returns only visible objects of current 3d view if user mouse is over 3d view.
@@ -158,7 +163,16 @@ def post_depsgraph(scene):
         # SCENE not updated, collections did not get hidden or shown in outliner
         return
 
-    _connections_wrapper.invalidate()
+    # invalidate retained drawing of changed objects, on scene update (eg. display settings change) invalidate everything
+    if depsgraph is None or depsgraph.id_type_updated('SCENE'):
+        locators_changed = _open_gl_core.invalidate_buffers()
+    else:
+        locators_changed = _open_gl_core.invalidate_buffers([update.id.original.name for update in depsgraph.updates
+                                                             if isinstance(update.id, bpy.types.Object)])
+
+    # connections can change only with displayed locators
+    if locators_changed:
+        _connections_wrapper.invalidate()
 
     # if post graph get's called with global context only (e.g. blend data changes in timers),
     # then screen is not availabe nor is visible_objects variable, in that case use all view layer objects
@@ -174,10 +188,11 @@ def post_depsgraph(scene):
 
     # if optimized do late connections update and refill, otherwise prepare connections for filling into buffers
     if scs_globals.optimized_connections_drawing:
-        _DelayedUpdate.schedule(0.1, objects_list)
+        if locators_changed:
+            _DelayedUpdate.schedule(0.1, objects_list)
     else:
         _connections_wrapper.update_for_redraw()
 
     # fill buffers in any case, when connections are optimized, only locators will be filled to buffers,
-    # otherwise everything will be filled.
+    # otherwise everything will be filled. Fill is skipped if nothing drawn was changed.
     _open_gl_core.fill_buffers(objects_list)
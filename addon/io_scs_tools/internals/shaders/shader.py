@@ -19,27 +19,285 @@
 # Copyright (C) 2015-2021: SCS Software
 
 import bpy
+from functools import lru_cache
 from io_scs_tools.utils.printout import lprint
 
+_ID_POINTER_COLLECTIONS = {
+    "NODETREE": "node_groups",
+    "IMAGE": "images",
+}
+"""Blender data collections of ID types which can be referenced by nodes of node tree templates."""
 
-def setup_nodes(material, effect, attr_dict, tex_dict, tex_settings_dict, recreate):
-    """Setup material nodes to correctly present given shader from game engine.
 
-    :param material: blender material which should be set for proper 3D view visualization
-    :type material: bpy.types.Material
-    :param effect: full effect name for shader which should be used in this material
+class _NodeTreeTemplate:
+    """Snapshot of initialized shader node tree, used to recreate the same node tree in other materials.
+
+    Nodes are stored with all their writable properties and sockets default values, links with indices of their sockets.
+    Referenced node groups and images are stored by their name and memory address, so template can be validated
+    against current Blender data before use.
+    """
+
+    __slots__ = ("nodes", "links", "id_refs")
+
+    __SKIPPED_NODE_PROPS = {"rna_type", "name", "location", "parent", "select", "dimensions", "node_tree"}
+    """Node properties that are never copied or are copied explicitly."""
+
+    def __init__(self):
+        self.nodes = []
+        """List of (bl_idname, name, node_tree, properties, inputs values, outputs values, parent name, location)."""
+        self.links = []
+        """List of (from node name, from socket index, to node name, to socket index)."""
+        self.id_refs = {}
+        """Referenced IDs: (collection name, ID name) mapped to memory address of the ID."""
+
+    def __get_id_ref(self, value):
+        """Gets reference of given ID and remembers it for validation.
+
+        :param value: blender ID
+        :type value: bpy.types.ID
+        :return: tuple of (collection name, ID name)
+        :rtype: tuple[str, str]
+        """
+
+        if value.id_type not in _ID_POINTER_COLLECTIONS or value.library:
+            raise TypeError("Unsupported ID %r referenced in shader node tree!" % value.name)
+
+        id_ref = (_ID_POINTER_COLLECTIONS[value.id_type], value.name)
+        self.id_refs[id_ref] = value.as_pointer()
+        return id_ref
+
+    @staticmethod
+    def __get_sockets_values(sockets):
+        """Gets default values and visibility of given sockets.
+
+        :param sockets: node inputs or outputs
+        :type sockets: bpy.types.NodeInputs | bpy.types.NodeOutputs
+        :return: list of (default value or None, hide)
+        :rtype: list[tuple]
+        """
+
+        values = []
+        for socket in sockets:
+
+            value = getattr(socket, "default_value", None)
+            if value is not None and not isinstance(value, (bool, int, float, str)):
+                value = tuple(value)
+
+            values.append((value, socket.hide))
+
+        return values
+
+    @staticmethod
+    def __set_sockets_values(sockets, values):
+        """Sets default values and visibility of given sockets.
+
+        :param sockets: node inputs or outputs
+        :type sockets: bpy.types.NodeInputs | bpy.types.NodeOutputs
+        :param values: list of (default value or None, hide)
+        :type values: list[tuple]
+        """
+
+        for socket, (value, hide) in zip(sockets, values):
+
+            if value is not None:
+                socket.default_value = value
+
+            if hide:
+                socket.hide = hide
+
+    def capture(self, node_tree):
+        """Captures given node tree into this template.
+
+        :param node_tree: initialized node tree
+        :type node_tree: bpy.types.NodeTree
+        :raise TypeError: if node tree is using data which can't be stored in template
+        """
+
+        sockets_indices = {}
+
+        for node in node_tree.nodes:
+
+            props = []
+            for prop in node.bl_rna.properties:
+
+                prop_id = prop.identifier
+                if prop.is_readonly or prop_id in self.__SKIPPED_NODE_PROPS or prop_id.startswith("bl_") or prop.type == "COLLECTION":
+                    continue
+
+                value = getattr(node, prop_id)
+                if prop.type == "POINTER":
+                    if value is not None:
+                        value = self.__get_id_ref(value)
+                elif getattr(prop, "is_array", False):
+                    value = tuple(value)
+
+                props.append((prop_id, prop.type == "POINTER", value))
+
+            group_ref = None
+            if getattr(node, "node_tree", None) is not None:
+                group_ref = self.__get_id_ref(node.node_tree)
+
+            self.nodes.append((node.bl_idname,
+                               node.name,
+                               group_ref,
+                               props,
+                               self.__get_sockets_values(node.inputs),
+                               self.__get_sockets_values(node.outputs),
+                               node.parent.name if node.parent else None,
+                               tuple(node.location)))
+
+            for i, socket in enumerate(node.inputs):
+                sockets_indices[socket.as_pointer()] = i
+            for i, socket in enumerate(node.outputs):
+                sockets_indices[socket.as_pointer()] = i
+
+        for link in node_tree.links:
+            self.links.append((link.from_node.name,
+                               sockets_indices[link.from_socket.as_pointer()],
+                               link.to_node.name,
+                               sockets_indices[link.to_socket.as_pointer()]))
+
+    def is_valid(self):
+        """Checks if all the IDs referenced by template still exist.
+
+        :return: True if template can be used; False otherwise
+        :rtype: bool
+        """
+
+        for (collection_name, id_name), pointer in self.id_refs.items():
+
+            blender_id = getattr(bpy.data, collection_name).get(id_name)
+            if blender_id is None or blender_id.as_pointer() != pointer:
+                return False
+
+        return True
+
+    def apply(self, node_tree):
+        """Creates nodes and links of this template in given empty node tree.
+
+        :param node_tree: empty node tree
+        :type node_tree: bpy.types.NodeTree
+        """
+
+        nodes = node_tree.nodes
+
+        def resolve(id_ref):
+            return getattr(bpy.data, id_ref[0])[id_ref[1]]
+
+        for bl_idname, name, group_ref, props, inputs_values, outputs_values, __, __ in self.nodes:
+
+            node = nodes.new(bl_idname)
+            node.name = name
+
+            # group has to be set first, as it creates sockets of the node
+            if group_ref is not None:
+                node.node_tree = resolve(group_ref)
+
+            for prop_id, is_pointer, value in props:
+                setattr(node, prop_id, resolve(value) if is_pointer and value is not None else value)
+
+            self.__set_sockets_values(node.inputs, inputs_values)
+            self.__set_sockets_values(node.outputs, outputs_values)
+
+        # location is relative to parent, so it can be set only after parenting
+        for __, name, __, __, __, __, parent_name, location in self.nodes:
+
+            node = nodes[name]
+            if parent_name is not None:
+                node.parent = nodes[parent_name]
+
+            node.location = location
+
+        links = node_tree.links
+        for from_node_name, from_socket_i, to_node_name, to_socket_i in self.links:
+            links.new(nodes[from_node_name].outputs[from_socket_i], nodes[to_node_name].inputs[to_socket_i])
+
+
+class _NodeTreeTemplates:
+    """Class for caching of initialized shader node trees per shader and its flavors.
+
+    When materials nodes are recreated, shader initialization and flavors setup is done only on first material
+    with given shader and flavors, every other material gets its node tree created from the template.
+    """
+
+    __templates = {}
+    """Templates per shader and flavors, None for combinations that can't be templated.
+
+    :type: dict[tuple, _NodeTreeTemplate | None]
+    """
+
+    @staticmethod
+    def __get_key(shader_module, flavors_dict):
+        """Gets template key for given shader and flavors.
+
+        :return: template key or None if flavors can't be used in key
+        :rtype: tuple | None
+        """
+        key = (shader_module, tuple(flavors_dict.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def init(node_tree, shader_module, flavors_dict):
+        """Initializes given empty node tree with given shader and flavors, from template if possible.
+
+        :param node_tree: empty node tree
+        :type node_tree: bpy.types.NodeTree
+        :param shader_module: shader class
+        :type shader_module: class
+        :param flavors_dict: shader flavors which should be set; entry: (flavor_type: flavor_data)
+        :type flavors_dict: dict
+        """
+
+        templates = _NodeTreeTemplates.__templates
+        key = _NodeTreeTemplates.__get_key(shader_module, flavors_dict)
+
+        template = templates.get(key)
+        if template is not None and template.is_valid():
+
+            try:
+                template.apply(node_tree)
+                return
+            except (TypeError, ValueError, KeyError, AttributeError, RuntimeError) as e:
+                lprint("D Node tree template of shader %r failed, initializing node tree directly: %s", (shader_module.get_name(), e))
+                node_tree.nodes.clear()
+                templates[key] = None
+
+        shader_module.init(node_tree)
+        _set_flavors(node_tree, shader_module, flavors_dict)
+
+        # capture template on first use or when referenced data were changed
+        if key is None or (key in templates and templates[key] is None):
+            return
+
+        template = _NodeTreeTemplate()
+        try:
+            template.capture(node_tree)
+        except (TypeError, KeyError, AttributeError) as e:
+            lprint("D Node tree of shader %r can't be used as template: %s", (shader_module.get_name(), e))
+            template = None
+
+        templates[key] = template
+
+    @staticmethod
+    def clear():
+        """Removes all the templates."""
+        _NodeTreeTemplates.__templates.clear()
+
+
+@lru_cache(maxsize=None)
+def _get_flavors(effect):
+    """Gets possible flavors from effect name.
+
+    :param effect: full effect name
     :type effect: str
-    :param attr_dict: shader attributes which should be set on given material; entry: (attribute_type: attr_value)
-    :type attr_dict: dict
-    :param tex_dict: shader textures which should be set on given material; entry: (texture_type: texture object)
-    :type tex_dict: dict
-    :param tex_settings_dict: shader texture settings which should be set on given material; entry: (texture_type: TOBJ settings string)
-    :type tex_settings_dict: dict
-    :param recreate: flag indicating if shader nodes should be recreated. Should be triggered if effect name changes.
-    :type recreate: bool
+    :return: flavor types in order they should be set
+    :rtype: tuple[str]
     """
 
-    # gather possible flavors from effect name
     flavors = {}
     if effect.endswith(".a") or ".a." in effect:
         flavors["alpha_test"] = True
@@ -107,6 +365,55 @@ def setup_nodes(material, effect, attr_dict, tex_dict, tex_settings_dict, recrea
     if effect.endswith(".flipsheet") or ".flipsheet." in effect:
         flavors["flipsheet"] = True
 
+    return tuple(flavors)
+
+
+def _set_flavors(node_tree, shader_module, flavors_dict):
+    """Sets given flavors to node tree of given shader.
+
+    :param node_tree: node tree of the shader
+    :type node_tree: bpy.types.NodeTree
+    :param shader_module: shader class
+    :type shader_module: class
+    :param flavors_dict: shader flavors which should be set; entry: (flavor_type: flavor_data)
+    :type flavors_dict: dict
+    """
+
+    for flavor_type in flavors_dict:
+        shader_set_flavor = getattr(shader_module, "set_" + flavor_type + "_flavor", None)
+        if shader_set_flavor:
+            shader_set_flavor(node_tree, flavors_dict[flavor_type])
+        else:
+            lprint("D Unsupported set_flavor with type %r called on shader %r", (flavor_type, shader_module.get_name()))
+
+
+def clear_node_tree_templates():
+    """Clears cached node tree templates and parsed effect flavors.
+    Should be called whenever shaders implementation or Blender data can change (e.g. addon reload or file load).
+    """
+    _NodeTreeTemplates.clear()
+    _get_flavors.cache_clear()
+
+
+def setup_nodes(material, effect, attr_dict, tex_dict, tex_settings_dict, recreate):
+    """Setup material nodes to correctly present given shader from game engine.
+
+    :param material: blender material which should be set for proper 3D view visualization
+    :type material: bpy.types.Material
+    :param effect: full effect name for shader which should be used in this material
+    :type effect: str
+    :param attr_dict: shader attributes which should be set on given material; entry: (attribute_type: attr_value)
+    :type attr_dict: dict
+    :param tex_dict: shader textures which should be set on given material; entry: (texture_type: texture object)
+    :type tex_dict: dict
+    :param tex_settings_dict: shader texture settings which should be set on given material; entry: (texture_type: TOBJ settings string)
+    :type tex_settings_dict: dict
+    :param recreate: flag indicating if shader nodes should be recreated. Should be triggered if effect name changes.
+    :type recreate: bool
+    """
+
+    flavors = dict.fromkeys(_get_flavors(effect), True)
+
     __setup_nodes__(material, effect, attr_dict, tex_dict, tex_settings_dict, {}, flavors, recreate)
 
 
@@ -162,6 +469,46 @@ def set_uv(material, tex_type, uv_layer, tex_coord):
     :type tex_coord: int
     """
 
+    if __is_valid_uv__(material, tex_type, tex_coord):
+        __setup_nodes__(material, material.scs_props.mat_effect_name, {}, {}, {}, {tex_type: uv_layer}, {}, False)
+
+
+def update_nodes(material, attr_dict, tex_dict, tex_settings_dict, uvs_dict):
+    """Set attributes, textures, texture settings and UV layers to material with one update of its nodes.
+
+    :param material: blender material
+    :type material: bpy.types.Material
+    :param attr_dict: shader attributes to set; entry: (attribute_type: attr_value)
+    :type attr_dict: dict
+    :param tex_dict: shader textures to set; entry: (texture_type: texture image)
+    :type tex_dict: dict
+    :param tex_settings_dict: shader texture settings to set; entry: (texture_type: TOBJ settings string)
+    :type tex_settings_dict: dict
+    :param uvs_dict: uv layers to set; entry: (texture_type: (uv layer name, index of tex_coord))
+    :type uvs_dict: dict[str, (str, int)]
+    """
+
+    valid_uvs_dict = {}
+    for tex_type, (uv_layer, tex_coord) in uvs_dict.items():
+        if __is_valid_uv__(material, tex_type, tex_coord):
+            valid_uvs_dict[tex_type] = uv_layer
+
+    __setup_nodes__(material, material.scs_props.mat_effect_name, attr_dict, tex_dict, tex_settings_dict, valid_uvs_dict, {}, False)
+
+
+def __is_valid_uv__(material, tex_type, tex_coord):
+    """Checks if given tex_coord can be visualized on given texture type of material.
+
+    :param material: blender material
+    :type material: bpy.types.Material
+    :param tex_type: type of SCS texture (one of: bpy.types.Material.scs_props.get_texture_types().keys())
+    :type tex_type: str
+    :param tex_coord: index of tex_coord this texture uses
+    :type tex_coord: int
+    :return: True if uv layer of this tex_coord should be set to shader; False otherwise
+    :rtype: bool
+    """
+
     is_valid_input = True
 
     # special validity check for truckpaint shader
@@ -184,8 +531,7 @@ def set_uv(material, tex_type, uv_layer, tex_coord):
             if tex_coord != 0:
                 is_valid_input = False
 
-    if is_valid_input:
-        __setup_nodes__(material, material.scs_props.mat_effect_name, {}, {}, {}, {tex_type: uv_layer}, {}, False)
+    return is_valid_input
 
 
 def __setup_nodes__(material, effect, attr_dict, tex_dict, tex_settings_dict, uvs_dict, flavors_dict, recreate):
@@ -219,18 +565,12 @@ def __setup_nodes__(material, effect, attr_dict, tex_dict, tex_settings_dict, uv
 
     node_tree = material.node_tree
 
-    # recreate if specified
+    # recreate if specified, flavors are set first so any attributes changing flavor part of shader can take effect
     if recreate:
         __clean_node_tree__(node_tree)
-        shader_module.init(node_tree)
-
-    # set flavors first so any attributes changing flavor part of shader can take effect
-    for flavor_type in flavors_dict:
-        shader_set_flavor = getattr(shader_module, "set_" + flavor_type + "_flavor", None)
-        if shader_set_flavor:
-            shader_set_flavor(node_tree, flavors_dict[flavor_type])
-        else:
-            lprint("D Unsupported set_flavor with type %r called on shader %r", (flavor_type, shader_module.get_name()))
+        _NodeTreeTemplates.init(node_tree, shader_module, flavors_dict)
+    else:
+        _set_flavors(node_tree, shader_module, flavors_dict)
 
     # set attributes
     for attr_type in attr_dict:
@@ -120,6 +120,46 @@ class SectionData(object):
         return False
 
 
+class StreamData(object):
+    """Packed data of homogeneous PIX data block (PIX files):
+    values (array)\t- Flat typed buffer with values of all data lines (mandatory)\n
+    stride (int)\t- Number of values in one data line (mandatory)
+
+    Behaves as read-only sequence of data lines, where each line is given as a new list,
+    so it can be used instead of SectionData.data list of lists.
+    """
+    _type_ = "stream_data"
+
+    def __init__(self, values, stride):
+        self.values = values
+        self.stride = stride
+
+    def __len__(self):
+        return len(self.values) // self.stride
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("stream data index out of range")
+
+        start = index * self.stride
+        return self.values[start:start + self.stride].tolist()
+
+    def __iter__(self):
+        values = self.values.tolist()
+        stride = self.stride
+        for start in range(0, len(values), stride):
+            yield values[start:start + stride]
+
+    def __repr__(self):
+        return "StreamData(%r, stride=%i, lines=%i)" % (self.values.typecode, self.stride, len(self))
+
+
 class UnitData(object):
     """Unit data structure (SII files):
     type (str)\t- Type of the Unit (mandatory)\n
@@ -24,6 +24,7 @@ import numpy
 import os
 import subprocess
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha1
 from sys import platform
 from time import time
@@ -38,8 +39,10 @@ from io_scs_tools.internals.containers import pix as _pix_container
 from io_scs_tools.internals.containers import sii as _sii_container
 from io_scs_tools.internals.containers.tobj import TobjContainer as _TobjContainer
 from io_scs_tools.operators.bases.export import SCSExportHelper as _SCSExportHelper
+from io_scs_tools.utils import image as _image_utils
 from io_scs_tools.utils import name as _name_utils
 from io_scs_tools.utils import object as _object_utils
+from io_scs_tools.utils import packing as _packing_utils
 from io_scs_tools.utils import path as _path_utils
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.utils.printout import lprint
@@ -1181,21 +1184,6 @@ class ConversionHelper:
         bl_description = "Pack converted sources to mod package and copy it to mod destination path.\n" \
                          "Depending on auto settings this operator will also execute clean, export and convert before packing."
 
-        @staticmethod
-        def get_zipfile_path(zipfile_originpath, abs_path):
-            """Extract zipfile path, do conversion to proper slashes as zipfile namelist
-            is returning only normal slashes even on windows and as last remove leading slash
-            as zipfile namelist again doesn't have it.
-
-            :param zipfile_originpath: path to directory where root of zipfile is (generally this should be some parent folder of second argument)
-            :type zipfile_originpath: str
-            :param abs_path: absolute path of file for which zipfile path shall be returned
-            :type abs_path: str
-            :return: correct zipfile path for given absolute path relative to irigin path
-            :rtype: str
-            """
-            return abs_path.replace(zipfile_originpath, "").replace("\\", "/").lstrip("/")
-
         @classmethod
         def poll(cls, context):
             return context.scene is not None
@@ -1258,8 +1246,9 @@ class ConversionHelper:
             if os.path.isdir(mod_filepath_as_dir):
                 _path_utils.rmtree(mod_filepath_as_dir)
 
-            # make sure previous ZIP file is not present
-            if os.path.isfile(mod_filepath):
+            # make sure previous ZIP file is not present, unless it will be reused by incremental packing
+            if os.path.isfile(mod_filepath) and not (scs_globals.conv_hlpr_incremental_packing and
+                                                     scs_globals.conv_hlpr_mod_compression != _CONV_HLPR_consts.NoZip):
                 os.remove(mod_filepath)
 
             # do copy or zipping
@@ -1277,45 +1266,21 @@ class ConversionHelper:
 
             else:
 
-                from zipfile import ZipFile
-
-                with ZipFile(mod_filepath, 'w') as myzip:
-
-                    for converted_dir in os.listdir(rsrc_path):  # use old conversion tools behaviour and pack everything that is in rsrc
-
-                        curr_dir = os.path.join(os.path.join(rsrc_path, converted_dir), "@cache")
-                        if not os.path.isdir(curr_dir):
-                            continue
-
-                        for root, dirs, files in os.walk(curr_dir):
-
-                            # ignore packing if no files in current dir
-                            if len(files) <= 0:
-                                continue
-
-                            # write directories to zip
-                            for directory in dirs:
-
-                                abs_dir = os.path.join(root, directory)
-                                archive_dir = self.get_zipfile_path(curr_dir, abs_dir)
-
-                                if archive_dir + "/" in myzip.namelist():
-                                    lprint("D Archive name %r already exists, ignoring it!" % archive_dir)
-                                    continue
-
-                                myzip.write(abs_dir, archive_dir, compress_type=int(scs_globals.conv_hlpr_mod_compression))
+                converted_dirs = []
+                for converted_dir in os.listdir(rsrc_path):  # use old conversion tools behaviour and pack everything that is in rsrc
 
-                            # write files to zip
-                            for file in files:
+                    curr_dir = os.path.join(os.path.join(rsrc_path, converted_dir), "@cache")
+                    if not os.path.isdir(curr_dir):
+                        continue
 
-                                abs_file = os.path.join(root, file)
-                                archive_file = self.get_zipfile_path(curr_dir, abs_file)
+                    converted_dirs.append(curr_dir)
 
-                                if archive_file in myzip.namelist():
-                                    lprint("D Archive name %r already exists, ignoring it!" % archive_file)
-                                    continue
+                start_time = time()
+                files_count, reused_count = _packing_utils.pack_directories(mod_filepath, converted_dirs,
+                                                                            int(scs_globals.conv_hlpr_mod_compression),
+                                                                            incremental=scs_globals.conv_hlpr_incremental_packing)
 
-                                myzip.write(abs_file, archive_file, compress_type=int(scs_globals.conv_hlpr_mod_compression))
+                lprint("I Packed %i files (%i reused from previous package) in %.2f s.", (files_count, reused_count, time() - start_time))
 
                 self.report({'INFO'}, "Packing done, mod packed to: '%s'" % mod_filepath)
 
@@ -2709,11 +2674,6 @@ class PaintjobTools:
 
         vehicle_type = _PT_consts.VehicleTypes.NONE
 
-        img_node = None
-        premul_node = None
-        translate_node = None
-        viewer_node = None
-
         config_meta_filepath: StringProperty(
             description="File path to paintjob configuration SII file."
         )
@@ -2804,63 +2764,22 @@ class PaintjobTools:
 
             lprint(prefix + message, report_errors=do_report, report_warnings=do_report)
 
-        def initialize_nodes(self, context, img):
-            """Initializes nodes and scene proeprties to be able to use compositor for rendering of texture portions TGAs.
-
-            :param context: blender context
-            :type context: bpy.types.Context
-            :param img: original big common texture image
-            :type img: bpy.types.Image
-            """
-
-            # ensure compositing and scene node tree
-
-            context.scene.render.use_compositing = True
-            context.scene.use_nodes = True
-
-            _X_SHIFT = 250
-
-            tree = context.scene.node_tree
-            nodes = tree.nodes
-            links = tree.links
-
-            # remove any existing nodes (they are created by defoult when switching to compositiong)
-
-            while len(nodes) > 0:
-                nodes.remove(nodes[0])
-
-            # create nodes
-
-            self.img_node = nodes.new(type="CompositorNodeImage")
-            self.img_node.location = (-_X_SHIFT, 0)
-            self.img_node.image = img
-
-            self.premul_node = nodes.new(type="CompositorNodePremulKey")
-            self.premul_node.location = (0, 0)
-            self.premul_node.mapping = 'STRAIGHT_TO_PREMUL'
-
-            self.translate_node = nodes.new(type="CompositorNodeTranslate")
-            self.translate_node.location = (_X_SHIFT, 0)
-
-            self.viewer_node = nodes.new(type="CompositorNodeComposite")
-            self.viewer_node.location = (_X_SHIFT * 2, 0)
-            self.viewer_node.use_alpha = True
-
-            # create links
-
-            links.new(self.premul_node.inputs["Image"], self.img_node.outputs["Image"])
-            links.new(self.translate_node.inputs["Image"], self.premul_node.outputs["Image"])
-            links.new(self.viewer_node.inputs["Image"], self.translate_node.outputs["Image"])
-
-        def export_texture(self, orig_img, tgas_dir_path, texture_portion):
+        def export_texture(self, common_pixels, tgas_dir_path, texture_portion, executor, exported_textures):
             """Export given texture portion into given paintjob path.
 
-            :param orig_img: Blender image datablock representing common texture
-            :type orig_img: bpy.types.Image
+            Portion pixels are cropped from already read common texture pixels and TGA is written in given executor,
+            TOBJ is written immediately. Portions with the same content are exported only once.
+
+            :param common_pixels: pixels of common texture as returned from io_scs_tools.utils.image.get_pixels
+            :type common_pixels: numpy.ndarray
             :param tgas_dir_path: absolute directory path to export TGA and TOBJ to
             :type tgas_dir_path: str
             :param texture_portion: texture portion defining portion position and size
             :type texture_portion: io_scs_tools.internals.structure.UnitData
+            :param executor: executor in which TGA writing is submitted, resulting future is added to exported textures
+            :type executor: concurrent.futures.Executor
+            :param exported_textures: already exported textures (key: hash of texture content, value: (TOBJ path, future of TGA writing))
+            :type exported_textures: dict[str, (str, concurrent.futures.Future)]
             :return: TOBJ path of exported texture, in case sth went wrong return None
             :rtype: str | None
             """
@@ -2869,8 +2788,7 @@ class PaintjobTools:
             size = [float(i) for i in texture_portion.get_prop("size")]
             is_master = bool(texture_portion.get_prop("is_master"))
 
-            orig_img_width = orig_img.size[0]
-            orig_img_height = orig_img.size[1]
+            orig_img_height, orig_img_width = common_pixels.shape[:2]
 
             orig_img_start_x = round(orig_img_width * position[0])
             orig_img_start_y = round(orig_img_height * position[1])
@@ -2878,115 +2796,47 @@ class PaintjobTools:
             img_width = round(orig_img_width * size[0])
             img_height = round(orig_img_height * size[1])
 
-            # setup compositing nodes for current texture
-            # NOTE: render clips original image by it's resolution and is centered on the output image,
-            # thus we have to translate our original image so that portion texture is in the middle of the render
-
-            orig_img_mid_x = orig_img_start_x + (img_width / 2)
-            orig_img_mid_y = orig_img_start_y + (img_height / 2)
+            # crop portion out of common texture, parts outside of common texture are left transparent black,
+            # the same as they were when portions were rendered with compositor
+            pixels = numpy.zeros((img_height, img_width, common_pixels.shape[2]), dtype=numpy.uint8)
 
-            self.translate_node.inputs["X"].default_value = (orig_img_width / 2) - orig_img_mid_x
-            self.translate_node.inputs["Y"].default_value = (orig_img_height / 2) - orig_img_mid_y
+            src_start_x, src_end_x = max(orig_img_start_x, 0), min(orig_img_start_x + img_width, orig_img_width)
+            src_start_y, src_end_y = max(orig_img_start_y, 0), min(orig_img_start_y + img_height, orig_img_height)
+            if src_start_x < src_end_x and src_start_y < src_end_y:
+                pixels[src_start_y - orig_img_start_y:src_end_y - orig_img_start_y, src_start_x - orig_img_start_x:src_end_x - orig_img_start_x] = \
+                    common_pixels[src_start_y:src_end_y, src_start_x:src_end_x]
 
             # we encode texture name with portion position and size, thus any possible duplicates will end up in same texture
             tga_name = "pjm_at_%ix%i_size_%ix%i.tga" % (orig_img_start_x,
                                                         orig_img_start_y,
                                                         img_width,
                                                         img_height)
-            tga_path = os.path.join(tgas_dir_path, tga_name)
-
-            # export texture portion image by properly reset scene settings and then render with compositor
-
-            scene = bpy.context.scene
-
-            scene.display_settings.display_device = "sRGB"
-
-            scene.view_settings.view_transform = "Standard"
-            scene.view_settings.look = "None"
-            scene.view_settings.exposure = 0
-            scene.view_settings.gamma = 1
-
-            scene.render.image_settings.file_format = "TARGA"
-            scene.render.image_settings.color_mode = "RGBA" if self.export_alpha else "RGB"
-            scene.render.resolution_percentage = 100
-            scene.render.resolution_x = img_width
-            scene.render.resolution_y = img_height
-            scene.render.filepath = tga_path
-            scene.render.dither_intensity = 0
-
-            bpy.ops.render.render(write_still=True)
 
             # if no optimization or is master then we can skip optimization processing,
-            # otherwise texture is re-opened and analyzed and
-            # in case only one color is inside, we export 4x4 texture and update tga path
-
-            if self.optimize_single_color_textures and not is_master:
-
-                lprint("I Analyzing texture for single color...")
-
-                is_img_single_color = True
-                img = bpy.data.images.load(tga_path, check_existing=True)
-
-                _CHUNK_SIZE = 2048 * 1024  # testing showed that this chunk size works best
-                rows_in_chunk = round(_CHUNK_SIZE / img_width)
-                buffer = []
-                comparing_pixel = [0.0] * 4
-                for row in range(0, img_height):
-
-                    # on the beginning of the chunk refill pixels from image
-                    if row % rows_in_chunk == 0:
-
-                        start_pixel = row * img_width * 4
-                        end_pixel = start_pixel + img_width * rows_in_chunk * 4
-                        end_pixel = min(end_pixel, img_width * img_height * 4)
-
-                        buffer = img.pixels[start_pixel:end_pixel]
-
-                    # use first pixel for comparison
-                    if row == 0:
-                        comparing_pixel = buffer[0:4]
-
-                    start_px = (row % rows_in_chunk) * img_width * 4
-                    for i in range(0, img_width * 4, 4):
-                        if buffer[(start_px + i):(start_px + i + 4)] != comparing_pixel:
-                            is_img_single_color = False
-                            break
-
-                    if not is_img_single_color:
-                        break
-
-                # already exported image not longer needed in Blender, so remove it!
-
-                img.buffers_free()
-                bpy.data.images.remove(img, do_unlink=True)
+            # otherwise in case only one color is inside, we export 4x4 texture instead
 
-                # finally export single texture
+            if self.optimize_single_color_textures and not is_master and pixels.size > 0 and _image_utils.is_single_color(pixels):
 
-                if is_img_single_color:
+                comparing_pixel = [int(channel) for channel in pixels[0, 0]] + [255] * (4 - pixels.shape[2])
+                pixels = numpy.tile(pixels[0, 0], (4, 4, 1))
 
-                    # don't forget to remove previously exported big TGA
-                    os.remove(tga_path)
+                # we use shared prefix for 4x4 textures in case any other portion will be using same one
+                tga_name = "shared_%.2x%.2x%.2x%.2x.tga" % tuple(comparing_pixel)
 
-                    _SINGLE_COLOR_IMAGE_NAME = "single_color_image"
+                lprint("I Texture portion %r has only one color in common texture, optimizing it by exporting 4x4px TGA!", (texture_portion.id,))
 
-                    if _SINGLE_COLOR_IMAGE_NAME not in bpy.data.images:
-                        bpy.data.images.new(_SINGLE_COLOR_IMAGE_NAME, 4, 4, alpha=True)
+            # portions with the same content share already exported texture
 
-                    img = bpy.data.images[_SINGLE_COLOR_IMAGE_NAME]
-                    img.colorspace_settings.name = "sRGB"  # make sure we use sRGB color-profile
-                    img.alpha_mode = 'STRAIGHT'
-                    img.pixels[:] = comparing_pixel * 16
+            texture_hash = sha1(repr(pixels.shape).encode("utf-8"))
+            texture_hash.update(pixels.tobytes())
+            texture_hash = texture_hash.hexdigest()
 
-                    # we use shared prefix for 4x4 textures in case any other portion will be using same one
-                    tga_name = "shared_%.2x%.2x%.2x%.2x.tga" % (int(comparing_pixel[0] * 255.0),
-                                                                int(comparing_pixel[1] * 255.0),
-                                                                int(comparing_pixel[2] * 255.0),
-                                                                int(comparing_pixel[3] * 255.0))
-                    tga_path = os.path.join(tgas_dir_path, tga_name)
+            if texture_hash in exported_textures:
+                lprint("D Texture portion %r has the same content as already exported texture, reusing it!", (texture_portion.id,))
+                return exported_textures[texture_hash][0]
 
-                    img.save_render(tga_path, scene=bpy.context.scene)
-
-                    lprint("I Texture portion %r has only one color in common texture, optimizing it by exporting 4x4px TGA!", (texture_portion.id,))
+            tga_path = os.path.join(tgas_dir_path, tga_name)
+            tga_future = executor.submit(_image_utils.write_tga, tga_path, pixels)
 
             # write TOBJ beside tga file
 
@@ -3003,6 +2853,8 @@ class PaintjobTools:
             if not tobj_cont.write_data_to_file():
                 return None
 
+            exported_textures[texture_hash] = (tobj_path, tga_future)
+
             return tobj_path
 
         def export_master_sii(self, config_path, pj_token, pj_full_unit_name, pj_props, suitable_for=None):
@@ -3369,8 +3221,6 @@ class PaintjobTools:
             common_tex_img.colorspace_settings.name = "sRGB"
             common_tex_img.alpha_mode = 'STRAIGHT' if self.export_alpha else 'NONE'
 
-            self.initialize_nodes(context, common_tex_img)
-
             if tuple(common_tex_img.size) != tuple(common_texture_size) and not self.export_configs_only:
                 self.do_report({'ERROR'},
                                "Wrong size of common texture TGA: [%s, %s], paintjob layout META is prescribing different size: %r!" %
@@ -3387,31 +3237,45 @@ class PaintjobTools:
                     current_file_path = os.path.join(tgas_dir_path, file)
                     if os.path.isfile(current_file_path) and (current_file_path.endswith(".tga") or current_file_path.endswith(".tobj")):
                         os.remove(current_file_path)
+            elif not self.export_configs_only:
+                os.makedirs(tgas_dir_path)
+
+            # read common texture pixels only once, all the portions are cropped from them
+            common_pixels = None
+            if not self.export_configs_only:
+                common_pixels = _image_utils.get_pixels(common_tex_img, self.export_alpha)
+
+            # common texture image not longer needed in Blender, so remove it!
+            common_tex_img.buffers_free()
+            bpy.data.images.remove(common_tex_img, do_unlink=True)
 
             # do export by portion id
             texture_portions_tobj_paths = {}  # storing TGA paths for each texture portion, used later for referencing textures in SIIs
-            exported_portion_textures = set()  # storing already exported texture portion to avoid double exporting same TGA
-            for unit_id in texture_portions:
+            exported_textures = {}  # storing already exported textures by their content to avoid double exporting same TGA
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
 
-                # skip texture export if we are doing only configs
-                if self.export_configs_only:
-                    break
+                for unit_id in texture_portions:
 
-                texture_portion = texture_portions[unit_id]
+                    # skip texture export if we are doing only configs
+                    if self.export_configs_only:
+                        break
 
-                # as parented texture portions do not own texture just ignore them
-                if texture_portions[unit_id].get_prop("parent"):
-                    continue
+                    texture_portion = texture_portions[unit_id]
+
+                    # as parented texture portions do not own texture just ignore them
+                    if texture_portions[unit_id].get_prop("parent"):
+                        continue
 
-                # mark this portion as exported
-                exported_portion_textures.add(texture_portion.id)
+                    # export TGA & save TOBJ path to dictionary for later usage in config generation
+                    exported_tobj_path = self.export_texture(common_pixels, tgas_dir_path, texture_portion, executor, exported_textures)
+                    assert exported_tobj_path is not None  # nothing should go wrong thus we have to assert here
+                    texture_portions_tobj_paths[unit_id] = exported_tobj_path
 
-                # export TGA & save TOBJ path to dictionary for later usage in config generation
-                exported_tobj_path = self.export_texture(common_tex_img, tgas_dir_path, texture_portion)
-                assert exported_tobj_path is not None  # nothing should go wrong thus we have to assert here
-                texture_portions_tobj_paths[unit_id] = exported_tobj_path
+                    lprint("I Exported: %r", (exported_tobj_path,))
 
-                lprint("I Exported: %r", (exported_tobj_path,))
+                # wait for all TGAs to be written, so any writing error is raised here
+                for tobj_path, tga_future in exported_textures.values():
+                    tga_future.result()
 
             ##################################
             #
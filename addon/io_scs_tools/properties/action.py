@@ -19,7 +19,7 @@
 # Copyright (C) 2013-2019: SCS Software
 
 import bpy
-from bpy.props import IntProperty
+from bpy.props import IntProperty, FloatProperty
 
 
 class ActionSCSTools(bpy.types.PropertyGroup):
@@ -37,6 +37,17 @@ class ActionSCSTools(bpy.types.PropertyGroup):
         options={'HIDDEN'},
         subtype='NONE',
     )
+    anim_export_tolerance: FloatProperty(
+        name="Reduction Tolerance",
+        description="Keyframe reduction tolerance used on export. Bone keyframes which can be reconstructed by interpolation "
+                    "of neighbouring keyframes within this tolerance are not exported (zero disables keyframe reduction).",
+        default=0.0,
+        min=0.0, max=1.0,
+        step=0.1,
+        precision=4,
+        options={'HIDDEN'},
+        subtype='NONE',
+    )
 
 
 classes = (
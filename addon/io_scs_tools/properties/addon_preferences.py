@@ -882,6 +882,21 @@ class SCSGlobals(bpy.types.PropertyGroup):
         _config_container.update_item_in_file('Import.IncludeSubdirsForPia', int(self.import_include_subdirs_for_pia))
         return None
 
+    def import_use_parse_cache_update(self, context):
+        _config_container.update_item_in_file('Import.UseParseCache', int(self.import_use_parse_cache))
+        return None
+
+    def import_parse_cache_dir_update(self, context):
+
+        # if relative path detected convert it to absolute
+        if self.import_parse_cache_dir.startswith("//") or self.import_parse_cache_dir.startswith("\\"):
+
+            self.import_parse_cache_dir = _path_utils.repair_path(self.import_parse_cache_dir)
+            return None  # interrupt update, as another one will be called for saving item into config.txt (as we changed cache path)
+
+        _config_container.update_item_in_file('Import.ParseCacheDir', self.import_parse_cache_dir)
+        return None
+
     def export_scale_update(self, context):
         _config_container.update_item_in_file('Export.ExportScale', float(self.export_scale))
         return None
@@ -962,6 +977,10 @@ class SCSGlobals(bpy.types.PropertyGroup):
         _config_container.update_item_in_file('Export.SignExport', int(self.export_write_signature))
         return None
 
+    def export_incremental_update(self, context):
+        _config_container.update_item_in_file('Export.Incremental', int(self.export_incremental))
+        return None
+
     # IMPORT OPTIONS
     import_scale: FloatProperty(
         name="Scale",
@@ -1059,6 +1078,19 @@ class SCSGlobals(bpy.types.PropertyGroup):
         default=True,
         update=import_include_subdirs_for_pia_update,
     )
+    import_use_parse_cache: BoolProperty(
+        name="Use Parse Cache",
+        description="Keep parsed PIX files in cache directory, so unchanged files don't have to be parsed again on next import",
+        default=True,
+        update=import_use_parse_cache_update,
+    )
+    import_parse_cache_dir: StringProperty(
+        name="Parse Cache Directory",
+        description="Directory where parsed PIX files are cached. If empty, directory inside system temporary directory is used.",
+        subtype="DIR_PATH",
+        default="",
+        update=import_parse_cache_dir_update,
+    )
 
     # EXPORT OPTIONS
     export_scope: EnumProperty(
@@ -1191,6 +1223,13 @@ class SCSGlobals(bpy.types.PropertyGroup):
         default=False,
         update=export_write_signature_update,
     )
+    export_incremental: BoolProperty(
+        name="Incremental Export",
+        description="Skip export of model files and animations which didn't change since last export. "
+                    "Fingerprints of exported data are stored in manifest file beside exported files",
+        default=False,
+        update=export_incremental_update,
+    )
 
     # COMMON SETTINGS - SAVED IN CONFIG
     def dump_level_update(self, context):
@@ -1213,8 +1252,10 @@ class SCSGlobals(bpy.types.PropertyGroup):
             ('1', "1 - Errors and Warnings", "Print Errors and Warnings to the console"),
             ('2', "2 - Errors, Warnings, Info", "Print Errors, Warnings and Info to the console"),
             ('3', "3 - Errors, Warnings, Info, Debugs", "Print Errors, Warnings, Info and Debugs to the console"),
-            ('4', "4 - Errors, Warnings, Info, Debugs, Specials", "Print Errors, Warnings, Info, Debugs and Specials to the console"),
-            ('5', "5 - Test mode (DEVELOPER ONLY)", "Extra developer mode. (Don't use it if you don't know what you are doing!)"),
+            ('4', "4 - Errors, Warnings, Info, Debugs, Specials", "Print Errors, Warnings, Info, Debugs and Specials to the console, "
+                                                                  "including timing breakdown of import and export"),
+            ('5', "5 - Test mode (DEVELOPER ONLY)", "Extra developer mode, also writes import and export timing trace files. "
+                                                    "(Don't use it if you don't know what you are doing!)"),
         ),
         default='2',
         update=dump_level_update,
@@ -1326,6 +1367,12 @@ class SCSGlobals(bpy.types.PropertyGroup):
         ),
         default=_CONV_HLPR_consts.DeflatedZip
     )
+    conv_hlpr_incremental_packing: BoolProperty(
+        name="Incremental",
+        description="Reuse already compressed files from previously packed mod archive,\n"
+                    "only files with changed size or modification time will be compressed again.",
+        default=True
+    )
 
     # SUN PROFILE SETTINGS
 
@@ -1024,6 +1024,9 @@ class SCS_TOOLS_PT_Animations(_ObjectPanelBlDefs, Panel):
                 row.operator('scene.scs_tools_decrease_animation_steps', text="", icon='REMOVE')
                 row.prop(active_obj.animation_data.action.scs_props, "anim_export_step")
 
+                row = action_col.row(align=True)
+                row.prop(active_obj.animation_data.action.scs_props, "anim_export_tolerance")
+
     def draw(self, context):
         layout_column = self.layout
         scs_root = self.scs_root
@@ -21,6 +21,7 @@
 import os
 import bpy
 from bpy.types import Panel, UIList
+from io_scs_tools.consts import ConvHlpr as _CONV_HLPR_consts
 from io_scs_tools.utils import path as _path_utils
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools.ui import shared as _shared
@@ -202,6 +203,10 @@ class SCS_TOOLS_PT_ConversionHelper(_OutputPanelBlDefs, Panel):
         row = col.row(align=True)
         row.prop(scs_globals, "conv_hlpr_mod_compression", text="")
 
+        if scs_globals.conv_hlpr_mod_compression != _CONV_HLPR_consts.NoZip:
+            icon = _shared.get_on_off_icon(scs_globals.conv_hlpr_incremental_packing)
+            row.prop(scs_globals, "conv_hlpr_incremental_packing", toggle=True, icon=icon)
+
         col.separator()
 
         row = col.row(align=True)
@@ -21,6 +21,9 @@
 import struct
 import math
 import re
+import sys
+import numpy
+from array import array
 from numpy import vectorize
 from mathutils import Matrix, Quaternion, Vector, Color
 from io_scs_tools.consts import Colors as _COL_consts
@@ -31,6 +34,10 @@ from io_scs_tools.utils import get_scs_inventories as _get_scs_inventories
 
 _FLOAT_STRUCT = struct.Struct(">f")
 _BYTE_STRUCT = struct.Struct(">I")
+_HEX_BYTESWAP = sys.byteorder == "little"
+_HEX_DIGITS = numpy.frombuffer(b"0123456789abcdef", dtype=numpy.uint8)
+_HEX_NUMPY_MIN_COUNT = 1024
+_FLOAT_ARRAY_STRUCTS = {}
 
 
 def __linear_to_srgb(x):
@@ -221,6 +228,73 @@ def float_to_hex_string(value):
     return '&%s' % _FLOAT_STRUCT.pack(value).hex()
 
 
+def floats_to_hex_string(values, separator="  "):
+    """Takes a float array and returns all values as hexadecimal numbers in one joined string.
+    Whole array is packed at once, big arrays are formatted with numpy.
+
+    For speed reasons we do not have any check on the values, so beware!
+
+    :param values: float values
+    :type values: collections.abc.Sequence[float] | numpy.ndarray
+    :param separator: separator written between hexadecimal numbers
+    :type separator: str
+    :return: Hexadecimal numbers in format &XXxxXXxx separated by given separator
+    :rtype: str
+    """
+
+    values_count = len(values)
+    if values_count == 0:
+        return ""
+
+    # short data lines are the most common, direct implementations are the fastest for them
+    if values_count <= 4 and separator == "  ":
+        return float_array_to_hex_string(values)
+
+    if values_count < _HEX_NUMPY_MIN_COUNT:
+        if values_count not in _FLOAT_ARRAY_STRUCTS:
+            _FLOAT_ARRAY_STRUCTS[values_count] = struct.Struct(">%if" % values_count)
+
+        return "&" + _FLOAT_ARRAY_STRUCTS[values_count].pack(*values).hex("&", 4).replace("&", separator + "&")
+
+    # write all characters into one byte matrix where each row is "&XXxxXXxx<separator>"
+    value_bytes = numpy.asarray(values, dtype=">f4").reshape(-1).view(numpy.uint8).reshape(values_count, 4)
+    separator_bytes = numpy.frombuffer(separator.encode("ascii"), dtype=numpy.uint8)
+
+    chars = numpy.empty((values_count, 9 + len(separator_bytes)), dtype=numpy.uint8)
+    chars[:, 0] = ord("&")
+    chars[:, 1:9:2] = _HEX_DIGITS[value_bytes >> 4]
+    chars[:, 2:9:2] = _HEX_DIGITS[value_bytes & 0x0F]
+    chars[:, 9:] = separator_bytes
+
+    return chars.tobytes()[:-len(separator_bytes) or None].decode("ascii")
+
+
+def hex_strings_to_floats(hex_strings):
+    """Takes hexadecimal number strings and returns them as float array.
+    All numbers are decoded at once with single "bytes.fromhex" call.
+
+    For speed reasons we do not check format of each number, so beware!
+
+    :param hex_strings: list of hexadecimal values in format &XXxxXXxx or one string with whitespace separated values
+    :type hex_strings: collections.abc.Iterable[str] | str
+    :return: Float values
+    :rtype: array.array
+    """
+    if isinstance(hex_strings, str):
+        joined_hex_strings = hex_strings
+    else:
+        joined_hex_strings = "".join(hex_strings)
+
+    values = array("f", bytes.fromhex(joined_hex_strings.replace("&", "")))
+    if _HEX_BYTESWAP:
+        values.byteswap()
+
+    if len(values) != joined_hex_strings.count("&"):
+        raise ValueError("Invalid hexadecimal float values, decoded %i values out of %i!" % (len(values), joined_hex_strings.count("&")))
+
+    return values
+
+
 def string_to_number(string):
     """Converts string to number. It accepts hex interpretation or decimal.
     NOTE: no safety checks if string is really a number string
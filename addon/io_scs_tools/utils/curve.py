@@ -20,7 +20,9 @@
 
 # #####  NOTE: Based on SCS Game engine code #####
 
+import numpy
 from mathutils import Vector
+from io_scs_tools.consts import PrefabLocators as _PL_consts
 
 
 def set_direction(forward):
@@ -190,6 +192,95 @@ def evaluate_bezier_curve_dt(vec1, vec2, vec3, vec4, float_t):
     return Vector((f1, f2, f3))
 
 
+def compute_bernstein_array(coefs):
+    """Evaluate the cubic Bernstein polynomials at given array of parameters.
+
+    :param coefs: array of parameters of any shape
+    :type coefs: numpy.ndarray
+    :return: bernstein polynomial coefficients with extra last axis of size 4
+    :rtype: numpy.ndarray
+    """
+    q = 1.0 - coefs
+    return numpy.stack((q * q * q, 3.0 * coefs * q * q, 3.0 * coefs * coefs * q, coefs * coefs * coefs), axis=-1)
+
+
+def get_control_points(points1, tangs1, points2, tangs2):
+    """Get bezier control points of smooth curves given by starting and ending waypoints and their tangents.
+    Same control points are used by "smooth_curve_position" and "smooth_curve_tangent".
+    They are computed in single precision as "mathutils.Vector" stores them.
+
+    :param points1: positions of the starting waypoints, single one or array of them
+    :type points1: collections.Iterable | numpy.ndarray
+    :param tangs1: tangential vectors at the starting waypoints, single one or array of them
+    :type tangs1: collections.Iterable | numpy.ndarray
+    :param points2: positions of the ending waypoints, single one or array of them
+    :type points2: collections.Iterable | numpy.ndarray
+    :param tangs2: tangential vectors at the ending waypoints, single one or array of them
+    :type tangs2: collections.Iterable | numpy.ndarray
+    :return: control points of the curves in array of shape (curves count, 4, 3)
+    :rtype: numpy.ndarray
+    """
+    points1, tangs1, points2, tangs2 = (numpy.asarray(array, dtype=numpy.float32).reshape(-1, 3)
+                                        for array in (points1, tangs1, points2, tangs2))
+    return numpy.stack((points1, points1 + tangs1, points2 - tangs2, points2), axis=1)
+
+
+def _combine_control_points(control_points, weights):
+    """Linear combination of control points of multiple curves with given weights.
+    Sum is done in double precision and in the same order as in "evaluate_bezier_curve".
+
+    :param control_points: control points of the curves in array of shape (curves count, 4, 3)
+    :type control_points: numpy.ndarray
+    :param weights: weights of control points in array of shape (coefs count, 4) or (curves count, coefs count, 4)
+    :type weights: numpy.ndarray
+    :return: combined points in array of shape (curves count, coefs count, 3)
+    :rtype: numpy.ndarray
+    """
+    control_points = control_points[:, numpy.newaxis].astype(numpy.float64)
+    return (weights[..., 0:1] * control_points[..., 0, :] + weights[..., 1:2] * control_points[..., 1, :] +
+            weights[..., 2:3] * control_points[..., 2, :] + weights[..., 3:4] * control_points[..., 3, :])
+
+
+def evaluate_positions(control_points, coefs):
+    """Evaluate positions on multiple bezier curves at multiple parameters at once.
+    Positions are rounded to single precision as "mathutils.Vector" stores them,
+    so results are matching the ones from scalar evaluation.
+
+    :param control_points: control points of the curves in array of shape (curves count, 4, 3)
+    :type control_points: numpy.ndarray
+    :param coefs: parameters ranging from 0.0 to 1.0; shared by all curves in shape (coefs count,)
+    or per curve in shape (curves count, coefs count)
+    :type coefs: collections.Iterable | numpy.ndarray
+    :return: positions on the curves in array of shape (curves count, coefs count, 3)
+    :rtype: numpy.ndarray
+    """
+    weights = compute_bernstein_array(numpy.asarray(coefs, dtype=numpy.float64))
+    return _combine_control_points(control_points, weights).astype(numpy.float32)
+
+
+def compute_lengths(control_points, measure_steps):
+    """Compute lengths of multiple bezier curves at once, by measuring their polylines of "measure_steps" segments.
+    Parameters are accumulated step by step and segments are measured the same way as "mathutils.Vector" would do it,
+    so lengths are matching the ones from scalar measuring.
+
+    :param control_points: control points of the curves in array of shape (curves count, 4, 3)
+    :type control_points: numpy.ndarray
+    :param measure_steps: number of segments used for measuring
+    :type measure_steps: int
+    :return: lengths of the curves
+    :rtype: numpy.ndarray
+    """
+    coefs = numpy.cumsum(numpy.full(measure_steps, 1.0 / float(measure_steps)))
+    positions = numpy.concatenate((control_points[:, 0:1], evaluate_positions(control_points, coefs)), axis=1)
+
+    # squares of segment coordinates are single precision, but they are summed in double as "mathutils.Vector.length" does
+    segments = numpy.diff(positions, axis=1)
+    squares = (segments * segments).astype(numpy.float64)
+    segment_lengths = numpy.sqrt(squares[..., 0] + squares[..., 1] + squares[..., 2])
+
+    return numpy.cumsum(segment_lengths, axis=1)[:, -1]
+
+
 def smooth_curve_position(point1, tang1, point2, tang2, coef):
     """Smooth continuous curve helper based on piecewise cubic bezier curves
     designed for waypoint navigation.
@@ -284,17 +375,7 @@ def compute_smooth_curve_length(point1, tang1, point2, tang2, measure_steps):
     :return:
     :rtype: float
     """
-    step_size = 1.0 / float(measure_steps)
-    coef = step_size
-    lenth = 0.0
-    start_pos = point1
-    for ii in range(measure_steps):
-        cpos = smooth_curve_position(point1, tang1, point2, tang2, coef)
-        le = start_pos - cpos
-        lenth += le.length
-        start_pos = cpos
-        coef += step_size
-    return lenth
+    return float(compute_lengths(get_control_points(point1, tang1, point2, tang2), measure_steps)[0])
 
 
 def compute_curve(point1, tang1, point2, tang2, curve_steps):
@@ -316,21 +397,43 @@ def compute_curve(point1, tang1, point2, tang2, curve_steps):
     """
 
     le = compute_smooth_curve_length(point1, tang1, point2, tang2, 300)
-    curve_data = {'curve_points': []}
-
-    for segment in range(curve_steps):
-        coef = float(segment / curve_steps)
-        # print('coef: %s' % coef)
-        pos = smooth_curve_position(point1, tang1 * (le / 3), point2, tang2 * (le / 3), coef)
-        # print('pos: %s' % str(pos))
-        curve_data['curve_points'].append(pos)
-        # points['point ' + str(coef)] = Vector(pos)
-    curve_data['curve_points'].append(point2)  # last point
+    control_points = get_control_points(point1, tang1 * (le / 3), point2, tang2 * (le / 3))
+
+    # evaluate starting points of all segments at once
+    coefs = numpy.arange(curve_steps) / curve_steps
+    curve_data = {'curve_points': evaluate_positions(control_points, coefs)[0].tolist()}
+    curve_data['curve_points'].append(list(point2))  # last point
     return curve_data
 
 
+def get_intersection_samples(control_points, lengths, part_count):
+    """Get polyline samples of multiple curves as used by intersection search in "curves_intersect".
+    Sampled positions on the curves are accumulated the same way as intersection search does it.
+
+    :param control_points: control points of the curves in array of shape (curves count, 4, 3)
+    :type control_points: numpy.ndarray
+    :param lengths: lengths of the curves, none of them can be zero
+    :type lengths: collections.Iterable[float] | numpy.ndarray
+    :param part_count: number of segments for curves to be sampled to
+    :type part_count: int
+    :return: for each curve, tuple of sampled position coefs and sampled points, both of size part_count + 1
+    :rtype: list[(list[float], list[list[float]])]
+    """
+    lengths = numpy.asarray(lengths, dtype=numpy.float64).reshape(-1, 1)
+
+    # positions along curves accumulated step by step
+    curve_positions = numpy.zeros((len(lengths), part_count + 1))
+    curve_positions[:, 1:] = lengths / part_count
+    numpy.cumsum(curve_positions, axis=1, out=curve_positions)
+
+    coefs = curve_positions / lengths
+    points = evaluate_positions(control_points, coefs)
+
+    return list(zip(coefs.tolist(), points.tolist()))
+
+
 def curves_intersect(curve1_p1, curve1_t1, curve1_p2, curve1_t2, length1,
-                     curve2_p1, curve2_t1, curve2_p2, curve2_t2, length2, part_count=10):
+                     curve2_p1, curve2_t1, curve2_p2, curve2_t2, length2, part_count=10, samples1=None, samples2=None):
     """Calculates first intersection point between two curves.
 
     NOTE: what about the multiple intersection points?
@@ -356,6 +459,10 @@ def curves_intersect(curve1_p1, curve1_t1, curve1_p2, curve1_t2, length1,
     :type length2: float
     :param part_count: number of segments for curve to be calculated
     :type part_count: int
+    :param samples1: already computed intersection samples of 1st curve from "get_intersection_samples", computed if not given
+    :type samples1: (list[float], list[list[float]]) | None
+    :param samples2: already computed intersection samples of 2nd curve from "get_intersection_samples", computed if not given
+    :type samples2: (list[float], list[list[float]]) | None
     :return: intersection point and position coefs where on curves that happend or None if not found
     :rtype: (mathutils.Vector, float, float) | (None, int, int)
     """
@@ -366,24 +473,31 @@ def curves_intersect(curve1_p1, curve1_t1, curve1_p2, curve1_t2, length1,
     if curve1_p2 == curve2_p2:
         return curve1_p2, 1, 1
 
-    step1 = length1 / part_count
-    step2 = length2 / part_count
+    if samples1 is None:
+        samples1 = get_intersection_samples(get_control_points(curve1_p1, curve1_t1, curve1_p2, curve1_t2), (length1,), part_count)[0]
+
+    if samples2 is None:
+        samples2 = get_intersection_samples(get_control_points(curve2_p1, curve2_t1, curve2_p2, curve2_t2), (length2,), part_count)[0]
+
+    coefs1, points1 = samples1
+    coefs2, points2 = samples2
 
-    pos1 = 0
     epsilon = 0.01
+    max_height = _PL_consts.CURVE_INTERSECTION_MAX_HEIGHT
 
     for i in range(part_count):
 
-        start1 = smooth_curve_position(curve1_p1, curve1_t1, curve1_p2, curve1_t2, pos1 / length1)
-        end1 = smooth_curve_position(curve1_p1, curve1_t1, curve1_p2, curve1_t2, (pos1 + step1) / length1)
+        start1 = points1[i]
+        end1 = points1[i + 1]
 
-        pos2 = 0
+        # NOTE: segment on second curve advances only if segments were checked for intersection
+        k2 = 0
         for j in range(part_count):
 
-            start2 = smooth_curve_position(curve2_p1, curve2_t1, curve2_p2, curve2_t2, pos2 / length2)
-            end2 = smooth_curve_position(curve2_p1, curve2_t1, curve2_p2, curve2_t2, (pos2 + step2) / length2)
+            start2 = points2[k2]
+            end2 = points2[k2 + 1]
 
-            if abs(start1[1] - start2[1]) > 4.0 or abs(end1[1] - end2[1]) > 4.0:
+            if abs(start1[1] - start2[1]) > max_height or abs(end1[1] - end2[1]) > max_height:
                 continue
 
             denom = ((end2[2] - start2[2]) * (end1[0] - start1[0])) - ((end2[0] - start2[0]) * (end1[2] - start1[2]))
@@ -407,10 +521,8 @@ def curves_intersect(curve1_p1, curve1_t1, curve1_p2, curve1_t2, length1,
                 curve_intersect.y = (start1[1] + end1[1] + start2[1] + end2[1]) / 4.0
                 curve_intersect.z = start1[2] + mu_a * (end1[2] - start1[2])
 
-                return curve_intersect, pos1 / length1, pos2 / length2
-
-            pos2 += step2
+                return curve_intersect, coefs1[i], coefs2[k2]
 
-        pos1 += step1
+            k2 += 1
 
     return None, -1, -1
@@ -0,0 +1,227 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Copyright (C) 2022: SCS Software
+
+import numpy
+import struct
+from io_scs_tools.utils import path as _path_utils
+
+_TGA_RLE_MAX_PACKET = 128
+"""Maximal number of pixels in one TGA RLE packet."""
+
+_TGA_RLE_BAND_ROWS = 256
+"""Number of rows encoded at once, as RLE packets never cross rows, image can be encoded in bands to limit memory usage."""
+
+
+def get_pixels(img, use_alpha):
+    """Gets pixels of given image as 8-bit per channel array.
+    Float images are converted from scene linear to sRGB and un-premultiplied, so result is matching byte images.
+
+    NOTE: rows are ordered from bottom to top as in Blender.
+
+    :param img: Blender image datablock
+    :type img: bpy.types.Image
+    :param use_alpha: should alpha channel be included in result
+    :type use_alpha: bool
+    :return: pixels in array of shape (height, width, 4 if use_alpha else 3)
+    :rtype: numpy.ndarray
+    """
+
+    width, height = img.size
+    channels = img.channels
+
+    pixels = numpy.empty(width * height * channels, dtype=numpy.float32)
+    img.pixels.foreach_get(pixels)
+    pixels = pixels.reshape((height, width, channels))
+
+    result = numpy.empty((height, width, 4 if use_alpha else 3), dtype=numpy.uint8)
+
+    # convert by rows chunks to avoid another float copy of whole image
+    for row in range(0, height, _TGA_RLE_BAND_ROWS):
+
+        chunk = pixels[row:row + _TGA_RLE_BAND_ROWS]
+
+        if channels >= 3:
+            rgba = numpy.empty(chunk.shape[:2] + (4,), dtype=numpy.float32)
+            rgba[..., :3] = chunk[..., :3]
+            rgba[..., 3] = chunk[..., 3] if channels == 4 else 1.0
+        else:  # grayscale images
+            rgba = numpy.repeat(chunk[..., :1], 4, axis=2)
+            rgba[..., 3] = chunk[..., 1] if channels == 2 else 1.0
+
+        if img.is_float:
+            alpha = rgba[..., 3:]
+            numpy.divide(rgba[..., :3], alpha, out=rgba[..., :3], where=alpha > 0)
+            rgba[..., :3] = numpy.where(rgba[..., :3] <= 0.0031308,
+                                        12.92 * rgba[..., :3],
+                                        numpy.power(numpy.maximum(rgba[..., :3], 0.0031308), 1.0 / 2.4) * 1.055 - 0.055)
+
+        result[row:row + _TGA_RLE_BAND_ROWS] = numpy.rint(numpy.clip(rgba[..., :result.shape[2]], 0.0, 1.0) * 255.0)
+
+    return result
+
+
+def is_single_color(pixels):
+    """Checks if all pixels have the same color as the first one.
+
+    :param pixels: pixels in array of shape (height, width, channels)
+    :type pixels: numpy.ndarray
+    :return: True if all pixels have the same color; False otherwise
+    :rtype: bool
+    """
+    return bool(numpy.all(pixels == pixels[0, 0]))
+
+
+def _split_packets(starts, lengths):
+    """Splits given pixel spans into packets not longer than maximal TGA RLE packet.
+
+    :param starts: starting pixel indices of spans
+    :type starts: numpy.ndarray
+    :param lengths: number of pixels in spans
+    :type lengths: numpy.ndarray
+    :return: starting pixel indices and lengths of packets
+    :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+
+    packets_counts = (lengths + _TGA_RLE_MAX_PACKET - 1) // _TGA_RLE_MAX_PACKET
+    packet_i_in_span = numpy.arange(packets_counts.sum()) - numpy.repeat(numpy.cumsum(packets_counts) - packets_counts, packets_counts)
+
+    packets_starts = numpy.repeat(starts, packets_counts) + packet_i_in_span * _TGA_RLE_MAX_PACKET
+    packets_lengths = numpy.minimum(numpy.repeat(starts + lengths, packets_counts) - packets_starts, _TGA_RLE_MAX_PACKET)
+
+    return packets_starts, packets_lengths
+
+
+def _encode_rle(pixels):
+    """Encodes given pixels with TGA run length encoding. Packets never cross rows.
+
+    :param pixels: pixels in TGA channels order, in array of shape (height, width, channels)
+    :type pixels: numpy.ndarray
+    :return: encoded pixels data
+    :rtype: bytes
+    """
+
+    height, width, channels = pixels.shape
+    flat_pixels = pixels.reshape((-1, channels))
+    pixels_count = len(flat_pixels)
+
+    # pack channels of each pixel into one integer for comparison
+    keys = numpy.zeros(pixels_count, dtype=numpy.uint32)
+    for channel in range(channels):
+        keys |= flat_pixels[:, channel].astype(numpy.uint32) << (8 * channel)
+
+    # runs of the same pixels, each row starts new run
+    is_run_start = numpy.ones(pixels_count, dtype=bool)
+    is_run_start[1:] = keys[1:] != keys[:-1]
+    is_run_start[::width] = True
+
+    runs_starts = numpy.flatnonzero(is_run_start)
+    runs_lengths = numpy.diff(numpy.append(runs_starts, pixels_count))
+
+    # runs of at least two pixels are written as RLE packets
+    is_rle_run = runs_lengths > 1
+    rle_starts, rle_lengths = _split_packets(runs_starts[is_rle_run], runs_lengths[is_rle_run])
+
+    # consecutive single pixels in the same row are written together as raw packets
+    single_pixels = runs_starts[~is_rle_run]
+    is_single_pixel = numpy.zeros(pixels_count + 1, dtype=bool)
+    is_single_pixel[single_pixels] = True
+
+    is_raw_start = (single_pixels % width == 0) | ~is_single_pixel[single_pixels - 1]
+    raw_spans_starts = single_pixels[is_raw_start]
+    raw_spans_lengths = numpy.diff(numpy.append(numpy.flatnonzero(is_raw_start), len(single_pixels)))
+    raw_starts, raw_lengths = _split_packets(raw_spans_starts, raw_spans_lengths)
+
+    # order packets by their position in image
+    packets_starts = numpy.concatenate((rle_starts, raw_starts))
+    packets_lengths = numpy.concatenate((rle_lengths, raw_lengths))
+    packets_is_rle = numpy.zeros(len(packets_starts), dtype=bool)
+    packets_is_rle[:len(rle_starts)] = True
+
+    order = numpy.argsort(packets_starts, kind="stable")
+    packets_starts = packets_starts[order]
+    packets_lengths = packets_lengths[order]
+    packets_is_rle = packets_is_rle[order]
+
+    packets_sizes = 1 + numpy.where(packets_is_rle, 1, packets_lengths) * channels
+    packets_offsets = numpy.cumsum(packets_sizes) - packets_sizes
+
+    data = numpy.empty(int(packets_sizes.sum()), dtype=numpy.uint8)
+    data[packets_offsets] = (packets_lengths - 1) | numpy.where(packets_is_rle, 0x80, 0)
+
+    channels_range = numpy.arange(channels)
+
+    # RLE packets hold only one pixel
+    rle_data_offsets = packets_offsets[packets_is_rle] + 1
+    data[rle_data_offsets[:, numpy.newaxis] + channels_range] = flat_pixels[packets_starts[packets_is_rle]]
+
+    # raw packets hold all of their pixels
+    raw_starts = packets_starts[~packets_is_rle]
+    raw_lengths = packets_lengths[~packets_is_rle]
+    pixel_i_in_packet = numpy.arange(raw_lengths.sum()) - numpy.repeat(numpy.cumsum(raw_lengths) - raw_lengths, raw_lengths)
+
+    raw_pixels = numpy.repeat(raw_starts, raw_lengths) + pixel_i_in_packet
+    raw_data_offsets = numpy.repeat(packets_offsets[~packets_is_rle] + 1, raw_lengths) + pixel_i_in_packet * channels
+    data[raw_data_offsets[:, numpy.newaxis] + channels_range] = flat_pixels[raw_pixels]
+
+    return data.tobytes()
+
+
+def write_tga(filepath, pixels, use_rle=True):
+    """Writes given pixels into TGA file.
+
+    NOTE: this is meant to be executed in worker threads, as NumPy and file writing release GIL for most of the work.
+
+    :param filepath: absolute path of TGA file to write
+    :type filepath: str
+    :param pixels: RGB or RGBA pixels with rows ordered from bottom to top, in array of shape (height, width, 3 or 4)
+    :type pixels: numpy.ndarray
+    :param use_rle: should pixels be compressed with run length encoding
+    :type use_rle: bool
+    :return: path of written file
+    :rtype: str
+    """
+
+    height, width, channels = pixels.shape
+
+    # TGA stores channels in BGR(A) order
+    tga_pixels = pixels[..., (2, 1, 0, 3)[:channels]]
+
+    header = struct.pack("<BBBHHBHHHHBB",
+                         0,  # no image ID
+                         0,  # no color map
+                         10 if use_rle else 2,  # true color image
+                         0, 0, 0,  # color map specification
+                         0, 0,  # image origin
+                         width, height,
+                         channels * 8,
+                         8 if channels == 4 else 0)  # alpha bits, bottom left origin
+
+    with open(filepath, mode="wb") as file:
+        file.write(header)
+
+        if use_rle:
+            for row in range(0, height, _TGA_RLE_BAND_ROWS):
+                file.write(_encode_rle(tga_pixels[row:row + _TGA_RLE_BAND_ROWS]))
+        else:
+            file.write(numpy.ascontiguousarray(tga_pixels).tobytes())
+
+    _path_utils.invalidate_project_index(filepath)
+
+    return filepath
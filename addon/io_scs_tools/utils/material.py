@@ -32,7 +32,7 @@ from io_scs_tools.utils import path as _path
 from io_scs_tools.utils.printout import lprint
 
 
-def get_texture_image(texture_path, texture_type, report_invalid=False):
+def get_texture_image(texture_path, texture_type, report_invalid=False, images_cache=None):
     """Creates and returns image for given texture path and type.
 
     :param texture_path: Texture path
@@ -41,10 +41,18 @@ def get_texture_image(texture_path, texture_type, report_invalid=False):
     :type texture_type: str
     :param report_invalid: flag indicating if invalid texture should be reported in 3d view
     :type report_invalid: bool
+    :param images_cache: optional dictionary of already looked up images, used to share lookups across many materials
+    :type images_cache: dict | None
     :return: loaded image datablock to be used in SCS material
     :rtype: bpy.types.Image
     """
 
+    if images_cache is not None:
+        cache_key = (texture_path, texture_type == "reflection")
+        if cache_key not in images_cache:
+            images_cache[cache_key] = get_texture_image(texture_path, texture_type, report_invalid=report_invalid)
+        return images_cache[cache_key]
+
     # get reflection image texture
     if texture_path.endswith(".tobj") and texture_type == "reflection":
         return get_reflection_image(texture_path, report_invalid=report_invalid)
@@ -697,7 +705,7 @@ def set_shader_data_to_material(material, section, is_import=False, override_bac
         _shader.set_uv(material, mapping_data[0], mapping_data[1], mapping_data[2])
 
 
-def reload_tobj_settings(material, tex_type):
+def reload_tobj_settings(material, tex_type, update_shader=True):
     """Relaods TOBJ settings on given texture type of material.
     If tobj doesn't exists it does nothing.
 
@@ -705,6 +713,10 @@ def reload_tobj_settings(material, tex_type):
     :type material: bpy.types.Material
     :param tex_type: texture type
     :type tex_type: str
+    :param update_shader: should reloaded settings be applied to shader, if not caller is responsible for it
+    :type update_shader: bool
+    :return: reloaded TOBJ settings string; None if tobj doesn't exists
+    :rtype: str | None
     """
 
     shader_texture_str = "shader_texture_" + tex_type
@@ -722,7 +734,12 @@ def reload_tobj_settings(material, tex_type):
         setattr(material.scs_props, shader_texture_str + "_tobj_load_time", str(os.path.getmtime(tobj_file)))
 
         # apply reloaded settings to shader
-        _shader.set_texture_settings(material, tex_type, settings)
+        if update_shader:
+            _shader.set_texture_settings(material, tex_type, settings)
+
+        return settings
+
+    return None
 
 
 def find_preset(material_effect, material_textures):
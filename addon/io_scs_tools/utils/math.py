@@ -19,8 +19,11 @@
 # Copyright (C) 2013-2014: SCS Software
 
 import math
+import numpy
 from mathutils import Vector
 
+_NORMALIZE_SQUARED_LENGTH_MIN = 1.0e-35  # the same as used by mathutils in "vector.normalized()"
+
 
 def get_distance(loc1, loc2):
     """Get distance between two points
@@ -127,3 +130,54 @@ def clamp(value, min_value=0, max_value=1):
     assert min_value < max_value
 
     return min(max_value, max(min_value, value))
+
+
+def transform_vectors(matrix, vectors):
+    """Transforms array of 3D vectors with 4x4 matrix, as "matrix @ vector" would do for each of the vectors.
+    Computation follows mathutils precision: products are computed in single precision and
+    summed in double precision, so results are the same as the ones from mathutils.
+
+    :param matrix: 4x4 transformation matrix
+    :type matrix: mathutils.Matrix
+    :param vectors: flat or (N, 3) shaped array of vectors
+    :type vectors: numpy.ndarray
+    :return: transformed vectors in (N, 3) shaped single precision array
+    :rtype: numpy.ndarray
+    """
+    mat = numpy.array(matrix, dtype=numpy.float32)
+    vecs = numpy.asarray(vectors, dtype=numpy.float32).reshape(-1, 3)
+
+    result = numpy.empty(vecs.shape, dtype=numpy.float32)
+    for row in range(3):
+        dot = (mat[row, 0] * vecs[:, 0]).astype(numpy.float64)
+        dot += mat[row, 1] * vecs[:, 1]
+        dot += mat[row, 2] * vecs[:, 2]
+        dot += mat[row, 3]
+        result[:, row] = dot
+
+    return result
+
+
+def normalize_vectors(vectors):
+    """Normalizes array of 3D vectors, as "vector.normalized()" would do for each of the vectors.
+    Steps of mathutils are followed exactly, so results are bit identical: squared length is summed in double precision
+    from last to first component, vectors with squared length not above mathutils threshold are set to zero vectors
+    and others are multiplied by single precision reciprocal of their length in single precision.
+
+    :param vectors: (N, 3) shaped single precision array of vectors
+    :type vectors: numpy.ndarray
+    :return: normalized vectors in (N, 3) shaped single precision array
+    :rtype: numpy.ndarray
+    """
+    vecs = numpy.asarray(vectors, dtype=numpy.float32).reshape(-1, 3)
+
+    squares = numpy.square(vecs, dtype=numpy.float64)
+    squared_length = squares[:, 2] + squares[:, 1]
+    squared_length += squares[:, 0]
+    is_valid = squared_length > _NORMALIZE_SQUARED_LENGTH_MIN
+
+    normalized = numpy.zeros(vecs.shape, dtype=numpy.float32)
+    reciprocal_length = numpy.float32(1.0) / numpy.sqrt(squared_length[is_valid]).astype(numpy.float32)
+    normalized[is_valid] = vecs[is_valid] * reciprocal_length[:, None]
+
+    return normalized
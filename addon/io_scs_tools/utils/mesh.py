@@ -20,7 +20,7 @@
 
 import bpy
 import bmesh
-from collections import deque
+import numpy
 from io_scs_tools.consts import Mesh as _MESH_consts
 from io_scs_tools.consts import VertexColorTools as _VCT_consts
 from io_scs_tools.utils.printout import lprint
@@ -28,7 +28,23 @@ from io_scs_tools.utils import convert as _convert
 
 
 def make_points_to_weld_list(mesh_vertices, mesh_normals, mesh_rgb, mesh_rgba, equal_decimals_count):
-    """Makes a map of duplicated vertices indices into it's original counter part."""
+    """Makes a map of duplicated vertices indices into it's original counter part.
+    Vertices are duplicates when they have the same quantized position, normal and vertex colors.
+    All vertices are quantized into one integer matrix and deduplicated at once.
+
+    :param mesh_vertices: vertex positions
+    :type mesh_vertices: list[list[float]]
+    :param mesh_normals: vertex normals
+    :type mesh_normals: list[list[float]]
+    :param mesh_rgb: RGB vertex colors layers
+    :type mesh_rgb: dict[str, list[list[float]]]
+    :param mesh_rgba: RGBA vertex colors layers
+    :type mesh_rgba: dict[str, list[list[float]]]
+    :param equal_decimals_count: number of decimals which have to be equal for vertices to be duplicates
+    :type equal_decimals_count: int
+    :return: original vertex index per vertex, where original vertex is mapped to itself
+    :rtype: numpy.ndarray
+    """
 
     # take first present vertex color data
     if mesh_rgb:
@@ -38,34 +54,17 @@ def make_points_to_weld_list(mesh_vertices, mesh_normals, mesh_rgb, mesh_rgba, e
     else:
         mesh_final_rgba = {}
 
-    posnorm_dict_tmp = {}
-    perc = 10 ** equal_decimals_count  # represent precision for duplicates
-    for val_i, val in enumerate(mesh_vertices):
-
-        key = (str(int(val[0] * perc)) + str(int(val[1] * perc)) + str(int(val[2] * perc)) +
-               str(int(mesh_normals[val_i][0] * perc)) + str(int(mesh_normals[val_i][1] * perc)) + str(int(mesh_normals[val_i][2] * perc)))
-
-        # also include vertex colors in key if present
-        for vc_layer_name in mesh_final_rgba:
-            for col_channel in mesh_final_rgba[vc_layer_name][val_i]:
-                key += str(int(col_channel * perc))
+    quantized_attributes = [mesh_vertices, mesh_normals]
+    quantized_attributes.extend(mesh_final_rgba.values())
 
-        if key not in posnorm_dict_tmp:
-            posnorm_dict_tmp[key] = [val_i]
-        else:
-            posnorm_dict_tmp[key].append(val_i)
-
-    # create map for quick access to original vertex index via double vertex indices: (key: double vert index; value: original vert index)
-    verts_map = {}
-    for indices in posnorm_dict_tmp.values():
-        # ignore entry if only one vertex was added to it (means there was no duplicates for it)
-        if len(indices) <= 1:
-            continue
+    perc = 10 ** equal_decimals_count  # represent precision for duplicates
+    quantized = numpy.hstack([numpy.trunc(numpy.asarray(attr, dtype=numpy.float64) * perc).astype(numpy.int64)
+                              for attr in quantized_attributes])
 
-        for idx in indices[1:]:
-            verts_map[idx] = indices[0]  # fist index is original, rest are duplicates
+    # fist vertex with the same quantized values is original, rest are duplicates
+    _, first_vertices, inverse = numpy.unique(quantized, axis=0, return_index=True, return_inverse=True)
 
-    return verts_map
+    return first_vertices[inverse.reshape(-1)].astype(numpy.int32)
 
 
 def bm_make_vertices(bm, vertices):
@@ -83,6 +82,40 @@ def bm_make_vertices(bm, vertices):
             vert.index = v_co_i
 
 
+def _get_winding_key(face):
+    """Gets key of the face which doesn't depend on the starting vertex of the face,
+    but still depends on it's winding. It's made by rotating face so it starts with the smallest vertex index.
+
+    :param face: face as vertex indices
+    :type face: tuple[int]
+    :return: rotated face
+    :rtype: tuple[int]
+    """
+    start_i = face.index(min(face))
+    return face[start_i:] + face[:start_i]
+
+
+def _is_back_face(face, made_faces, back_faces_keys):
+    """Checks if given face is reverse face of already made face, which doesn't have it's back face yet.
+    On success face is also registered as back face.
+
+    :param face: face as vertex indices
+    :type face: tuple[int] | list[int]
+    :param made_faces: winding keys of already made faces by their sorted vertex indices
+    :type made_faces: dict[tuple[int], tuple[int]]
+    :param back_faces_keys: sorted vertex indices of already found back faces
+    :type back_faces_keys: set[tuple[int]]
+    :return: True if face is a back face; False otherwise
+    :rtype: bool
+    """
+    key = tuple(sorted(face))
+    if key in back_faces_keys or made_faces.get(key) != _get_winding_key(tuple(reversed(face))):
+        return False
+
+    back_faces_keys.add(key)
+    return True
+
+
 def bm_make_faces(bm, faces, points_to_weld_list):
     """
     Takes BMesh object, list of faces as vertex indices, list of vertices for elimination (smoothing).
@@ -93,54 +126,182 @@ def bm_make_faces(bm, faces, points_to_weld_list):
     :type bm: bmesh.types.BMesh
     :param faces: faces which should be created, tuples of vertex indices
     :type faces: list[tuple[float]]
-    :param points_to_weld_list:
+    :param points_to_weld_list: original vertex index per vertex or None if no vertices should be welded
+    :type points_to_weld_list: numpy.ndarray | None
     :return: new faces with correct indices without back faces and back faces
     :rtype: tuple[list[tuple[int]], list[tuple[int]]]
     """
     back_faces = []
     new_faces = []  # store faces in new array so indices to vertices will be fixed in the case of duplicate geometry
 
-    # dictionaries only for quick search access
+    # dictionaries only for quick search access, keyed by sorted vertex indices of the face
     new_faces_dict = {}
-    back_faces_dict = {}
+    back_faces_keys = set()
 
     if faces:
+        bm.verts.ensure_lookup_table()
+
         for f_idx_i, f_idx in enumerate(faces):
 
-            new_f_idx = []
-            for v_idx in f_idx:
-                new_v_idx = v_idx
-                if v_idx in points_to_weld_list:
-                    new_v_idx = points_to_weld_list[v_idx]
-                new_f_idx.append(new_v_idx)
+            if points_to_weld_list is None:
+                new_f_idx = f_idx
+            else:
+                new_f_idx = points_to_weld_list[f_idx].tolist()
 
             try:
 
-                bm.verts.ensure_lookup_table()
                 bm.faces.new([bm.verts[i] for i in new_f_idx])
                 new_faces.append(f_idx)
-                new_faces_dict[str(f_idx)] = True
+                new_faces_dict[tuple(sorted(f_idx))] = _get_winding_key(tuple(f_idx))
 
             except ValueError:
                 lprint('D Face #%i vertex indices already used: %s', (f_idx_i, str(new_f_idx)))
 
-                # with deque rotation we can determinate if current face
-                # is really reverse face of already existing,
+                # if current face is reverse face of already existing one,
                 # then we can add it as back face; otherwise we have to ignore it
-                f_idx_deque = deque(reversed(f_idx))
-                f_idx_deque.rotate(-1)
-
-                for _ in range(len(f_idx)):
-                    f_idx_deque.rotate()
-                    f_idx_str = str(list(f_idx_deque))
-                    if f_idx_str in new_faces_dict and f_idx_str not in back_faces_dict:
-                        back_faces.append(f_idx)
-                        back_faces_dict[f_idx_str] = True
-                        lprint('D Face #%i is a reverse face, it will be added to extra back object.', (f_idx_i,))
+                if _is_back_face(f_idx, new_faces_dict, back_faces_keys):
+                    back_faces.append(f_idx)
+                    lprint('D Face #%i is a reverse face, it will be added to extra back object.', (f_idx_i,))
 
     return new_faces, back_faces
 
 
+def get_welded_vertices_map(vertices_count, points_to_weld_list):
+    """Gets indices of vertices which are left after welding and map of all vertex indices into indices of left vertices.
+    Duplicated vertices are mapped to the new index of their original counter part.
+
+    :param vertices_count: number of all vertices
+    :type vertices_count: int
+    :param points_to_weld_list: original vertex index per vertex or None if no vertices should be welded
+    :type points_to_weld_list: numpy.ndarray | None
+    :return: original indices of left vertices and map of all vertex indices into new indices
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    if points_to_weld_list is None:
+        return numpy.arange(vertices_count), numpy.arange(vertices_count)
+
+    left_indices = numpy.flatnonzero(points_to_weld_list == numpy.arange(vertices_count))
+
+    vertices_map = numpy.empty(vertices_count, dtype=numpy.int64)
+    vertices_map[left_indices] = numpy.arange(len(left_indices))
+
+    return left_indices, vertices_map[points_to_weld_list]
+
+
+def make_faces(faces, vertices_map):
+    """Makes faces for bulk mesh creation the same way as they would be made in BMesh one by one.
+    Faces using same vertex multiple times or using same vertices as one of previous faces are skipped,
+    where ones being reverse faces of made faces are returned as back faces.
+
+    :param faces: faces as vertex indices, all with the same number of vertices
+    :type faces: list[tuple[int]]
+    :param vertices_map: map of vertex indices into indices of mesh vertices
+    :type vertices_map: numpy.ndarray
+    :return: made faces with original indices, made faces with mapped indices and back faces with original indices
+    :rtype: tuple[numpy.ndarray, numpy.ndarray, list[tuple[int]]]
+    """
+    if not faces:
+        empty_faces = numpy.empty((0, 3), dtype=numpy.int64)
+        return empty_faces, empty_faces, []
+
+    faces = numpy.array(faces, dtype=numpy.int64)
+    mapped_faces = vertices_map[faces]
+
+    # face is valid only if it's not using same vertex multiple times
+    sorted_faces = numpy.sort(mapped_faces, axis=1)
+    valid_indices = numpy.flatnonzero(numpy.all(sorted_faces[:, 1:] != sorted_faces[:, :-1], axis=1))
+
+    # out of valid faces using the same vertices only first one can be made
+    _, first_indices = numpy.unique(sorted_faces[valid_indices], axis=0, return_index=True)
+    is_made = numpy.zeros(len(faces), dtype=bool)
+    is_made[valid_indices[first_indices]] = True
+
+    made_faces = faces[is_made]
+    back_faces = []
+
+    skipped_indices = numpy.flatnonzero(~is_made)
+    if len(skipped_indices) > 0:
+
+        made_indices = numpy.flatnonzero(is_made).tolist()
+        made_faces_dict = {}
+        back_faces_keys = set()
+
+        made_i = 0
+        for f_idx_i in skipped_indices.tolist():
+            f_idx = tuple(faces[f_idx_i].tolist())
+
+            # only faces made before current one can be reverse faces of it
+            while made_i < len(made_indices) and made_indices[made_i] < f_idx_i:
+                made_f_idx = tuple(faces[made_indices[made_i]].tolist())
+                made_faces_dict[tuple(sorted(made_f_idx))] = _get_winding_key(made_f_idx)
+                made_i += 1
+
+            lprint('D Face #%i vertex indices already used: %s', (f_idx_i, str(mapped_faces[f_idx_i].tolist())))
+
+            # if current face is reverse face of already made one,
+            # then we can add it as back face; otherwise we have to ignore it
+            if _is_back_face(f_idx, made_faces_dict, back_faces_keys):
+                back_faces.append(f_idx)
+                lprint('D Face #%i is a reverse face, it will be added to extra back object.', (f_idx_i,))
+
+    return made_faces, mapped_faces[is_made], back_faces
+
+
+def make_mesh(mesh, vertices, faces):
+    """Makes vertices, loops and polygons of given empty mesh in bulk.
+
+    :param mesh: mesh to make geometry in
+    :type mesh: bpy.types.Mesh
+    :param vertices: vertex coordinates
+    :type vertices: collections.Sequence[tuple[float]]
+    :param faces: faces as vertex indices
+    :type faces: numpy.ndarray
+    """
+    mesh.from_pydata(vertices, [], faces.tolist())
+    mesh.update()
+
+
+def make_uv_layer(mesh, uv_layer_name, loops_uvs):
+    """Makes UV layer on given mesh from UVs in SCS coordinates given per loop.
+
+    :param mesh: mesh to make UV layer in
+    :type mesh: bpy.types.Mesh
+    :param uv_layer_name: name for the layer
+    :type uv_layer_name: str
+    :param loops_uvs: UVs per loop as (N, 2) array
+    :type loops_uvs: numpy.ndarray
+    """
+    uvs = numpy.array(loops_uvs, dtype=numpy.float32)
+    uvs[:, 1] = 1 - uvs[:, 1]
+
+    uv_lay = mesh.uv_layers.new(name=uv_layer_name, do_init=False)
+    uv_lay.data.foreach_set("uv", uvs.ravel())
+
+
+def make_vc_layer(mesh, vc_layer_name, loops_colors):
+    """Makes vertex color layer on given mesh from SCS vertex colors given per loop.
+    If colors have alpha channel, additional vertex color alpha layer is made.
+
+    :param mesh: mesh to make vertex color layer in
+    :type mesh: bpy.types.Mesh
+    :param vc_layer_name: name for the layer
+    :type vc_layer_name: str
+    :param loops_colors: RGB or RGBA colors per loop as (N, 3) or (N, 4) array
+    :type loops_colors: numpy.ndarray
+    """
+    loops_count = len(loops_colors)
+
+    # NOTE: vertex colors layers are used as they are storing colors without color space conversion,
+    # the same as BMesh color layers did
+    colors = numpy.ones((loops_count, 4), dtype=numpy.float32)
+    colors[:, :3] = loops_colors[:, :3] / 2
+    mesh.vertex_colors.new(name=vc_layer_name).data.foreach_set("color", colors.ravel())
+
+    if loops_colors.shape[1] == 4:
+        colors[:, :3] = loops_colors[:, 3:4] / 2
+        mesh.vertex_colors.new(name=vc_layer_name + _MESH_consts.vcol_a_suffix).data.foreach_set("color", colors.ravel())
+
+
 def flip_faceverts(faces):
     """Reverse order of Face-Vertex indices (to flip the normals).
 
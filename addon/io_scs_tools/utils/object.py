@@ -267,7 +267,7 @@ def make_mesh_from_verts_and_faces(verts, faces, convex_props):
     _mesh.bm_make_vertices(new_bm, verts)
 
     # MAKE FACES
-    _mesh.bm_make_faces(new_bm, faces, [])
+    _mesh.bm_make_faces(new_bm, faces, None)
 
     new_bm.to_mesh(new_mesh)
     new_mesh.update()
@@ -0,0 +1,333 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Copyright (C) 2013-2022: SCS Software
+
+import bz2
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import ZipFile, ZipInfo, BadZipFile, ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2
+from io_scs_tools.consts import ExportManifest as _MANIFEST_consts
+from io_scs_tools.utils.printout import lprint
+
+_SUPPORTED_COMPRESSIONS = {ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2}
+"""Compression types for which compression can be done in worker threads."""
+
+_LOCAL_HEADER_SIZE = 30
+"""Size of ZIP local file header without variable fields (file name and extra field)."""
+
+_RAW_WRITE_ZIPFILE_ATTRS = ("fp", "start_dir", "filelist", "NameToInfo", "_writecheck", "_didModify", "_writing")
+"""Non public attributes of ZipFile used for writing already compressed entries (verified with Python 3.7 - 3.11)."""
+
+
+def get_archive_path(origin_path, abs_path):
+    """Extract zipfile path, do conversion to proper slashes as zipfile namelist
+    is returning only normal slashes even on windows and as last remove leading slash
+    as zipfile namelist again doesn't have it.
+
+    :param origin_path: path to directory where root of zipfile is (generally this should be some parent folder of second argument)
+    :type origin_path: str
+    :param abs_path: absolute path of file for which zipfile path shall be returned
+    :type abs_path: str
+    :return: correct zipfile path for given absolute path relative to irigin path
+    :rtype: str
+    """
+    return abs_path.replace(origin_path, "").replace("\\", "/").lstrip("/")
+
+
+def _collect_entries(src_dirs):
+    """Collects archive entries from given source directories. Entries already collected
+    under the same archive name from previous directories are ignored.
+
+    :param src_dirs: source directories which content should be packed
+    :type src_dirs: collections.Iterable[str]
+    :return: list of entries as tuples (absolute path, archive name, is directory)
+    :rtype: list[tuple[str, str, bool]]
+    """
+
+    entries = []
+    archive_names = set()
+
+    for src_dir in src_dirs:
+
+        for root, dirs, files in os.walk(src_dir):
+
+            # ignore packing if no files in current dir
+            if len(files) <= 0:
+                continue
+
+            # collect directories
+            for directory in dirs:
+
+                abs_dir = os.path.join(root, directory)
+                archive_dir = get_archive_path(src_dir, abs_dir) + "/"
+
+                if archive_dir in archive_names:
+                    lprint("D Archive name %r already exists, ignoring it!", (archive_dir,))
+                    continue
+
+                archive_names.add(archive_dir)
+                entries.append((abs_dir, archive_dir, True))
+
+            # collect files
+            for file in files:
+
+                # export manifests are used only by Blender Tools
+                if file.endswith(_MANIFEST_consts.file_ext):
+                    continue
+
+                abs_file = os.path.join(root, file)
+                archive_file = get_archive_path(src_dir, abs_file)
+
+                if archive_file in archive_names:
+                    lprint("D Archive name %r already exists, ignoring it!", (archive_file,))
+                    continue
+
+                archive_names.add(archive_file)
+                entries.append((abs_file, archive_file, False))
+
+    return entries
+
+
+def _compress_file(filepath, compress_type, reusable_crc=None):
+    """Reads and compresses given file the same way as zipfile module does.
+    As zlib and bz2 release GIL while compressing, this is meant to be executed in worker threads.
+
+    :param filepath: absolute path of the file to compress
+    :type filepath: str
+    :param compress_type: ZIP compression type
+    :type compress_type: int
+    :param reusable_crc: CRC of the entry from previous archive, compression is skipped if file CRC is the same
+    :type reusable_crc: int | None
+    :return: CRC of uncompressed data, uncompressed size and compressed data; None instead of data if CRC matches reusable one
+    :rtype: tuple[int, int, bytes | None]
+    """
+
+    with open(filepath, mode="rb") as file:
+        data = file.read()
+
+    crc = zlib.crc32(data)
+    if crc == reusable_crc:
+        return crc, len(data), None
+
+    if compress_type == ZIP_DEFLATED:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        compressed_data = compressor.compress(data) + compressor.flush()
+    elif compress_type == ZIP_BZIP2:
+        compressed_data = bz2.compress(data)
+    else:
+        compressed_data = data
+
+    return crc, len(data), compressed_data
+
+
+def _read_raw_entry(file, zinfo):
+    """Reads raw (still compressed) data of given entry from opened ZIP file.
+
+    :param file: ZIP file opened for binary reading
+    :type file: io.BufferedReader
+    :param zinfo: info of the entry which data should be read
+    :type zinfo: zipfile.ZipInfo
+    :return: compressed data of the entry
+    :rtype: bytes
+    """
+
+    file.seek(zinfo.header_offset)
+    local_header = file.read(_LOCAL_HEADER_SIZE)
+    filename_length, extra_length = struct.unpack("<HH", local_header[26:30])
+    file.seek(filename_length + extra_length, os.SEEK_CUR)
+
+    return file.read(zinfo.compress_size)
+
+
+def _can_write_raw(zip_file):
+    """Checks if already compressed entries can be written into given ZIP file.
+
+    As writing them depends on zipfile internals, which might change with any Python version,
+    this has to be checked before using _write_raw_entry.
+
+    :param zip_file: ZIP file opened for writing
+    :type zip_file: zipfile.ZipFile
+    :return: True if all needed internals are available and no other entry is being written; False otherwise
+    :rtype: bool
+    """
+    return (all(hasattr(zip_file, attr) for attr in _RAW_WRITE_ZIPFILE_ATTRS) and
+            callable(getattr(ZipInfo, "FileHeader", None)) and
+            zip_file.fp.seekable() and
+            not zip_file._writing)
+
+
+def _write_raw_entry(zip_file, zinfo, raw_data):
+    """Writes already compressed entry into ZIP file opened for writing.
+
+    NOTE: this follows what zipfile module does when writing an entry, just without compressing the data.
+    It relies on zipfile internals, thus _can_write_raw has to be checked before.
+
+    :param zip_file: ZIP file opened for writing
+    :type zip_file: zipfile.ZipFile
+    :param zinfo: info of the entry with already set CRC, compressed and uncompressed size
+    :type zinfo: zipfile.ZipInfo
+    :param raw_data: compressed data of the entry
+    :type raw_data: bytes
+    """
+
+    zip_file.fp.seek(zip_file.start_dir)
+    zinfo.header_offset = zip_file.fp.tell()
+
+    zip_file._writecheck(zinfo)
+    zip_file._didModify = True
+
+    zip_file.fp.write(zinfo.FileHeader())
+    zip_file.fp.write(raw_data)
+
+    zip_file.filelist.append(zinfo)
+    zip_file.NameToInfo[zinfo.filename] = zinfo
+    zip_file.start_dir = zip_file.fp.tell()
+
+
+def _is_entry_reusable(old_zinfo, zinfo, compress_type):
+    """Checks if entry from previous archive might be reused for given new entry,
+    meaning file size didn't change and same compression was used.
+
+    NOTE: modification time isn't reliable enough, so content of the file has to be compared by CRC afterwards.
+
+    :param old_zinfo: entry info from previous archive
+    :type old_zinfo: zipfile.ZipInfo
+    :param zinfo: entry info of the file to be packed
+    :type zinfo: zipfile.ZipInfo
+    :param compress_type: ZIP compression type of new archive
+    :type compress_type: int
+    :return: True if old entry can be copied over; False otherwise
+    :rtype: bool
+    """
+    return (old_zinfo.compress_type == compress_type and
+            not old_zinfo.flag_bits & 0x1 and  # encrypted entries can't be reused
+            old_zinfo.file_size == zinfo.file_size)
+
+
+def pack_directories(zip_filepath, src_dirs, compress_type, incremental=False):
+    """Packs content of given source directories into ZIP archive.
+
+    Files are compressed in worker threads and written into the archive in the same order as they are collected.
+    If incremental is requested and archive already exists, entries of files with unchanged size and CRC
+    are copied from existing archive without recompressing them. Archive is written to temporary file first and
+    replaces existing one only when packing succeeds.
+
+    :param zip_filepath: absolute path of resulting ZIP archive
+    :type zip_filepath: str
+    :param src_dirs: source directories which content should be packed, if same archive name is found in multiple directories
+    first one is used
+    :type src_dirs: collections.Iterable[str]
+    :param compress_type: ZIP compression type
+    :type compress_type: int
+    :param incremental: should entries from existing archive be reused
+    :type incremental: bool
+    :return: number of packed files and number of files reused from existing archive
+    :rtype: tuple[int, int]
+    """
+
+    entries = _collect_entries(src_dirs)
+    files_count = sum(1 for entry in entries if not entry[2])
+
+    # read entries of existing archive
+    old_zip_file = None
+    old_zinfos = {}
+    if incremental and os.path.isfile(zip_filepath):
+        try:
+            with ZipFile(zip_filepath, 'r') as old_zip:
+                old_zinfos = {zinfo.filename: zinfo for zinfo in old_zip.infolist()}
+            old_zip_file = open(zip_filepath, mode="rb")
+        except (BadZipFile, OSError) as e:
+            lprint("W Existing mod archive can't be reused, packing everything from scratch: %s", (e,))
+            old_zinfos = {}
+
+    tmp_zip_filepath = zip_filepath + ".tmp"
+    files_done = reused_count = 0
+    max_workers = os.cpu_count() or 1
+
+    try:
+        with ZipFile(tmp_zip_filepath, 'w') as zip_file, ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            # without raw writing everything is compressed by zipfile itself
+            threaded = compress_type in _SUPPORTED_COMPRESSIONS and _can_write_raw(zip_file)
+            if not threaded and compress_type in _SUPPORTED_COMPRESSIONS:
+                lprint("D Writing of compressed entries isn't supported by this zipfile module, packing in single thread!")
+
+            pending = deque()
+
+            def write_next_pending():
+                """Writes first pending entry into the archive, waiting for its compression if needed."""
+                nonlocal files_done, reused_count
+
+                abs_path, zinfo, job, old_zinfo = pending.popleft()
+
+                if job is None:  # directory or file with compression we can't do in threads
+                    zip_file.write(abs_path, zinfo.filename, compress_type=compress_type)
+                    if zinfo.is_dir():
+                        return
+                else:
+                    zinfo.CRC, zinfo.file_size, raw_data = job.result()
+                    if raw_data is None:  # content didn't change, reuse entry from existing archive
+                        zinfo.compress_size = old_zinfo.compress_size
+                        zinfo.flag_bits = old_zinfo.flag_bits & ~0x08
+                        raw_data = _read_raw_entry(old_zip_file, old_zinfo)
+                        reused_count += 1
+                    else:
+                        zinfo.compress_size = len(raw_data)
+                    _write_raw_entry(zip_file, zinfo, raw_data)
+
+                files_done += 1
+                lprint("I Packing mod - %i of %i files done ...", (files_done, files_count), immediate_timeout=1)
+
+            for abs_path, archive_name, is_dir in entries:
+
+                zinfo = ZipInfo.from_file(abs_path, archive_name)
+                zinfo.compress_type = compress_type
+
+                old_zinfo = old_zinfos.get(archive_name)
+                if old_zinfo and not _is_entry_reusable(old_zinfo, zinfo, compress_type):
+                    old_zinfo = None
+
+                if is_dir or not threaded:
+                    job = None
+                else:
+                    job = executor.submit(_compress_file, abs_path, compress_type, old_zinfo.CRC if old_zinfo else None)
+
+                pending.append((abs_path, zinfo, job, old_zinfo))
+
+                # limit number of files held in memory
+                if len(pending) > max_workers * 4:
+                    write_next_pending()
+
+            while pending:
+                write_next_pending()
+
+        os.replace(tmp_zip_filepath, zip_filepath)
+
+    finally:
+
+        if old_zip_file:
+            old_zip_file.close()
+
+        if os.path.isfile(tmp_zip_filepath):
+            os.remove(tmp_zip_filepath)
+
+    return files_count, reused_count
@@ -23,12 +23,316 @@ import bpy
 import os
 import subprocess
 import shutil
+import threading
+import time
 from sys import platform
 from io_scs_tools.utils.printout import lprint
 from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 
 _KNOWN_PROJECT_BASES = ("base_vehicle", "base_share", "base")
 
+_PROJECT_INDEX_REVALIDATION_TIME = 2.0
+"""Time in seconds for which directory listings of project index are trusted, before their modification time is checked again."""
+
+
+class _DirListing:
+    """Snapshot of one directory in project index."""
+
+    __slots__ = ("checked", "mtime", "files", "dirs")
+
+    def __init__(self, checked, mtime, files, dirs):
+        self.checked = checked
+        """Time of the last validation of the listing."""
+        self.mtime = mtime
+        """Modification time of the directory in nanoseconds, None if directory doesn't exist."""
+        self.files = files
+        """Files of the directory, normalized names mapped to actual names, None if directory doesn't exist."""
+        self.dirs = dirs
+        """Normalized names of sub-directories, None if directory doesn't exist."""
+
+
+class _ProjectIndex:
+    """Class for answering existence checks and listings of files inside project bases from memory.
+
+    Index covers "SCS Project Base Path" and all alternative bases given by project infixes and it's
+    built lazily, directory by directory, when paths are looked up. Existence of the directory is taken from
+    listing of its parent, so looking up paths in non-existing alternative bases doesn't touch filesystem at all.
+    Listings are trusted for a short time after they are validated, afterwards their modification time
+    is checked and directory is listed again only if it was changed.
+    Whole index is dropped once project path or usage of alternative bases changes.
+    """
+
+    __bases_key = None
+    """Project path and alternative bases usage, index was built for."""
+    __roots = ()
+    """Normalized root directories of all bases covered by index."""
+    __listings = {}
+    """:type: dict[str, _DirListing]"""
+    __lock = threading.RLock()
+
+    __avoided = 0
+    __performed = 0
+
+    @staticmethod
+    def __ensure_bases():
+        """Makes sure that index is built for current project path and alternative bases, otherwise it's dropped."""
+
+        scs_globals = _get_scs_globals()
+        bases_key = (scs_globals.scs_project_path, scs_globals.use_alternative_bases)
+
+        if bases_key == _ProjectIndex.__bases_key:
+            return
+
+        roots = []
+        project_path = bases_key[0]
+        if len(project_path) > 2:
+
+            for infix in [""] + get_possible_project_infixes():
+
+                root = os.path.join(project_path, infix)
+
+                # paths are normalized without resolving symbolic links,
+                # so bases which would end elsewhere with symbolic links resolved are left out of the index
+                if infix != "" and os.path.realpath(root) != os.path.realpath(os.path.normpath(root)):
+                    continue
+
+                roots.append(full_norm(root))
+
+        _ProjectIndex.__bases_key = bases_key
+        _ProjectIndex.__roots = tuple(roots)
+        _ProjectIndex.__listings = {}
+
+    @staticmethod
+    def __is_indexed(norm_path):
+        """Checks if given normalized path is inside any of the indexed bases.
+
+        :param norm_path: fully normalized path
+        :type norm_path: str
+        :return: True if path is covered by index; False otherwise
+        :rtype: bool
+        """
+        for root in _ProjectIndex.__roots:
+            if norm_path == root or norm_path.startswith(root.rstrip(os.sep) + os.sep):
+                return True
+        return False
+
+    @staticmethod
+    def __list_dir(norm_dirpath):
+        """Lists given directory from filesystem.
+
+        :param norm_dirpath: fully normalized path of the directory
+        :type norm_dirpath: str
+        :return: listing of the directory
+        :rtype: _DirListing
+        """
+
+        files = {}
+        dirs = set()
+        mtime = None
+
+        try:
+            mtime = os.stat(norm_dirpath).st_mtime_ns
+            with os.scandir(norm_dirpath) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            dirs.add(os.path.normcase(entry.name))
+                        else:
+                            files[os.path.normcase(entry.name)] = entry.name
+                    except OSError:
+                        continue
+        except OSError:
+            return _DirListing(time.monotonic(), None, None, None)
+
+        return _DirListing(time.monotonic(), mtime, files, dirs)
+
+    @staticmethod
+    def __get_listing(norm_dirpath):
+        """Gets listing of given directory, either from index or filesystem.
+
+        :param norm_dirpath: fully normalized path of the directory, has to be covered by index
+        :type norm_dirpath: str
+        :return: listing of the directory
+        :rtype: _DirListing
+        """
+
+        listing = _ProjectIndex.__listings.get(norm_dirpath)
+
+        if listing is not None and time.monotonic() - listing.checked < _PROJECT_INDEX_REVALIDATION_TIME:
+            return listing
+
+        # existence of the directory is taken from parent listing, if parent is indexed as well
+        parent_dirpath = os.path.dirname(norm_dirpath)
+        if parent_dirpath != norm_dirpath and _ProjectIndex.__is_indexed(parent_dirpath):
+
+            parent_listing = _ProjectIndex.__get_listing(parent_dirpath)
+            if parent_listing.dirs is None or os.path.basename(norm_dirpath) not in parent_listing.dirs:
+                listing = _DirListing(time.monotonic(), None, None, None)
+                _ProjectIndex.__listings[norm_dirpath] = listing
+                return listing
+
+        _ProjectIndex.__performed += 1
+
+        # directory which wasn't changed only gets validated again
+        if listing is not None and listing.mtime is not None:
+            try:
+                if os.stat(norm_dirpath).st_mtime_ns == listing.mtime:
+                    listing.checked = time.monotonic()
+                    return listing
+            except OSError:
+                pass
+
+        listing = _ProjectIndex.__list_dir(norm_dirpath)
+        _ProjectIndex.__listings[norm_dirpath] = listing
+        return listing
+
+    @staticmethod
+    def exists(path, is_dir):
+        """Checks existence of given file or directory.
+
+        :param path: absolute path
+        :type path: str
+        :param is_dir: should path be a directory
+        :type is_dir: bool
+        :return: True if exists; False if it doesn't exist; None if path is not covered by index
+        :rtype: bool | None
+        """
+
+        with _ProjectIndex.__lock:
+
+            _ProjectIndex.__ensure_bases()
+
+            norm_path = full_norm(path)
+            if not _ProjectIndex.__is_indexed(norm_path):
+                return None
+
+            performed = _ProjectIndex.__performed
+
+            if norm_path in _ProjectIndex.__roots:
+                result = _ProjectIndex.__get_listing(norm_path).dirs is not None and is_dir
+            else:
+                dirpath, name = os.path.split(norm_path)
+                listing = _ProjectIndex.__get_listing(dirpath)
+
+                if listing.dirs is None:
+                    result = False
+                elif is_dir:
+                    result = name in listing.dirs
+                else:
+                    result = name in listing.files
+
+            if _ProjectIndex.__performed == performed:
+                _ProjectIndex.__avoided += 1
+
+            return result
+
+    @staticmethod
+    def list_files(dirpath):
+        """Lists names of the files inside given directory.
+
+        :param dirpath: absolute path of the directory
+        :type dirpath: str
+        :return: names of files, empty list if directory doesn't exist; None if directory is not covered by index
+        :rtype: list[str] | None
+        """
+
+        with _ProjectIndex.__lock:
+
+            _ProjectIndex.__ensure_bases()
+
+            norm_dirpath = full_norm(dirpath)
+            if not _ProjectIndex.__is_indexed(norm_dirpath):
+                return None
+
+            performed = _ProjectIndex.__performed
+
+            listing = _ProjectIndex.__get_listing(norm_dirpath)
+
+            if _ProjectIndex.__performed == performed:
+                _ProjectIndex.__avoided += 1
+
+            if listing.files is None:
+                return []
+
+            return sorted(listing.files.values())
+
+    @staticmethod
+    def invalidate(path):
+        """Drops listings of given path and all of its parents, so changes done on the path are visible immediately.
+
+        :param path: absolute path of changed file or directory
+        :type path: str
+        """
+
+        with _ProjectIndex.__lock:
+
+            norm_path = full_norm(path)
+            while True:
+
+                _ProjectIndex.__listings.pop(norm_path, None)
+
+                parent_path = os.path.dirname(norm_path)
+                if parent_path == norm_path:
+                    break
+
+                norm_path = parent_path
+
+    @staticmethod
+    def get_stats():
+        """Gets number of filesystem checks answered from index and number of filesystem accesses done by index.
+
+        :return: tuple of (avoided, performed)
+        :rtype: tuple[int, int]
+        """
+        return _ProjectIndex.__avoided, _ProjectIndex.__performed
+
+    @staticmethod
+    def reset_stats():
+        """Resets number of avoided and performed filesystem accesses."""
+        _ProjectIndex.__avoided = 0
+        _ProjectIndex.__performed = 0
+
+
+def _exists(path, is_dir):
+    """Checks existence of given file or directory, using project index for paths inside project bases.
+
+    :param path: absolute path
+    :type path: str
+    :param is_dir: should path be a directory
+    :type is_dir: bool
+    :return: True if exists; False otherwise
+    :rtype: bool
+    """
+
+    result = _ProjectIndex.exists(path, is_dir)
+    if result is None:
+        result = os.path.isdir(path) if is_dir else os.path.isfile(path)
+
+    return result
+
+
+def invalidate_project_index(path):
+    """Makes project index aware of changes on given path. Should be called after file or directory was created or removed.
+
+    :param path: absolute path of changed file or directory
+    :type path: str
+    """
+    _ProjectIndex.invalidate(path)
+
+
+def get_project_index_stats():
+    """Gets number of filesystem checks answered from project index and number of filesystem accesses done by it since last reset.
+
+    :return: tuple of (avoided, performed)
+    :rtype: tuple[int, int]
+    """
+    return _ProjectIndex.get_stats()
+
+
+def reset_project_index_stats():
+    """Resets number of avoided and performed filesystem accesses of project index."""
+    _ProjectIndex.reset_stats()
+
 
 def strip_sep(path):
     """Strips double path separators (slashes and backslashes) on the start and the end of the given path
@@ -174,9 +478,8 @@ def get_abs_path(path_in, subdir_path='', is_dir=False, skip_mod_check=False):
 
     # use subdir_path as last item, so that if file/dir not found we return correct abs path, not the last checked from parents dir
     infixes = get_possible_project_infixes() + [subdir_path, ]
-    existance_check = os.path.isdir if is_dir else os.path.isfile
 
-    while infixes and result is not None and not existance_check(result) and not skip_mod_check:
+    while infixes and result is not None and not skip_mod_check and not _exists(result, is_dir):
         result = get_abs_path(path_in, subdir_path=infixes.pop(0), is_dir=is_dir, skip_mod_check=True)
 
     return result
@@ -204,8 +507,6 @@ def get_abs_paths(filepath, is_dir=False, include_nonexist_alternative_bases=Fal
     So make sure to use normalized paths as keys and actual paths as values which should be returned as result.
     """
 
-    existance_check = os.path.isdir if is_dir else os.path.isfile
-
     for sub_dir in get_possible_project_infixes(include_zero_infix=True):
 
         infixed_abs_path = get_abs_path(filepath, subdir_path=sub_dir, is_dir=is_dir, skip_mod_check=True)
@@ -224,7 +525,7 @@ def get_abs_paths(filepath, is_dir=False, include_nonexist_alternative_bases=Fal
 
             # create normalized path to properly gather only unique paths
             normalized_resulted_path = full_norm(resulted_path)
-            if (include_nonexist_alternative_bases or existance_check(resulted_path)) and normalized_resulted_path not in abs_paths:
+            if (include_nonexist_alternative_bases or _exists(resulted_path, is_dir)) and normalized_resulted_path not in abs_paths:
                 abs_paths[normalized_resulted_path] = resulted_path
 
     # we are returning de-normalized paths, as they might be used in printout and precious information
@@ -730,7 +1031,7 @@ def get_all_infixed_file_paths(filepath, include_given_path=True):
     orig_dir, orig_file = os.path.split(filepath)
 
     # if original directory doesn't exists skip searching for any infix files
-    if not os.path.isdir(orig_dir):
+    if not _exists(orig_dir, True):
         return infixed_filepaths
 
     last_ext_i = orig_file.rfind(".")
@@ -738,7 +1039,11 @@ def get_all_infixed_file_paths(filepath, include_given_path=True):
     orig_file_prefix = orig_file[:last_ext_i]
     orig_file_postfix = orig_file[last_ext_i:]
 
-    for file in os.listdir(orig_dir):
+    files = _ProjectIndex.list_files(orig_dir)
+    if files is None:
+        files = os.listdir(orig_dir)
+
+    for file in files:
 
         # if given file path is already prefixed make sure to ignore it
         if file == orig_file:
@@ -20,6 +20,7 @@
 
 import bpy
 import atexit
+import threading
 from time import time
 from tempfile import NamedTemporaryFile
 
@@ -149,6 +150,9 @@ error_messages = []
 dev_warning_messages = []
 warning_messages = []
 
+_collected = threading.local()
+"""Thread local storage of messages collected by lprint instead of printing them, used by worker threads."""
+
 
 def lprint(string, values=(), report_errors=0, report_warnings=0, immediate_timeout=-1):
     """Handy printout function with alert levels and more fancy stuff.
@@ -166,6 +170,12 @@ def lprint(string, values=(), report_errors=0, report_warnings=0, immediate_time
     """
     from io_scs_tools.utils import get_scs_globals as _get_scs_globals
 
+    # printing accesses blender data, so thread collecting its messages only stores them for later printout on main thread
+    collected_messages = getattr(_collected, "messages", None)
+    if collected_messages is not None:
+        collected_messages.append((string, values))
+        return False
+
     dump_level = int(_get_scs_globals().dump_level)
 
     prech = ''
@@ -277,6 +287,35 @@ def lprint(string, values=(), report_errors=0, report_warnings=0, immediate_time
         return False
 
 
+def start_collecting():
+    """Starts collecting of messages in current thread, from now on lprint only stores messages of this thread
+    instead of printing them. Meant for worker threads which can't access blender data.
+    Should be always used in pair with finish_collecting.
+    """
+    _collected.messages = []
+
+
+def finish_collecting():
+    """Stops collecting of messages in current thread.
+
+    :return: collected messages as tuples of message string and its values, to be printed with print_collected
+    :rtype: list[tuple[str, tuple]]
+    """
+    messages = getattr(_collected, "messages", None)
+    _collected.messages = None
+    return messages if messages is not None else []
+
+
+def print_collected(messages):
+    """Prints out messages collected by finish_collecting. Has to be called from main thread.
+
+    :param messages: collected messages
+    :type messages: list[tuple[str, tuple]]
+    """
+    for string, values in messages:
+        lprint(string, values)
+
+
 def get_log():
     """Gets current content of temporary SCS BT log file,
     which was created at startup and is having log of BT session.
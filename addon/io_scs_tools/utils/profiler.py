@@ -0,0 +1,386 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Copyright (C) 2022: SCS Software
+
+import os
+import re
+import json
+import time
+import tempfile
+import threading
+from io_scs_tools.consts import Cache as _CACHE_consts
+from io_scs_tools.consts import Profiler as _PROFILER_consts
+from io_scs_tools.utils import get_scs_globals as _get_scs_globals
+from io_scs_tools.utils.printout import lprint
+
+
+class _Stage:
+    """Accumulated timings of one stage in hierarchy of stages."""
+
+    __slots__ = ("name", "children", "total", "calls", "items")
+
+    def __init__(self, name):
+        self.name = name
+        self.children = {}
+        """:type: dict[str, _Stage]"""
+        self.total = 0.0
+        self.calls = 0
+        self.items = 0
+
+    def get_self_time(self):
+        """Gets time spent in this stage without its child stages.
+
+        :return: self time in seconds
+        :rtype: float
+        """
+        return max(0.0, self.total - sum(child.total for child in self.children.values()))
+
+    def get_as_dict(self):
+        """Gets stage and its children as dictionary, used for JSON output.
+
+        :return: stage as dictionary
+        :rtype: dict
+        """
+        return {
+            "name": self.name,
+            "total": self.total,
+            "self": self.get_self_time(),
+            "calls": self.calls,
+            "items": self.items,
+            "children": [child.get_as_dict() for child in self.children.values()]
+        }
+
+
+class _Timer:
+    """Running timer of one stage call."""
+
+    __slots__ = ("stage", "start", "items")
+
+    def __init__(self, stage):
+        self.stage = stage
+        self.start = time.perf_counter()
+        self.items = 0
+
+
+class _StageContext:
+    """Context manager timing the stage it was created for."""
+
+    __slots__ = ("__name", "__items")
+
+    def __init__(self, name, items):
+        self.__name = name
+        self.__items = items
+
+    def __enter__(self):
+        begin(self.__name, self.__items)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end()
+        return False
+
+
+class _NullContext:
+    """Context manager doing nothing, used while profiling is disabled, so instrumented code has no overhead."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_CONTEXT = _NullContext()
+
+
+class _Profiler:
+    """Class for recording hierarchical timings of an operation.
+
+    Each thread has its own stack of running timers, so stages started in worker threads
+    are recorded as top level stages of the operation and their times overlap with the ones of main thread.
+    """
+
+    __operation = None
+    """Name of currently profiled operation, None if profiling is not active."""
+    __root = None
+    """:type: _Stage"""
+    __start = 0.0
+    __events = None
+    """Trace events of all stage calls, None if trace shouldn't be written."""
+    __lock = threading.Lock()
+    __local = threading.local()
+
+    @staticmethod
+    def __get_stack():
+        """Gets stack of running timers for current thread.
+
+        :return: timers stack
+        :rtype: list[_Timer]
+        """
+        stack = getattr(_Profiler.__local, "stack", None)
+        if stack is None or getattr(_Profiler.__local, "root", None) is not _Profiler.__root:
+            stack = _Profiler.__local.stack = []
+            _Profiler.__local.root = _Profiler.__root
+        return stack
+
+    @staticmethod
+    def is_active():
+        """Is any operation currently being profiled?
+
+        :return: True if profiling is active; False otherwise
+        :rtype: bool
+        """
+        return _Profiler.__root is not None
+
+    @staticmethod
+    def start(operation):
+        """Starts profiling of given operation, if enabled by dump level.
+        If previous operation didn't finish (e.g. it was aborted by an exception), its records are discarded.
+
+        :param operation: name of the profiled operation
+        :type operation: str
+        """
+
+        dump_level = int(_get_scs_globals().dump_level)
+        if dump_level < _PROFILER_consts.dump_level:
+            _Profiler.__operation = _Profiler.__root = _Profiler.__events = None
+            return
+
+        _Profiler.__operation = operation
+        _Profiler.__root = _Stage(operation)
+        _Profiler.__events = [] if dump_level >= _PROFILER_consts.trace_dump_level else None
+        _Profiler.__start = time.perf_counter()
+
+    @staticmethod
+    def begin(name, items):
+        """Begins a call of stage with given name as a child of currently running stage of this thread.
+
+        :param name: name of the stage
+        :type name: str
+        :param items: number of items processed by this call
+        :type items: int
+        """
+
+        stack = _Profiler.__get_stack()
+        parent = stack[-1].stage if stack else _Profiler.__root
+
+        with _Profiler.__lock:
+            if name not in parent.children:
+                parent.children[name] = _Stage(name)
+            stage = parent.children[name]
+
+        timer = _Timer(stage)
+        timer.items = items
+        stack.append(timer)
+
+    @staticmethod
+    def end():
+        """Ends currently running stage call of this thread."""
+
+        end_time = time.perf_counter()
+
+        stack = _Profiler.__get_stack()
+        if not stack:
+            return
+
+        timer = stack.pop()
+        duration = end_time - timer.start
+
+        with _Profiler.__lock:
+            stage = timer.stage
+            stage.total += duration
+            stage.calls += 1
+            stage.items += timer.items
+
+            if _Profiler.__events is not None:
+                event = {
+                    "name": stage.name,
+                    "cat": _Profiler.__operation,
+                    "ph": "X",
+                    "ts": round((timer.start - _Profiler.__start) * 1e6, 3),
+                    "dur": round(duration * 1e6, 3),
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+                if timer.items:
+                    event["args"] = {"items": timer.items}
+                _Profiler.__events.append(event)
+
+    @staticmethod
+    def add_items(count):
+        """Adds number of processed items to currently running stage call of this thread.
+
+        :param count: number of items
+        :type count: int
+        """
+
+        stack = _Profiler.__get_stack()
+        if stack:
+            stack[-1].items += count
+
+    @staticmethod
+    def finish():
+        """Finishes profiling of current operation, prints breakdown of its stages and writes trace file if requested."""
+
+        root = _Profiler.__root
+        if root is None:
+            return
+
+        root.total = time.perf_counter() - _Profiler.__start
+        root.calls = 1
+
+        lines = []
+        _Profiler.__add_breakdown_lines(lines, root, 0, root.total)
+
+        header = "%-48s %10s %10s %7s %7s %10s" % ("Stage", "Total [ms]", "Self [ms]", "%", "Calls", "Items")
+        lprint("S Profile of %r operation:\n\t   %s\n\t   %s\n\t   %s",
+               (_Profiler.__operation, header, "-" * len(header), "\n\t   ".join(lines)))
+
+        if _Profiler.__events is not None:
+            _Profiler.__write_trace(root, _Profiler.__events)
+
+        _Profiler.__operation = _Profiler.__root = _Profiler.__events = None
+
+    @staticmethod
+    def __add_breakdown_lines(lines, stage, depth, operation_total):
+        """Adds breakdown lines of given stage and its children sorted by total time.
+
+        :param lines: list where lines are added to
+        :type lines: list[str]
+        :param stage: stage to add
+        :type stage: _Stage
+        :param depth: depth of stage in hierarchy
+        :type depth: int
+        :param operation_total: total time of the operation, used for percentage
+        :type operation_total: float
+        """
+
+        percentage = stage.total / operation_total * 100 if operation_total > 0 else 0.0
+        lines.append("%-48s %10.3f %10.3f %7.1f %7i %10s" % (("  " * depth + stage.name)[:48],
+                                                              stage.total * 1000,
+                                                              stage.get_self_time() * 1000,
+                                                              percentage,
+                                                              stage.calls,
+                                                              stage.items if stage.items else ""))
+
+        for child in sorted(stage.children.values(), key=lambda child_stage: child_stage.total, reverse=True):
+            _Profiler.__add_breakdown_lines(lines, child, depth + 1, operation_total)
+
+    @staticmethod
+    def __write_trace(root, events):
+        """Writes trace file in Chrome trace event format with stages summary, so it can be inspected or compared later.
+
+        :param root: root stage of the operation
+        :type root: _Stage
+        :param events: trace events
+        :type events: list[dict]
+        """
+
+        trace_dir = os.path.join(tempfile.gettempdir(), _CACHE_consts.dir_name, _PROFILER_consts.trace_dir_name)
+        trace_name = "%s_%s.json" % (re.sub(r"[^\w]+", "_", root.name).lower(), time.strftime("%Y%m%d_%H%M%S"))
+        trace_filepath = os.path.join(trace_dir, trace_name)
+
+        events.append({
+            "name": root.name,
+            "cat": root.name,
+            "ph": "X",
+            "ts": 0.0,
+            "dur": round(root.total * 1e6, 3),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        })
+
+        try:
+            os.makedirs(trace_dir, exist_ok=True)
+            with open(trace_filepath, mode="w", encoding="utf8") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms", "stages": root.get_as_dict()}, f)
+        except OSError as e:
+            lprint("W Unable to write profile trace file %r: %s", (trace_filepath, e))
+            return
+
+        lprint("S Profile trace written to: %r", (trace_filepath,))
+
+
+def start(operation):
+    """Starts profiling of given operation, if dump level is high enough.
+    Profiling has to be finished with finish(), which prints the breakdown of recorded stages.
+
+    :param operation: name of the profiled operation
+    :type operation: str
+    """
+    _Profiler.start(operation)
+
+
+def is_active():
+    """Is any operation currently being profiled?
+
+    :return: True if profiling is active; False otherwise
+    :rtype: bool
+    """
+    return _Profiler.is_active()
+
+
+def finish():
+    """Finishes profiling of current operation and prints breakdown of recorded stages."""
+    _Profiler.finish()
+
+
+def begin(name, items=0):
+    """Begins stage with given name in current thread. It has to be ended with end().
+
+    :param name: name of the stage
+    :type name: str
+    :param items: number of items processed by the stage (vertices, curves, frames...)
+    :type items: int
+    """
+    if _Profiler.is_active():
+        _Profiler.begin(name, items)
+
+
+def end():
+    """Ends last begun stage of current thread."""
+    if _Profiler.is_active():
+        _Profiler.end()
+
+
+def stage(name, items=0):
+    """Gets context manager timing given stage.
+
+    :param name: name of the stage
+    :type name: str
+    :param items: number of items processed by the stage (vertices, curves, frames...)
+    :type items: int
+    :return: context manager timing the stage
+    :rtype: _StageContext | _NullContext
+    """
+    if _Profiler.is_active():
+        return _StageContext(name, items)
+    return _NULL_CONTEXT
+
+
+def add_items(count):
+    """Adds number of processed items to the last begun stage of current thread.
+
+    :param count: number of items (vertices, curves, frames...)
+    :type count: int
+    """
+    if _Profiler.is_active():
+        _Profiler.add_items(count)
@@ -0,0 +1,67 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Copyright (C) 2022: SCS Software
+
+"""Micro-benchmark of hexadecimal float conversions used by PIX readers and writers.
+
+Compares per value conversions against batch conversions on stream of 1M floats.
+Run it with Blender, where SCS Blender Tools are installed:
+
+> blender --background --factory-startup --python test/benchmark/hex_convert.py
+"""
+
+import random
+from time import perf_counter
+from io_scs_tools.utils import convert as _convert_utils
+
+_FLOAT_COUNT = 1000000
+
+
+def _measure(label, func, *args):
+    start_time = perf_counter()
+    result = func(*args)
+    duration = perf_counter() - start_time
+    print("%-40s %8.3f s" % (label, duration))
+    return result, duration
+
+
+def main():
+    random.seed(0)
+    floats = [random.uniform(-1000.0, 1000.0) for _ in range(_FLOAT_COUNT)]
+
+    print("Hexadecimal float conversions of %i values:" % _FLOAT_COUNT)
+
+    hex_string, encode_single = _measure("float_to_hex_string (per value)",
+                                         lambda values: "  ".join([_convert_utils.float_to_hex_string(val) for val in values]),
+                                         floats)
+    batch_hex_string, encode_batch = _measure("floats_to_hex_string (batch)", _convert_utils.floats_to_hex_string, floats)
+    assert hex_string == batch_hex_string
+
+    hex_strings = hex_string.split()
+    decoded, decode_single = _measure("hex_string_to_float (per value)",
+                                      lambda values: [_convert_utils.hex_string_to_float(val) for val in values],
+                                      hex_strings)
+    batch_decoded, decode_batch = _measure("hex_strings_to_floats (batch)", _convert_utils.hex_strings_to_floats, hex_strings)
+    assert decoded == batch_decoded.tolist()
+
+    print("Encode speedup: %.1fx, decode speedup: %.1fx" % (encode_single / encode_batch, decode_single / decode_batch))
+
+
+if __name__ == "__main__":
+    main()
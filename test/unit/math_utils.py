@@ -0,0 +1,64 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Copyright (C) 2022: SCS Software
+
+"""Tests of batch vector math against per vector mathutils computations.
+
+Run it with Blender, where SCS Blender Tools are installed:
+
+> blender --background --factory-startup --python test/unit/math_utils.py
+"""
+
+import sys
+import unittest
+import numpy
+from mathutils import Vector
+from io_scs_tools.utils import math as _math_utils
+
+
+class NormalizeVectorsTest(unittest.TestCase):
+
+    def _assert_as_mathutils(self, vectors):
+        vectors = numpy.asarray(vectors, dtype=numpy.float32)
+
+        normalized = _math_utils.normalize_vectors(vectors)
+        expected = numpy.array([tuple(Vector(vec).normalized()) for vec in vectors], dtype=numpy.float32)
+
+        numpy.testing.assert_array_equal(normalized, expected)
+
+    def test_unit_range(self):
+        rng = numpy.random.default_rng(0)
+        self._assert_as_mathutils(rng.uniform(-1.0, 1.0, (10000, 3)))
+
+    def test_big_vectors(self):
+        rng = numpy.random.default_rng(1)
+        self._assert_as_mathutils(rng.uniform(-1.0e4, 1.0e4, (1000, 3)))
+
+    def test_tiny_vectors(self):
+        rng = numpy.random.default_rng(2)
+        self._assert_as_mathutils(rng.uniform(-1.0, 1.0, (1000, 3)) * 1.0e-10)
+        self._assert_as_mathutils(rng.uniform(-1.0, 1.0, (1000, 3)) * 1.0e-19)
+
+    def test_zero_vectors(self):
+        self._assert_as_mathutils([(0.0, 0.0, 0.0), (1.0e-20, 0.0, 0.0), (0.0, -1.0e-30, 0.0)])
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=[sys.argv[0]], exit=False).result
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,107 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Copyright (C) 2022: SCS Software
+
+"""Tests of PIX parse cache on sample PIS and PIA files, which containers include matrices.
+
+Each file is copied to temporary directory first, so the first read is always a cache miss.
+Run it with Blender, where SCS Blender Tools are installed:
+
+> blender --background --factory-startup --python test/unit/parse_cache.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import bpy
+from mathutils import Matrix, Vector
+from io_scs_tools.internals.containers import pix as _pix_container
+from io_scs_tools.internals.structure import SectionData, StreamData
+from io_scs_tools.utils import get_scs_globals as _get_scs_globals
+
+_SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir,
+                           "data", "sample_truck_base", "vehicle", "truck", "man_tgx_sample")
+
+
+def _to_comparable(value):
+    """Converts parsed container to nested tuples, so two containers can be compared with equality operator."""
+    if isinstance(value, SectionData):
+        return value.type, _to_comparable(value.props), _to_comparable(value.data), _to_comparable(value.sections)
+    if isinstance(value, StreamData):
+        return value.stride, tuple(value.values)
+    if isinstance(value, Matrix):
+        return "Matrix", tuple(tuple(row) for row in value)
+    if isinstance(value, Vector):
+        return "Vector", tuple(value)
+    if isinstance(value, dict):
+        return tuple((key, _to_comparable(val)) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_comparable(val) for val in value)
+    return value
+
+
+def _contains_matrix(value):
+    if isinstance(value, Matrix):
+        return True
+    if isinstance(value, SectionData):
+        return _contains_matrix(value.props) or _contains_matrix(value.data) or _contains_matrix(value.sections)
+    if isinstance(value, dict):
+        return _contains_matrix(list(value.values()))
+    if isinstance(value, (list, tuple)):
+        return any(_contains_matrix(val) for val in value)
+    return False
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.use_parse_cache = _get_scs_globals().import_use_parse_cache
+        _get_scs_globals().import_use_parse_cache = True
+
+    def tearDown(self):
+        _get_scs_globals().import_use_parse_cache = self.use_parse_cache
+        shutil.rmtree(self.tmp_dir)
+
+    def _read_twice(self, file_name, tokenized):
+        filepath = shutil.copy(os.path.join(_SAMPLE_DIR, file_name), self.tmp_dir)
+
+        _pix_container.reset_parse_cache_stats()
+        parsed = _pix_container.get_data_from_file(filepath, "    ", tokenized=tokenized, use_cache=True)
+        cached = _pix_container.get_data_from_file(filepath, "    ", tokenized=tokenized, use_cache=True)
+
+        self.assertEqual(_pix_container.get_parse_cache_stats(), (1, 1))
+        self.assertTrue(_contains_matrix(cached))
+        self.assertEqual(_to_comparable(parsed), _to_comparable(cached))
+
+    def test_pis(self):
+        self._read_twice("wipers_uk.pis", False)
+
+    def test_pia(self):
+        self._read_twice("wipers_uk.pia", True)
+
+
+if __name__ == "__main__":
+    if "io_scs_tools" not in bpy.context.preferences.addons:
+        bpy.ops.preferences.addon_enable(module="io_scs_tools")
+
+    result = unittest.main(argv=[sys.argv[0]], exit=False).result
+    sys.exit(not result.wasSuccessful())